@@ -15,10 +15,15 @@ Usage:
 """
 
 import os
+import json
 from dataclasses import dataclass
 from typing import Dict, Any, Optional, Tuple
 from pathlib import Path
-import json
+
+from core.config import Config
+
+# agents.timeout in config/config.yml is the default stage deadline
+_YAML_AGENT_TIMEOUT = Config().get('agents.timeout', 300)
 
 
 @dataclass
@@ -40,6 +45,12 @@ class AgentConfig:
     DATA_LOADER_ENCODING: str = os.getenv('DATA_LOADER_ENCODING', 'utf-8')
     DATA_LOADER_MAX_FILE_SIZE_MB: int = int(os.getenv('DATA_LOADER_MAX_FILE_SIZE', '500'))
     DATA_LOADER_INFER_DTYPES: bool = os.getenv('DATA_LOADER_INFER_DTYPES', 'true').lower() == 'true'
+    DATA_LOADER_CACHE_DIR: str = os.getenv('DATA_LOADER_CACHE_DIR', '')  # Empty disables the load cache
+    DATA_LOADER_CACHE_MAX_MB: float = float(os.getenv('DATA_LOADER_CACHE_MAX_MB', '512'))
+    DATA_LOADER_VALIDATION_MODE: str = os.getenv('DATA_LOADER_VALIDATION_MODE', 'full')  # full, sampled or incremental
+    DATA_LOADER_VALIDATION_SAMPLE_ROWS: int = int(os.getenv('DATA_LOADER_VALIDATION_SAMPLE_ROWS', '50000'))
+    DATA_LOADER_SCHEMA_REGISTRY: str = os.getenv('DATA_LOADER_SCHEMA_REGISTRY', '')  # JSON file; empty disables profiles
+    DATA_LOADER_MEMORY_FRACTION: float = float(os.getenv('DATA_LOADER_MEMORY_FRACTION', '0.5'))  # Share of free RAM one load may use
     
     # ==================== EXPLORER ====================
     EXPLORER_OUTLIER_IQR_MULTIPLIER: float = float(os.getenv('EXPLORER_IQR_MULTIPLIER', '1.5'))
@@ -73,6 +84,27 @@ class AgentConfig:
     OPERATION_TIMEOUT_SECONDS: int = int(os.getenv('OPERATION_TIMEOUT', '30'))
     MAX_RETRIES: int = int(os.getenv('MAX_RETRIES', '3'))
     RETRY_BACKOFF_FACTOR: int = int(os.getenv('RETRY_BACKOFF', '2'))
+    TASK_TIMEOUT_SECONDS: float = float(os.getenv('TASK_TIMEOUT', str(_YAML_AGENT_TIMEOUT)))  # Per stage; 0 = no deadline
+    WORKFLOW_TIMEOUT_SECONDS: float = float(os.getenv('WORKFLOW_TIMEOUT', '0'))  # Whole workflow; 0 = no deadline
+    WORKFLOW_MAX_WORKERS: int = int(os.getenv('WORKFLOW_MAX_WORKERS', '4'))  # 1 runs workflow tasks sequentially
+    API_JOB_WORKERS: int = int(os.getenv('API_JOB_WORKERS', '1'))  # Workflows share the orchestrator cache
+    API_JOB_QUEUE_LIMIT: int = int(os.getenv('API_JOB_QUEUE_LIMIT', '16'))
+    ORCHESTRATOR_RESULT_CACHE_ENTRIES: int = int(os.getenv('ORCHESTRATOR_RESULT_CACHE_ENTRIES', '256'))  # 0 disables memoization
+    ORCHESTRATOR_RESULT_CACHE_TTL_SECONDS: float = float(os.getenv('ORCHESTRATOR_RESULT_CACHE_TTL', '600'))  # 0 = no expiry
+    ORCHESTRATOR_RESULT_CACHE_MAX_MB: float = float(os.getenv('ORCHESTRATOR_RESULT_CACHE_MAX_MB', '256'))
+    ORCHESTRATOR_CACHE_MAX_MB: float = float(os.getenv('ORCHESTRATOR_CACHE_MAX_MB', '1024'))  # DataManager budget; 0 = unlimited
+    ORCHESTRATOR_SPILL_DIR: str = os.getenv('ORCHESTRATOR_SPILL_DIR', '')  # Empty uses a temp directory
+    ORCHESTRATOR_PROCESS_WORKERS: int = int(os.getenv('ORCHESTRATOR_PROCESS_WORKERS', '0'))  # CPU-bound task processes; 0 = in-process
+    ORCHESTRATOR_PROCESS_START_METHOD: str = os.getenv('ORCHESTRATOR_PROCESS_START_METHOD', 'spawn')
+    SESSION_MAX_COUNT: int = int(os.getenv('SESSION_MAX_COUNT', '64'))  # 0 = unlimited
+    SESSION_IDLE_TTL_SECONDS: float = float(os.getenv('SESSION_IDLE_TTL', '3600'))  # 0 = never expire
+    SESSION_CACHE_MAX_MB: float = float(os.getenv('SESSION_CACHE_MAX_MB', '512'))  # Per-session DataManager quota
+    
+    # ==================== ERROR INTELLIGENCE ====================
+    ERROR_INTEL_PATTERNS_FILE: str = os.getenv('ERROR_INTEL_PATTERNS_FILE', '.error_patterns.json')
+    ERROR_INTEL_FLUSH_EVERY: int = int(os.getenv('ERROR_INTEL_FLUSH_EVERY', '100'))  # Tracked events per write; 1 = every call
+    ERROR_INTEL_FLUSH_INTERVAL_SECONDS: float = float(os.getenv('ERROR_INTEL_FLUSH_INTERVAL', '5'))
+    ERROR_INTEL_LOG_FORMAT: str = os.getenv('ERROR_INTEL_LOG_FORMAT', 'snapshot')  # snapshot or append
     
     # ==================== LOGGING ====================
     ENABLE_STRUCTURED_LOGGING: bool = os.getenv('STRUCTURED_LOGGING', 'true').lower() == 'true'
@@ -102,12 +134,39 @@ class AgentConfig:
         if config.DATA_LOADER_CHUNK_SIZE <= 0:
             errors.append("DATA_LOADER_CHUNK_SIZE must be positive")
         
+        if config.DATA_LOADER_VALIDATION_MODE not in ('full', 'sampled', 'incremental'):
+            errors.append("DATA_LOADER_VALIDATION_MODE must be full, sampled or incremental")
+        
+        if not (0 < config.DATA_LOADER_MEMORY_FRACTION <= 1):
+            errors.append("DATA_LOADER_MEMORY_FRACTION must be between 0 and 1")
+        
         if not (0 < config.ANOMALY_ISOLATION_FOREST_CONTAMINATION < 1):
             errors.append("ANOMALY_ISOLATION_FOREST_CONTAMINATION must be between 0 and 1")
         
         if config.PREDICTOR_CV_FOLDS < 2:
             errors.append("PREDICTOR_CV_FOLDS must be >= 2")
         
+        if config.TASK_TIMEOUT_SECONDS < 0 or config.WORKFLOW_TIMEOUT_SECONDS < 0:
+            errors.append("TASK_TIMEOUT_SECONDS and WORKFLOW_TIMEOUT_SECONDS must be >= 0")
+        
+        if config.WORKFLOW_MAX_WORKERS < 1:
+            errors.append("WORKFLOW_MAX_WORKERS must be >= 1")
+        
+        if config.API_JOB_WORKERS < 1:
+            errors.append("API_JOB_WORKERS must be >= 1")
+        
+        if config.ORCHESTRATOR_PROCESS_WORKERS < 0:
+            errors.append("ORCHESTRATOR_PROCESS_WORKERS must be >= 0")
+        
+        if config.SESSION_MAX_COUNT < 0:
+            errors.append("SESSION_MAX_COUNT must be >= 0")
+        
+        if config.ERROR_INTEL_FLUSH_EVERY < 1 or config.ERROR_INTEL_FLUSH_INTERVAL_SECONDS <= 0:
+            errors.append("ERROR_INTEL_FLUSH_EVERY must be >= 1 and ERROR_INTEL_FLUSH_INTERVAL_SECONDS positive")
+        
+        if config.ERROR_INTEL_LOG_FORMAT not in ('snapshot', 'append'):
+            errors.append("ERROR_INTEL_LOG_FORMAT must be snapshot or append")
+        
         if config.OPERATION_TIMEOUT_SECONDS <= 0:
             errors.append("OPERATION_TIMEOUT_SECONDS must be positive")
         
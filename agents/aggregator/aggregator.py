@@ -23,7 +23,7 @@ Integrated with Week 1 Systems:
 - Error recovery and handling
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 import pandas as pd
 from datetime import datetime
 
@@ -31,6 +31,7 @@ from core.logger import get_logger
 from core.error_recovery import retry_on_error
 from core.structured_logger import get_structured_logger
 from core.exceptions import AgentError
+from core.shared_dataset import SharedDataset, frame_for_agent
 from .workers import (
     WindowFunction,
     RollingAggregation,
@@ -118,13 +119,14 @@ class Aggregator:
 
     # === DATA MANAGEMENT ===
 
-    def set_data(self, df: pd.DataFrame) -> None:
+    def set_data(self, df: Union[pd.DataFrame, SharedDataset]) -> None:
         """Store the DataFrame for aggregation operations.
         
         Args:
-            df: DataFrame to process
+            df: DataFrame to process (copied), or SharedDataset (kept as a view)
         """
-        self.data = df.copy()
+        df = frame_for_agent(df)
+        self.data = df
         self.aggregation_results = {}
         self.logger.info(f"Data set: {df.shape[0]} rows, {df.shape[1]} columns")
         self.structured_logger.info("Data set for aggregation", {
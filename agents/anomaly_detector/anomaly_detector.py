@@ -19,7 +19,7 @@ Integrated with Week 1-2 Systems:
 - Error Intelligence tracking (Phase 2)
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 import pandas as pd
 from datetime import datetime
 
@@ -27,6 +27,7 @@ from core.logger import get_logger
 from core.error_recovery import retry_on_error
 from core.structured_logger import get_structured_logger
 from core.exceptions import AgentError
+from core.shared_dataset import SharedDataset, frame_for_agent
 from .workers import (
     StatisticalWorker,
     IsolationForest,
@@ -118,25 +119,26 @@ class AnomalyDetector:
     # ===== DATA MANAGEMENT (Agent Contract) =====
 
     @retry_on_error(max_attempts=2, backoff=1)
-    def set_data(self, df: pd.DataFrame) -> None:
+    def set_data(self, df: Union[pd.DataFrame, SharedDataset]) -> None:
         """Load input data for processing.
         
         GUIDANCE: Section 2.2 - Agent Interface Contract
         
         Args:
-            df: Input DataFrame to process
+            df: Input DataFrame to process (copied), or SharedDataset (kept as a view)
             
         Raises:
             ValueError: If data is invalid or empty
             TypeError: If data is not DataFrame
         """
+        df = frame_for_agent(df)
         if not isinstance(df, pd.DataFrame):
             raise TypeError(f"Expected DataFrame, got {type(df)}")
         
         if df.empty:
             raise ValueError("DataFrame is empty")
         
-        self.data = df.copy()
+        self.data = df
         self.detection_results = {}
         self.error_log = []
         
@@ -16,6 +16,7 @@ from .ocsvm import OneClassSVM
 from .isolation_forest import IsolationForest as IFWorker
 from .base_worker import BaseWorker, WorkerResult, ErrorType
 from core.logger import get_logger
+from core.cancellation import checkpoint
 from agents.error_intelligence.main import ErrorIntelligence
 
 # ===== CONSTANTS =====
@@ -181,6 +182,7 @@ class Ensemble(BaseWorker):
             except Exception as e:
                 self.logger.warning(f"LOF error in ensemble: {str(e)}")
                 self._add_warning(result, f"LOF error: {str(e)}")
+            checkpoint(algorithm_results=dict(algorithm_results))
             
             # ===== RUN ONE-CLASS SVM =====
             try:
@@ -200,6 +202,7 @@ class Ensemble(BaseWorker):
             except Exception as e:
                 self.logger.warning(f"One-Class SVM error in ensemble: {str(e)}")
                 self._add_warning(result, f"One-Class SVM error: {str(e)}")
+            checkpoint(algorithm_results=dict(algorithm_results))
             
             # ===== RUN ISOLATION FOREST =====
             try:
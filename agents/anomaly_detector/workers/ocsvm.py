@@ -15,6 +15,7 @@ from typing import Any, Optional, Literal
 
 from .base_worker import BaseWorker, WorkerResult, ErrorType
 from core.logger import get_logger
+from core.cancellation import checkpoint
 from agents.error_intelligence.main import ErrorIntelligence
 
 # ===== CONSTANTS =====
@@ -198,7 +199,11 @@ class OneClassSVM(BaseWorker):
                 gamma='auto'
             )
             
+            # The fit itself cannot be interrupted; a task that times out
+            # during it keeps the agent reserved until the fit returns
+            checkpoint()
             predictions: np.ndarray = ocsvm.fit_predict(scaled_data)
+            checkpoint()
             
             # Get decision function scores (distance from hyperplane)
             decision_scores: np.ndarray = ocsvm.decision_function(scaled_data)
@@ -1,10 +1,12 @@
-from typing import Any, Dict, Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, Optional, List, Sequence, Tuple, Union
 from pathlib import Path
+import glob
 import pandas as pd
 import os
-import sqlite3
 import time
 
+from agents.agent_config import AgentConfig
 from core.logger import get_logger
 from core.error_recovery import retry_on_error
 from core.structured_logger import get_structured_logger
@@ -14,8 +16,35 @@ from .workers import (
     ParquetLoaderWorker,
     ValidatorWorker,
     CSVStreaming,
+    JSONLStreaming,
+    SQLLoaderWorker,
     FormatDetection,
+    StreamingQualityAccumulator,
+    LoadCache,
     WorkerResult,
+    ErrorType,
+)
+from .workers.pushdown import normalize_filters, apply_pushdown, read_columns
+from .workers.json_excel_loader import excel_engine, DEFAULT_SHEET_PARALLELISM
+from .workers.schema_registry import SchemaRegistry, DatasetProfile, compare_schema
+from .workers.load_strategy import choose_tier, TIER_CHUNKED, TIER_SAMPLED
+from .workers.sql_loader import is_url, DEFAULT_TABLE, DEFAULT_CHUNKSIZE as SQL_CHUNKSIZE
+from .workers.append_tracker import (
+    AppendTracker,
+    AppendState,
+    SchemaDriftError,
+    APPENDABLE_FORMATS,
+    MODE_FULL,
+    MODE_APPEND,
+    MODE_UNCHANGED,
+    options_key,
+    head_signature,
+    complete_boundary,
+    read_range,
+    parse_csv_tail,
+    parse_jsonl_tail,
+    align_to_schema,
+    concat_appended,
 )
 
 logger = get_logger(__name__)
@@ -25,71 +54,118 @@ structured_logger = get_structured_logger(__name__)
 class DataLoader:
     """DataLoader Agent - coordinates data loading workers with quality tracking.
     
-    Manages 6 workers:
+    Manages 8 workers:
     - CSVLoaderWorker: Loads standard CSV files with quality scoring
     - JSONExcelLoaderWorker: Loads JSON and Excel with validation
     - ParquetLoaderWorker: Loads Parquet files with quality metrics
+    - SQLLoaderWorker: Chunked SQL reads over pooled connections
     - ValidatorWorker: Validates data with comprehensive quality analysis
     - CSVStreaming: Streams large CSVs (>500MB)
-    - FormatDetection: Auto-detects formats
+    - JSONLStreaming: Streams JSONL in line batches
+    - FormatDetection: Sniffs format, encoding and CSV dialect from the file header
     
     Capabilities:
+    - Size-tiered loading: in-memory, chunked or sampled, chosen from
+      file size and available RAM (see load_strategy)
     - Load CSV files (streaming for large files)
     - Load JSON files
-    - Load Excel files (XLSX, XLS)
+    - Load Excel files (XLSX, XLS); all or selected sheets at once (load_sheets)
     - Load Parquet files (with streaming)
-    - Load JSONL files
+    - Load JSONL files (line batches, nested keys flattened)
     - Load HDF5 files
-    - Load SQLite databases
+    - Load SQLite databases and SQLAlchemy URLs (chunked, with query pushdown)
     - Auto-detect file format
     - Validate loaded data with quality scoring
     - Extract comprehensive metadata
     - Track data quality through workflow
+    - Cache parsed datasets as Parquet (optional, see LoadCache)
+    - Load partitioned datasets from a glob or file list in parallel (load_many)
+    - Incremental append loading of growing CSV/JSONL files (see AppendTracker)
+    - Per-dataset schema profiles: reuse parse options and dtypes, fail fast
+      on schema drift (optional, see SchemaRegistry)
     """
 
     SUPPORTED_FORMATS = ['csv', 'json', 'xlsx', 'xls', 'parquet', 'jsonl', 'h5', 'hdf5', 'db', 'sqlite']
-    MAX_FILE_SIZE_MB = 100
+    MAX_FILE_SIZE_MB = 100  # Largest file loaded in one pass; bigger files are chunked or sampled
     MIN_QUALITY_THRESHOLD = 0.0  # Accept any quality score
+    # Text/row formats worth caching as Parquet (Parquet and SQL are already fast to read)
+    CACHEABLE_FORMATS = ['csv', 'json', 'xlsx', 'xls', 'jsonl', 'h5', 'hdf5']
+    DEFAULT_PARALLELISM = 4
+    SCHEMA_DRIFT_MODES = ['error', 'warn', 'update']
+    PROFILE_HINT_KEYS = ['dtype', 'parse_dates']  # read_csv arguments filled from a schema profile
 
-    def __init__(self) -> None:
-        """Initialize DataLoader agent and all workers."""
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        cache_max_mb: Optional[float] = None,
+        schema_registry: Optional[str] = None
+    ) -> None:
+        """Initialize DataLoader agent and all workers.
+        
+        Args:
+            cache_dir: Directory for the Parquet load cache. Defaults to
+                AgentConfig.DATA_LOADER_CACHE_DIR; caching is off when empty.
+            cache_max_mb: Cache size budget (default AgentConfig.DATA_LOADER_CACHE_MAX_MB)
+            schema_registry: JSON file of dataset profiles. Defaults to
+                AgentConfig.DATA_LOADER_SCHEMA_REGISTRY; profiles are off when empty.
+        """
         self.name = "DataLoader"
         self.logger = get_logger("DataLoader")
         self.loaded_data: Optional[pd.DataFrame] = None
         self.metadata: Dict[str, Any] = {}
         self.quality_score: float = 0.0
         self.load_history: List[Dict[str, Any]] = []
+        self.append_tracker = AppendTracker()
+
+        cache_dir = cache_dir or AgentConfig.DATA_LOADER_CACHE_DIR
+        self.load_cache: Optional[LoadCache] = None
+        if cache_dir:
+            self.load_cache = LoadCache(
+                cache_dir,
+                max_size_mb=cache_max_mb or AgentConfig.DATA_LOADER_CACHE_MAX_MB
+            )
+
+        registry_path = schema_registry or AgentConfig.DATA_LOADER_SCHEMA_REGISTRY
+        self.schema_registry: Optional[SchemaRegistry] = (
+            SchemaRegistry(registry_path) if registry_path else None
+        )
 
         # === INITIALIZE ALL WORKERS ===
         # Core workers with enhanced quality scoring
         self.csv_loader = CSVLoaderWorker()
         self.json_excel_loader = JSONExcelLoaderWorker()
         self.parquet_loader = ParquetLoaderWorker()
+        self.sql_loader = SQLLoaderWorker()
         self.validator = ValidatorWorker()
         
         # Performance/Format workers (Week 1 Day 1)
         self.csv_streaming = CSVStreaming()
+        self.jsonl_streaming = JSONLStreaming()
         self.format_detector = FormatDetection()
         
         self.core_workers = [
             self.csv_loader,
             self.json_excel_loader,
             self.parquet_loader,
+            self.sql_loader,
             self.validator,
         ]
         
         self.performance_workers = [
             self.csv_streaming,
+            self.jsonl_streaming,
             self.format_detector,
         ]
 
-        self.logger.info("DataLoader initialized with 6 workers")
+        self.logger.info("DataLoader initialized with 8 workers")
         structured_logger.info("DataLoader initialized", {
             "core_workers": len(self.core_workers),
             "performance_workers": len(self.performance_workers),
             "total_workers": len(self.core_workers) + len(self.performance_workers),
             "supported_formats": self.SUPPORTED_FORMATS,
-            "quality_tracking": "enabled"
+            "quality_tracking": "enabled",
+            "load_cache": str(self.load_cache.cache_dir) if self.load_cache else "disabled",
+            "schema_registry": str(self.schema_registry.path) if self.schema_registry else "disabled"
         })
 
     # === MAIN LOADING ===
@@ -99,12 +175,46 @@ class DataLoader:
         """Load data from a file with quality tracking.
         
         Delegates to appropriate worker based on format.
-        Uses CSVStreaming for >500MB CSV files.
+        Files above MAX_FILE_SIZE_MB are streamed in chunks; when the parsed
+        frame would not fit in memory, a uniform row sample is loaded instead
+        (metadata['load_tier'] records the choice).
         Uses FormatDetection for format auto-detection.
         Tracks quality scores through loading and validation pipeline.
         
         Args:
             file_path: Path to data file
+            use_cache: Set False to bypass the load cache for this call
+            load_tier: Force 'in_memory', 'chunked' or 'sampled' instead of
+                choosing from file size and available memory
+            validation_mode: 'full' (scan every row), 'sampled' (stratified
+                sample, quality score reported as an estimate with bounds) or
+                'incremental' (reuse metrics accumulated while streaming).
+                Defaults to AgentConfig.DATA_LOADER_VALIDATION_MODE.
+            validation_sample_rows: Sample size for sampled validation
+            sheet_name: Excel only - sheet name or index to load (default
+                the first; see load_sheets() for several)
+            optimize_dtypes: CSV only - infer compact dtypes (category,
+                narrow ints/floats, nullable ints, datetimes) during parsing
+            columns: Only load these columns (all formats; CSV/Excel skip
+                the rest while parsing, Parquet only reads their bytes)
+            filters: Row filters as [(column, op, value)], ANDed; ops are
+                ==, !=, >, >=, <, <=, in, not in. Parquet prunes row groups
+                by statistics, other formats filter while/after parsing
+            incremental: CSV/JSONL only - remember where this load stopped
+                and, on the next call, parse only the complete lines appended
+                since; quality metrics are updated from the new rows only.
+                Falls back to a full load when the file was truncated,
+                rewritten, its columns changed or the load options differ.
+                metadata['append'] reports the mode used.
+            dataset: Schema profile name (default: the profile registered for
+                this path or a glob pattern matching it). With a profile the
+                format, dialect and CSV dtypes are reused instead of inferred
+                and the validator checks the data against the profile's stats
+            schema_drift: What to do when columns/dtypes differ from the
+                profile: 'error' (default, CSV headers are checked before
+                parsing), 'warn' or 'update' (re-learn the profile)
+            schema_pattern: Glob stored with a newly learned profile so other
+                files ('exports/sales_*.csv') share it
             **kwargs: Additional pandas arguments
             
         Returns:
@@ -121,64 +231,90 @@ class DataLoader:
         """
         if not file_path:
             return self._error_result("No file path provided")
+        if is_url(file_path):
+            return self.load_sql(file_path, **kwargs)
 
+        use_cache = kwargs.pop('use_cache', True)
+        incremental = kwargs.pop('incremental', False)
+        dataset = kwargs.pop('dataset', None)
+        schema_drift = kwargs.pop('schema_drift', 'error')
+        schema_pattern = kwargs.pop('schema_pattern', None)
+        if schema_drift not in self.SCHEMA_DRIFT_MODES:
+            return self._error_result(
+                f"Unknown schema_drift '{schema_drift}'. Supported: {self.SCHEMA_DRIFT_MODES}"
+            )
+        try:
+            kwargs['filters'] = normalize_filters(kwargs.get('filters'))
+        except ValueError as e:
+            return self._error_result(str(e))
         file_path = Path(file_path)
-        file_format = file_path.suffix.lower().lstrip('.')
-
-        # If format missing or unknown, use FormatDetection
-        if not file_format or file_format not in self.SUPPORTED_FORMATS:
-            detection_result = self.format_detector.safe_execute(file_path=str(file_path))
-            if detection_result.success and detection_result.data:
-                file_format = detection_result.data.get('detected_format', 'csv')
-            else:
-                return self._error_result(f"Unsupported or unknown format for file: {file_path}")
+        profile = None
+        if self.schema_registry is not None:
+            profile = self.schema_registry.match(dataset or file_path)
+        if profile is not None:
+            # Known dataset: reuse its format and dialect instead of sniffing
+            file_format, csv_options = profile.file_format, dict(profile.parse_options)
+        else:
+            file_format, csv_options = self._resolve_format(file_path)
+        if file_format is None:
+            return self._error_result(f"Unsupported or unknown format for file: {file_path}")
+        # Sniffed dialect fills in whatever the caller did not specify
+        for key, value in csv_options.items():
+            kwargs.setdefault(key, value)
 
         # Validate file
         validation = self._validate_file(file_path, file_format)
         if not validation['valid']:
             return self._error_result(validation['message'])
 
+        header_drift = []
+        profile_hints = []
+        if profile is not None:
+            caller_hints = [key for key in self.PROFILE_HINT_KEYS if key in kwargs]
+            header_drift = self._apply_profile(profile, file_path, file_format, kwargs)
+            profile_hints = [key for key in self.PROFILE_HINT_KEYS if key in kwargs and key not in caller_hints]
+            if header_drift and schema_drift == 'error':
+                return self._error_result(
+                    f"Schema drift from profile '{profile.name}': {'; '.join(header_drift)}"
+                )
+
+        if incremental and file_format in APPENDABLE_FORMATS:
+            return self._load_incremental(file_path, file_format, kwargs)
+        if incremental:
+            self.logger.warning(f"Incremental loading not supported for {file_format}; loading in full")
+
+        # Cache hit skips parsing and re-validation entirely
+        cache_key = None
+        if self.load_cache is not None and use_cache and file_format in self.CACHEABLE_FORMATS:
+            cache_key = self.load_cache.make_key(str(file_path), {'format': file_format, **kwargs})
+            cached = self.load_cache.get(cache_key)
+            if cached is not None:
+                return self._result_from_cache(file_path, file_format, *cached)
+
         # Load based on format
-        if file_format == 'csv':
-            # Use CSVStreaming for >500MB files
-            file_size_mb = file_path.stat().st_size / (1024 * 1024)
-            if file_size_mb > 500:
-                load_result = self.csv_streaming.safe_execute(file_path=str(file_path))
-            else:
-                load_result = self.csv_loader.safe_execute(file_path=str(file_path))
-        elif file_format == 'json':
-            load_result = self.json_excel_loader.safe_execute(
-                file_path=str(file_path),
-                file_format='json'
-            )
-        elif file_format in ['xlsx', 'xls']:
-            load_result = self.json_excel_loader.safe_execute(
-                file_path=str(file_path),
-                file_format=file_format
-            )
-        elif file_format == 'parquet':
-            load_result = self.parquet_loader.safe_execute(file_path=str(file_path))
-        elif file_format == 'jsonl':
-            load_result = self._load_jsonl_worker(file_path=str(file_path))
-        elif file_format in ['h5', 'hdf5']:
-            load_result = self._load_hdf5_worker(file_path=str(file_path))
-        elif file_format in ['db', 'sqlite']:
-            load_result = self._load_sqlite_worker(file_path=str(file_path), **kwargs)
-        else:
-            return self._error_result(f"Unsupported format: {file_format}")
+        accumulator = (
+            StreamingQualityAccumulator()
+            if self._validation_mode(kwargs) == 'incremental' else None
+        )
+        load_result = self._load_with_worker(file_path, file_format, kwargs, accumulator)
+        if not load_result.success and profile_hints:
+            # Profile dtypes are hints: data they no longer fit (a null in an
+            # integer column) is schema drift, not a parse failure
+            hint_error = '; '.join(e['message'] for e in load_result.errors)
+            for key in profile_hints:
+                kwargs.pop(key)
+            if accumulator is not None:
+                accumulator = StreamingQualityAccumulator()
+            load_result = self._load_with_worker(file_path, file_format, kwargs, accumulator)
+            if load_result.success:
+                header_drift.append(f"Profile dtypes do not fit the data ({hint_error})")
+                if schema_drift == 'error':
+                    return self._error_result(
+                        f"Schema drift from profile '{profile.name}': {'; '.join(header_drift)}"
+                    )
 
         if not load_result.success:
-            self.quality_score = 0.0
-            return {
-                'status': 'error',
-                'message': f"Failed to load {file_format} file",
-                'data': None,
-                'metadata': {},
-                'quality_score': 0.0,
-                'quality_issues': [],
-                'warnings': [w for w in getattr(load_result, 'warnings', [])],
-                'errors': [e['message'] for e in load_result.errors]
-            }
+            return self._failed_load_result(load_result, f"Failed to load {file_format} file")
 
         # Store loader quality score
         loader_quality = getattr(load_result, 'quality_score', 0.0)
@@ -193,11 +329,607 @@ class DataLoader:
         })
 
         # Validate data
+        result = self._validate_loaded(load_result, file_path, file_format, kwargs, accumulator, profile)
+        if profile is not None and schema_drift == 'error' and result['metadata'].get('schema_drift'):
+            return self._error_result(
+                f"Schema drift from profile '{profile.name}': {'; '.join(result['metadata']['schema_drift'])}"
+            )
+        self._learn_profile(
+            profile, dataset, file_path, file_format, kwargs, result,
+            relearn=schema_drift == 'update' and bool(header_drift or result['metadata'].get('schema_drift')),
+            pattern=schema_pattern
+        )
+        df = result['data']
+        final_quality = result['quality_score']
+
+        cache_status = 'disabled'
+        if cache_key is not None and load_result.metadata.get('load_tier') == TIER_SAMPLED:
+            # A sample depends on free memory at load time; never serve it as the full file
+            cache_status = 'uncacheable'
+        elif cache_key is not None:
+            stored = self.load_cache.put(cache_key, df, {
+                key: value for key, value in result.items() if key != 'data'
+            })
+            cache_status = 'miss' if stored else 'uncacheable'
+
+        # Track load history
+        self._record_history(file_path, file_format, df, final_quality, cache_status)
+
+        return result
+
+    def load_sheets(
+        self,
+        file_path: str,
+        sheet_names: Optional[Sequence[Union[str, int]]] = None,
+        parallelism: int = DEFAULT_SHEET_PARALLELISM,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Load all or selected sheets of an Excel workbook in one call.
+        
+        Sheets are parsed by JSONExcelLoaderWorker.load_sheets (concurrently
+        with the calamine engine, otherwise from one open workbook), then
+        validated one by one. With the load cache enabled every sheet gets
+        its own Parquet entry, and the sheet list of the workbook is cached
+        too, so a repeat call does not open the workbook at all.
+        
+        ``loaded_data`` is set to the first loaded sheet, like load() with
+        the default sheet.
+        
+        Args:
+            file_path: Path to .xlsx/.xls workbook
+            sheet_names: Sheet names or indexes (default: every sheet)
+            parallelism: Maximum sheets parsed at once
+            use_cache: Set False to bypass the load cache for this call
+            columns: Columns to keep in every sheet
+            filters: Row filters for every sheet (see load())
+            validation_mode: See load()
+            
+        Returns:
+            {
+                'status': 'success', 'warning' (some sheets failed or have
+                    quality issues) or 'error' (no sheet loaded),
+                'message': str,
+                'data': {sheet: DataFrame} for the sheets that loaded,
+                'sheet_quality': {sheet: float},
+                'metadata': dict with per-sheet metadata under 'sheets' and
+                    per-sheet cache status under 'cache',
+                'quality_score': row-weighted mean of the sheet scores,
+                'quality_issues': list,
+                'warnings': list,
+                'errors': list
+            }
+        """
+        if not file_path:
+            return self._error_result("No file path provided")
+
+        use_cache = kwargs.pop('use_cache', True)
+        try:
+            kwargs['filters'] = normalize_filters(kwargs.get('filters'))
+        except ValueError as e:
+            return self._error_result(str(e))
+        file_path = Path(file_path)
+        file_format, _ = self._resolve_format(file_path)
+        if file_format not in ('xlsx', 'xls'):
+            return self._error_result(f"load_sheets requires an Excel workbook, got: {file_format}")
+        validation = self._validate_file(file_path, file_format)
+        if not validation['valid']:
+            return self._error_result(validation['message'])
+
+        cache = self.load_cache if use_cache else None
+        options = {'format': file_format, **kwargs}
+        names = list(sheet_names) if sheet_names is not None else None
+        manifest_key = None
+        if cache is not None and names is None:
+            manifest_key = cache.make_key(str(file_path), {**options, 'sheets': '*'})
+            manifest = cache.get(manifest_key)
+            if manifest is not None:
+                names = manifest[1]['sheet_names']
+
+        # Sheets served from the cache skip Excel parsing and validation
+        sheet_results: Dict[Union[str, int], Dict[str, Any]] = {}
+        cache_status: Dict[Union[str, int], str] = {}
+        if cache is not None and names is not None:
+            for sheet in names:
+                hit = cache.get(cache.make_key(str(file_path), {**options, 'sheet': sheet}))
+                if hit is not None:
+                    df, entry = hit
+                    sheet_results[sheet] = {**entry, 'data': df, 'metadata': {**entry['metadata'], 'cache_hit': True}}
+                    cache_status[sheet] = 'hit'
+
+        to_parse = None if names is None else [sheet for sheet in names if sheet not in sheet_results]
+        if to_parse is None or to_parse:
+            try:
+                parsed = self.json_excel_loader.load_sheets(
+                    str(file_path),
+                    file_format=file_format,
+                    sheet_names=to_parse,
+                    columns=kwargs.get('columns'),
+                    filters=kwargs.get('filters'),
+                    parallelism=parallelism,
+                    detected_format=file_format
+                )
+            except Exception as e:
+                return self._error_result(f"Failed to load sheets: {e}")
+            if names is None:
+                names = list(parsed)
+                if manifest_key is not None:
+                    cache.put(manifest_key, pd.DataFrame({'sheet': [str(name) for name in names]}),
+                              {'sheet_names': names})
+
+            for sheet, load_result in parsed.items():
+                if not load_result.success:
+                    sheet_results[sheet] = self._failed_load_result(load_result, f"Failed to load sheet {sheet!r}")
+                    cache_status[sheet] = 'disabled' if cache is None else 'uncacheable'
+                    continue
+                result = self._validate_loaded(load_result, file_path, file_format, kwargs)
+                sheet_results[sheet] = result
+                cache_status[sheet] = 'disabled'
+                if cache is not None:
+                    stored = cache.put(
+                        cache.make_key(str(file_path), {**options, 'sheet': sheet}),
+                        result['data'],
+                        {key: value for key, value in result.items() if key != 'data'}
+                    )
+                    cache_status[sheet] = 'miss' if stored else 'uncacheable'
+
+        return self._combine_sheets(file_path, file_format, names, sheet_results, cache_status)
+
+    def _combine_sheets(
+        self,
+        file_path: Path,
+        file_format: str,
+        names: List[Union[str, int]],
+        sheet_results: Dict[Union[str, int], Dict[str, Any]],
+        cache_status: Dict[Union[str, int], str]
+    ) -> Dict[str, Any]:
+        """Merge per-sheet load results into one load_sheets() result."""
+        frames = {
+            sheet: sheet_results[sheet]['data'] for sheet in names
+            if sheet_results[sheet]['data'] is not None
+        }
+        sheet_quality = {sheet: sheet_results[sheet]['quality_score'] for sheet in names}
+        loaded_rows = sum(len(df) for df in frames.values())
+        quality = (
+            sum(sheet_quality[sheet] * len(df) for sheet, df in frames.items()) / loaded_rows
+            if loaded_rows else 0.0
+        )
+        errors = [f"{sheet}: {error}" for sheet in names for error in sheet_results[sheet]['errors']]
+        failed = [sheet for sheet in names if sheet not in frames]
+
+        for sheet, df in frames.items():
+            self._record_history(f"{file_path}#{sheet}", file_format, df, sheet_quality[sheet], cache_status[sheet])
+
+        self.loaded_data = next(iter(frames.values()), None)
+        self.quality_score = quality
+        self.metadata = {
+            'file_name': file_path.name,
+            'file_format': file_format,
+            'engine': excel_engine(file_format),
+            'sheet_names': list(names),
+            'sheets': {sheet: sheet_results[sheet]['metadata'] for sheet in names},
+            'cache': cache_status,
+            'rows': loaded_rows,
+            'quality_score': quality,
+        }
+
+        if not frames:
+            status = 'error'
+        elif failed or any(sheet_results[sheet]['status'] != 'success' for sheet in frames):
+            status = 'warning'
+        else:
+            status = 'success'
+        self.logger.info(
+            f"Loaded {len(frames)}/{len(names)} sheets from {file_path.name}: "
+            f"{loaded_rows} rows, quality={quality:.2f}"
+        )
+        return {
+            'status': status,
+            'message': f"Loaded {len(frames)} of {len(names)} sheets, {loaded_rows} rows (Quality: {quality:.2%})",
+            'data': frames,
+            'sheet_quality': sheet_quality,
+            'metadata': self.metadata,
+            'quality_score': quality,
+            'quality_issues': [
+                f"{sheet}: {issue}" for sheet in frames for issue in sheet_results[sheet]['quality_issues']
+            ],
+            'warnings': [f"{sheet}: {w}" for sheet in names for w in sheet_results[sheet]['warnings']],
+            'errors': errors,
+        }
+
+    def load_sql(
+        self,
+        source: str,
+        table_name: str = DEFAULT_TABLE,
+        query: Optional[str] = None,
+        params: Optional[Union[Dict[str, Any], List[Any]]] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Load a table or query from a SQLite file or SQLAlchemy URL.
+        
+        Rows are fetched in ``chunksize`` batches over a pooled connection.
+        ``columns`` and ``filters`` become the SELECT list and a WHERE
+        clause with bound parameters, so unneeded data never leaves the
+        database.
+        
+        Args:
+            source: SQLite file path or SQLAlchemy URL
+                (e.g. 'sqlite:///data/analyst.db')
+            table_name: Table to read when no query is given
+            query: Optional SQL query (wrapped as a subquery for pushdown)
+            params: Bound parameters for query (dict, or list for '?' style)
+            **kwargs: columns, filters, chunksize, validation_mode, ...
+            
+        Returns:
+            Same structure as load()
+        """
+        if not is_url(source):
+            return self.load(source, table_name=table_name, query=query, params=params, **kwargs)
+
+        kwargs.pop('use_cache', None)
+        try:
+            kwargs['filters'] = normalize_filters(kwargs.get('filters'))
+        except ValueError as e:
+            return self._error_result(str(e))
+
+        accumulator = (
+            StreamingQualityAccumulator()
+            if self._validation_mode(kwargs) == 'incremental' else None
+        )
+        load_result = self.sql_loader.safe_execute(
+            source=source,
+            table_name=table_name,
+            query=query,
+            params=params,
+            columns=kwargs.get('columns'),
+            filters=kwargs['filters'],
+            chunksize=kwargs.get('chunksize', SQL_CHUNKSIZE),
+            accumulator=accumulator
+        )
+        if not load_result.success:
+            return self._failed_load_result(load_result, "Failed to load SQL source")
+
+        result = self._validate_loaded(load_result, None, 'sql', kwargs, accumulator)
+        self._record_history(source, 'sql', result['data'], result['quality_score'], 'disabled')
+        return result
+
+    # === INCREMENTAL APPEND LOADING ===
+
+    def _load_incremental(self, file_path: Path, file_format: str, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Extend the last load of a growing file, or load it in full.
+        
+        Args:
+            file_path: Validated CSV/JSONL file
+            file_format: 'csv' or 'jsonl'
+            kwargs: Load options (filters already normalized)
+            
+        Returns:
+            Load result dictionary with metadata['append']
+        """
+        size = file_path.stat().st_size
+        options = options_key(kwargs)
+        state = self.append_tracker.get(file_path)
+        reason = 'first load' if state is None else self.append_tracker.reload_reason(
+            state, file_path, options, size
+        )
+
+        if reason is None:
+            boundary = complete_boundary(file_path, state.offset, size)
+            if boundary == state.offset:
+                return self._unchanged_result(file_path, file_format, state)
+            try:
+                return self._append_rows(file_path, file_format, state, boundary, kwargs)
+            except SchemaDriftError as e:
+                reason = str(e)
+            except (ValueError, pd.errors.ParserError) as e:
+                reason = f"appended lines unreadable: {e}"
+
+        self.logger.info(f"Full load of {file_path.name} ({reason})")
+        return self._full_incremental_load(file_path, file_format, kwargs, options, size, reason)
+
+    def _full_incremental_load(
+        self,
+        file_path: Path,
+        file_format: str,
+        kwargs: Dict[str, Any],
+        options: str,
+        size: int,
+        reason: str
+    ) -> Dict[str, Any]:
+        """Load the whole file and remember where the load stopped."""
+        kwargs = {**kwargs, 'validation_mode': 'incremental'}
+        accumulator = StreamingQualityAccumulator()
+        load_result = self._load_with_worker(file_path, file_format, kwargs, accumulator)
+        if not load_result.success:
+            self.append_tracker.forget(file_path)
+            return self._failed_load_result(load_result, f"Failed to load {file_format} file")
+
+        result = self._validate_loaded(load_result, file_path, file_format, kwargs, accumulator)
+        df = result['data']
+        self.append_tracker.record(MODE_FULL)
+
+        # The offset is only trustworthy if the parse saw exactly `size` bytes of whole lines
+        tracked = (
+            file_path.stat().st_size == size
+            and complete_boundary(file_path, 0, size) == size
+            and load_result.metadata.get('load_tier') != TIER_SAMPLED
+        )
+        if tracked:
+            file_columns = []
+            if file_format == 'csv':
+                file_columns = list(pd.read_csv(
+                    file_path,
+                    nrows=0,
+                    encoding=kwargs.get('encoding', 'utf-8'),
+                    sep=kwargs.get('delimiter', ','),
+                    quotechar=kwargs.get('quotechar', '"')
+                ).columns)
+            self.append_tracker.put(file_path, AppendState(
+                file_format=file_format,
+                options_key=options,
+                offset=size,
+                rows=len(df),
+                head_signature=head_signature(file_path, size),
+                file_columns=file_columns,
+                dtypes=dict(df.dtypes),
+                data=df,
+                accumulator=accumulator,
+                # Tier decision of the full load; shape metadata is recomputed per append
+                load_metadata={
+                    key: value for key, value in load_result.metadata.items()
+                    if key.startswith('load_tier') or key in ('estimated_memory_mb', 'available_memory_mb')
+                },
+            ))
+        else:
+            self.append_tracker.forget(file_path)
+            reason = f"{reason}; not tracked (file still being written or sampled)"
+
+        self.metadata['append'] = {
+            'mode': MODE_FULL,
+            'reason': reason,
+            'offset': size if tracked else None,
+            'appended_rows': len(df),
+            'appended_bytes': size,
+        }
+        state = self.append_tracker.get(file_path)
+        if state is not None:
+            state.result = {key: value for key, value in result.items() if key != 'data'}
+        self._record_history(file_path, file_format, df, result['quality_score'], 'incremental')
+        return result
+
+    def _append_rows(
+        self,
+        file_path: Path,
+        file_format: str,
+        state: AppendState,
+        boundary: int,
+        kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Parse the lines in [state.offset, boundary) and append them.
+        
+        Raises:
+            SchemaDriftError: If the appended rows do not fit the cached schema
+        """
+        start = time.time()
+        data = read_range(file_path, state.offset, boundary)
+        malformed = 0
+        if file_format == 'csv':
+            new_rows = parse_csv_tail(
+                data,
+                state.file_columns,
+                state.dtypes,
+                columns=kwargs.get('columns'),
+                filters=kwargs.get('filters'),
+                encoding=kwargs.get('encoding', 'utf-8'),
+                delimiter=kwargs.get('delimiter', ','),
+                quotechar=kwargs.get('quotechar', '"')
+            )
+        else:
+            new_rows, malformed = parse_jsonl_tail(
+                data,
+                columns=kwargs.get('columns'),
+                filters=kwargs.get('filters'),
+                schema=kwargs.get('schema'),
+                max_level=kwargs.get('max_level'),
+                sep=kwargs.get('sep', '.')
+            )
+        new_rows = align_to_schema(new_rows, state.dtypes, allow_missing=file_format == 'jsonl')
+        combined = concat_appended(state.data, new_rows)
+
+        # Only the new rows are folded into the quality metrics
+        state.accumulator.update(new_rows)
+        append_meta = {
+            'mode': MODE_APPEND,
+            'reason': None,
+            'offset': boundary,
+            'appended_rows': len(new_rows),
+            'appended_bytes': boundary - state.offset,
+        }
+        load_result = WorkerResult(
+            worker="DataLoader",
+            task_type=f"{file_format}_append",
+            success=True,
+            data=combined,
+            metadata={**state.load_metadata, 'append': append_meta},
+            warnings=[f"Skipped {malformed} malformed appended lines"] if malformed else [],
+            execution_time_ms=(time.time() - start) * 1000,
+            quality_score=state.result.get('quality_score', 0.0),
+            rows_processed=len(new_rows),
+            rows_failed=malformed,
+        )
+        result = self._validate_loaded(
+            load_result, file_path, file_format,
+            {**kwargs, 'validation_mode': 'incremental'}, state.accumulator
+        )
+
+        state.offset = boundary
+        state.rows = len(combined)
+        state.data = combined
+        state.dtypes = dict(combined.dtypes)
+        state.head_signature = head_signature(file_path, boundary)
+        state.result = {key: value for key, value in result.items() if key != 'data'}
+        state.appends += 1
+        self.append_tracker.record(MODE_APPEND)
+
+        self.logger.info(
+            f"Appended {len(new_rows)} rows ({append_meta['appended_bytes']} bytes) "
+            f"to {file_path.name}: {len(combined)} rows total"
+        )
+        self._record_history(file_path, file_format, combined, result['quality_score'], 'incremental')
+        return result
+
+    def _unchanged_result(self, file_path: Path, file_format: str, state: AppendState) -> Dict[str, Any]:
+        """Serve the tracked frame when nothing complete was appended."""
+        self.append_tracker.record(MODE_UNCHANGED)
+        self.loaded_data = state.data
+        self.metadata = {
+            **state.result.get('metadata', {}),
+            'append': {
+                'mode': MODE_UNCHANGED,
+                'reason': None,
+                'offset': state.offset,
+                'appended_rows': 0,
+                'appended_bytes': 0,
+            }
+        }
+        self.quality_score = state.result.get('quality_score', 0.0)
+        self._record_history(file_path, file_format, state.data, self.quality_score, 'incremental')
+        return {**state.result, 'data': state.data, 'metadata': self.metadata}
+
+    # === SCHEMA PROFILES ===
+
+    def _apply_profile(
+        self,
+        profile: DatasetProfile,
+        file_path: Path,
+        file_format: str,
+        kwargs: Dict[str, Any]
+    ) -> List[str]:
+        """Check a CSV header against a profile and reuse its dtypes.
+        
+        Reading the header costs one line, so drift is caught before the
+        file is parsed. When the header matches, the profile dtypes are
+        passed to the parser (caller-supplied dtype/parse_dates win).
+        
+        Args:
+            profile: Matched profile
+            file_path: File being loaded
+            file_format: Format key
+            kwargs: Load options, updated in place with dtype hints
+            
+        Returns:
+            Header drift descriptions (empty for non-CSV formats)
+        """
+        if file_format != 'csv':
+            return []
+        header = pd.read_csv(
+            file_path,
+            nrows=0,
+            encoding=kwargs.get('encoding', 'utf-8'),
+            sep=kwargs.get('delimiter', ','),
+            quotechar=kwargs.get('quotechar', '"')
+        ).columns
+        drift = compare_schema(profile, header)
+        if not drift:
+            hints = profile.read_hints(read_columns(kwargs.get('columns'), kwargs.get('filters')))
+            kwargs.setdefault('dtype', hints['dtype'])
+            kwargs.setdefault('parse_dates', hints['parse_dates'])
+        return drift
+
+    def _learn_profile(
+        self,
+        profile: Optional[DatasetProfile],
+        dataset: Optional[str],
+        file_path: Path,
+        file_format: str,
+        kwargs: Dict[str, Any],
+        result: Dict[str, Any],
+        relearn: bool = False,
+        pattern: Optional[str] = None
+    ) -> None:
+        """Register a profile for a new dataset, or re-learn a drifted one.
+        
+        Projected, filtered or sampled loads only count as a use of an
+        existing profile: they do not describe the whole dataset.
+        """
+        if self.schema_registry is None or result['status'] == 'error':
+            return
+        partial = (
+            kwargs.get('columns') is not None
+            or kwargs.get('filters')
+            or result['metadata'].get('load_tier') == TIER_SAMPLED
+        )
+        if profile is not None and (partial or not relearn):
+            self.schema_registry.record_load(profile.name)
+            return
+        if partial:
+            return
+        self.schema_registry.register(
+            profile.name if profile is not None else (dataset or str(file_path.resolve())),
+            result['data'],
+            file_format,
+            {key: kwargs[key] for key in ('encoding', 'delimiter', 'quotechar') if key in kwargs},
+            pattern=pattern
+        )
+
+    def _failed_load_result(self, load_result: WorkerResult, message: str) -> Dict[str, Any]:
+        """Build the error result for a failed loader WorkerResult."""
+        self.quality_score = 0.0
+        return {
+            'status': 'error',
+            'message': message,
+            'data': None,
+            'metadata': {},
+            'quality_score': 0.0,
+            'quality_issues': [],
+            'warnings': [w for w in getattr(load_result, 'warnings', [])],
+            'errors': [e['message'] for e in load_result.errors]
+        }
+
+    def _validation_mode(self, kwargs: Dict[str, Any]) -> str:
+        """Validation mode for a load call (kwarg or config default)."""
+        return kwargs.get('validation_mode') or AgentConfig.DATA_LOADER_VALIDATION_MODE
+
+    def _validate_loaded(
+        self,
+        load_result: WorkerResult,
+        file_path: Optional[Path],
+        file_format: str,
+        kwargs: Dict[str, Any],
+        accumulator: Optional[StreamingQualityAccumulator] = None,
+        baseline: Optional[DatasetProfile] = None
+    ) -> Dict[str, Any]:
+        """Validate a successful loader result and build the load result.
+        
+        Updates loaded_data, metadata and quality_score.
+        
+        Args:
+            load_result: Successful loader WorkerResult
+            file_path: Source file (None for multi-file loads)
+            file_format: Format key
+            kwargs: Load options (validation_mode, validation_sample_rows)
+            accumulator: Metrics gathered while streaming (incremental mode)
+            baseline: Schema profile to check the data against (drift)
+            
+        Returns:
+            Load result dictionary
+        """
+        validation_mode = self._validation_mode(kwargs)
+        if validation_mode == 'incremental':
+            accumulator = accumulator or StreamingQualityAccumulator()
+            if accumulator.chunks == 0:
+                # Not streamed: one hashing pass over the loaded frame
+                accumulator.update(load_result.data)
+        loader_quality = getattr(load_result, 'quality_score', 0.0)
         df = load_result.data
         validator_result = self.validator.safe_execute(
             df=df,
-            file_path=str(file_path),
-            file_format=file_format
+            file_path=str(file_path) if file_path is not None else None,
+            file_format=file_format,
+            validation_mode=validation_mode,
+            sample_rows=kwargs.get('validation_sample_rows', AgentConfig.DATA_LOADER_VALIDATION_SAMPLE_ROWS),
+            accumulator=accumulator,
+            baseline=baseline,
+            expected_columns=kwargs.get('columns')
         )
 
         # Get validator quality score
@@ -236,17 +968,7 @@ class DataLoader:
             "quality_issues_count": len(quality_issues)
         })
 
-        # Track load history
-        self.load_history.append({
-            'file_path': str(file_path),
-            'format': file_format,
-            'rows': df.shape[0],
-            'columns': df.shape[1],
-            'quality_score': final_quality,
-            'timestamp': time.time()
-        })
-
-        return {
+        result = {
             'status': 'success' if validator_result.success else 'warning',
             'message': f"Loaded {df.shape[0]} rows and {df.shape[1]} columns (Quality: {final_quality:.2%})",
             'data': df,
@@ -258,63 +980,461 @@ class DataLoader:
             'errors': [] if validator_result.success else [e['message'] for e in validator_result.errors]
         }
 
-    # === FORMAT LOADERS FOR OTHER FORMATS ===
+        return result
 
-    @retry_on_error(max_attempts=3, backoff=2)
-    def _load_jsonl_worker(self, file_path: str) -> WorkerResult:
-        """Load JSONL format.
+    def _load_with_worker(
+        self,
+        file_path: Path,
+        file_format: str,
+        kwargs: Dict[str, Any],
+        accumulator: Optional[StreamingQualityAccumulator] = None
+    ) -> WorkerResult:
+        """Parse one file with the worker for its format.
         
         Args:
-            file_path: Path to JSONL file
+            file_path: Validated file path
+            file_format: Format key from SUPPORTED_FORMATS
+            kwargs: Load options (filters already normalized)
+            accumulator: Filled while streaming chunked/sampled CSV loads
             
         Returns:
-            WorkerResult with loaded DataFrame
+            Loader WorkerResult (not yet validated)
         """
-        structured_logger.info("Loading JSONL file", {
-            "filepath": file_path,
-            "format": "jsonl"
-        })
-        
-        start_time = time.time()
+        pushdown = {'columns': kwargs.get('columns'), 'filters': kwargs.get('filters')}
+
         try:
-            df = pd.read_json(file_path, lines=True)
-            duration = time.time() - start_time
-            structured_logger.info("JSONL loaded successfully", {
-                "shape": str(df.shape),
-                "columns": len(df.columns),
-                "duration_sec": round(duration, 3)
-            })
-            return WorkerResult(
-                worker="DataLoaderJSONL",
-                task_type="load_jsonl",
-                success=True,
-                data=df,
-                errors=[],
-                warnings=[],
-                quality_score=1.0 if len(df) > 0 else 0.0
+            plan = choose_tier(
+                file_path.stat().st_size / (1024 * 1024),
+                file_format,
+                in_memory_max_mb=self.MAX_FILE_SIZE_MB,
+                memory_fraction=AgentConfig.DATA_LOADER_MEMORY_FRACTION,
+                requested_tier=kwargs.get('load_tier')
             )
-        except Exception as e:
-            structured_logger.error("Failed to load JSONL", {
-                "filepath": file_path,
-                "error": str(e)
-            })
+        except ValueError as e:
             return WorkerResult(
-                worker="DataLoaderJSONL",
-                task_type="load_jsonl",
+                worker="DataLoader",
+                task_type=f"{file_format}_loading",
                 success=False,
                 data=None,
-                errors=[{"message": str(e), "type": "load_error"}],
-                warnings=[],
+                errors=[{"type": ErrorType.VALIDATION_ERROR.value, "message": str(e)}],
                 quality_score=0.0
             )
 
+        load_result = self._run_format_worker(
+            file_path, file_format, kwargs, pushdown, plan.tier, plan.sample_fraction, accumulator
+        )
+        if load_result.success:
+            load_result.metadata.update(plan.to_dict())
+            if plan.tier == TIER_SAMPLED:
+                load_result.warnings.append(
+                    f"Loaded a {plan.sample_fraction:.2%} row sample: {plan.reason}"
+                )
+        return load_result
+
+    def _run_format_worker(
+        self,
+        file_path: Path,
+        file_format: str,
+        kwargs: Dict[str, Any],
+        pushdown: Dict[str, Any],
+        tier: str,
+        sample_fraction: float,
+        accumulator: Optional[StreamingQualityAccumulator] = None
+    ) -> WorkerResult:
+        """Dispatch to the format worker for the chosen tier."""
+        if file_format == 'csv':
+            dialect = {
+                key: kwargs[key]
+                for key in ('encoding', 'delimiter', 'quotechar', 'dtype', 'parse_dates') if key in kwargs
+            }
+            if tier in (TIER_CHUNKED, TIER_SAMPLED):
+                return self.csv_streaming.safe_execute(
+                    file_path=str(file_path),
+                    detected_format=file_format,
+                    sample_fraction=sample_fraction,
+                    accumulator=accumulator,
+                    optimize_dtypes=kwargs.get('optimize_dtypes', False),
+                    sample_rows=kwargs.get('sample_rows', 10_000),
+                    **dialect,
+                    **pushdown
+                )
+            return self.csv_loader.safe_execute(
+                file_path=str(file_path),
+                detected_format=file_format,
+                optimize_dtypes=kwargs.get('optimize_dtypes', False),
+                sample_rows=kwargs.get('sample_rows', 10_000),
+                **dialect,
+                **pushdown
+            )
+        if file_format == 'parquet':
+            return self.parquet_loader.safe_execute(
+                file_path=str(file_path),
+                detected_format=file_format,
+                incremental=tier in (TIER_CHUNKED, TIER_SAMPLED),
+                sample_fraction=sample_fraction,
+                **pushdown
+            )
+        if file_format in ['json', 'xlsx', 'xls']:
+            return self.json_excel_loader.safe_execute(
+                file_path=str(file_path),
+                file_format=file_format,
+                detected_format=file_format,
+                sheet_name=kwargs.get('sheet_name', 0),
+                **pushdown
+            )
+        if file_format == 'jsonl':
+            # Line batches bound parse memory at every tier; sampling thins each batch
+            return self.jsonl_streaming.safe_execute(
+                file_path=str(file_path),
+                detected_format=file_format,
+                sample_fraction=sample_fraction,
+                accumulator=accumulator,
+                **{key: kwargs[key] for key in ('chunksize', 'schema', 'max_level', 'sep') if key in kwargs},
+                **pushdown
+            )
+        if file_format in ['h5', 'hdf5']:
+            return self._load_hdf5_worker(file_path=str(file_path), **pushdown)
+        if file_format in ['db', 'sqlite']:
+            return self._load_sqlite_worker(
+                str(file_path),
+                table_name=kwargs.get('table_name', DEFAULT_TABLE),
+                query=kwargs.get('query'),
+                params=kwargs.get('params'),
+                chunksize=kwargs.get('chunksize', SQL_CHUNKSIZE),
+                sample_fraction=sample_fraction,
+                accumulator=accumulator,
+                **pushdown
+            )
+        raise ValueError(f"Unsupported format: {file_format}")
+
+    def _result_from_cache(
+        self,
+        file_path: Path,
+        file_format: str,
+        df: pd.DataFrame,
+        entry: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Build load result from a cache entry without re-validating.
+        
+        Args:
+            file_path: Source file path
+            file_format: Detected format
+            df: Cached DataFrame
+            entry: Stored result fields (everything except data)
+            
+        Returns:
+            Load result dictionary
+        """
+        self.loaded_data = df
+        self.metadata = entry.get('metadata', {})
+        self.metadata['cache_hit'] = True
+        self.quality_score = entry.get('quality_score', 0.0)
+
+        self.logger.info(f"Loaded {file_format} from cache: {df.shape[0]} rows, {df.shape[1]} columns")
+        self._record_history(file_path, file_format, df, self.quality_score, 'hit')
+
+        return {**entry, 'data': df, 'metadata': self.metadata}
+
+    def _record_history(
+        self,
+        file_path: Path,
+        file_format: str,
+        df: pd.DataFrame,
+        quality_score: float,
+        cache_status: str
+    ) -> None:
+        """Append an entry to load_history.
+        
+        Args:
+            file_path: Source file path
+            file_format: Detected format
+            df: Loaded DataFrame
+            quality_score: Final quality score
+            cache_status: 'hit', 'miss', 'uncacheable' or 'disabled'
+        """
+        entry = {
+            'file_path': str(file_path),
+            'format': file_format,
+            'rows': df.shape[0],
+            'columns': df.shape[1],
+            'quality_score': quality_score,
+            'timestamp': time.time(),
+            'cache': cache_status,
+        }
+        if self.load_cache is not None:
+            entry['cache_hits'] = self.load_cache.hits
+            entry['cache_misses'] = self.load_cache.misses
+        self.load_history.append(entry)
+
+    def stream(
+        self,
+        file_path: str,
+        chunksize: int = 100_000,
+        accumulator: Optional[StreamingQualityAccumulator] = None,
+        track_duplicates: bool = True,
+        **kwargs
+    ) -> Iterator[pd.DataFrame]:
+        """Stream a CSV or JSONL file as DataFrame chunks.
+        
+        Memory stays bounded by ``chunksize``; nothing is kept in
+        ``loaded_data``. Pass an accumulator to collect quality metrics
+        (nulls, duplicates, dtypes) while iterating.
+        
+        Args:
+            file_path: Path to CSV or JSONL file
+            chunksize: Rows per chunk
+            accumulator: Optional StreamingQualityAccumulator to update
+            track_duplicates: If False, the accumulator skips row hashing
+                (duplicates are reported as None)
+            **kwargs: columns/filters pushdown (see load()) plus additional
+                pandas read_csv arguments, or schema/max_level/sep/stats
+                for JSONL (see JSONLStreaming.iter_chunks)
+            
+        Yields:
+            DataFrame chunks
+        """
+        file_format, csv_options = self._resolve_format(Path(file_path))
+        structured_logger.info("Streaming file", {
+            "filepath": str(file_path),
+            "format": file_format,
+            "chunksize": chunksize
+        })
+        if accumulator is not None and not track_duplicates:
+            accumulator.track_duplicates = False
+        if file_format == 'jsonl':
+            yield from self.jsonl_streaming.iter_chunks(
+                str(file_path),
+                chunksize=chunksize,
+                accumulator=accumulator,
+                detected_format=file_format,
+                **kwargs
+            )
+            return
+        for key, value in csv_options.items():
+            kwargs.setdefault(key, value)
+        yield from self.csv_streaming.iter_chunks(
+            str(file_path),
+            chunksize=chunksize,
+            accumulator=accumulator,
+            **kwargs
+        )
+
+    def load_many(
+        self,
+        pattern_or_paths: Union[str, Sequence[str]],
+        parallelism: int = DEFAULT_PARALLELISM,
+        source_column: Optional[str] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Load a partitioned dataset from several files into one DataFrame.
+        
+        Partitions are parsed concurrently in a thread pool (the pandas and
+        pyarrow readers release the GIL while parsing), concatenated with
+        the union of their columns, then validated once as a whole.
+        
+        Args:
+            pattern_or_paths: Glob pattern ('exports/sales_2025-*.csv') or
+                list of file paths; partitions may mix formats
+            parallelism: Maximum number of files parsed at once
+            source_column: If set, add a categorical column with each
+                row's source file name
+            **kwargs: Per-file load options (columns, filters, optimize_dtypes, ...)
+            
+        Returns:
+            Same structure as load(); metadata adds 'files', 'file_count',
+            'parallelism', 'missing_columns' and 'dtype_conflicts'
+        """
+        if not isinstance(parallelism, int) or parallelism < 1:
+            return self._error_result(f"parallelism must be a positive integer, got {parallelism}")
+
+        paths = self._expand_paths(pattern_or_paths)
+        if not paths:
+            return self._error_result(f"No files match: {pattern_or_paths}")
+
+        kwargs.pop('use_cache', None)
+        try:
+            kwargs['filters'] = normalize_filters(kwargs.get('filters'))
+        except ValueError as e:
+            return self._error_result(str(e))
+
+        # Resolve and validate every partition before parsing any of them
+        partitions = []
+        for path in paths:
+            file_format, csv_options = self._resolve_format(path)
+            if file_format is None:
+                return self._error_result(f"Unsupported or unknown format for file: {path}")
+            validation = self._validate_file(path, file_format)
+            if not validation['valid']:
+                return self._error_result(validation['message'])
+            partitions.append((path, file_format, {**csv_options, **kwargs}))
+
+        structured_logger.info("Loading partitioned dataset", {
+            "files": len(partitions),
+            "parallelism": parallelism
+        })
+
+        start_time = time.time()
+        with ThreadPoolExecutor(max_workers=min(parallelism, len(partitions))) as pool:
+            load_results = list(pool.map(
+                lambda partition: self._load_with_worker(*partition),
+                partitions
+            ))
+        parse_duration = time.time() - start_time
+
+        # With filters, a partition with no matching rows is expected, not a failure
+        filtered_out = [
+            not load_result.success and bool(kwargs['filters']) and all(
+                error.get('type') == ErrorType.EMPTY_DATA.value for error in load_result.errors
+            )
+            for load_result in load_results
+        ]
+        failed = [
+            f"{path.name}: {error['message']}"
+            for (path, _, _), load_result, skipped in zip(partitions, load_results, filtered_out)
+            if not load_result.success and not skipped
+            for error in load_result.errors
+        ]
+        if failed:
+            self.quality_score = 0.0
+            return {**self._error_result(f"Failed to load {len(failed)} of {len(partitions)} files"), 'errors': failed}
+        if all(filtered_out):
+            self.quality_score = 0.0
+            return self._error_result("No rows match filters in any file")
+
+        frames = []
+        frame_names = []
+        files_meta = []
+        for (path, file_format, _), load_result, skipped in zip(partitions, load_results, filtered_out):
+            if skipped:
+                files_meta.append({'file': str(path), 'format': file_format, 'rows': 0, 'quality_score': 0.0})
+                continue
+            df = load_result.data
+            if source_column:
+                df = df.assign(**{source_column: path.name})
+            frames.append(df)
+            frame_names.append(path.name)
+            files_meta.append({
+                'file': str(path),
+                'format': file_format,
+                'rows': len(df),
+                'quality_score': load_result.quality_score,
+                'load_tier': load_result.metadata.get('load_tier'),
+            })
+
+        schema_report = self._schema_report(frames, frame_names)
+        combined = pd.concat(frames, ignore_index=True, sort=False)
+        if source_column:
+            combined[source_column] = combined[source_column].astype('category')
+
+        total_rows = sum(len(df) for df in frames)
+        loader_quality = (
+            sum(meta['quality_score'] * meta['rows'] for meta in files_meta) / total_rows
+            if total_rows else 0.0
+        )
+        warnings = sorted({w for load_result in load_results for w in load_result.warnings})
+        warnings += [
+            f"Column '{col}' missing from {len(files)} file(s); filled with nulls"
+            for col, files in schema_report['missing_columns'].items()
+        ]
+        warnings += [
+            f"Column '{col}' has conflicting dtypes across files: {dtypes}"
+            for col, dtypes in schema_report['dtype_conflicts'].items()
+        ]
+
+        formats = sorted({file_format for _, file_format, _ in partitions})
+        dataset_format = formats[0] if len(formats) == 1 else 'mixed'
+        combined_result = WorkerResult(
+            worker="DataLoaderMultiFile",
+            task_type="load_many",
+            success=True,
+            data=combined,
+            metadata={
+                'files': files_meta,
+                'file_count': len(files_meta),
+                'file_name': str(pattern_or_paths) if isinstance(pattern_or_paths, str) else f"{len(files_meta)} files",
+                'file_size_mb': round(sum(path.stat().st_size for path, _, _ in partitions) / (1024 * 1024), 2),
+                'parallelism': parallelism,
+                'parse_duration_sec': round(parse_duration, 3),
+                **schema_report,
+            },
+            warnings=warnings,
+            quality_score=loader_quality,
+            rows_processed=total_rows
+        )
+
+        result = self._validate_loaded(combined_result, None, dataset_format, kwargs)
+        self._record_history(
+            Path(combined_result.metadata['file_name']),
+            dataset_format,
+            combined,
+            result['quality_score'],
+            'disabled'
+        )
+        return result
+
+    @staticmethod
+    def _expand_paths(pattern_or_paths: Union[str, Sequence[str]]) -> List[Path]:
+        """Expand a glob pattern or path list into sorted existing paths.
+        
+        Args:
+            pattern_or_paths: Glob pattern, single path, or list of paths
+            
+        Returns:
+            List of Path objects
+        """
+        if isinstance(pattern_or_paths, (str, Path)):
+            pattern = str(pattern_or_paths)
+            if glob.has_magic(pattern):
+                return [Path(p) for p in sorted(glob.glob(pattern)) if Path(p).is_file()]
+            return [Path(pattern)]
+        return [Path(p) for p in pattern_or_paths]
+
+    @staticmethod
+    def _schema_report(frames: List[pd.DataFrame], names: List[str]) -> Dict[str, Any]:
+        """Describe how partition schemas differ before concatenation.
+        
+        Args:
+            frames: Partition DataFrames
+            names: File name per partition
+            
+        Returns:
+            {'missing_columns': {col: [files]}, 'dtype_conflicts': {col: [dtypes]}}
+        """
+        all_columns: List[str] = []
+        dtypes: Dict[str, set] = {}
+        for df in frames:
+            for col in df.columns:
+                if col not in dtypes:
+                    all_columns.append(col)
+                    dtypes[col] = set()
+                dtypes[col].add(str(df[col].dtype))
+
+        missing = {
+            col: [name for name, df in zip(names, frames) if col not in df.columns]
+            for col in all_columns
+        }
+        return {
+            'missing_columns': {col: files for col, files in missing.items() if files},
+            'dtype_conflicts': {col: sorted(types) for col, types in dtypes.items() if len(types) > 1},
+        }
+
+    # === FORMAT LOADERS FOR OTHER FORMATS ===
+
     @retry_on_error(max_attempts=3, backoff=2)
-    def _load_hdf5_worker(self, file_path: str, key: str = 'data') -> WorkerResult:
+    def _load_hdf5_worker(
+        self,
+        file_path: str,
+        key: str = 'data',
+        columns: Optional[List[str]] = None,
+        filters: Optional[List[Any]] = None
+    ) -> WorkerResult:
         """Load HDF5 format.
         
         Args:
             file_path: Path to HDF5 file
             key: HDF5 key/group name
+            columns: Optional columns to keep
+            filters: Optional [(column, op, value)] row filters
             
         Returns:
             WorkerResult with loaded DataFrame
@@ -327,7 +1447,7 @@ class DataLoader:
         
         start_time = time.time()
         try:
-            df = pd.read_hdf(file_path, key)
+            df = apply_pushdown(pd.read_hdf(file_path, key), columns, filters)
             duration = time.time() - start_time
             structured_logger.info("HDF5 loaded successfully", {
                 "shape": str(df.shape),
@@ -358,67 +1478,61 @@ class DataLoader:
                 quality_score=0.0
             )
 
-    @retry_on_error(max_attempts=3, backoff=2)
-    def _load_sqlite_worker(self, file_path: str, table_name: str = 'data', query: Optional[str] = None) -> WorkerResult:
+    def _load_sqlite_worker(
+        self,
+        file_path: str,
+        table_name: str = DEFAULT_TABLE,
+        query: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+        filters: Optional[List[Any]] = None,
+        **kwargs
+    ) -> WorkerResult:
         """Load SQLite database.
         
+        Kept for direct callers; delegates to SQLLoaderWorker.
+        
         Args:
             file_path: Path to SQLite database file
             table_name: Table name to load
             query: Optional SQL query to execute
+            columns: Optional columns to select
+            filters: Optional [(column, op, value)] row filters
+            **kwargs: params, chunksize, sample_fraction, accumulator
             
         Returns:
             WorkerResult with loaded DataFrame
         """
-        structured_logger.info("Loading SQLite database", {
-            "filepath": file_path,
-            "format": "sqlite",
-            "table": table_name,
-            "query": query
-        })
+        return self.sql_loader.safe_execute(
+            source=file_path,
+            table_name=table_name,
+            query=query,
+            columns=columns,
+            filters=filters,
+            **{key: kwargs[key] for key in ('params', 'chunksize', 'sample_fraction', 'accumulator') if key in kwargs}
+        )
+
+    # === FILE VALIDATION & FORMAT DETECTION ===
+
+    def _resolve_format(self, file_path: Path) -> Tuple[Optional[str], Dict[str, Any]]:
+        """Sniff the file header with FormatDetection, falling back to the extension.
         
-        start_time = time.time()
-        try:
-            conn = sqlite3.connect(file_path)
-            
-            if query:
-                df = pd.read_sql(query, conn)
-            else:
-                df = pd.read_sql(f'SELECT * FROM {table_name}', conn)
-            
-            conn.close()
-            duration = time.time() - start_time
+        Args:
+            file_path: Path object
             
-            structured_logger.info("SQLite loaded successfully", {
-                "shape": str(df.shape),
-                "columns": len(df.columns),
-                "duration_sec": round(duration, 3)
-            })
-            return WorkerResult(
-                worker="DataLoaderSQLite",
-                task_type="load_sqlite",
-                success=True,
-                data=df,
-                errors=[],
-                warnings=[],
-                quality_score=1.0 if len(df) > 0 else 0.0
-            )
-        except Exception as e:
-            structured_logger.error("Failed to load SQLite", {
-                "filepath": file_path,
-                "error": str(e)
-            })
-            return WorkerResult(
-                worker="DataLoaderSQLite",
-                task_type="load_sqlite",
-                success=False,
-                data=None,
-                errors=[{"message": str(e), "type": "load_error"}],
-                warnings=[],
-                quality_score=0.0
-            )
+        Returns:
+            (format key or None if it cannot be determined, sniffed CSV
+            options - encoding, delimiter, quotechar - for CSV files)
+        """
+        detection_result = self.format_detector.safe_execute(file_path=str(file_path))
+        if detection_result.success and detection_result.data:
+            file_format = detection_result.data.get('detected_format')
+            if file_format in self.SUPPORTED_FORMATS:
+                return file_format, detection_result.data.get('csv_options', {})
 
-    # === FILE VALIDATION & FORMAT DETECTION ===
+        file_format = file_path.suffix.lower().lstrip('.')
+        if file_format and file_format in self.SUPPORTED_FORMATS:
+            return file_format, {}
+        return None, {}
 
     def _validate_file(self, file_path: Path, file_format: str) -> Dict[str, Any]:
         """Validate file before loading.
@@ -433,10 +1547,6 @@ class DataLoader:
         if not file_path.exists():
             return {'valid': False, 'message': f"File not found: {file_path}"}
 
-        file_size_mb = file_path.stat().st_size / (1024 * 1024)
-        if file_size_mb > self.MAX_FILE_SIZE_MB:
-            return {'valid': False, 'message': f"File too large: {file_size_mb:.1f}MB (max: {self.MAX_FILE_SIZE_MB}MB)"}
-
         if file_format not in self.SUPPORTED_FORMATS:
             return {'valid': False, 'message': f"Unsupported format: {file_format}. Supported: {self.SUPPORTED_FORMATS}"}
 
@@ -564,6 +1674,16 @@ class DataLoader:
         """
         return self.load_history
 
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get load cache counters.
+        
+        Returns:
+            Cache stats dictionary, or {'enabled': False}
+        """
+        if self.load_cache is None:
+            return {'enabled': False}
+        return {'enabled': True, **self.load_cache.get_stats()}
+
     # === UTILITIES ===
 
     def _error_result(self, message: str) -> Dict[str, Any]:
@@ -4,11 +4,21 @@ Core Workers:
 - CSVLoaderWorker: Loads CSV files
 - JSONExcelLoaderWorker: Loads JSON and Excel files
 - ParquetLoaderWorker: Loads Parquet files
+- SQLLoaderWorker: Chunked SQLite/SQLAlchemy reads with query pushdown
 - ValidatorWorker: Validates loaded data
 
 Performance/Format Workers (Week 1 Day 1):
 - CSVStreaming: Streams large CSV files
-- FormatDetection: Auto-detects file format
+- JSONLStreaming: Streams JSON Lines files in line batches
+- FormatDetection: Sniffs file format, encoding and CSV dialect from the header
+
+Helpers:
+- StreamingQualityAccumulator: Incremental quality metrics over chunks
+- LoadCache: Parquet cache of parsed datasets
+- AppendTracker: Per-file offsets for incremental append loading
+- SchemaRegistry: Persistent per-dataset schema profiles
+- DtypeOptimizer: Compact dtype inference and downcasting
+- pushdown: Column projection and row-filter helpers shared by loaders
 """
 
 from typing import List
@@ -16,9 +26,16 @@ from .base_worker import BaseWorker, WorkerResult, ErrorType
 from .csv_loader import CSVLoaderWorker
 from .json_excel_loader import JSONExcelLoaderWorker
 from .parquet_loader import ParquetLoaderWorker
+from .sql_loader import SQLLoaderWorker, SQLConnectionPool
 from .validator_worker import ValidatorWorker
 from .csv_streaming import CSVStreaming
+from .jsonl_streaming import JSONLStreaming
 from .format_detection import FormatDetection
+from .quality_accumulator import StreamingQualityAccumulator
+from .load_cache import LoadCache
+from .append_tracker import AppendTracker
+from .schema_registry import SchemaRegistry, DatasetProfile
+from .dtype_optimizer import DtypeOptimizer
 
 __all__ = [
     "BaseWorker",
@@ -27,7 +44,16 @@ __all__ = [
     "CSVLoaderWorker",
     "JSONExcelLoaderWorker",
     "ParquetLoaderWorker",
+    "SQLLoaderWorker",
+    "SQLConnectionPool",
     "ValidatorWorker",
     "CSVStreaming",
+    "JSONLStreaming",
     "FormatDetection",
+    "StreamingQualityAccumulator",
+    "LoadCache",
+    "AppendTracker",
+    "SchemaRegistry",
+    "DatasetProfile",
+    "DtypeOptimizer",
 ]
@@ -0,0 +1,319 @@
+"""Append Tracker - Incremental loading of CSV/JSONL files that only grow.
+
+Remembers, per file, where the last load stopped so the next load parses
+only the bytes appended since:
+- Offset: byte position just past the last complete line that was parsed
+- Head signature: SHA-256 of the file's first bytes; a mismatch means the
+  file was rewritten or rotated, not appended to
+- Schema: column names and dtypes of the cached frame; appended rows are
+  cast to them, and a column change forces a full reload
+- Accumulator: the StreamingQualityAccumulator of the cached frame, so
+  quality metrics are updated with the new rows only
+
+A trailing line without a newline is treated as still being written and
+is left for the next load.
+"""
+
+import hashlib
+import io
+import json
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from .pushdown import apply_pushdown
+from .quality_accumulator import StreamingQualityAccumulator
+from core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# ===== CONSTANTS =====
+APPENDABLE_FORMATS = ['csv', 'jsonl']
+HEAD_SIGNATURE_BYTES = 4096
+SCAN_BLOCK_BYTES = 64 * 1024
+
+# Append modes reported in metadata['append']['mode']
+MODE_FULL = 'full'
+MODE_APPEND = 'append'
+MODE_UNCHANGED = 'unchanged'
+
+
+class SchemaDriftError(ValueError):
+    """Appended rows do not match the schema of the cached frame."""
+
+
+@dataclass
+class AppendState:
+    """What the last load of one file consumed."""
+    file_format: str
+    options_key: str
+    offset: int
+    rows: int
+    head_signature: str
+    file_columns: List[str]
+    dtypes: Dict[str, Any]
+    data: pd.DataFrame
+    accumulator: StreamingQualityAccumulator
+    load_metadata: Dict[str, Any] = field(default_factory=dict)
+    result: Dict[str, Any] = field(default_factory=dict)
+    appends: int = 0
+
+
+def options_key(kwargs: Dict[str, Any]) -> str:
+    """Stable key of the load options that shape the parsed frame."""
+    relevant = {
+        key: value for key, value in kwargs.items()
+        if key not in ('incremental', 'use_cache', 'validation_mode', 'validation_sample_rows')
+    }
+    return json.dumps(relevant, sort_keys=True, default=str)
+
+
+def head_signature(file_path: Path, length: int) -> str:
+    """SHA-256 of the first ``length`` bytes (capped at HEAD_SIGNATURE_BYTES)."""
+    with open(file_path, 'rb') as f:
+        head = f.read(min(length, HEAD_SIGNATURE_BYTES))
+    return hashlib.sha256(head).hexdigest()
+
+
+def complete_boundary(file_path: Path, start: int, size: int) -> int:
+    """Offset just past the last newline in [start, size), or start if none.
+
+    Scans backwards from the end of the file in blocks, so only the
+    unfinished tail is read.
+    """
+    with open(file_path, 'rb') as f:
+        end = size
+        while end > start:
+            block_start = max(start, end - SCAN_BLOCK_BYTES)
+            f.seek(block_start)
+            block = f.read(end - block_start)
+            newline = block.rfind(b'\n')
+            if newline >= 0:
+                return block_start + newline + 1
+            end = block_start
+    return start
+
+
+def read_range(file_path: Path, start: int, end: int) -> bytes:
+    """Raw bytes of [start, end)."""
+    with open(file_path, 'rb') as f:
+        f.seek(start)
+        return f.read(end - start)
+
+
+def _is_text_dtype(dtype: Any) -> bool:
+    """Whether a cached column holds text: object, str/StringDtype (pandas 3) or text categories."""
+    if isinstance(dtype, pd.CategoricalDtype):
+        dtype = dtype.categories.dtype
+    return pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype)
+
+
+def parse_csv_tail(
+    data: bytes,
+    file_columns: List[str],
+    dtypes: Dict[str, Any],
+    columns: Optional[List[str]] = None,
+    filters: Optional[List[Any]] = None,
+    encoding: str = 'utf-8',
+    delimiter: str = ',',
+    quotechar: str = '"'
+) -> pd.DataFrame:
+    """Parse appended CSV lines (no header) with the original columns.
+
+    Text columns of the cached frame are read as strings so numeric-looking
+    values are not re-inferred as numbers.
+    """
+    text_columns = {
+        col: str for col, dtype in dtypes.items()
+        if col in file_columns and _is_text_dtype(dtype)
+    }
+    df = pd.read_csv(
+        io.BytesIO(data),
+        header=None,
+        names=file_columns,
+        dtype=text_columns or None,
+        encoding=encoding,
+        sep=delimiter,
+        quotechar=quotechar,
+        low_memory=False,
+        on_bad_lines='skip',
+        encoding_errors='ignore',
+    )
+    return apply_pushdown(df, columns, filters)
+
+
+def parse_jsonl_tail(
+    data: bytes,
+    columns: Optional[List[str]] = None,
+    filters: Optional[List[Any]] = None,
+    schema: Optional[Dict[str, Any]] = None,
+    max_level: Optional[int] = None,
+    sep: str = '.'
+) -> Tuple[pd.DataFrame, int]:
+    """Parse appended JSON lines.
+
+    Returns:
+        Tuple of flattened DataFrame and the number of malformed lines skipped
+    """
+    records = []
+    malformed = 0
+    for line in data.splitlines():
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except (ValueError, UnicodeDecodeError):
+            record = None
+        if not isinstance(record, dict):
+            malformed += 1
+            continue
+        records.append(record)
+
+    df = pd.json_normalize(records, sep=sep, max_level=max_level)
+    if schema:
+        df = df.reindex(columns=list(schema)).astype(schema)
+    if columns is None and filters is None:
+        return df, malformed
+    # Filters may reference optional keys absent from every appended line
+    needed = list(columns or []) + [flt[0] for flt in filters or []]
+    df = df.reindex(columns=list(dict.fromkeys(list(df.columns) + needed)))
+    return apply_pushdown(df, columns, filters), malformed
+
+
+def align_to_schema(
+    new_rows: pd.DataFrame,
+    dtypes: Dict[str, Any],
+    allow_missing: bool = False
+) -> pd.DataFrame:
+    """Cast appended rows to the cached column order and dtypes.
+
+    Categorical columns keep their dtype; new categories are added by
+    concat_appended().
+
+    Args:
+        new_rows: Parsed appended rows
+        dtypes: {column: dtype} of the cached frame
+        allow_missing: Fill absent columns with nulls (optional JSONL keys)
+
+    Returns:
+        DataFrame with exactly the cached columns
+
+    Raises:
+        SchemaDriftError: If columns were added/removed or a cast fails
+    """
+    expected = list(dtypes)
+    extra = [col for col in new_rows.columns if col not in dtypes]
+    missing = [col for col in expected if col not in new_rows.columns]
+    if extra or (missing and not allow_missing):
+        raise SchemaDriftError(f"Columns changed: added {extra}, removed {missing}")
+
+    aligned = new_rows.reindex(columns=expected)
+    casts = {}
+    for col, dtype in dtypes.items():
+        if isinstance(dtype, pd.CategoricalDtype):
+            casts[col] = 'category'
+        elif aligned[col].dtype != dtype:
+            casts[col] = dtype
+    try:
+        return aligned.astype(casts) if casts else aligned
+    except (ValueError, TypeError) as e:
+        raise SchemaDriftError(f"Appended rows do not match cached dtypes: {e}") from e
+
+
+def concat_appended(cached: pd.DataFrame, new_rows: pd.DataFrame) -> pd.DataFrame:
+    """Append rows to the cached frame, preserving categorical columns."""
+    if new_rows.empty:
+        return cached
+    unions = {}
+    for col in cached.columns:
+        dtype = cached[col].dtype
+        if isinstance(dtype, pd.CategoricalDtype) and dtype != new_rows[col].dtype:
+            unions[col] = pd.CategoricalDtype(
+                dtype.categories.union(new_rows[col].cat.categories), ordered=dtype.ordered
+            )
+    if unions:
+        cached = cached.astype(unions)
+        new_rows = new_rows.astype(unions)
+    return pd.concat([cached, new_rows], ignore_index=True)
+
+
+class AppendTracker:
+    """Thread-safe registry of AppendState per resolved file path.
+
+    Example:
+        >>> tracker = AppendTracker()
+        >>> state = tracker.get(path)
+        >>> if state is not None and tracker.reload_reason(state, path, key, size) is None:
+        ...     tail = read_range(path, state.offset, complete_boundary(path, state.offset, size))
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty tracker."""
+        self._states: Dict[str, AppendState] = {}
+        self._lock = threading.Lock()
+        self.full_loads = 0
+        self.appends = 0
+        self.unchanged = 0
+
+    @staticmethod
+    def _key(file_path: Any) -> str:
+        return str(Path(file_path).resolve())
+
+    def get(self, file_path: Any) -> Optional[AppendState]:
+        """State from the last load of a file, or None."""
+        with self._lock:
+            return self._states.get(self._key(file_path))
+
+    def put(self, file_path: Any, state: AppendState) -> None:
+        """Remember a file's state after a load."""
+        with self._lock:
+            self._states[self._key(file_path)] = state
+
+    def forget(self, file_path: Any = None) -> None:
+        """Drop one file's state, or all states when file_path is None."""
+        with self._lock:
+            if file_path is None:
+                self._states.clear()
+            else:
+                self._states.pop(self._key(file_path), None)
+
+    def record(self, mode: str) -> None:
+        """Count a load by mode (full, append, unchanged)."""
+        with self._lock:
+            if mode == MODE_APPEND:
+                self.appends += 1
+            elif mode == MODE_UNCHANGED:
+                self.unchanged += 1
+            else:
+                self.full_loads += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Tracked files and load counts by mode."""
+        with self._lock:
+            return {
+                'tracked_files': len(self._states),
+                'full_loads': self.full_loads,
+                'appends': self.appends,
+                'unchanged': self.unchanged,
+            }
+
+    @staticmethod
+    def reload_reason(state: AppendState, file_path: Path, options: str, size: int) -> Optional[str]:
+        """Why the cached state cannot be extended, or None if it can.
+
+        Args:
+            state: State from the previous load
+            file_path: Source file
+            options: options_key() of the current load options
+            size: Current file size in bytes
+        """
+        if state.options_key != options:
+            return 'load options changed'
+        if size < state.offset:
+            return 'file was truncated'
+        if head_signature(file_path, state.offset) != state.head_signature:
+            return 'file was rewritten'
+        return None
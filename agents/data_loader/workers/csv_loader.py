@@ -6,14 +6,18 @@ Handles:
 - Data quality tracking
 - Comprehensive error intelligence
 - Quality score calculation (0-1 range)
+- Optional compact dtype inference (optimize_dtypes)
+- Column projection (usecols) and row filters
 """
 
 import pandas as pd
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 import time
 
 from .base_worker import BaseWorker, WorkerResult, ErrorType
+from .dtype_optimizer import DtypeOptimizer, DEFAULT_SAMPLE_ROWS
+from .pushdown import normalize_filters, read_columns, apply_pushdown
 from core.logger import get_logger
 from agents.error_intelligence.main import ErrorIntelligence
 
@@ -39,7 +43,16 @@ class CSVLoaderWorker(BaseWorker):
         {
             'file_path': str (required),
             'encoding': str (optional, defaults to 'utf-8'),
-            'delimiter': str (optional, defaults to ',')
+            'delimiter': str (optional, defaults to ','),
+            'quotechar': str (optional, defaults to '"'),
+            'detected_format': str (optional, 'csv' when sniffing confirmed
+                the content; lifts the .csv extension requirement),
+            'optimize_dtypes': bool (optional, defaults to False),
+            'sample_rows': int (optional, rows sampled for dtype inference),
+            'dtype': Dict[str, str] (optional, known column dtypes),
+            'parse_dates': List[str] (optional, known datetime columns),
+            'columns': List[str] (optional, only these columns are parsed),
+            'filters': List[(column, op, value)] (optional)
         }
     
     Output Format:
@@ -71,7 +84,6 @@ class CSVLoaderWorker(BaseWorker):
         Checks:
         - file_path exists and is accessible
         - File is readable CSV
-        - File is not too large (>100MB)
         
         Args:
             input_data: Dictionary with 'file_path' key
@@ -96,13 +108,10 @@ class CSVLoaderWorker(BaseWorker):
         if not file_path.exists():
             raise ValueError(f"File not found: {file_path}")
         
-        if file_path.suffix.lower() != '.csv':
+        # Extensionless or mislabeled files are accepted once sniffing confirmed CSV
+        if file_path.suffix.lower() not in ('.csv', '') and input_data.get('detected_format') != 'csv':
             raise ValueError(f"File must be CSV, got {file_path.suffix}")
         
-        file_size_mb = file_path.stat().st_size / (1024 * 1024)
-        if file_size_mb > 100:
-            raise ValueError(f"File too large: {file_size_mb:.1f}MB (max: 100MB)")
-        
         return True
     
     def execute(self, **kwargs) -> WorkerResult:
@@ -112,6 +121,15 @@ class CSVLoaderWorker(BaseWorker):
             file_path: Path to CSV file (required)
             encoding: File encoding (optional, default 'utf-8')
             delimiter: CSV delimiter (optional, default ',')
+            quotechar: Quote character (optional, default '"')
+            detected_format: Format confirmed by FormatDetection (optional)
+            optimize_dtypes: Infer compact dtypes from a sample (optional, default False)
+            sample_rows: Rows sampled for dtype inference (optional, default 10,000)
+            dtype: Known column dtypes, e.g. from a schema profile (optional;
+                takes precedence over optimize_dtypes)
+            parse_dates: Known datetime columns (optional)
+            columns: Columns to parse and return (optional)
+            filters: [(column, op, value)] row filters (optional)
             **kwargs: Additional pandas read_csv arguments
             
         Returns:
@@ -120,7 +138,10 @@ class CSVLoaderWorker(BaseWorker):
         start_time = time.time()
         try:
             # Validate input
-            self.validate_input({'file_path': kwargs.get('file_path')})
+            self.validate_input({
+                'file_path': kwargs.get('file_path'),
+                'detected_format': kwargs.get('detected_format')
+            })
             
             result = self._run_csv_load(**kwargs)
             
@@ -171,23 +192,50 @@ class CSVLoaderWorker(BaseWorker):
         file_path = kwargs.get('file_path')
         encoding = kwargs.get('encoding', 'utf-8')
         delimiter = kwargs.get('delimiter', ',')
+        quotechar = kwargs.get('quotechar', '"')
+        optimize_dtypes = kwargs.get('optimize_dtypes', False)
+        sample_rows = kwargs.get('sample_rows', DEFAULT_SAMPLE_ROWS)
+        columns = kwargs.get('columns')
         
         result = self._create_result(task_type="csv_loading")
         file_path = Path(file_path)
         
+        # Load CSV with robust error handling
+        # - low_memory=False to avoid DtypeWarning
+        # - on_bad_lines='skip' to skip corrupt/malformed lines
+        # - encoding_errors='ignore' only as a safety net; DataLoader passes the
+        #   encoding sniffed by FormatDetection, so valid characters are not dropped
+        read_options = {
+            'encoding': encoding,
+            'delimiter': delimiter,
+            'quotechar': quotechar,
+            'low_memory': False,
+            'on_bad_lines': 'skip',  # Skip corrupt lines
+            'encoding_errors': 'ignore',  # Ignore encoding errors
+        }
+        
         try:
-            # Load CSV with robust error handling
-            # - low_memory=False to avoid DtypeWarning
-            # - on_bad_lines='skip' to skip corrupt/malformed lines
-            # - encoding_errors='ignore' to handle encoding issues
-            df = pd.read_csv(
-                file_path,
-                encoding=encoding,
-                delimiter=delimiter,
-                low_memory=False,
-                on_bad_lines='skip',  # Skip corrupt lines
-                encoding_errors='ignore'  # Ignore encoding errors
-            )
+            filters = normalize_filters(kwargs.get('filters'))
+            # Unprojected columns are skipped by the parser entirely
+            usecols = read_columns(columns, filters)
+            if usecols is not None:
+                read_options['usecols'] = usecols
+            
+            dtype_info = {}
+            if kwargs.get('dtype') or kwargs.get('parse_dates'):
+                # Known dtypes (schema profile): no inference pass needed
+                optimize_dtypes = False
+                df = pd.read_csv(
+                    file_path,
+                    dtype=kwargs.get('dtype') or None,
+                    parse_dates=kwargs.get('parse_dates') or None,
+                    **read_options
+                )
+            elif optimize_dtypes:
+                df, dtype_info = self._read_optimized(file_path, read_options, sample_rows)
+            else:
+                df = pd.read_csv(file_path, **read_options)
+            df = apply_pushdown(df, columns, filters)
             
             rows_loaded = len(df)
             cols_loaded = len(df.columns)
@@ -197,7 +245,7 @@ class CSVLoaderWorker(BaseWorker):
                 self._add_error(
                     result,
                     ErrorType.EMPTY_DATA,
-                    "CSV file is empty"
+                    "No rows match filters" if filters else "CSV file is empty"
                 )
                 result.success = False
                 return result
@@ -234,6 +282,23 @@ class CSVLoaderWorker(BaseWorker):
                 "delimiter": delimiter,
             }
             
+            if optimize_dtypes:
+                # Baseline is extrapolated from the default-dtype sample
+                unoptimized_mb = dtype_info['sample_mb_per_row'] * rows_loaded
+                optimized_mb = DtypeOptimizer.memory_mb(df)
+                result.metadata.update({
+                    "dtypes_optimized": True,
+                    "memory_usage_unoptimized_mb": round(unoptimized_mb, 2),
+                    "memory_saved_mb": round(max(0.0, unoptimized_mb - optimized_mb), 2),
+                    "memory_saved_pct": round(
+                        max(0.0, (1 - optimized_mb / unoptimized_mb) * 100), 1
+                    ) if unoptimized_mb > 0 else 0.0,
+                    "dtype_changes": {
+                        col: change for col, change in dtype_info['changes'].items()
+                        if col in df.columns
+                    },
+                })
+            
             result.success = True
             logger.info(
                 f"CSV loaded successfully: {rows_loaded} rows, "
@@ -250,3 +315,40 @@ class CSVLoaderWorker(BaseWorker):
             result.success = False
             logger.error(f"CSV loading failed: {e}", exc_info=True)
             return result
+    
+    def _read_optimized(
+        self,
+        file_path: Path,
+        read_options: Dict[str, Any],
+        sample_rows: int
+    ) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+        """Read CSV with dtypes inferred from a leading sample.
+        
+        Category and datetime hints are applied by read_csv itself, so
+        string columns never materialize as object arrays; numeric columns
+        are downcast after parsing.
+        
+        Args:
+            file_path: CSV path
+            read_options: Base read_csv options
+            sample_rows: Rows to sample for inference
+            
+        Returns:
+            (DataFrame, info dict with dtype changes and sample memory/row)
+        """
+        sample = pd.read_csv(file_path, nrows=sample_rows, **read_options)
+        hints = DtypeOptimizer.infer_read_options(sample)
+        sample_mb_per_row = DtypeOptimizer.memory_mb(sample) / len(sample) if len(sample) else 0.0
+        
+        df = pd.read_csv(
+            file_path,
+            dtype=hints['dtype'] or None,
+            parse_dates=hints['parse_dates'] or None,
+            **read_options
+        )
+        df, changes = DtypeOptimizer.downcast(df)
+        
+        for col in list(hints['dtype']) + hints['parse_dates']:
+            changes[col] = f"{sample[col].dtype}->{df[col].dtype}"
+        
+        return df, {'changes': changes, 'sample_mb_per_row': sample_mb_per_row}
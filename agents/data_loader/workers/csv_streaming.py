@@ -1,19 +1,50 @@
-"""CSV Streaming - Handles large CSV files with chunked reading."""
+"""CSV Streaming - Handles large CSV files with chunked reading.
+
+Reads with pandas ``chunksize`` so only one chunk is parsed at a time.
+Quality metrics are accumulated per chunk, so peak memory of the
+metrics pass is bounded by chunk size rather than file size.
+
+With optimize_dtypes, category/datetime hints are inferred once from a
+leading sample and applied by the parser to every chunk; numeric columns
+are downcast per chunk (concatenation widens to the largest width any
+chunk needed, so the result is still exact).
+"""
 
 import pandas as pd
 from pathlib import Path
 import time
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, List, Optional
+
+from pandas.api.types import union_categoricals
 
 from agents.data_loader.workers.base_worker import BaseWorker, WorkerResult, ErrorType
+from agents.data_loader.workers.quality_accumulator import StreamingQualityAccumulator
+from agents.data_loader.workers.dtype_optimizer import DtypeOptimizer, DEFAULT_SAMPLE_ROWS
+from agents.data_loader.workers.pushdown import normalize_filters, read_columns, apply_pushdown
 from core.logger import get_logger
 from agents.error_intelligence.main import ErrorIntelligence
 
 logger = get_logger(__name__)
 
+# ===== CONSTANTS =====
+DEFAULT_CHUNKSIZE = 100_000
+
 
 class CSVStreaming(BaseWorker):
-    """Worker that streams large CSV files for memory efficiency."""
+    """Worker that streams large CSV files for memory efficiency.
+    
+    Two ways to consume a file:
+    - iter_chunks(): generator yielding DataFrame chunks (bounded memory)
+    - safe_execute(): WorkerResult with quality metrics; the concatenated
+      frame is only materialized when collect=True (the default)
+    
+    Example:
+        >>> worker = CSVStreaming()
+        >>> acc = StreamingQualityAccumulator()
+        >>> for chunk in worker.iter_chunks('big.csv', chunksize=50_000, accumulator=acc):
+        ...     process(chunk)
+        >>> acc.metrics()['duplicates']
+    """
     
     def __init__(self):
         """Initialize CSVStreaming."""
@@ -49,17 +80,82 @@ class CSVStreaming(BaseWorker):
         if not file_path.exists():
             raise ValueError(f"File not found: {file_path}")
         
-        if not str(file_path).lower().endswith('.csv'):
+        if file_path.suffix.lower() not in ('.csv', '') and input_data.get('detected_format') != 'csv':
             raise ValueError(f"File must be CSV, got: {file_path.suffix}")
         
         return True
     
+    def iter_chunks(
+        self,
+        file_path: str,
+        chunksize: int = DEFAULT_CHUNKSIZE,
+        accumulator: Optional[StreamingQualityAccumulator] = None,
+        columns: Optional[List[str]] = None,
+        filters: Optional[List[Any]] = None,
+        **read_kwargs
+    ) -> Iterator[pd.DataFrame]:
+        """Yield DataFrame chunks from a CSV file.
+        
+        Projection is passed to the parser as ``usecols``; filters are
+        applied per chunk, so non-matching rows never accumulate.
+        
+        Args:
+            file_path: Path to CSV file
+            chunksize: Rows per chunk
+            accumulator: Optional accumulator updated with every chunk
+            columns: Optional columns to parse and yield
+            filters: Optional [(column, op, value)] row filters
+            **read_kwargs: Additional pandas read_csv arguments
+            
+        Yields:
+            DataFrame chunks of at most ``chunksize`` rows
+            
+        Raises:
+            ValueError: If input or filters are invalid
+        """
+        self.validate_input({
+            'file_path': file_path,
+            'detected_format': read_kwargs.pop('detected_format', None)
+        })
+        if not isinstance(chunksize, int) or chunksize <= 0:
+            raise ValueError(f"chunksize must be a positive integer, got {chunksize}")
+        filters = normalize_filters(filters)
+        
+        options = {
+            'low_memory': False,
+            'on_bad_lines': 'skip',
+            'encoding_errors': 'ignore',
+        }
+        usecols = read_columns(columns, filters)
+        if usecols is not None:
+            options['usecols'] = usecols
+        options.update(read_kwargs)
+        
+        with pd.read_csv(file_path, chunksize=chunksize, **options) as reader:
+            for chunk in reader:
+                chunk = apply_pushdown(chunk, columns, filters)
+                if accumulator is not None:
+                    accumulator.update(chunk)
+                yield chunk
+    
     def execute(self, file_path: str = None, **kwargs) -> WorkerResult:
         """Execute CSV streaming for large files.
         
         Args:
             file_path: Path to CSV file
-            **kwargs: Additional arguments
+            chunksize: Rows per chunk (optional, default 100,000)
+            collect: Concatenate chunks into result.data (optional, default True).
+                When False only quality metrics are returned.
+            sample_fraction: Keep this share of each chunk's rows (optional,
+                default 1.0). Quality metrics still cover every row.
+            accumulator: StreamingQualityAccumulator to fill (optional; lets
+                the caller reuse the metrics, e.g. for incremental validation)
+            track_duplicates: Hash rows to count duplicates (optional, default
+                True). Disable for very large files to skip the per-row hash.
+            optimize_dtypes: Infer compact dtypes (optional, default False;
+                ignored when dtype/parse_dates are given)
+            sample_rows: Rows sampled for dtype inference (optional, default 10,000)
+            **kwargs: Additional pandas read_csv arguments
             
         Returns:
             WorkerResult with loaded data
@@ -86,10 +182,30 @@ class CSVStreaming(BaseWorker):
             )
             raise
     
-    def _run_csv_streaming(self, file_path: str = None, **kwargs) -> WorkerResult:
-        """Perform CSV streaming."""
+    def _run_csv_streaming(
+        self,
+        file_path: str = None,
+        chunksize: int = DEFAULT_CHUNKSIZE,
+        collect: bool = True,
+        sample_fraction: float = 1.0,
+        accumulator: Optional[StreamingQualityAccumulator] = None,
+        track_duplicates: bool = True,
+        optimize_dtypes: bool = False,
+        sample_rows: int = DEFAULT_SAMPLE_ROWS,
+        **kwargs
+    ) -> WorkerResult:
+        """Perform chunked CSV streaming with incremental quality metrics."""
         result = self._create_result(task_type="csv_streaming")
         
+        if not 0 < sample_fraction <= 1:
+            self._add_error(
+                result,
+                ErrorType.VALIDATION_ERROR,
+                f"sample_fraction must be in (0, 1], got {sample_fraction}"
+            )
+            result.success = False
+            return result
+        
         if not file_path:
             self._add_error(result, ErrorType.VALIDATION_ERROR, "file_path required")
             result.success = False
@@ -104,45 +220,119 @@ class CSVStreaming(BaseWorker):
         
         try:
             start_time = time.time()
+            if accumulator is None:
+                accumulator = StreamingQualityAccumulator(track_duplicates=track_duplicates)
+            chunks = []
+            sample = None
+            if optimize_dtypes and not (kwargs.get('dtype') or kwargs.get('parse_dates')):
+                sample = self._read_sample(file_path, sample_rows, kwargs)
+            if sample is not None:
+                hints = DtypeOptimizer.infer_read_options(sample)
+                kwargs['dtype'] = hints['dtype'] or None
+                kwargs['parse_dates'] = hints['parse_dates'] or None
             
-            # Stream CSV with error handling
-            df = pd.read_csv(
-                file_path,
-                low_memory=False,
-                on_bad_lines='skip',
-                encoding_errors='ignore'
-            )
+            for chunk in self.iter_chunks(
+                str(file_path),
+                chunksize=chunksize,
+                accumulator=accumulator,
+                **kwargs
+            ):
+                if collect:
+                    if sample_fraction < 1:
+                        # Seed per chunk so reruns return the same sample
+                        chunk = chunk.sample(frac=sample_fraction, random_state=accumulator.chunks)
+                    if sample is not None:
+                        chunk, _ = DtypeOptimizer.downcast(chunk)
+                    chunks.append(chunk)
             
-            if df.empty:
+            quality_check = accumulator.metrics()
+            
+            if accumulator.rows == 0:
                 self._add_error(result, ErrorType.EMPTY_DATA, "CSV file is empty")
                 result.success = False
                 return result
             
+            df = self._concat_chunks(chunks) if collect else None
             duration = time.time() - start_time
             
             # Calculate quality score
-            quality_check = self._check_data_quality(df)
             quality_score = 1.0 if quality_check['valid'] else max(0.0, 1.0 - (quality_check['null_pct'] / 100.0))
             
             result.data = df
             result.metadata = {
-                "rows": len(df),
-                "columns": len(df.columns),
-                "column_names": df.columns.tolist(),
+                "rows": accumulator.rows,
+                "columns": len(accumulator.columns),
+                "column_names": list(accumulator.columns),
+                "column_dtypes": quality_check['column_dtypes'],
                 "file_size_mb": file_path.stat().st_size / (1024 * 1024),
                 "duration_sec": round(duration, 3),
                 "null_pct": quality_check['null_pct'],
                 "duplicates": quality_check['duplicates'],
-                "issues": quality_check['issues']
+                "duplicate_pct": quality_check['duplicate_pct'],
+                "issues": quality_check['issues'],
+                "chunksize": chunksize,
+                "chunks": accumulator.chunks,
+                "collected": collect,
             }
+            if sample is not None and df is not None:
+                sample_mb_per_row = DtypeOptimizer.memory_mb(sample) / len(sample)
+                unoptimized_mb = sample_mb_per_row * len(df)
+                optimized_mb = DtypeOptimizer.memory_mb(df)
+                result.metadata.update({
+                    "dtypes_optimized": True,
+                    "memory_usage_unoptimized_mb": round(unoptimized_mb, 2),
+                    "memory_saved_mb": round(max(0.0, unoptimized_mb - optimized_mb), 2),
+                    "memory_saved_pct": round(
+                        max(0.0, (1 - optimized_mb / unoptimized_mb) * 100), 1
+                    ) if unoptimized_mb > 0 else 0.0,
+                    "dtype_changes": {
+                        col: f"{sample[col].dtype}->{df[col].dtype}"
+                        for col in df.columns
+                        if col in sample.columns and sample[col].dtype != df[col].dtype
+                    },
+                })
+            if sample_fraction < 1:
+                result.metadata.update({
+                    "is_sample": True,
+                    "sample_fraction": sample_fraction,
+                    "sample_rows": len(df) if df is not None else 0,
+                })
             result.quality_score = quality_score
-            result.rows_processed = len(df)
+            result.rows_processed = accumulator.rows
             result.success = True
             
-            logger.info(f"CSV streamed: {len(df)} rows, {len(df.columns)} columns in {duration:.3f}s")
+            logger.info(
+                f"CSV streamed: {accumulator.rows} rows, {len(accumulator.columns)} columns "
+                f"in {accumulator.chunks} chunks ({duration:.3f}s)"
+            )
             return result
         
         except Exception as e:
             self._add_error(result, ErrorType.LOAD_ERROR, f"CSV streaming failed: {e}")
             result.success = False
             return result
+    
+    def _read_sample(self, file_path: Path, sample_rows: int, kwargs: Dict[str, Any]) -> Optional[pd.DataFrame]:
+        """Leading rows (with pushdown) used to infer dtype hints; None if empty."""
+        reader = self.iter_chunks(str(file_path), chunksize=max(1, int(sample_rows)), **dict(kwargs))
+        try:
+            sample = next(reader, None)
+        finally:
+            reader.close()
+        return sample if sample is not None and len(sample) else None
+    
+    @staticmethod
+    def _concat_chunks(chunks: List[pd.DataFrame]) -> Optional[pd.DataFrame]:
+        """Concatenate chunks, keeping categorical columns categorical.
+        
+        Each chunk has its own categories; pd.concat would fall back to
+        object for those columns, so categories are unioned first.
+        """
+        if not chunks:
+            return None
+        for col in chunks[0].columns:
+            if len(chunks) > 1 and all(isinstance(chunk[col].dtype, pd.CategoricalDtype) for chunk in chunks):
+                categories = union_categoricals([chunk[col] for chunk in chunks]).categories
+                for chunk in chunks:
+                    chunk[col] = chunk[col].cat.set_categories(categories)
+        return pd.concat(chunks, ignore_index=True)
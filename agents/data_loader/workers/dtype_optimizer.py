@@ -0,0 +1,138 @@
+"""Dtype Optimizer - Infers compact dtypes for loaded data.
+
+Two passes:
+1. infer_read_options(): from a row sample, decide which columns should be
+   parsed as category or datetime (applied by read_csv during parsing)
+2. downcast(): after parsing, shrink numeric columns to the smallest
+   lossless width (int8..int64, uint*, float32, nullable Int*)
+
+Downcasting is exact: floats only narrow to float32 when every value
+round-trips, and integer-valued floats with nulls become nullable ints.
+"""
+
+import warnings
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+# ===== CONSTANTS =====
+DEFAULT_SAMPLE_ROWS = 10_000
+CATEGORY_MAX_UNIQUE_RATIO = 0.5   # unique/non-null in sample
+CATEGORY_MAX_UNIQUE = 10_000
+DATETIME_MIN_PARSE_RATIO = 0.95
+
+_NULLABLE_INT_TYPES = [
+    ('Int8', np.iinfo(np.int8)),
+    ('Int16', np.iinfo(np.int16)),
+    ('Int32', np.iinfo(np.int32)),
+    ('Int64', np.iinfo(np.int64)),
+]
+
+
+class DtypeOptimizer:
+    """Infer and apply memory-efficient dtypes."""
+
+    @staticmethod
+    def infer_read_options(sample: pd.DataFrame) -> Dict[str, Any]:
+        """Infer read_csv dtype hints from a sample.
+
+        Args:
+            sample: First rows of the file, parsed with default dtypes
+
+        Returns:
+            {'dtype': {col: 'category'}, 'parse_dates': [cols]}
+        """
+        dtype: Dict[str, str] = {}
+        parse_dates: List[str] = []
+
+        for col in sample.columns:
+            series = sample[col]
+            # Text columns are object dtype, or str/StringDtype under pandas 3
+            if not (pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series)):
+                continue
+
+            non_null = series.dropna()
+            if non_null.empty:
+                continue
+
+            if DtypeOptimizer._looks_like_datetime(non_null):
+                parse_dates.append(col)
+                continue
+
+            n_unique = non_null.nunique()
+            if n_unique <= CATEGORY_MAX_UNIQUE and n_unique / len(non_null) <= CATEGORY_MAX_UNIQUE_RATIO:
+                dtype[col] = 'category'
+
+        return {'dtype': dtype, 'parse_dates': parse_dates}
+
+    @staticmethod
+    def _looks_like_datetime(values: pd.Series) -> bool:
+        """Check whether string values parse as datetimes."""
+        as_str = values.astype(str)
+        # Plain numbers (ids, amounts) are not dates even if parseable
+        if not as_str.str.contains(r'\d[-/:.]\d', regex=True).all():
+            return False
+        if as_str.str.fullmatch(r'[-+]?\d*\.?\d+').mean() > 0.5:
+            return False
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            parsed = pd.to_datetime(as_str, errors='coerce', format='mixed')
+        return parsed.notna().mean() >= DATETIME_MIN_PARSE_RATIO
+
+    @staticmethod
+    def downcast(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, str]]:
+        """Shrink numeric columns to the smallest lossless dtype.
+
+        Args:
+            df: Parsed DataFrame (modified copy is returned)
+
+        Returns:
+            (optimized DataFrame, {column: 'old->new'} for changed columns)
+        """
+        changes: Dict[str, str] = {}
+        out = df.copy(deep=False)
+
+        for col in out.columns:
+            series = out[col]
+            before = str(series.dtype)
+
+            if pd.api.types.is_bool_dtype(series):
+                continue
+            if pd.api.types.is_integer_dtype(series) and not isinstance(series.dtype, pd.api.extensions.ExtensionDtype):
+                unsigned = len(series) > 0 and series.min() >= 0
+                converted = pd.to_numeric(series, downcast='unsigned' if unsigned else 'integer')
+            elif pd.api.types.is_float_dtype(series):
+                converted = DtypeOptimizer._downcast_float(series)
+            else:
+                continue
+
+            if str(converted.dtype) != before:
+                out[col] = converted
+                changes[col] = f"{before}->{converted.dtype}"
+
+        return out, changes
+
+    @staticmethod
+    def _downcast_float(series: pd.Series) -> pd.Series:
+        """Downcast float column to nullable int or float32 when exact."""
+        non_null = series.dropna()
+        if non_null.empty:
+            return series
+
+        finite = np.isfinite(non_null.to_numpy())
+        if finite.all() and (non_null % 1 == 0).all():
+            lo, hi = non_null.min(), non_null.max()
+            for name, info in _NULLABLE_INT_TYPES:
+                if info.min <= lo and hi <= info.max:
+                    return series.astype(name)
+
+        as32 = series.astype(np.float32)
+        if np.array_equal(as32.astype(np.float64).to_numpy(), series.to_numpy(), equal_nan=True):
+            return as32
+        return series
+
+    @staticmethod
+    def memory_mb(df: pd.DataFrame) -> float:
+        """Deep memory usage in MB."""
+        return df.memory_usage(deep=True).sum() / (1024 * 1024)
@@ -1,8 +1,17 @@
-"""Format Detection - Auto-detects file format from extension and content."""
+"""Format Detection - Auto-detects file format from file content.
 
+Reads at most HEADER_BYTES from the start of the file:
+- Binary signatures: Parquet (PAR1), SQLite, HDF5, Excel (zip/OLE), pickle
+- Text: encoding (BOM, UTF-8, CP1252, Latin-1), then JSON vs JSONL vs CSV
+- CSV dialect: delimiter and quote character via csv.Sniffer
+
+The extension is only used when the content is inconclusive.
+"""
+
+import csv
+import json
 from pathlib import Path
-import pandas as pd
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from agents.data_loader.workers.base_worker import BaseWorker, WorkerResult, ErrorType
 from core.logger import get_logger
@@ -10,15 +19,59 @@ from agents.error_intelligence.main import ErrorIntelligence
 
 logger = get_logger(__name__)
 
+# ===== CONSTANTS =====
+HEADER_BYTES = 8192
+CSV_DELIMITERS = ',;\t|'
+
+# (offset, signature, format)
+BINARY_SIGNATURES = [
+    (0, b'PAR1', 'parquet'),
+    (0, b'SQLite format 3\x00', 'sqlite'),
+    (0, b'\x89HDF\r\n\x1a\n', 'hdf5'),
+    (512, b'\x89HDF\r\n\x1a\n', 'hdf5'),  # HDF5 allows a user block before the superblock
+    (0, b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1', 'xls'),  # OLE2 compound document
+]
+ZIP_SIGNATURE = b'PK\x03\x04'
+TEXT_BOMS = [
+    (b'\xef\xbb\xbf', 'utf-8-sig'),
+    (b'\xff\xfe', 'utf-16'),
+    (b'\xfe\xff', 'utf-16'),
+]
+EXTENSION_FORMATS = {
+    '.csv': 'csv',
+    '.tsv': 'csv',
+    '.json': 'json',
+    '.jsonl': 'jsonl',
+    '.ndjson': 'jsonl',
+    '.xlsx': 'xlsx',
+    '.xls': 'xls',
+    '.parquet': 'parquet',
+    '.pkl': 'pkl',
+    '.h5': 'hdf5',
+    '.hdf5': 'hdf5',
+    '.db': 'sqlite',
+    '.sqlite': 'sqlite',
+}
+
 
 class FormatDetection(BaseWorker):
-    """Worker that auto-detects file format."""
+    """Worker that auto-detects file format by sniffing the file header.
+    
+    detected_format is a DataLoader format key ('csv', 'jsonl', 'parquet', ...).
+    For CSV files, csv_options holds the sniffed encoding, delimiter and
+    quotechar, ready to pass to CSVLoaderWorker.
+    
+    Example:
+        >>> result = FormatDetection().safe_execute(file_path='export_2025')
+        >>> result.data['detected_format'], result.data['csv_options']
+        ('csv', {'encoding': 'utf-8', 'delimiter': ';', 'quotechar': '"'})
+    """
     
     def __init__(self):
         """Initialize FormatDetection."""
         super().__init__("FormatDetection")
         self.error_intelligence = ErrorIntelligence()
-        self.supported_formats = {'.csv', '.json', '.xlsx', '.xls', '.parquet', '.pkl'}
+        self.supported_formats = set(EXTENSION_FORMATS)
     
     def validate_input(self, input_data: Dict[str, Any]) -> bool:
         """Validate input before format detection.
@@ -52,7 +105,7 @@ class FormatDetection(BaseWorker):
         return True
     
     def execute(self, file_path: str = None, **kwargs) -> WorkerResult:
-        """Detect file format from extension and content.
+        """Detect file format from content, falling back to the extension.
         
         Args:
             file_path: Path to file
@@ -100,47 +153,158 @@ class FormatDetection(BaseWorker):
             return result
         
         try:
-            # Get extension
             extension = file_path.suffix.lower()
+            with open(file_path, 'rb') as f:
+                header = f.read(HEADER_BYTES)
+            
+            sniffed = self.sniff(header)
+            extension_format = EXTENSION_FORMATS.get(extension)
+            # A one-record JSONL file looks like a JSON object; let the extension decide
+            if {sniffed.get('format'), extension_format} == {'json', 'jsonl'}:
+                sniffed['format'] = extension_format
+            detected_format = sniffed.get('format') or extension_format
             
-            if extension not in self.supported_formats:
+            if detected_format is None:
                 self._add_error(
                     result,
                     ErrorType.VALIDATION_ERROR,
-                    f"Unsupported format: {extension}. Supported: {self.supported_formats}"
+                    f"Could not detect format of {file_path.name} from content or extension '{extension}'"
                 )
                 result.success = False
                 return result
             
-            # Map extension to format
-            format_map = {
-                '.csv': 'CSV',
-                '.json': 'JSON',
-                '.xlsx': 'Excel',
-                '.xls': 'Excel',
-                '.parquet': 'Parquet',
-                '.pkl': 'Pickle'
-            }
-            
-            detected_format = format_map.get(extension, 'Unknown')
+            if extension_format and sniffed.get('format') and extension_format != sniffed['format']:
+                self._add_warning(
+                    result,
+                    f"Extension '{extension}' does not match content; detected {sniffed['format']}"
+                )
             
-            # Additional content validation
             file_size_mb = file_path.stat().st_size / (1024 * 1024)
             
             result.data = {
                 "file_name": file_path.name,
                 "extension": extension,
                 "detected_format": detected_format,
+                "detection_method": "content" if sniffed.get('format') else "extension",
                 "file_size_mb": round(file_size_mb, 2),
-                "is_supported": True
+                "is_supported": True,
+                "bytes_read": len(header),
             }
+            if sniffed.get('encoding'):
+                result.data['encoding'] = sniffed['encoding']
+            if detected_format == 'csv':
+                result.data['csv_options'] = sniffed.get('csv_options') or {
+                    'encoding': sniffed.get('encoding', 'utf-8'),
+                    'delimiter': '\t' if extension == '.tsv' else ',',
+                    'quotechar': '"',
+                }
             result.quality_score = 1.0
             result.success = True
             
-            logger.info(f"Format detected: {detected_format} ({extension})")
+            logger.info(f"Format detected: {detected_format} ({result.data['detection_method']})")
             return result
         
         except Exception as e:
             self._add_error(result, ErrorType.LOAD_ERROR, f"Format detection failed: {e}")
             result.success = False
             return result
+    
+    # === SNIFFING ===
+    
+    @staticmethod
+    def sniff(header: bytes) -> Dict[str, Any]:
+        """Classify a file from its leading bytes.
+        
+        Args:
+            header: First bytes of the file (up to HEADER_BYTES)
+            
+        Returns:
+            {'format': str or None, 'encoding': str (text only),
+             'csv_options': dict (CSV only)}
+        """
+        if not header:
+            return {'format': None}
+        
+        for offset, signature, file_format in BINARY_SIGNATURES:
+            if header[offset:offset + len(signature)] == signature:
+                return {'format': file_format}
+        
+        if header.startswith(ZIP_SIGNATURE):
+            # XLSX is a zip whose first entries are the OOXML parts
+            if b'[Content_Types].xml' in header or b'xl/' in header:
+                return {'format': 'xlsx'}
+            return {'format': None}
+        
+        if header[:1] == b'\x80' and header[1:2] in (b'\x02', b'\x03', b'\x04', b'\x05'):
+            return {'format': 'pkl'}
+        
+        text, encoding = FormatDetection._decode(header)
+        if text is None:
+            return {'format': None}
+        
+        file_format = FormatDetection._classify_text(text)
+        sniffed: Dict[str, Any] = {'format': file_format, 'encoding': encoding}
+        if file_format == 'csv':
+            sniffed['csv_options'] = {'encoding': encoding, **FormatDetection._sniff_dialect(text)}
+        return sniffed
+    
+    @staticmethod
+    def _decode(header: bytes):
+        """Decode header bytes, returning (text, encoding) or (None, None) for binary."""
+        for bom, encoding in TEXT_BOMS:
+            if header.startswith(bom):
+                try:
+                    return header.decode(encoding, errors='ignore'), encoding
+                except LookupError:
+                    return None, None
+        
+        if b'\x00' in header:
+            return None, None
+        
+        try:
+            return header.decode('utf-8'), 'utf-8'
+        except UnicodeDecodeError as e:
+            # A multi-byte character cut off at the end of the header is fine
+            if e.start >= len(header) - 3 and e.reason == 'unexpected end of data':
+                return header[:e.start].decode('utf-8'), 'utf-8'
+        
+        try:
+            return header.decode('cp1252'), 'cp1252'
+        except UnicodeDecodeError:
+            return header.decode('latin-1'), 'latin-1'
+    
+    @staticmethod
+    def _classify_text(text: str) -> Optional[str]:
+        """Tell JSON, JSONL and CSV apart from decoded header text."""
+        stripped = text.lstrip()
+        if not stripped:
+            return None
+        
+        if stripped[0] == '[':
+            return 'json'
+        if stripped[0] == '{':
+            lines = [line.strip() for line in stripped.splitlines() if line.strip()]
+            # JSONL: first line is a complete object and the next one starts another
+            if len(lines) > 1 and lines[1].startswith('{'):
+                try:
+                    json.loads(lines[0])
+                    return 'jsonl'
+                except ValueError:
+                    pass
+            return 'json'
+        return 'csv'
+    
+    @staticmethod
+    def _sniff_dialect(text: str) -> Dict[str, str]:
+        """Detect CSV delimiter and quote character."""
+        # Drop the last, possibly truncated, line
+        sample = text[:text.rfind('\n')] if '\n' in text else text
+        try:
+            dialect = csv.Sniffer().sniff(sample, delimiters=CSV_DELIMITERS)
+            return {'delimiter': dialect.delimiter, 'quotechar': dialect.quotechar or '"'}
+        except csv.Error:
+            # Single-column files have no delimiter to find
+            first_line = sample.split('\n', 1)[0]
+            counts = {d: first_line.count(d) for d in CSV_DELIMITERS}
+            delimiter = max(counts, key=counts.get) if any(counts.values()) else ','
+            return {'delimiter': delimiter, 'quotechar': '"'}
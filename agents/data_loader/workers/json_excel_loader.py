@@ -2,7 +2,9 @@
 
 Handles:
 - JSON file loading
-- Excel file loading (.xlsx, .xls)
+- Excel file loading (.xlsx, .xls), one sheet or many in one call
+- Fast Rust-based calamine engine when python-calamine is installed
+- Column projection and row filters
 - Input validation
 - Data quality tracking
 - Comprehensive error intelligence
@@ -10,11 +12,13 @@ Handles:
 """
 
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Sequence, Union
 import time
 
 from .base_worker import BaseWorker, WorkerResult, ErrorType
+from .pushdown import normalize_filters, read_columns, apply_pushdown
 from core.logger import get_logger
 from agents.error_intelligence.main import ErrorIntelligence
 
@@ -24,6 +28,27 @@ logger = get_logger(__name__)
 MIN_ROWS_REQUIRED = 1
 QUALITY_THRESHOLD = 0.8
 SUPPORTED_FORMATS = ['json', 'xlsx', 'xls']
+DEFAULT_SHEET_PARALLELISM = 4
+# Engines whose parsing runs outside the GIL, so sheets can be read in threads.
+# openpyxl is pure Python: threads would only re-read the workbook per sheet.
+PARALLEL_ENGINES = ['calamine']
+
+
+def excel_engine(file_format: str) -> str:
+    """Fastest installed read engine for an Excel format.
+
+    Args:
+        file_format: 'xlsx' or 'xls'
+
+    Returns:
+        'calamine' when python-calamine is installed, otherwise the pandas
+        default for the format ('openpyxl' or 'xlrd')
+    """
+    try:
+        import python_calamine  # noqa: F401
+        return 'calamine'
+    except ImportError:
+        return 'xlrd' if file_format == 'xls' else 'openpyxl'
 
 
 class JSONExcelLoaderWorker(BaseWorker):
@@ -41,7 +66,9 @@ class JSONExcelLoaderWorker(BaseWorker):
         {
             'file_path': str (required),
             'file_format': str ('json', 'xlsx', 'xls') (required),
-            'sheet_name': str (optional, for Excel)
+            'sheet_name': str (optional, for Excel),
+            'columns': List[str] (optional),
+            'filters': List[(column, op, value)] (optional)
         }
     
     Output Format:
@@ -77,7 +104,6 @@ class JSONExcelLoaderWorker(BaseWorker):
         - file_path exists and is accessible
         - file_format is supported (json, xlsx, xls)
         - File extension matches format
-        - File is not too large (>100MB)
         
         Args:
             input_data: Dictionary with 'file_path' and 'file_format' keys
@@ -114,15 +140,12 @@ class JSONExcelLoaderWorker(BaseWorker):
         
         # Validate extension matches format
         ext = file_path.suffix.lower().lstrip('.')
-        if ext != file_format and not (file_format in ['xls', 'xlsx'] and ext in ['xls', 'xlsx']):
+        extension_ok = ext == file_format or (file_format in ['xls', 'xlsx'] and ext in ['xls', 'xlsx'])
+        if not extension_ok and input_data.get('detected_format') != file_format:
             raise ValueError(
                 f"File extension '{ext}' does not match format '{file_format}'"
             )
         
-        file_size_mb = file_path.stat().st_size / (1024 * 1024)
-        if file_size_mb > 100:
-            raise ValueError(f"File too large: {file_size_mb:.1f}MB (max: 100MB)")
-        
         return True
     
     def execute(self, **kwargs) -> WorkerResult:
@@ -132,6 +155,8 @@ class JSONExcelLoaderWorker(BaseWorker):
             file_path: Path to file (required)
             file_format: 'json', 'xlsx', or 'xls' (required)
             sheet_name: Sheet name for Excel files (optional)
+            columns: Columns to keep (optional; Excel only parses these)
+            filters: [(column, op, value)] row filters (optional)
             **kwargs: Additional pandas arguments
             
         Returns:
@@ -142,7 +167,8 @@ class JSONExcelLoaderWorker(BaseWorker):
             # Validate input
             self.validate_input({
                 'file_path': kwargs.get('file_path'),
-                'file_format': kwargs.get('file_format')
+                'file_format': kwargs.get('file_format'),
+                'detected_format': kwargs.get('detected_format')
             })
             
             result = self._run_json_excel_load(**kwargs)
@@ -198,16 +224,26 @@ class JSONExcelLoaderWorker(BaseWorker):
         file_path = kwargs.get('file_path')
         file_format = kwargs.get('file_format', '').lower()
         sheet_name = kwargs.get('sheet_name', 0)  # Default to first sheet
+        columns = kwargs.get('columns')
         
         result = self._create_result(task_type=f"{file_format}_loading")
         file_path = Path(file_path)
         
         try:
+            filters = normalize_filters(kwargs.get('filters'))
+            
             # Load based on format
             if file_format == 'json':
-                df = pd.read_json(file_path)
+                # read_json has no projection; filter/project after parsing
+                df = apply_pushdown(pd.read_json(file_path), columns, filters)
             elif file_format in ['xlsx', 'xls']:
-                df = pd.read_excel(file_path, sheet_name=sheet_name)
+                df = pd.read_excel(
+                    file_path,
+                    sheet_name=sheet_name,
+                    usecols=read_columns(columns, filters),
+                    engine=excel_engine(file_format)
+                )
+                df = apply_pushdown(df, columns, filters)
             else:
                 self._add_error(
                     result,
@@ -217,60 +253,10 @@ class JSONExcelLoaderWorker(BaseWorker):
                 result.success = False
                 return result
             
-            rows_loaded = len(df)
-            cols_loaded = len(df.columns)
-            
-            # Check if empty
-            if df.empty:
-                self._add_error(
-                    result,
-                    ErrorType.EMPTY_DATA,
-                    f"{file_format.upper()} file is empty"
-                )
-                result.success = False
-                return result
-            
-            # Check data quality
-            quality_info = self._check_data_quality(df)
-            if quality_info['issues']:
-                for issue in quality_info['issues']:
-                    self._add_warning(result, issue)
-            
-            # Calculate metrics
-            result.data = df
-            result.rows_processed = rows_loaded
-            result.rows_failed = 0  # No failed rows since we load all
-            result.quality_score = self._calculate_quality_score(
-                rows_loaded, 0
+            return self._finish_frame(
+                result, df, file_path, file_format, filters,
+                sheet_name if file_format in ['xlsx', 'xls'] else None
             )
-            result.data_loss_pct = 0.0
-            
-            # Build metadata
-            result.metadata = {
-                "file_name": file_path.name,
-                "file_size_mb": round(file_path.stat().st_size / (1024 * 1024), 2),
-                "file_format": file_format,
-                "rows": rows_loaded,
-                "columns": cols_loaded,
-                "column_names": df.columns.tolist(),
-                "column_dtypes": {col: str(dtype) for col, dtype in zip(df.columns, df.dtypes)},
-                "memory_usage_mb": round(df.memory_usage(deep=True).sum() / (1024 * 1024), 2),
-                "null_count": int(df.isna().sum().sum()),
-                "null_pct": round(quality_info['null_pct'], 2),
-                "duplicates": quality_info['duplicates'],
-                "duplicate_pct": round(quality_info['duplicate_pct'], 2),
-            }
-            
-            # Add sheet name for Excel
-            if file_format in ['xlsx', 'xls']:
-                result.metadata['sheet_name'] = sheet_name
-            
-            result.success = True
-            logger.info(
-                f"{file_format.upper()} loaded successfully: {rows_loaded} rows, "
-                f"{cols_loaded} columns, quality={result.quality_score:.2f}"
-            )
-            return result
         
         except Exception as e:
             self._add_error(
@@ -281,3 +267,181 @@ class JSONExcelLoaderWorker(BaseWorker):
             result.success = False
             logger.error(f"{file_format.upper()} loading failed: {e}", exc_info=True)
             return result
+    
+    def _finish_frame(
+        self,
+        result: WorkerResult,
+        df: pd.DataFrame,
+        file_path: Path,
+        file_format: str,
+        filters: Optional[List[Any]],
+        sheet_name: Optional[Union[str, int]] = None
+    ) -> WorkerResult:
+        """Fill a WorkerResult with a parsed frame and its quality metrics.
+        
+        Args:
+            result: Result created for this load
+            df: Parsed (and pushed-down) frame
+            file_path: Source file
+            file_format: Format key
+            filters: Normalized filters (for the empty-result message)
+            sheet_name: Excel sheet the frame came from
+            
+        Returns:
+            The completed result (success=False if the frame is empty)
+        """
+        rows_loaded = len(df)
+        cols_loaded = len(df.columns)
+        
+        # Check if empty
+        if df.empty:
+            self._add_error(
+                result,
+                ErrorType.EMPTY_DATA,
+                "No rows match filters" if filters else f"{file_format.upper()} file is empty"
+            )
+            result.success = False
+            return result
+        
+        # Check data quality
+        quality_info = self._check_data_quality(df)
+        if quality_info['issues']:
+            for issue in quality_info['issues']:
+                self._add_warning(result, issue)
+        
+        # Calculate metrics
+        result.data = df
+        result.rows_processed = rows_loaded
+        result.rows_failed = 0  # No failed rows since we load all
+        result.quality_score = self._calculate_quality_score(
+            rows_loaded, 0
+        )
+        result.data_loss_pct = 0.0
+        
+        # Build metadata
+        result.metadata = {
+            "file_name": file_path.name,
+            "file_size_mb": round(file_path.stat().st_size / (1024 * 1024), 2),
+            "file_format": file_format,
+            "rows": rows_loaded,
+            "columns": cols_loaded,
+            "column_names": df.columns.tolist(),
+            "column_dtypes": {col: str(dtype) for col, dtype in zip(df.columns, df.dtypes)},
+            "memory_usage_mb": round(df.memory_usage(deep=True).sum() / (1024 * 1024), 2),
+            "null_count": int(df.isna().sum().sum()),
+            "null_pct": round(quality_info['null_pct'], 2),
+            "duplicates": quality_info['duplicates'],
+            "duplicate_pct": round(quality_info['duplicate_pct'], 2),
+        }
+        
+        # Add sheet name for Excel
+        if sheet_name is not None:
+            result.metadata['sheet_name'] = sheet_name
+        
+        result.success = True
+        source = file_format.upper() if sheet_name is None else f"{file_format.upper()} sheet {sheet_name!r}"
+        logger.info(
+            f"{source} loaded successfully: {rows_loaded} rows, "
+            f"{cols_loaded} columns, quality={result.quality_score:.2f}"
+        )
+        return result
+    
+    # === MULTI-SHEET EXCEL ===
+    
+    def load_sheets(
+        self,
+        file_path: str,
+        file_format: str = 'xlsx',
+        sheet_names: Optional[Sequence[Union[str, int]]] = None,
+        columns: Optional[List[str]] = None,
+        filters: Optional[List[Any]] = None,
+        parallelism: int = DEFAULT_SHEET_PARALLELISM,
+        detected_format: Optional[str] = None
+    ) -> Dict[Union[str, int], WorkerResult]:
+        """Load several sheets of a workbook in one call.
+        
+        With a thread-friendly engine (calamine) sheets are parsed
+        concurrently; otherwise the workbook is opened once and its sheets
+        parsed in turn. Each sheet gets its own result, so an empty or
+        malformed sheet does not fail the others.
+        
+        Args:
+            file_path: Path to .xlsx/.xls workbook
+            file_format: 'xlsx' or 'xls'
+            sheet_names: Sheets to load (default: all, in workbook order)
+            columns: Columns to keep in every sheet
+            filters: [(column, op, value)] row filters for every sheet
+            parallelism: Maximum sheets parsed at once
+            detected_format: Format confirmed by FormatDetection (optional)
+            
+        Returns:
+            {sheet name: WorkerResult}, in the requested order
+            
+        Raises:
+            ValueError: If input is invalid or a requested sheet does not exist
+        """
+        self.validate_input({
+            'file_path': file_path,
+            'file_format': file_format,
+            'detected_format': detected_format
+        })
+        if file_format not in ['xlsx', 'xls']:
+            raise ValueError(f"load_sheets requires an Excel format, got: {file_format}")
+        
+        file_path = Path(file_path)
+        filters = normalize_filters(filters)
+        engine = excel_engine(file_format)
+        usecols = read_columns(columns, filters)
+        
+        def finish(sheet: Union[str, int], df: Optional[pd.DataFrame], error: Optional[Exception]) -> WorkerResult:
+            result = self._create_result(task_type=f"{file_format}_sheet_loading")
+            if error is not None:
+                self._add_error(result, ErrorType.LOAD_ERROR, f"Failed to load sheet {sheet!r}: {error}")
+                result.success = False
+                return result
+            try:
+                result = self._finish_frame(
+                    result, apply_pushdown(df, columns, filters), file_path, file_format, filters, sheet
+                )
+            except KeyError as e:
+                self._add_error(result, ErrorType.LOAD_ERROR, f"Failed to load sheet {sheet!r}: {e}")
+                result.success = False
+            if result.success:
+                result.metadata['engine'] = engine
+            return result
+        
+        results: List[WorkerResult] = []
+        with pd.ExcelFile(file_path, engine=engine) as workbook:
+            available = workbook.sheet_names
+            names = list(sheet_names) if sheet_names is not None else list(available)
+            missing = [name for name in names if isinstance(name, str) and name not in available]
+            if missing:
+                raise ValueError(f"Sheets not found: {missing} (available: {available})")
+            concurrent = engine in PARALLEL_ENGINES and parallelism > 1 and len(names) > 1
+            
+            if not concurrent:
+                # One open workbook, sheets parsed in turn
+                for sheet in names:
+                    try:
+                        df = workbook.parse(sheet_name=sheet, usecols=usecols)
+                    except Exception as e:
+                        results.append(finish(sheet, None, e))
+                        continue
+                    results.append(finish(sheet, df, None))
+        
+        if concurrent:
+            def read(sheet: Union[str, int]) -> WorkerResult:
+                try:
+                    df = pd.read_excel(file_path, sheet_name=sheet, usecols=usecols, engine=engine)
+                except Exception as e:
+                    return finish(sheet, None, e)
+                return finish(sheet, df, None)
+            
+            with ThreadPoolExecutor(max_workers=min(parallelism, len(names))) as pool:
+                results = list(pool.map(read, names))
+        
+        logger.info(
+            f"Loaded {sum(r.success for r in results)}/{len(names)} sheets from "
+            f"{file_path.name} (engine={engine})"
+        )
+        return dict(zip(names, results))
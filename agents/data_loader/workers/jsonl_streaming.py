@@ -0,0 +1,342 @@
+"""JSONL Streaming - Reads JSON Lines files in bounded line batches.
+
+Each batch of ``chunksize`` lines is parsed and flattened on its own, so
+peak memory is bounded by the batch rather than the file:
+- Nested objects are flattened to columns ('user.id') via json_normalize
+- An optional schema pins column order and dtypes across batches
+- Malformed lines are skipped and counted (like on_bad_lines='skip' for CSV)
+"""
+
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+import pandas as pd
+
+from agents.data_loader.workers.base_worker import BaseWorker, WorkerResult, ErrorType
+from agents.data_loader.workers.quality_accumulator import StreamingQualityAccumulator
+from agents.data_loader.workers.pushdown import normalize_filters, apply_pushdown
+from core.logger import get_logger
+from agents.error_intelligence.main import ErrorIntelligence
+
+logger = get_logger(__name__)
+
+# ===== CONSTANTS =====
+DEFAULT_CHUNKSIZE = 100_000
+NESTED_SEPARATOR = '.'
+JSONL_EXTENSIONS = ['.jsonl', '.ndjson', '.json', '']
+
+
+class JSONLStreaming(BaseWorker):
+    """Worker that streams JSON Lines files for memory efficiency.
+
+    Same interface as CSVStreaming:
+    - iter_chunks(): generator yielding DataFrame chunks (bounded memory)
+    - safe_execute(): WorkerResult with quality metrics and malformed-line
+      count; the concatenated frame is only built when collect=True
+
+    Example:
+        >>> worker = JSONLStreaming()
+        >>> stats = {}
+        >>> for chunk in worker.iter_chunks('events.jsonl', chunksize=50_000, stats=stats):
+        ...     process(chunk)
+        >>> stats['malformed_lines']
+    """
+
+    def __init__(self):
+        """Initialize JSONLStreaming."""
+        super().__init__("JSONLStreaming")
+        self.error_intelligence = ErrorIntelligence()
+
+    def validate_input(self, input_data: Dict[str, Any]) -> bool:
+        """Validate input before streaming.
+
+        Args:
+            input_data: Dictionary with 'file_path' key
+
+        Returns:
+            True if valid
+
+        Raises:
+            ValueError: If validation fails
+            TypeError: If wrong data types
+        """
+        if 'file_path' not in input_data:
+            raise ValueError("file_path is required")
+
+        file_path = input_data['file_path']
+
+        if file_path is None:
+            raise ValueError("file_path cannot be None")
+
+        if not isinstance(file_path, (str, Path)):
+            raise TypeError("file_path must be str or Path")
+
+        file_path = Path(file_path)
+
+        if not file_path.exists():
+            raise ValueError(f"File not found: {file_path}")
+
+        if file_path.suffix.lower() not in JSONL_EXTENSIONS and input_data.get('detected_format') != 'jsonl':
+            raise ValueError(f"File must be JSONL, got: {file_path.suffix}")
+
+        return True
+
+    def iter_chunks(
+        self,
+        file_path: str,
+        chunksize: int = DEFAULT_CHUNKSIZE,
+        accumulator: Optional[StreamingQualityAccumulator] = None,
+        columns: Optional[List[str]] = None,
+        filters: Optional[List[Any]] = None,
+        schema: Optional[Dict[str, Any]] = None,
+        max_level: Optional[int] = None,
+        sep: str = NESTED_SEPARATOR,
+        stats: Optional[Dict[str, int]] = None,
+        detected_format: Optional[str] = None
+    ) -> Iterator[pd.DataFrame]:
+        """Yield DataFrame chunks from a JSONL file.
+
+        Args:
+            file_path: Path to JSONL file
+            chunksize: Lines per chunk
+            accumulator: Optional accumulator updated with every chunk
+            columns: Optional flattened columns to yield
+            filters: Optional [(column, op, value)] row filters
+            schema: Optional {flattened column: dtype}. Chunks are reindexed
+                to exactly these columns (missing keys become null, extra
+                keys are dropped) and cast, so every chunk has the same shape
+            max_level: Nesting depth to flatten (None = all levels)
+            sep: Separator between nested key names
+            stats: Optional dict updated in place with 'lines' and
+                'malformed_lines' counts
+            detected_format: Format confirmed by FormatDetection (optional)
+
+        Yields:
+            DataFrame chunks of at most ``chunksize`` rows
+
+        Raises:
+            ValueError: If input or filters are invalid
+            KeyError: If a projected or filtered column is in no line of
+                the file (raised once the file has been read)
+        """
+        self.validate_input({'file_path': file_path, 'detected_format': detected_format})
+        if not isinstance(chunksize, int) or chunksize <= 0:
+            raise ValueError(f"chunksize must be a positive integer, got {chunksize}")
+        filters = normalize_filters(filters)
+        if stats is None:
+            stats = {}
+        stats.setdefault('lines', 0)
+        stats.setdefault('malformed_lines', 0)
+
+        records: List[Dict[str, Any]] = []
+        seen: Set[str] = set()  # Flattened keys of every batch, for pushdown checks
+        with open(file_path, 'rb') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                stats['lines'] += 1
+                try:
+                    record = json.loads(line)
+                except (ValueError, UnicodeDecodeError):
+                    record = None
+                if not isinstance(record, dict):
+                    stats['malformed_lines'] += 1
+                    continue
+                records.append(record)
+
+                if len(records) >= chunksize:
+                    yield self._to_chunk(records, columns, filters, schema, max_level, sep, accumulator, seen)
+                    records = []
+
+        if records:
+            yield self._to_chunk(records, columns, filters, schema, max_level, sep, accumulator, seen)
+
+        # Optional keys may be absent from single batches; only a key found
+        # in no batch at all is an error, whatever the chunksize
+        if seen and not schema:
+            missing = [col for col in columns or [] if col not in seen]
+            if missing:
+                raise KeyError(f"Columns not found: {missing}")
+            for flt in filters:
+                if flt[0] not in seen:
+                    raise KeyError(f"Filter column not found: {flt[0]}")
+
+    @staticmethod
+    def _to_chunk(
+        records: List[Dict[str, Any]],
+        columns: Optional[List[str]],
+        filters: List[Any],
+        schema: Optional[Dict[str, Any]],
+        max_level: Optional[int],
+        sep: str,
+        accumulator: Optional[StreamingQualityAccumulator],
+        seen: Set[str]
+    ) -> pd.DataFrame:
+        """Flatten one batch of records and apply schema and pushdown.
+
+        Without a schema, requested and filtered columns missing from the
+        batch are added as nulls (see iter_chunks for the whole-file check).
+        """
+        chunk = pd.json_normalize(records, sep=sep, max_level=max_level)
+        seen.update(chunk.columns)
+        if schema:
+            chunk = chunk.reindex(columns=list(schema)).astype(schema)
+        elif columns is not None or filters:
+            needed = list(columns or []) + [flt[0] for flt in filters]
+            chunk = chunk.reindex(columns=list(dict.fromkeys(list(chunk.columns) + needed)))
+        chunk = apply_pushdown(chunk, columns, filters)
+        if accumulator is not None:
+            accumulator.update(chunk)
+        return chunk
+
+    def execute(self, file_path: str = None, **kwargs) -> WorkerResult:
+        """Execute JSONL streaming.
+
+        Args:
+            file_path: Path to JSONL file
+            chunksize: Lines per chunk (optional, default 100,000)
+            collect: Concatenate chunks into result.data (optional, default True).
+                When False only quality metrics are returned.
+            sample_fraction: Keep this share of each chunk's rows (optional,
+                default 1.0). Quality metrics still cover every row.
+            accumulator: StreamingQualityAccumulator to fill (optional)
+            **kwargs: columns, filters, schema, max_level, sep (see iter_chunks)
+
+        Returns:
+            WorkerResult with loaded data
+        """
+        try:
+            result = self._run_jsonl_streaming(file_path=file_path, **kwargs)
+
+            self.error_intelligence.track_success(
+                agent_name="data_loader",
+                worker_name="JSONLStreaming",
+                operation="jsonl_streaming",
+                context={"file_path": file_path}
+            )
+
+            return result
+
+        except Exception as e:
+            self.error_intelligence.track_error(
+                agent_name="data_loader",
+                worker_name="JSONLStreaming",
+                error_type=type(e).__name__,
+                error_message=str(e),
+                context={"file_path": file_path}
+            )
+            raise
+
+    def _run_jsonl_streaming(
+        self,
+        file_path: str = None,
+        chunksize: int = DEFAULT_CHUNKSIZE,
+        collect: bool = True,
+        sample_fraction: float = 1.0,
+        accumulator: Optional[StreamingQualityAccumulator] = None,
+        **kwargs
+    ) -> WorkerResult:
+        """Perform batched JSONL streaming with incremental quality metrics."""
+        result = self._create_result(task_type="jsonl_streaming")
+
+        if not 0 < sample_fraction <= 1:
+            self._add_error(
+                result,
+                ErrorType.VALIDATION_ERROR,
+                f"sample_fraction must be in (0, 1], got {sample_fraction}"
+            )
+            result.success = False
+            return result
+
+        if not file_path:
+            self._add_error(result, ErrorType.VALIDATION_ERROR, "file_path required")
+            result.success = False
+            return result
+
+        file_path = Path(file_path)
+
+        if not file_path.exists():
+            self._add_error(result, ErrorType.FILE_NOT_FOUND, f"File not found: {file_path}")
+            result.success = False
+            return result
+
+        try:
+            start_time = time.time()
+            if accumulator is None:
+                accumulator = StreamingQualityAccumulator()
+            stats: Dict[str, int] = {}
+            chunks = []
+
+            for chunk in self.iter_chunks(
+                str(file_path),
+                chunksize=chunksize,
+                accumulator=accumulator,
+                stats=stats,
+                **kwargs
+            ):
+                if collect:
+                    if sample_fraction < 1:
+                        # Seed per chunk so reruns return the same sample
+                        chunk = chunk.sample(frac=sample_fraction, random_state=accumulator.chunks)
+                    chunks.append(chunk)
+
+            malformed = stats.get('malformed_lines', 0)
+            if malformed:
+                self._add_warning(result, f"Skipped {malformed} malformed line(s)")
+
+            if accumulator.rows == 0:
+                message = "No rows match filters" if kwargs.get('filters') else "JSONL file is empty"
+                if malformed:
+                    message = f"No valid JSON objects ({malformed} malformed line(s))"
+                self._add_error(result, ErrorType.EMPTY_DATA, message)
+                result.success = False
+                return result
+
+            quality_check = accumulator.metrics()
+            df = pd.concat(chunks, ignore_index=True) if collect else None
+            duration = time.time() - start_time
+
+            lines = stats.get('lines', 0)
+
+            result.data = df
+            result.metadata = {
+                "rows": accumulator.rows,
+                "columns": len(accumulator.columns),
+                "column_names": list(accumulator.columns),
+                "column_dtypes": quality_check['column_dtypes'],
+                "file_size_mb": file_path.stat().st_size / (1024 * 1024),
+                "duration_sec": round(duration, 3),
+                "null_pct": quality_check['null_pct'],
+                "duplicates": quality_check['duplicates'],
+                "duplicate_pct": quality_check['duplicate_pct'],
+                "issues": quality_check['issues'],
+                "chunksize": chunksize,
+                "chunks": accumulator.chunks,
+                "collected": collect,
+                "lines": lines,
+                "malformed_lines": malformed,
+            }
+            if sample_fraction < 1:
+                result.metadata.update({
+                    "is_sample": True,
+                    "sample_fraction": sample_fraction,
+                    "sample_rows": len(df) if df is not None else 0,
+                })
+            result.rows_processed = accumulator.rows
+            result.rows_failed = malformed
+            result.data_loss_pct = self._calculate_data_loss_pct(lines - malformed, malformed)
+            result.quality_score = self._calculate_quality_score(lines - malformed, malformed)
+            result.success = True
+
+            logger.info(
+                f"JSONL streamed: {accumulator.rows} rows, {len(accumulator.columns)} columns "
+                f"in {accumulator.chunks} chunks, {malformed} malformed ({duration:.3f}s)"
+            )
+            return result
+
+        except Exception as e:
+            self._add_error(result, ErrorType.LOAD_ERROR, f"JSONL streaming failed: {e}")
+            result.success = False
+            return result
@@ -0,0 +1,233 @@
+"""Load Cache - Content-addressed on-disk cache of parsed datasets.
+
+Parsed frames are stored as Parquet so repeated loads of the same source
+file skip text parsing and re-validation:
+- Key: resolved path + mtime + size + load kwargs (SHA-256)
+- Entry: <key>.parquet (data) + <key>.json (load metadata)
+- Hit: Parquet is memory-mapped back into a DataFrame
+- Eviction: least-recently-used entries until under the size budget
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# ===== CONSTANTS =====
+DEFAULT_CACHE_MAX_MB = 512.0
+DATA_SUFFIX = '.parquet'
+META_SUFFIX = '.json'
+
+
+def _json_default(value: Any) -> Any:
+    """Convert numpy/pandas scalars for json.dump."""
+    if isinstance(value, np.integer):
+        return int(value)
+    if isinstance(value, np.floating):
+        return float(value)
+    if isinstance(value, np.bool_):
+        return bool(value)
+    return str(value)
+
+
+class LoadCache:
+    """Size-bounded Parquet cache for loaded datasets.
+
+    Example:
+        >>> cache = LoadCache('.cache/data_loader', max_size_mb=256)
+        >>> key = cache.make_key('data/sales.csv', {'format': 'csv'})
+        >>> hit = cache.get(key)
+        >>> if hit is None:
+        ...     cache.put(key, df, {'quality_score': 0.97})
+    """
+
+    def __init__(self, cache_dir: str, max_size_mb: float = DEFAULT_CACHE_MAX_MB) -> None:
+        """Initialize cache directory.
+
+        Args:
+            cache_dir: Directory where cache entries are stored
+            max_size_mb: Size budget; LRU entries are evicted beyond it
+        """
+        if max_size_mb <= 0:
+            raise ValueError(f"max_size_mb must be positive, got {max_size_mb}")
+
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.write_failures = 0
+        self._lock = threading.Lock()
+
+    # === KEYS ===
+
+    @staticmethod
+    def make_key(file_path: str, load_kwargs: Optional[Dict[str, Any]] = None) -> str:
+        """Build cache key from file identity and load options.
+
+        Args:
+            file_path: Source file path
+            load_kwargs: Options that affect the parsed result
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        path = Path(file_path).resolve()
+        stat = path.stat()
+        payload = json.dumps(
+            {
+                'path': str(path),
+                'mtime_ns': stat.st_mtime_ns,
+                'size': stat.st_size,
+                'kwargs': load_kwargs or {},
+            },
+            sort_keys=True,
+            default=_json_default,
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _data_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{DATA_SUFFIX}"
+
+    def _meta_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{META_SUFFIX}"
+
+    # === READ / WRITE ===
+
+    def get(self, key: str) -> Optional[Tuple[pd.DataFrame, Dict[str, Any]]]:
+        """Return cached (DataFrame, metadata) or None on miss.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Tuple of DataFrame and stored metadata, or None
+        """
+        data_path = self._data_path(key)
+        meta_path = self._meta_path(key)
+
+        if not data_path.exists() or not meta_path.exists():
+            with self._lock:
+                self.misses += 1
+            return None
+
+        try:
+            df = pd.read_parquet(data_path, memory_map=True)
+            with open(meta_path, 'r') as f:
+                metadata = json.load(f)
+            # Touch entry so eviction sees it as recently used
+            os.utime(data_path, None)
+        except Exception as e:
+            logger.warning(f"Load cache entry unreadable, discarding {key[:12]}: {e}")
+            self._remove(key)
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+        logger.info(f"Load cache hit: {key[:12]}")
+        return df, metadata
+
+    def put(self, key: str, df: pd.DataFrame, metadata: Optional[Dict[str, Any]] = None) -> bool:
+        """Store a parsed frame and its metadata.
+
+        Writes go to a temporary file first and are renamed into place, so
+        a concurrent reader never sees a partial entry.
+
+        Args:
+            key: Cache key from make_key()
+            df: Parsed DataFrame
+            metadata: JSON-serializable load metadata
+
+        Returns:
+            True if stored, False if the frame could not be written
+        """
+        data_path = self._data_path(key)
+        meta_path = self._meta_path(key)
+        tmp_data = data_path.with_suffix(f"{DATA_SUFFIX}.tmp")
+        tmp_meta = meta_path.with_suffix(f"{META_SUFFIX}.tmp")
+
+        try:
+            df.to_parquet(tmp_data, index=True)
+            with open(tmp_meta, 'w') as f:
+                json.dump(metadata or {}, f, default=_json_default)
+            os.replace(tmp_data, data_path)
+            os.replace(tmp_meta, meta_path)
+        except Exception as e:
+            # e.g. object columns with mixed types Parquet cannot represent
+            logger.warning(f"Load cache write skipped for {key[:12]}: {e}")
+            for tmp in (tmp_data, tmp_meta):
+                tmp.unlink(missing_ok=True)
+            with self._lock:
+                self.write_failures += 1
+            return False
+
+        self._evict()
+        return True
+
+    # === EVICTION ===
+
+    def _entries(self):
+        """List (mtime, size, key) for all complete entries."""
+        entries = []
+        for data_path in self.cache_dir.glob(f"*{DATA_SUFFIX}"):
+            key = data_path.name[:-len(DATA_SUFFIX)]
+            try:
+                stat = data_path.stat()
+                meta_size = self._meta_path(key).stat().st_size if self._meta_path(key).exists() else 0
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size + meta_size, key))
+        return entries
+
+    def _evict(self) -> None:
+        """Evict least-recently-used entries until under the size budget."""
+        with self._lock:
+            entries = sorted(self._entries())
+            total = sum(size for _, size, _ in entries)
+            while entries and total > self.max_size_bytes:
+                _, size, key = entries.pop(0)
+                self._remove(key)
+                total -= size
+                self.evictions += 1
+                logger.info(f"Load cache evicted: {key[:12]}")
+
+    def _remove(self, key: str) -> None:
+        self._data_path(key).unlink(missing_ok=True)
+        self._meta_path(key).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Remove all cache entries."""
+        with self._lock:
+            for _, _, key in self._entries():
+                self._remove(key)
+
+    # === STATS ===
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache counters and current size.
+
+        Returns:
+            Dictionary with hits, misses, evictions and size
+        """
+        entries = self._entries()
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'write_failures': self.write_failures,
+            'entries': len(entries),
+            'size_mb': round(sum(size for _, size, _ in entries) / (1024 * 1024), 3),
+            'max_size_mb': round(self.max_size_bytes / (1024 * 1024), 3),
+        }
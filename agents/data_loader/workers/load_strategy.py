@@ -0,0 +1,163 @@
+"""Load Strategy - Picks a loading tier from file size and available RAM.
+
+Tiers:
+- in_memory: parse the whole file at once (small files)
+- chunked: stream the file in bounded chunks and concatenate (the parse
+  overhead stays bounded even though the result is fully materialized)
+- sampled: the parsed frame would not fit in the memory budget; keep a
+  uniform sample while quality metrics still cover every row
+
+Only CSV, Parquet, JSONL and SQLite can be read incrementally. Other formats are loaded
+in memory when they fit and rejected when they do not.
+"""
+
+import os
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, Optional
+
+from core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# ===== CONSTANTS =====
+TIER_IN_MEMORY = 'in_memory'
+TIER_CHUNKED = 'chunked'
+TIER_SAMPLED = 'sampled'
+TIERS = [TIER_IN_MEMORY, TIER_CHUNKED, TIER_SAMPLED]
+
+DEFAULT_IN_MEMORY_MAX_MB = 100.0
+DEFAULT_MEMORY_FRACTION = 0.5
+
+# Parsed-DataFrame size relative to on-disk size (rough, conservative)
+MEMORY_EXPANSION = {
+    'csv': 3.0,
+    'json': 3.0,
+    'jsonl': 3.0,
+    'xlsx': 10.0,   # zipped XML
+    'xls': 5.0,
+    'parquet': 5.0,  # compressed columnar
+    'h5': 1.5,
+    'hdf5': 1.5,
+    'db': 1.5,
+    'sqlite': 1.5,
+}
+INCREMENTAL_FORMATS = ['csv', 'parquet', 'jsonl', 'db', 'sqlite']
+
+
+@dataclass
+class LoadPlan:
+    """Chosen tier and the numbers behind the decision."""
+    tier: str
+    reason: str
+    file_size_mb: float
+    estimated_memory_mb: float
+    available_memory_mb: Optional[float]
+    sample_fraction: float = 1.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to metadata dictionary."""
+        data = asdict(self)
+        return {
+            'load_tier': data['tier'],
+            'load_tier_reason': data['reason'],
+            'estimated_memory_mb': round(data['estimated_memory_mb'], 2),
+            'available_memory_mb': (
+                round(data['available_memory_mb'], 2)
+                if data['available_memory_mb'] is not None else None
+            ),
+            'sample_fraction': round(data['sample_fraction'], 6),
+        }
+
+
+def available_memory_mb() -> Optional[float]:
+    """Available physical memory in MB, or None if it cannot be determined.
+
+    Uses psutil when installed, falling back to sysconf on POSIX.
+    """
+    try:
+        import psutil
+        return psutil.virtual_memory().available / (1024 * 1024)
+    except ImportError:
+        pass
+
+    try:
+        return os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def choose_tier(
+    file_size_mb: float,
+    file_format: str,
+    in_memory_max_mb: float = DEFAULT_IN_MEMORY_MAX_MB,
+    memory_fraction: float = DEFAULT_MEMORY_FRACTION,
+    available_mb: Optional[float] = None,
+    requested_tier: Optional[str] = None
+) -> LoadPlan:
+    """Decide how to load a file.
+
+    Args:
+        file_size_mb: On-disk size
+        file_format: Format key (csv, parquet, ...)
+        in_memory_max_mb: Largest file loaded in one pass
+        memory_fraction: Share of available RAM a load may use
+        available_mb: Available RAM (detected when None)
+        requested_tier: Force a tier instead of choosing
+
+    Returns:
+        LoadPlan
+
+    Raises:
+        ValueError: If requested_tier is unknown or not supported for the format
+    """
+    if available_mb is None:
+        available_mb = available_memory_mb()
+    estimated_mb = file_size_mb * MEMORY_EXPANSION.get(file_format, 3.0)
+    budget_mb = available_mb * memory_fraction if available_mb is not None else None
+    incremental = file_format in INCREMENTAL_FORMATS
+
+    def fraction() -> float:
+        if budget_mb is None or estimated_mb <= 0:
+            return 1.0
+        return max(min(budget_mb / estimated_mb, 1.0), 1e-6)
+
+    if requested_tier is not None:
+        if requested_tier not in TIERS:
+            raise ValueError(f"Unknown load tier '{requested_tier}'. Supported: {TIERS}")
+        if requested_tier != TIER_IN_MEMORY and not incremental:
+            raise ValueError(f"Tier '{requested_tier}' is not supported for {file_format} files")
+        return LoadPlan(
+            tier=requested_tier,
+            reason='requested',
+            file_size_mb=file_size_mb,
+            estimated_memory_mb=estimated_mb,
+            available_memory_mb=available_mb,
+            sample_fraction=fraction() if requested_tier == TIER_SAMPLED else 1.0,
+        )
+
+    fits = budget_mb is None or estimated_mb <= budget_mb
+
+    if file_size_mb <= in_memory_max_mb and fits:
+        tier, reason = TIER_IN_MEMORY, f"file <= {in_memory_max_mb:g}MB and fits in memory"
+    elif fits and incremental:
+        tier, reason = TIER_CHUNKED, f"file > {in_memory_max_mb:g}MB, estimated {estimated_mb:.0f}MB fits in memory budget"
+    elif fits:
+        tier, reason = TIER_IN_MEMORY, f"{file_format} cannot be read incrementally; fits in memory budget"
+    elif incremental:
+        tier, reason = TIER_SAMPLED, f"estimated {estimated_mb:.0f}MB exceeds memory budget {budget_mb:.0f}MB"
+    else:
+        raise ValueError(
+            f"File too large to load: estimated {estimated_mb:.0f}MB in memory exceeds "
+            f"budget {budget_mb:.0f}MB and {file_format} cannot be sampled incrementally"
+        )
+
+    plan = LoadPlan(
+        tier=tier,
+        reason=reason,
+        file_size_mb=file_size_mb,
+        estimated_memory_mb=estimated_mb,
+        available_memory_mb=available_mb,
+        sample_fraction=fraction() if tier == TIER_SAMPLED else 1.0,
+    )
+    logger.info(f"Load tier: {plan.tier} ({plan.reason})")
+    return plan
@@ -2,6 +2,8 @@
 
 Handles:
 - Parquet file loading
+- Column projection and row-group filter pushdown
+- Batched (chunked) and sampled reads for large files
 - Input validation
 - Data quality tracking
 - Comprehensive error intelligence
@@ -10,10 +12,11 @@ Handles:
 
 import pandas as pd
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List
 import time
 
 from .base_worker import BaseWorker, WorkerResult, ErrorType
+from .pushdown import normalize_filters, read_columns, apply_pushdown, Filter
 from core.logger import get_logger
 from agents.error_intelligence.main import ErrorIntelligence
 
@@ -22,6 +25,7 @@ logger = get_logger(__name__)
 # ===== CONSTANTS =====
 MIN_ROWS_REQUIRED = 1
 QUALITY_THRESHOLD = 0.8
+BATCH_SIZE = 100_000
 
 
 class ParquetLoaderWorker(BaseWorker):
@@ -37,7 +41,10 @@ class ParquetLoaderWorker(BaseWorker):
     Input Format:
         {
             'file_path': str (required),
-            'columns': List[str] (optional)
+            'columns': List[str] (optional),
+            'filters': List[(column, op, value)] (optional),
+            'incremental': bool (optional, read in record batches),
+            'sample_fraction': float (optional, implies incremental)
         }
     
     Output Format:
@@ -67,7 +74,6 @@ class ParquetLoaderWorker(BaseWorker):
         Checks:
         - file_path exists and is accessible
         - File has .parquet extension
-        - File is not too large (>100MB)
         
         Args:
             input_data: Dictionary with 'file_path' key
@@ -92,13 +98,9 @@ class ParquetLoaderWorker(BaseWorker):
         if not file_path.exists():
             raise ValueError(f"File not found: {file_path}")
         
-        if file_path.suffix.lower() != '.parquet':
+        if file_path.suffix.lower() != '.parquet' and input_data.get('detected_format') != 'parquet':
             raise ValueError(f"File must be Parquet, got {file_path.suffix}")
         
-        file_size_mb = file_path.stat().st_size / (1024 * 1024)
-        if file_size_mb > 100:
-            raise ValueError(f"File too large: {file_size_mb:.1f}MB (max: 100MB)")
-        
         return True
     
     def execute(self, **kwargs) -> WorkerResult:
@@ -107,6 +109,11 @@ class ParquetLoaderWorker(BaseWorker):
         Args:
             file_path: Path to Parquet file (required)
             columns: Optional list of columns to load
+            filters: Optional [(column, op, value)] row filters; row groups
+                whose min/max statistics cannot match are skipped
+            incremental: Read record batches one at a time instead of the
+                whole table, so Arrow and pandas copies never coexist in full
+            sample_fraction: Keep this share of each batch's rows (0-1]
             **kwargs: Additional pandas read_parquet arguments
             
         Returns:
@@ -115,7 +122,10 @@ class ParquetLoaderWorker(BaseWorker):
         start_time = time.time()
         try:
             # Validate input
-            self.validate_input({'file_path': kwargs.get('file_path')})
+            self.validate_input({
+                'file_path': kwargs.get('file_path'),
+                'detected_format': kwargs.get('detected_format')
+            })
             
             result = self._run_parquet_load(**kwargs)
             
@@ -170,8 +180,21 @@ class ParquetLoaderWorker(BaseWorker):
         file_path = Path(file_path)
         
         try:
-            # Load Parquet with optional column selection
-            df = pd.read_parquet(file_path, columns=columns)
+            filters = normalize_filters(kwargs.get('filters'))
+            sample_fraction = kwargs.get('sample_fraction', 1.0)
+            if not 0 < sample_fraction <= 1:
+                raise ValueError(f"sample_fraction must be in (0, 1], got {sample_fraction}")
+            
+            if kwargs.get('incremental') or sample_fraction < 1:
+                df = self._read_batches(file_path, columns, filters, sample_fraction)
+            else:
+                # Only projected column chunks are read; filters prune row
+                # groups by statistics before the remaining rows are decoded
+                df = pd.read_parquet(
+                    file_path,
+                    columns=list(columns) if columns is not None else None,
+                    filters=filters or None
+                )
             
             rows_loaded = len(df)
             cols_loaded = len(df.columns)
@@ -181,7 +204,7 @@ class ParquetLoaderWorker(BaseWorker):
                 self._add_error(
                     result,
                     ErrorType.EMPTY_DATA,
-                    "Parquet file is empty"
+                    "No rows match filters" if filters else "Parquet file is empty"
                 )
                 result.success = False
                 return result
@@ -215,6 +238,14 @@ class ParquetLoaderWorker(BaseWorker):
                 "duplicates": quality_info['duplicates'],
                 "duplicate_pct": round(quality_info['duplicate_pct'], 2),
             }
+            if columns is not None or filters:
+                result.metadata.update(self._pushdown_stats(file_path, filters))
+            if sample_fraction < 1:
+                result.metadata.update({
+                    "is_sample": True,
+                    "sample_fraction": sample_fraction,
+                    "sample_rows": rows_loaded,
+                })
             
             result.success = True
             logger.info(
@@ -232,3 +263,104 @@ class ParquetLoaderWorker(BaseWorker):
             result.success = False
             logger.error(f"Parquet loading failed: {e}", exc_info=True)
             return result
+    
+    def _read_batches(
+        self,
+        file_path: Path,
+        columns: Any,
+        filters: List[Filter],
+        sample_fraction: float = 1.0
+    ) -> pd.DataFrame:
+        """Read matching row groups batch by batch, optionally sampling.
+        
+        Args:
+            file_path: Parquet file
+            columns: Output columns (None = all)
+            filters: Normalized filters
+            sample_fraction: Share of rows kept per batch
+            
+        Returns:
+            Concatenated DataFrame
+        """
+        import pyarrow.parquet as pq
+        
+        parquet_file = pq.ParquetFile(file_path)
+        row_groups = [
+            i for i in range(parquet_file.metadata.num_row_groups)
+            if self._row_group_may_match(parquet_file.metadata.row_group(i), filters)
+        ]
+        
+        frames = []
+        batches = parquet_file.iter_batches(
+            batch_size=BATCH_SIZE,
+            row_groups=row_groups,
+            columns=read_columns(columns, filters)
+        )
+        for i, batch in enumerate(batches):
+            chunk = apply_pushdown(batch.to_pandas(), columns, filters)
+            if sample_fraction < 1:
+                chunk = chunk.sample(frac=sample_fraction, random_state=i)
+            frames.append(chunk)
+        
+        if not frames:
+            schema = parquet_file.schema_arrow.empty_table().to_pandas()
+            return apply_pushdown(schema, columns, filters)
+        return pd.concat(frames, ignore_index=True)
+    
+    def _pushdown_stats(self, file_path: Path, filters: List[Filter]) -> Dict[str, Any]:
+        """Report how much of the file projection and filters skipped.
+        
+        Args:
+            file_path: Parquet file
+            filters: Normalized filters
+            
+        Returns:
+            Dict with total/read row groups and total columns in the file
+        """
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            return {}
+        
+        parquet_meta = pq.ParquetFile(file_path).metadata
+        total = parquet_meta.num_row_groups
+        read = sum(
+            1 for i in range(total)
+            if self._row_group_may_match(parquet_meta.row_group(i), filters)
+        )
+        return {
+            "file_columns": parquet_meta.num_columns,
+            "row_groups_total": total,
+            "row_groups_read": read,
+            "filters": [list(f) for f in filters],
+        }
+    
+    @staticmethod
+    def _row_group_may_match(row_group: Any, filters: List[Filter]) -> bool:
+        """Check a row group's min/max statistics against the filters."""
+        stats: Dict[str, Any] = {}
+        for i in range(row_group.num_columns):
+            column = row_group.column(i)
+            if column.is_stats_set and column.statistics.has_min_max:
+                stats[column.path_in_schema] = (column.statistics.min, column.statistics.max)
+        
+        for name, op, value in filters:
+            if name not in stats:
+                continue
+            lo, hi = stats[name]
+            try:
+                if op in ('==', '=') and not lo <= value <= hi:
+                    return False
+                if op == '>' and not hi > value:
+                    return False
+                if op == '>=' and not hi >= value:
+                    return False
+                if op == '<' and not lo < value:
+                    return False
+                if op == '<=' and not lo <= value:
+                    return False
+                if op == 'in' and not any(lo <= v <= hi for v in value):
+                    return False
+            except TypeError:
+                continue
+        return True
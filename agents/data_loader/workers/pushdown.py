@@ -0,0 +1,153 @@
+"""Pushdown helpers - Column projection and row filters for all loaders.
+
+Filters use the same tuple format as pyarrow/pandas read_parquet, so they
+can be handed to Parquet untouched (row-group statistics pruning) and
+applied in-memory by every other loader:
+
+    columns=['region', 'amount']
+    filters=[('amount', '>', 100), ('region', 'in', ['north', 'south'])]
+
+All filters are ANDed together.
+"""
+
+from typing import Any, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+# ===== CONSTANTS =====
+FILTER_OPERATORS = ['==', '=', '!=', '>', '>=', '<', '<=', 'in', 'not in']
+
+Filter = Tuple[str, str, Any]
+
+
+def normalize_filters(filters: Optional[Sequence[Sequence[Any]]]) -> List[Filter]:
+    """Validate filter tuples.
+
+    Args:
+        filters: Sequence of (column, operator, value)
+
+    Returns:
+        List of (column, operator, value) tuples
+
+    Raises:
+        ValueError: If a filter is malformed or uses an unknown operator
+    """
+    if not filters:
+        return []
+    if isinstance(filters, tuple) and len(filters) == 3 and isinstance(filters[1], str):
+        filters = [filters]
+
+    normalized = []
+    for flt in filters:
+        if not isinstance(flt, (list, tuple)) or len(flt) != 3:
+            raise ValueError(f"Filter must be (column, operator, value), got {flt!r}")
+        column, op, value = flt
+        op = str(op).lower()
+        if op not in FILTER_OPERATORS:
+            raise ValueError(f"Unsupported filter operator '{op}'. Supported: {FILTER_OPERATORS}")
+        if op in ('in', 'not in') and not isinstance(value, (list, tuple, set)):
+            raise ValueError(f"Operator '{op}' requires a list of values, got {value!r}")
+        normalized.append((column, op, list(value) if op in ('in', 'not in') else value))
+    return normalized
+
+
+def read_columns(
+    columns: Optional[Sequence[str]],
+    filters: Optional[List[Filter]] = None
+) -> Optional[List[str]]:
+    """Columns a reader must parse: the projection plus filter columns.
+
+    Args:
+        columns: Requested output columns (None = all)
+        filters: Normalized filters
+
+    Returns:
+        Column list to read, or None to read everything
+    """
+    if columns is None:
+        return None
+    needed = list(columns)
+    for column, _, _ in filters or []:
+        if column not in needed:
+            needed.append(column)
+    return needed
+
+
+def apply_filters(df: pd.DataFrame, filters: Optional[List[Filter]]) -> pd.DataFrame:
+    """Keep rows matching all filters.
+
+    Args:
+        df: Input DataFrame
+        filters: Normalized filters
+
+    Returns:
+        Filtered DataFrame (index reset)
+
+    Raises:
+        KeyError: If a filter column does not exist
+    """
+    if not filters:
+        return df
+
+    mask = pd.Series(True, index=df.index)
+    for column, op, value in filters:
+        if column not in df.columns:
+            raise KeyError(f"Filter column not found: {column}")
+        series = df[column]
+        if op in ('==', '='):
+            mask &= series == value
+        elif op == '!=':
+            mask &= series != value
+        elif op == '>':
+            mask &= series > value
+        elif op == '>=':
+            mask &= series >= value
+        elif op == '<':
+            mask &= series < value
+        elif op == '<=':
+            mask &= series <= value
+        elif op == 'in':
+            mask &= series.isin(value)
+        elif op == 'not in':
+            mask &= ~series.isin(value)
+
+    return df[mask.fillna(False).astype(bool)].reset_index(drop=True)
+
+
+def project(df: pd.DataFrame, columns: Optional[Sequence[str]]) -> pd.DataFrame:
+    """Select requested columns in the requested order.
+
+    Args:
+        df: Input DataFrame
+        columns: Output columns (None = all)
+
+    Returns:
+        Projected DataFrame
+
+    Raises:
+        KeyError: If a requested column does not exist
+    """
+    if columns is None:
+        return df
+    missing = [col for col in columns if col not in df.columns]
+    if missing:
+        raise KeyError(f"Columns not found: {missing}")
+    return df[list(columns)]
+
+
+def apply_pushdown(
+    df: pd.DataFrame,
+    columns: Optional[Sequence[str]] = None,
+    filters: Optional[List[Filter]] = None
+) -> pd.DataFrame:
+    """Filter rows then project columns (for readers without native support).
+
+    Args:
+        df: Input DataFrame
+        columns: Output columns (None = all)
+        filters: Normalized filters
+
+    Returns:
+        Filtered, projected DataFrame
+    """
+    return project(apply_filters(df, filters), columns)
@@ -0,0 +1,168 @@
+"""Quality Accumulator - Incremental data quality metrics over DataFrame chunks.
+
+Used by the streaming loaders so quality metrics can be computed without
+ever holding the full dataset in memory:
+- Null counts per column
+- Duplicate rows (across chunk boundaries)
+- Column dtypes (promoted when chunks disagree)
+"""
+
+from typing import Any, Dict, List
+
+import numpy as np
+import pandas as pd
+
+from .base_worker import MAX_NULL_PERCENTAGE
+
+# ===== CONSTANTS =====
+HIGH_DUPLICATE_PERCENTAGE = 50.0
+
+
+class StreamingQualityAccumulator:
+    """Accumulate quality metrics chunk by chunk.
+
+    Peak memory is bounded by the chunk being processed plus one 8-byte
+    hash per distinct row. Hashes are kept as a few sorted numpy runs of
+    geometrically growing size; a new chunk only merges into the small
+    runs, so tracking N rows costs O(N log N) rather than re-sorting
+    everything seen on every chunk. Duplicate tracking can be disabled
+    for very large inputs.
+
+    Example:
+        >>> acc = StreamingQualityAccumulator()
+        >>> for chunk in pd.read_csv('big.csv', chunksize=100_000):
+        ...     acc.update(chunk)
+        >>> acc.metrics()['null_pct']
+    """
+
+    def __init__(self, track_duplicates: bool = True) -> None:
+        """Initialize empty accumulator.
+
+        Args:
+            track_duplicates: Whether to hash rows for duplicate detection
+        """
+        self.track_duplicates = track_duplicates
+        self.rows: int = 0
+        self.chunks: int = 0
+        self.duplicates: int = 0
+        self.columns: List[str] = []
+        self.null_counts: Dict[str, int] = {}
+        self.column_dtypes: Dict[str, str] = {}
+        # Sorted, disjoint hash runs; each is at least twice the size of the next
+        self._hash_runs: List[np.ndarray] = []
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        """Fold one chunk into the running metrics.
+
+        Args:
+            chunk: Next DataFrame chunk
+        """
+        if chunk is None or chunk.empty:
+            return
+
+        self.chunks += 1
+        self.rows += len(chunk)
+
+        for col in chunk.columns:
+            if col not in self.null_counts:
+                self.columns.append(col)
+                # Rows seen before this column appeared count as null
+                self.null_counts[col] = self.rows - len(chunk)
+            self.null_counts[col] += int(chunk[col].isna().sum())
+            self._merge_dtype(col, chunk[col].dtype)
+
+        # Columns missing from this chunk are null for all of its rows
+        for col in self.columns:
+            if col not in chunk.columns:
+                self.null_counts[col] += len(chunk)
+
+        if self.track_duplicates:
+            self._update_duplicates(chunk)
+
+    def _merge_dtype(self, col: str, dtype: Any) -> None:
+        """Record column dtype, promoting when chunks disagree."""
+        previous = self.column_dtypes.get(col)
+        current = str(dtype)
+        if previous is None or previous == current:
+            self.column_dtypes[col] = current
+            return
+        try:
+            self.column_dtypes[col] = str(np.promote_types(previous, current))
+        except TypeError:
+            self.column_dtypes[col] = 'object'
+
+    def _update_duplicates(self, chunk: pd.DataFrame) -> None:
+        """Count duplicate rows within the chunk and against earlier chunks."""
+        # Align to the known column order so hashes are comparable
+        aligned = chunk.reindex(columns=self.columns)
+        try:
+            hashes = pd.util.hash_pandas_object(aligned, index=False).to_numpy(dtype=np.uint64)
+        except TypeError:
+            # Unhashable cells (lists from nested JSON) are compared by their repr
+            hashes = pd.util.hash_pandas_object(aligned.astype(str), index=False).to_numpy(dtype=np.uint64)
+
+        unique_hashes = np.unique(hashes)
+        self.duplicates += len(hashes) - len(unique_hashes)
+
+        for run in self._hash_runs:
+            if len(unique_hashes) == 0:
+                break
+            pos = np.minimum(np.searchsorted(run, unique_hashes), len(run) - 1)
+            already_seen = run[pos] == unique_hashes
+            self.duplicates += int(already_seen.sum())
+            unique_hashes = unique_hashes[~already_seen]
+
+        if len(unique_hashes) > 0:
+            self._hash_runs.append(unique_hashes)
+            # Merge while the newest run is not clearly smaller than the one
+            # before it, so every hash is merged O(log N) times in total
+            while len(self._hash_runs) > 1 and len(self._hash_runs[-2]) <= 2 * len(self._hash_runs[-1]):
+                newest = self._hash_runs.pop()
+                self._hash_runs[-1] = np.union1d(self._hash_runs[-1], newest)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Get accumulated quality metrics.
+
+        Returns:
+            Dictionary compatible with BaseWorker._check_data_quality output,
+            plus per-column null counts and dtypes
+        """
+        if self.rows == 0 or not self.columns:
+            return {
+                "valid": False,
+                "rows": 0,
+                "columns": 0,
+                "null_count": 0,
+                "null_pct": 100.0,
+                "duplicates": 0,
+                "duplicate_pct": 0.0,
+                "column_null_counts": {},
+                "column_dtypes": {},
+                "chunks": self.chunks,
+                "issues": ["DataFrame is empty"]
+            }
+
+        total_cells = self.rows * len(self.columns)
+        null_count = sum(self.null_counts.values())
+        null_pct = (null_count / total_cells * 100) if total_cells > 0 else 0.0
+        dup_pct = (self.duplicates / self.rows * 100) if self.rows > 0 else 0.0
+
+        issues = []
+        if null_pct > MAX_NULL_PERCENTAGE:
+            issues.append(f"High null percentage: {null_pct:.1f}%")
+        if dup_pct > HIGH_DUPLICATE_PERCENTAGE:
+            issues.append(f"High duplicate percentage: {dup_pct:.1f}%")
+
+        return {
+            "valid": len(issues) == 0,
+            "rows": self.rows,
+            "columns": len(self.columns),
+            "null_count": int(null_count),
+            "null_pct": round(null_pct, 2),
+            "duplicates": int(self.duplicates) if self.track_duplicates else None,
+            "duplicate_pct": round(dup_pct, 2),
+            "column_null_counts": dict(self.null_counts),
+            "column_dtypes": dict(self.column_dtypes),
+            "chunks": self.chunks,
+            "issues": issues
+        }
@@ -15,22 +15,29 @@ quality_score = (
     (1 - outlier_pct/100) * 0.15 +
     memory_efficiency * 0.10
 )
+
+With sample_rows set, components are computed on a stratified sample and
+the score is flagged as an estimate (see quality_sampling).
 """
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, Optional, Tuple
+
+from .quality_sampling import stratified_sample, estimate_duplicate_fraction
 
 
 class QualityScoreCalculator:
     """Calculate comprehensive data quality scores."""
 
     @staticmethod
-    def calculate(df: pd.DataFrame) -> Tuple[float, Dict[str, Any]]:
+    def calculate(df: pd.DataFrame, sample_rows: Optional[int] = None) -> Tuple[float, Dict[str, Any]]:
         """Calculate quality score and detailed metrics.
         
         Args:
             df: DataFrame to assess
+            sample_rows: Score a stratified sample of this many rows
+                instead of the whole frame (None = all rows)
             
         Returns:
             (quality_score, detailed_metrics)
@@ -39,6 +46,10 @@ class QualityScoreCalculator:
             return 0.0, {"error": "Empty DataFrame"}
 
         metrics = {}
+        total_rows = len(df)
+        if sample_rows is not None and total_rows > sample_rows:
+            df = stratified_sample(df, sample_rows)
+        sample_fraction = len(df) / total_rows
 
         # 1. Null/Missing Data (40% weight)
         null_score, null_metrics = QualityScoreCalculator._calculate_null_score(df)
@@ -46,7 +57,7 @@ class QualityScoreCalculator:
         metrics.update(null_metrics)
 
         # 2. Duplicate Rows (20% weight)
-        duplicate_score, duplicate_metrics = QualityScoreCalculator._calculate_duplicate_score(df)
+        duplicate_score, duplicate_metrics = QualityScoreCalculator._calculate_duplicate_score(df, sample_fraction)
         metrics['duplicate_score'] = duplicate_score
         metrics.update(duplicate_metrics)
 
@@ -78,6 +89,12 @@ class QualityScoreCalculator:
         quality_score = max(0.0, min(1.0, quality_score))
 
         metrics['overall_quality_score'] = quality_score
+        metrics['quality_score_is_estimate'] = sample_fraction < 1
+        if sample_fraction < 1:
+            metrics['sample_rows'] = len(df)
+            metrics['sample_fraction'] = round(sample_fraction, 6)
+            metrics['total_rows'] = total_rows
+            metrics['memory_usage_mb'] = round(metrics['memory_usage_mb'] / sample_fraction, 2)
         metrics['score_components'] = {
             'null_handling': {'score': null_score, 'weight': 0.40},
             'duplicate_handling': {'score': duplicate_score, 'weight': 0.20},
@@ -120,9 +137,12 @@ class QualityScoreCalculator:
         }
 
     @staticmethod
-    def _calculate_duplicate_score(df: pd.DataFrame) -> Tuple[float, Dict[str, Any]]:
+    def _calculate_duplicate_score(df: pd.DataFrame, sample_fraction: float = 1.0) -> Tuple[float, Dict[str, Any]]:
         """Calculate duplicate row score (20% weight).
         
+        On a sample, the within-sample duplicate rate is scaled up by the
+        sampling fraction.
+        
         Perfect: No duplicates = 1.0
         Good: < 2% = 0.95
         Acceptable: 2-5% = 0.85
@@ -131,7 +151,12 @@ class QualityScoreCalculator:
         """
         total_rows = len(df)
         duplicate_rows = df.duplicated().sum()
-        duplicate_pct = (duplicate_rows / total_rows * 100) if total_rows > 0 else 0.0
+        if sample_fraction < 1:
+            duplicate_pct = estimate_duplicate_fraction(int(duplicate_rows), total_rows, sample_fraction) * 100
+            total_rows = int(round(total_rows / sample_fraction))
+            duplicate_rows = round(duplicate_pct / 100 * total_rows)
+        else:
+            duplicate_pct = (duplicate_rows / total_rows * 100) if total_rows > 0 else 0.0
 
         if duplicate_pct == 0:
             score = 1.0
@@ -0,0 +1,302 @@
+"""Schema Registry - Persistent per-dataset load profiles.
+
+A profile records what a successful load of a dataset looked like:
+- Format and parse options (encoding, delimiter, quotechar), so later
+  loads skip format sniffing
+- Column dtypes, passed to the parser so types are not re-inferred
+- Known-good column stats (null %, numeric range), used by ValidatorWorker
+  as a baseline for cheap drift checks
+
+Profiles are keyed by dataset name; a profile may also carry a glob
+pattern ('exports/sales_*.csv') so every matching file shares it. The
+registry is a single JSON file, rewritten atomically on every change.
+"""
+
+import fnmatch
+import json
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# ===== CONSTANTS =====
+REGISTRY_VERSION = 1
+# Drift thresholds used by compare_stats
+NULL_DRIFT_PCT_POINTS = 20.0
+RANGE_DRIFT_FACTOR = 1.0  # Values beyond the known range by more than its width
+
+
+@dataclass
+class DatasetProfile:
+    """Known-good schema and stats of one dataset."""
+    name: str
+    file_format: str
+    dtypes: Dict[str, str]
+    parse_options: Dict[str, Any] = field(default_factory=dict)
+    column_stats: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    pattern: Optional[str] = None
+    rows: int = 0
+    loads: int = 0
+    updated_at: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to JSON-serializable dictionary."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'DatasetProfile':
+        """Build a profile from its stored dictionary."""
+        return cls(**data)
+
+    def read_hints(self, columns: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+        """read_csv dtype/parse_dates arguments for this profile.
+
+        Args:
+            columns: Columns that will be parsed (None = all)
+
+        Returns:
+            {'dtype': {col: dtype}, 'parse_dates': [col, ...]}
+        """
+        dtype, parse_dates = {}, []
+        for col, dtype_name in self.dtypes.items():
+            if columns is not None and col not in columns:
+                continue
+            if dtype_name.startswith('datetime64'):
+                parse_dates.append(col)
+            else:
+                dtype[col] = dtype_name
+        return {'dtype': dtype, 'parse_dates': parse_dates}
+
+
+def column_stats(df: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
+    """Null percentage and numeric range of every column (one vectorized pass)."""
+    rows = len(df)
+    null_counts = df.isna().sum()
+    stats = {}
+    for col in df.columns:
+        entry = {'null_pct': round(float(null_counts[col]) / rows * 100, 2) if rows else 0.0}
+        series = df[col]
+        if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+            non_null = series.dropna()
+            if len(non_null):
+                entry['min'] = float(non_null.min())
+                entry['max'] = float(non_null.max())
+        stats[str(col)] = entry
+    return stats
+
+
+def compare_schema(
+    profile: DatasetProfile,
+    columns: Sequence[Any],
+    dtypes: Optional[Dict[str, Any]] = None,
+    expected_columns: Optional[Sequence[str]] = None
+) -> List[str]:
+    """Column-level drift between a profile and a parsed (or header-only) frame.
+
+    Args:
+        profile: Baseline profile
+        columns: Observed columns
+        dtypes: Observed {column: dtype} (skip the dtype check when None)
+        expected_columns: Projection that was requested; only these profile
+            columns are required (None = all)
+
+    Returns:
+        Drift descriptions (empty when the schema matches)
+    """
+    observed = [str(col) for col in columns]
+    required = list(profile.dtypes) if expected_columns is None else [str(col) for col in expected_columns]
+    issues = []
+    added = [col for col in observed if col not in profile.dtypes]
+    removed = [col for col in required if col not in observed]
+    if added:
+        issues.append(f"New columns: {added}")
+    if removed:
+        issues.append(f"Missing columns: {removed}")
+    for col, dtype in (dtypes or {}).items():
+        expected = profile.dtypes.get(str(col))
+        if expected is not None and str(dtype) != expected:
+            issues.append(f"Column '{col}' dtype changed: {expected} -> {dtype}")
+    return issues
+
+
+def compare_stats(profile: DatasetProfile, stats: Dict[str, Dict[str, Any]]) -> List[str]:
+    """Value-level drift: null spikes and values far outside the known range.
+
+    Args:
+        profile: Baseline profile
+        stats: column_stats() of the new data
+
+    Returns:
+        Drift descriptions
+    """
+    issues = []
+    for col, current in stats.items():
+        baseline = profile.column_stats.get(col)
+        if not baseline:
+            continue
+        null_delta = current['null_pct'] - baseline.get('null_pct', 0.0)
+        if null_delta > NULL_DRIFT_PCT_POINTS:
+            issues.append(
+                f"Column '{col}' null rate rose from {baseline['null_pct']:.1f}% to {current['null_pct']:.1f}%"
+            )
+        if 'min' in baseline and 'min' in current:
+            margin = (baseline['max'] - baseline['min']) * RANGE_DRIFT_FACTOR
+            if current['min'] < baseline['min'] - margin or current['max'] > baseline['max'] + margin:
+                issues.append(
+                    f"Column '{col}' range [{current['min']:g}, {current['max']:g}] is far outside "
+                    f"known [{baseline['min']:g}, {baseline['max']:g}]"
+                )
+    return issues
+
+
+class SchemaRegistry:
+    """JSON-backed store of DatasetProfile objects.
+
+    Example:
+        >>> registry = SchemaRegistry('.cache/schemas.json')
+        >>> registry.register('sales', df, 'csv', {'delimiter': ';'}, pattern='exports/sales_*.csv')
+        >>> registry.match('exports/sales_2025-07.csv').dtypes['amount']
+        'float64'
+    """
+
+    def __init__(self, path: str) -> None:
+        """Open (or start) a registry file.
+
+        Args:
+            path: JSON file holding the profiles
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._profiles: Dict[str, DatasetProfile] = {}
+        if self.path.exists():
+            try:
+                with open(self.path, 'r') as f:
+                    stored = json.load(f)
+                self._profiles = {
+                    name: DatasetProfile.from_dict(data)
+                    for name, data in stored.get('profiles', {}).items()
+                }
+            except (ValueError, TypeError, OSError) as e:
+                logger.warning(f"Schema registry {self.path} unreadable, starting empty: {e}")
+
+    def __len__(self) -> int:
+        return len(self._profiles)
+
+    def names(self) -> List[str]:
+        """Registered dataset names."""
+        with self._lock:
+            return list(self._profiles)
+
+    def get(self, name: str) -> Optional[DatasetProfile]:
+        """Profile registered under an exact name."""
+        with self._lock:
+            return self._profiles.get(name)
+
+    def match(self, name_or_path: Any) -> Optional[DatasetProfile]:
+        """Find the profile for a dataset name or file path.
+
+        An exact name (or resolved file path) wins; otherwise the profile
+        with the longest glob pattern matching the path as given, the
+        resolved path or the file name is used.
+
+        Args:
+            name_or_path: Dataset name or path of the file being loaded
+
+        Returns:
+            Matching profile or None
+        """
+        key = str(name_or_path)
+        path = Path(key)
+        forms = [path.as_posix(), path.resolve().as_posix(), path.name]
+        with self._lock:
+            for form in (key, forms[1]):
+                if form in self._profiles:
+                    return self._profiles[form]
+            candidates: List[Tuple[int, DatasetProfile]] = [
+                (len(profile.pattern), profile)
+                for profile in self._profiles.values()
+                if profile.pattern and any(fnmatch.fnmatch(form, profile.pattern) for form in forms)
+            ]
+        return max(candidates, key=lambda item: item[0])[1] if candidates else None
+
+    def register(
+        self,
+        name: str,
+        df: pd.DataFrame,
+        file_format: str,
+        parse_options: Optional[Dict[str, Any]] = None,
+        pattern: Optional[str] = None
+    ) -> DatasetProfile:
+        """Create or replace a profile from a successfully loaded frame.
+
+        Args:
+            name: Dataset name (file path when none is given)
+            df: Loaded DataFrame
+            file_format: Format key
+            parse_options: Encoding/delimiter/quotechar used to parse it
+            pattern: Optional glob so other files share the profile
+
+        Returns:
+            The stored profile
+        """
+        with self._lock:
+            previous = self._profiles.get(name)
+            profile = DatasetProfile(
+                name=name,
+                file_format=file_format,
+                dtypes={str(col): str(dtype) for col, dtype in df.dtypes.items()},
+                parse_options=dict(parse_options or {}),
+                column_stats=column_stats(df),
+                pattern=pattern or (previous.pattern if previous else None),
+                rows=len(df),
+                loads=(previous.loads if previous else 0) + 1,
+                updated_at=time.time(),
+            )
+            self._profiles[name] = profile
+            self._save()
+        logger.info(f"Schema profile '{name}' registered: {len(profile.dtypes)} columns")
+        return profile
+
+    def record_load(self, name: str) -> None:
+        """Count a load that reused a profile (kept in memory until the next save)."""
+        with self._lock:
+            if name in self._profiles:
+                self._profiles[name].loads += 1
+
+    def forget(self, name: str) -> bool:
+        """Remove a profile.
+
+        Returns:
+            True if a profile was removed
+        """
+        with self._lock:
+            removed = self._profiles.pop(name, None) is not None
+            if removed:
+                self._save()
+        return removed
+
+    def _save(self) -> None:
+        """Write all profiles atomically (caller holds the lock)."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            'version': REGISTRY_VERSION,
+            'profiles': {name: profile.to_dict() for name, profile in self._profiles.items()},
+        }
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(payload, f, indent=2, default=str)
+            os.replace(tmp_path, self.path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
@@ -0,0 +1,508 @@
+"""SQL Loader Worker - Chunked reads from SQLite files and SQLAlchemy URLs.
+
+Handles:
+- Connection reuse: SQLite files share a pool of read-only connections,
+  URLs share one SQLAlchemy engine (and its connection pool) per URL
+- Column projection and filters pushed into the SELECT as quoted
+  identifiers and bound parameters, never string-formatted values
+- Parameterized user queries (pushdown wraps them as a subquery)
+- Chunked fetching with pandas ``chunksize`` and incremental quality metrics
+"""
+
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+import pandas as pd
+
+from agents.data_loader.workers.base_worker import BaseWorker, WorkerResult, ErrorType
+from agents.data_loader.workers.quality_accumulator import StreamingQualityAccumulator
+from agents.data_loader.workers.pushdown import normalize_filters, Filter
+from core.logger import get_logger
+from agents.error_intelligence.main import ErrorIntelligence
+
+logger = get_logger(__name__)
+
+# ===== CONSTANTS =====
+DEFAULT_CHUNKSIZE = 50_000
+DEFAULT_TABLE = 'data'
+DEFAULT_POOL_SIZE = 4  # Idle SQLite connections kept per database file
+SQL_OPERATORS = {'==': '=', '=': '=', '!=': '<>', '>': '>', '>=': '>=', '<': '<', '<=': '<='}
+
+Params = Union[Dict[str, Any], List[Any]]
+
+
+def is_url(source: Union[str, Path]) -> bool:
+    """True for SQLAlchemy URLs ('postgresql://...', 'sqlite:///...')."""
+    return isinstance(source, str) and '://' in source
+
+
+class SQLConnectionPool:
+    """Thread-safe connection reuse for SQL sources.
+
+    SQLite files get read-only sqlite3 connections that are returned to an
+    idle list after each read instead of being closed. URLs get one
+    SQLAlchemy engine per URL, whose own pool does the reuse.
+
+    Example:
+        >>> pool = SQLConnectionPool()
+        >>> with pool.connection('sales.db') as conn:
+        ...     pd.read_sql('SELECT 1', conn)
+        >>> pool.stats()['reused']
+    """
+
+    def __init__(self, max_idle: int = DEFAULT_POOL_SIZE) -> None:
+        """Initialize empty pool.
+
+        Args:
+            max_idle: Idle SQLite connections kept per database file
+        """
+        self.max_idle = max_idle
+        self._lock = threading.Lock()
+        self._idle: Dict[str, List[sqlite3.Connection]] = {}
+        self._engines: Dict[str, Any] = {}
+        self.created = 0
+        self.reused = 0
+
+    @contextmanager
+    def connection(self, source: Union[str, Path]) -> Iterator[Any]:
+        """Borrow a connection for the duration of the block.
+
+        Args:
+            source: SQLite file path or SQLAlchemy URL
+
+        Yields:
+            sqlite3.Connection or SQLAlchemy Connection
+        """
+        if is_url(source):
+            with self.engine(source).connect() as conn:
+                yield conn
+            return
+
+        key = str(Path(source).resolve())
+        conn = self._checkout(key)
+        completed = False
+        try:
+            yield conn
+            completed = True
+        finally:
+            # Do not return a connection in an unknown state to the pool
+            if completed:
+                self._checkin(key, conn)
+            else:
+                conn.close()
+
+    def engine(self, url: str) -> Any:
+        """Get (or create) the shared SQLAlchemy engine for a URL."""
+        with self._lock:
+            if url not in self._engines:
+                from sqlalchemy import create_engine
+                self._engines[url] = create_engine(url, pool_pre_ping=True)
+            return self._engines[url]
+
+    def _checkout(self, key: str) -> sqlite3.Connection:
+        """Take an idle connection or open a new read-only one."""
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                self.reused += 1
+                return idle.pop()
+            self.created += 1
+        return sqlite3.connect(f"{Path(key).as_uri()}?mode=ro", uri=True, check_same_thread=False)
+
+    def _checkin(self, key: str, conn: sqlite3.Connection) -> None:
+        """Return a connection to the idle list, closing it if the list is full."""
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def stats(self) -> Dict[str, int]:
+        """Get pool counters (created/reused count SQLite connections)."""
+        with self._lock:
+            return {
+                'created': self.created,
+                'reused': self.reused,
+                'idle': sum(len(conns) for conns in self._idle.values()),
+                'engines': len(self._engines),
+            }
+
+    def close(self) -> None:
+        """Close idle connections and dispose engines."""
+        with self._lock:
+            for conns in self._idle.values():
+                for conn in conns:
+                    conn.close()
+            self._idle.clear()
+            for engine in self._engines.values():
+                engine.dispose()
+            self._engines.clear()
+
+
+def quote_identifier(name: str, dialect: Any = None, qualified: bool = False) -> str:
+    """Quote a table or column name.
+
+    Args:
+        name: Identifier
+        dialect: SQLAlchemy dialect (None = ANSI double quotes, as in SQLite)
+        qualified: Treat dots as 'schema.table' separators and quote each part
+
+    Returns:
+        Quoted identifier
+    """
+    parts = str(name).split('.') if qualified else [str(name)]
+    if dialect is not None:
+        return '.'.join(dialect.identifier_preparer.quote_identifier(part) for part in parts)
+    return '.'.join('"' + part.replace('"', '""') + '"' for part in parts)
+
+
+def build_query(
+    table_name: Optional[str] = None,
+    query: Optional[str] = None,
+    params: Optional[Params] = None,
+    columns: Optional[Sequence[str]] = None,
+    filters: Optional[List[Filter]] = None,
+    dialect: Any = None
+) -> Tuple[str, Params]:
+    """Build a SELECT with projection and filters pushed down.
+
+    Values are always bound. Named placeholders (:_p0) are used unless the
+    caller's query already uses positional (?) parameters, in which case
+    filter values are appended positionally.
+
+    Args:
+        table_name: Table to read (ignored when query is given)
+        query: Optional SQL query; wrapped as a subquery when pushdown applies
+        params: Parameters for query (dict for named, list for positional)
+        columns: Columns to select (None = all)
+        filters: Normalized (column, op, value) filters, ANDed
+        dialect: SQLAlchemy dialect for identifier quoting (None = SQLite)
+
+    Returns:
+        (sql, params)
+
+    Raises:
+        ValueError: If neither table_name nor query is given
+    """
+    if not table_name and not query:
+        raise ValueError("table_name or query is required")
+
+    positional = params is not None and not isinstance(params, Mapping)
+    bound: Params = list(params) if positional else dict(params or {})
+
+    def bind(value: Any) -> str:
+        if positional:
+            bound.append(value)
+            return '?'
+        name = f"_p{len(bound)}"
+        bound[name] = value
+        return f":{name}"
+
+    select = ', '.join(quote_identifier(c, dialect) for c in columns) if columns else '*'
+    source = f"({query}) AS _q" if query else quote_identifier(table_name, dialect, qualified=True)
+    if query and not columns and not filters:
+        return query, bound
+
+    clauses = []
+    for column, op, value in filters or []:
+        name = quote_identifier(column, dialect)
+        if op in ('in', 'not in'):
+            if not value:
+                clauses.append('1 = 0' if op == 'in' else '1 = 1')
+                continue
+            placeholders = ', '.join(bind(v) for v in value)
+            clauses.append(f"{name} {op.upper()} ({placeholders})")
+        elif value is None and op in ('==', '=', '!='):
+            clauses.append(f"{name} IS {'NOT ' if op == '!=' else ''}NULL")
+        else:
+            clauses.append(f"{name} {SQL_OPERATORS[op]} {bind(value)}")
+
+    sql = f"SELECT {select} FROM {source}"
+    if clauses:
+        sql += " WHERE " + " AND ".join(clauses)
+    return sql, bound
+
+
+class SQLLoaderWorker(BaseWorker):
+    """Worker that reads SQL tables and queries in chunks.
+
+    Input Format:
+        {
+            'source': str (required, SQLite file path or SQLAlchemy URL),
+            'table_name': str (optional, defaults to 'data'),
+            'query': str (optional, replaces table_name),
+            'params': dict or list (optional, bound query parameters),
+            'columns': List[str] (optional),
+            'filters': List[(column, op, value)] (optional),
+            'chunksize': int (optional, rows fetched per round trip)
+        }
+
+    Example:
+        >>> worker = SQLLoaderWorker()
+        >>> result = worker.safe_execute(
+        ...     source='sqlite:///data/analyst.db', table_name='analyses',
+        ...     columns=['id', 'status'], filters=[('status', '==', 'done')])
+        >>> result.metadata['query']
+        'SELECT "id", "status" FROM "analyses" WHERE "status" = :_p0'
+    """
+
+    def __init__(self, pool: Optional[SQLConnectionPool] = None) -> None:
+        """Initialize SQLLoaderWorker.
+
+        Args:
+            pool: Connection pool to share (a private one is created if None)
+        """
+        super().__init__("SQLLoaderWorker")
+        self.error_intelligence = ErrorIntelligence()
+        self.pool = pool or SQLConnectionPool()
+
+    def validate_input(self, input_data: Dict[str, Any]) -> bool:
+        """Validate input before loading.
+
+        Args:
+            input_data: Dictionary with 'source' key
+
+        Returns:
+            True if valid
+
+        Raises:
+            ValueError: If validation fails
+            TypeError: If wrong data types
+        """
+        source = input_data.get('source')
+
+        if not source:
+            raise ValueError("source is required")
+
+        if not isinstance(source, (str, Path)):
+            raise TypeError(f"source must be str or Path, got {type(source)}")
+
+        if not is_url(source) and not Path(source).exists():
+            raise ValueError(f"File not found: {source}")
+
+        params = input_data.get('params')
+        if params is not None and not isinstance(params, (Mapping, list, tuple)):
+            raise TypeError(f"params must be a dict or list, got {type(params)}")
+
+        if is_url(source) and params is not None and not isinstance(params, Mapping):
+            raise ValueError("SQLAlchemy URLs require named (dict) params")
+
+        return True
+
+    def iter_chunks(
+        self,
+        source: Union[str, Path],
+        table_name: Optional[str] = DEFAULT_TABLE,
+        query: Optional[str] = None,
+        params: Optional[Params] = None,
+        columns: Optional[List[str]] = None,
+        filters: Optional[List[Any]] = None,
+        chunksize: int = DEFAULT_CHUNKSIZE,
+        accumulator: Optional[StreamingQualityAccumulator] = None
+    ) -> Iterator[pd.DataFrame]:
+        """Yield DataFrame chunks of a table or query.
+
+        The connection is held while iterating and returned to the pool
+        when the generator finishes or is closed.
+
+        Args:
+            source: SQLite file path or SQLAlchemy URL
+            table_name: Table to read when no query is given
+            query: Optional SQL query
+            params: Bound parameters for query
+            columns: Columns to select
+            filters: [(column, op, value)] pushed into the WHERE clause
+            chunksize: Rows fetched per round trip
+            accumulator: Optional accumulator updated with every chunk
+
+        Yields:
+            DataFrame chunks of at most ``chunksize`` rows
+
+        Raises:
+            ValueError: If input or filters are invalid
+        """
+        self.validate_input({'source': source, 'params': params})
+        if not isinstance(chunksize, int) or chunksize <= 0:
+            raise ValueError(f"chunksize must be a positive integer, got {chunksize}")
+
+        sql, bound = self._build(source, table_name, query, params, columns, filters)
+        with self.pool.connection(source) as conn:
+            if is_url(source):
+                from sqlalchemy import text
+                sql = text(sql)
+            for chunk in pd.read_sql(sql, conn, params=bound or None, chunksize=chunksize):
+                if accumulator is not None:
+                    accumulator.update(chunk)
+                yield chunk
+
+    def _build(
+        self,
+        source: Union[str, Path],
+        table_name: Optional[str],
+        query: Optional[str],
+        params: Optional[Params],
+        columns: Optional[List[str]],
+        filters: Optional[List[Any]]
+    ) -> Tuple[str, Params]:
+        """Build the pushed-down SQL for a source."""
+        dialect = self.pool.engine(source).dialect if is_url(source) else None
+        return build_query(
+            table_name=table_name,
+            query=query,
+            params=params,
+            columns=columns,
+            filters=normalize_filters(filters),
+            dialect=dialect
+        )
+
+    def execute(self, **kwargs) -> WorkerResult:
+        """Execute SQL loading with robust error handling.
+
+        Args:
+            source: SQLite file path or SQLAlchemy URL (required)
+            table_name: Table to read (optional, default 'data')
+            query: SQL query (optional, replaces table_name)
+            params: Bound parameters for query (optional)
+            columns: Columns to select (optional)
+            filters: [(column, op, value)] pushed into WHERE (optional)
+            chunksize: Rows fetched per round trip (optional, default 50,000)
+            collect: Concatenate chunks into result.data (optional, default True)
+            sample_fraction: Keep this share of each chunk's rows (optional,
+                default 1.0). Quality metrics still cover every row.
+            accumulator: StreamingQualityAccumulator to fill (optional)
+
+        Returns:
+            WorkerResult with loaded data and quality metrics
+        """
+        source = kwargs.get('source')
+        try:
+            result = self._run_sql_load(**kwargs)
+
+            self.error_intelligence.track_success(
+                agent_name="data_loader",
+                worker_name="SQLLoaderWorker",
+                operation="sql_loading",
+                context={"source": str(source), "rows": result.rows_processed}
+            )
+
+            return result
+
+        except Exception as e:
+            self.error_intelligence.track_error(
+                agent_name="data_loader",
+                worker_name="SQLLoaderWorker",
+                error_type=type(e).__name__,
+                error_message=str(e),
+                context={"source": str(source)}
+            )
+            raise
+
+    def _run_sql_load(
+        self,
+        source: Union[str, Path] = None,
+        table_name: Optional[str] = DEFAULT_TABLE,
+        query: Optional[str] = None,
+        params: Optional[Params] = None,
+        columns: Optional[List[str]] = None,
+        filters: Optional[List[Any]] = None,
+        chunksize: int = DEFAULT_CHUNKSIZE,
+        collect: bool = True,
+        sample_fraction: float = 1.0,
+        accumulator: Optional[StreamingQualityAccumulator] = None,
+        **kwargs
+    ) -> WorkerResult:
+        """Perform chunked SQL loading with incremental quality metrics."""
+        result = self._create_result(task_type="sql_loading")
+
+        if not 0 < sample_fraction <= 1:
+            self._add_error(
+                result,
+                ErrorType.VALIDATION_ERROR,
+                f"sample_fraction must be in (0, 1], got {sample_fraction}"
+            )
+            result.success = False
+            return result
+
+        try:
+            self.validate_input({'source': source, 'params': params})
+        except (ValueError, TypeError) as e:
+            error_type = ErrorType.FILE_NOT_FOUND if 'not found' in str(e) else ErrorType.VALIDATION_ERROR
+            self._add_error(result, error_type, str(e))
+            result.success = False
+            return result
+
+        try:
+            start_time = time.time()
+            if accumulator is None:
+                accumulator = StreamingQualityAccumulator()
+            sql, _ = self._build(source, table_name, query, params, columns, filters)
+            chunks = []
+
+            for chunk in self.iter_chunks(
+                source,
+                table_name=table_name,
+                query=query,
+                params=params,
+                columns=columns,
+                filters=filters,
+                chunksize=chunksize,
+                accumulator=accumulator
+            ):
+                if sample_fraction < 1:
+                    # Seed per chunk so reruns return the same sample
+                    chunk = chunk.sample(frac=sample_fraction, random_state=accumulator.chunks)
+                if collect:
+                    chunks.append(chunk)
+
+            df = pd.concat(chunks, ignore_index=True) if collect and chunks else None
+            quality_check = accumulator.metrics()
+            duration = time.time() - start_time
+
+            result.data = df
+            result.metadata = {
+                "source": str(source),
+                "table": None if query else table_name,
+                "query": sql,
+                "rows": accumulator.rows,
+                "columns": len(df.columns) if df is not None else len(accumulator.columns),
+                "column_names": df.columns.tolist() if df is not None else list(accumulator.columns),
+                "column_dtypes": quality_check['column_dtypes'],
+                "duration_sec": round(duration, 3),
+                "null_pct": quality_check['null_pct'] if accumulator.rows else 0.0,
+                "duplicates": quality_check['duplicates'],
+                "duplicate_pct": quality_check['duplicate_pct'],
+                "chunksize": chunksize,
+                "chunks": accumulator.chunks,
+                "collected": collect,
+                "pool": self.pool.stats(),
+            }
+            if not is_url(source):
+                result.metadata["file_size_mb"] = round(Path(source).stat().st_size / (1024 * 1024), 2)
+            if sample_fraction < 1:
+                result.metadata.update({
+                    "is_sample": True,
+                    "sample_fraction": sample_fraction,
+                    "sample_rows": len(df) if df is not None else 0,
+                })
+
+            if accumulator.rows == 0:
+                self._add_warning(result, "No rows match filters" if filters else "Query returned no rows")
+            result.rows_processed = accumulator.rows
+            result.quality_score = 1.0 if accumulator.rows > 0 else 0.0
+            result.success = True
+
+            logger.info(
+                f"SQL loaded: {accumulator.rows} rows in {accumulator.chunks} chunks ({duration:.3f}s)"
+            )
+            return result
+
+        except Exception as e:
+            self._add_error(result, ErrorType.LOAD_ERROR, f"Failed to load SQL: {e}")
+            result.success = False
+            logger.error(f"SQL loading failed: {e}", exc_info=True)
+            return result
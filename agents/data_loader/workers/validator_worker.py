@@ -7,6 +7,9 @@ Handles:
 - Duplicate detection
 - Data type analysis
 - Quality score calculation
+- Validation modes: full scan, stratified sample with confidence bounds,
+  or metrics accumulated while streaming (incremental)
+- Drift checks against a SchemaRegistry profile (baseline)
 """
 
 import pandas as pd
@@ -15,6 +18,15 @@ from typing import Any, Dict, List, Optional
 import time
 
 from .base_worker import BaseWorker, WorkerResult, ErrorType
+from .quality_accumulator import StreamingQualityAccumulator
+from .schema_registry import DatasetProfile, compare_schema, compare_stats
+from .quality_sampling import (
+    stratified_sample,
+    wilson_interval,
+    estimate_duplicate_fraction,
+    DEFAULT_SAMPLE_ROWS,
+    CONFIDENCE_LEVEL,
+)
 from core.logger import get_logger
 from agents.error_intelligence.main import ErrorIntelligence
 
@@ -24,6 +36,7 @@ logger = get_logger(__name__)
 MAX_FILE_SIZE_MB = 100
 QUALITY_THRESHOLD = 0.8
 MAX_NULL_PERCENTAGE = 90.0
+VALIDATION_MODES = ['full', 'sampled', 'incremental']
 
 
 class ValidatorWorker(BaseWorker):
@@ -46,7 +59,11 @@ class ValidatorWorker(BaseWorker):
         {
             'df': pd.DataFrame (required),
             'file_path': str (optional),
-            'file_format': str (optional)
+            'file_format': str (optional),
+            'validation_mode': 'full' | 'sampled' | 'incremental' (optional),
+            'sample_rows': int (optional, sampled mode),
+            'accumulator': StreamingQualityAccumulator (incremental mode),
+            'baseline': DatasetProfile (optional, enables drift checks)
         }
     
     Output Format:
@@ -114,6 +131,17 @@ class ValidatorWorker(BaseWorker):
             df: DataFrame to validate (required)
             file_path: Path to source file (optional)
             file_format: File format (optional)
+            validation_mode: 'full' (default) scans every row; 'sampled'
+                scores a stratified sample and reports 95% confidence
+                bounds; 'incremental' reuses a StreamingQualityAccumulator
+            sample_rows: Sample size for sampled mode (default 50,000)
+            accumulator: Accumulator already fed with the data (incremental mode)
+            baseline: DatasetProfile from a SchemaRegistry. Columns and dtypes
+                are compared with it ('schema_drift'), null rates and numeric
+                ranges too ('stats_drift'); per-column unique counts are
+                skipped since the profile already describes the columns
+            expected_columns: Columns the caller asked for (projection), so
+                unrequested profile columns are not reported as missing
             **kwargs: Additional arguments
             
         Returns:
@@ -173,32 +201,63 @@ class ValidatorWorker(BaseWorker):
         df = kwargs.get('df')
         file_path = kwargs.get('file_path')
         file_format = kwargs.get('file_format', 'unknown')
+        validation_mode = kwargs.get('validation_mode') or 'full'
+        
+        if validation_mode not in VALIDATION_MODES:
+            raise ValueError(
+                f"Unknown validation_mode '{validation_mode}'. Supported: {VALIDATION_MODES}"
+            )
+        accumulator = kwargs.get('accumulator')
+        if validation_mode == 'incremental' and not isinstance(accumulator, StreamingQualityAccumulator):
+            raise ValueError("incremental validation requires a StreamingQualityAccumulator")
+        
+        baseline = kwargs.get('baseline')
+        if baseline is not None and not isinstance(baseline, DatasetProfile):
+            raise TypeError(f"baseline must be a DatasetProfile, got {type(baseline).__name__}")
+        unique_counts = baseline is None
         
         result = self._create_result(task_type="validation")
         
         try:
-            # Extract metadata
-            metadata = self._extract_metadata(df, file_path, file_format)
-            
-            # Check data quality
-            quality_info = self._check_data_quality(df)
+            if validation_mode == 'sampled':
+                sample = stratified_sample(df, kwargs.get('sample_rows', DEFAULT_SAMPLE_ROWS))
+                metadata = self._extract_metadata(sample, file_path, file_format, unique_counts)
+                # Column profile comes from the sample; scale totals to the frame
+                metadata['rows'] = len(df)
+                metadata['memory_usage_mb'] = round(metadata['memory_usage_mb'] * len(df) / len(sample), 2)
+                quality_info = self._check_sampled_quality(df, sample)
+            elif validation_mode == 'incremental':
+                metadata = self._extract_accumulated_metadata(accumulator, df, file_path, file_format)
+                quality_info = self._check_accumulated_quality(accumulator)
+            else:
+                metadata = self._extract_metadata(df, file_path, file_format, unique_counts)
+                quality_info = self._check_data_quality(df)
             
             # Add warnings for quality issues
             for issue in quality_info['issues']:
                 self._add_warning(result, issue)
             
+            if baseline is not None:
+                metadata.update(self._check_drift(df, baseline, metadata, kwargs.get('expected_columns')))
+                for issue in metadata['schema_drift'] + metadata['stats_drift']:
+                    self._add_warning(result, f"Drift from profile '{baseline.name}': {issue}")
+            
             # Calculate quality score
             quality_score = self._calculate_quality_from_metrics(quality_info)
             
             # Set results
             result.data = df
-            result.metadata = {**metadata, **quality_info}
+            result.metadata = {**metadata, **quality_info, 'validation_mode': validation_mode}
             result.quality_score = quality_score
             result.rows_processed = len(df)
             result.success = quality_info['valid']
             
+            if validation_mode == 'sampled':
+                result.metadata['quality_score_is_estimate'] = quality_info['sample_fraction'] < 1
+                result.metadata['quality_score_ci'] = self._quality_score_bounds(quality_info)
+            
             logger.info(
-                f"Validation completed: {len(df)} rows, "
+                f"Validation completed ({validation_mode}): {len(df)} rows, "
                 f"{len(df.columns)} columns, quality={quality_score:.2f}"
             )
             return result
@@ -213,13 +272,21 @@ class ValidatorWorker(BaseWorker):
             logger.error(f"Validation failed: {e}", exc_info=True)
             return result
     
-    def _extract_metadata(self, df: pd.DataFrame, file_path: Any, file_format: str) -> Dict[str, Any]:
+    def _extract_metadata(
+        self,
+        df: pd.DataFrame,
+        file_path: Any,
+        file_format: str,
+        unique_counts: bool = True
+    ) -> Dict[str, Any]:
         """Extract comprehensive metadata.
         
         Args:
             df: DataFrame to analyze
             file_path: Path to source file
             file_format: Format of source file
+            unique_counts: Compute per-column unique counts (a hash pass
+                per column; skipped when a baseline profile is known)
             
         Returns:
             Metadata dictionary
@@ -249,9 +316,11 @@ class ValidatorWorker(BaseWorker):
                 "non_null_count": int(df[col].notna().sum()),
                 "null_count": null_count,
                 "null_percentage": round(null_pct, 2),
-                "unique_values": int(df[col].nunique()),
-                "unique_percentage": round((df[col].nunique() / len(df) * 100), 2) if len(df) > 0 else 0.0,
             }
+            if unique_counts:
+                unique = int(df[col].nunique())
+                columns_info[col]["unique_values"] = unique
+                columns_info[col]["unique_percentage"] = round(unique / len(df) * 100, 2) if len(df) > 0 else 0.0
         
         return {
             "file_name": file_name,
@@ -264,6 +333,47 @@ class ValidatorWorker(BaseWorker):
             "columns_info": columns_info,
         }
     
+    def _check_drift(
+        self,
+        df: pd.DataFrame,
+        baseline: DatasetProfile,
+        metadata: Dict[str, Any],
+        expected_columns: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Compare the data with a baseline profile.
+        
+        Null rates come from the column metadata already extracted (so they
+        follow the validation mode); numeric ranges are one min/max pass.
+        
+        Args:
+            df: Validated DataFrame
+            baseline: Known-good profile
+            metadata: Output of the metadata extraction for this mode
+            expected_columns: Requested projection (None = all profile columns)
+            
+        Returns:
+            {'schema_drift': [...], 'stats_drift': [...], 'baseline_profile': name}
+        """
+        schema_drift = compare_schema(
+            baseline, df.columns, dict(df.dtypes.items()), expected_columns=expected_columns
+        )
+        
+        stats = {}
+        for col, info in metadata.get('columns_info', {}).items():
+            entry = {'null_pct': info['null_percentage']}
+            series = df[col]
+            if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+                if series.notna().any():
+                    entry['min'] = float(series.min())
+                    entry['max'] = float(series.max())
+            stats[str(col)] = entry
+        
+        return {
+            'schema_drift': schema_drift,
+            'stats_drift': compare_stats(baseline, stats),
+            'baseline_profile': baseline.name,
+        }
+    
     def _check_data_quality(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Check comprehensive data quality.
         
@@ -292,7 +402,19 @@ class ValidatorWorker(BaseWorker):
         dup_count = int(df.duplicated().sum())
         dup_pct = (dup_count / len(df) * 100) if len(df) > 0 else 0.0
         
-        # Issue detection
+        issues = self._detect_issues(null_pct, dup_pct)
+        
+        return {
+            "valid": len(issues) == 0,
+            "null_count": null_count,
+            "null_pct": round(null_pct, 2),
+            "duplicates": dup_count,
+            "duplicate_pct": round(dup_pct, 2),
+            "issues": issues
+        }
+    
+    def _detect_issues(self, null_pct: float, dup_pct: float) -> List[str]:
+        """List quality issues for null and duplicate percentages."""
         issues = []
         if null_pct > MAX_NULL_PERCENTAGE:
             issues.append(f"High null percentage: {null_pct:.1f}%")
@@ -300,16 +422,111 @@ class ValidatorWorker(BaseWorker):
             issues.append(f"High duplicate percentage: {dup_pct:.1f}%")
         if null_pct > 25:
             issues.append(f"Moderate null values: {null_pct:.1f}%")
+        return issues
+    
+    def _check_sampled_quality(self, df: pd.DataFrame, sample: pd.DataFrame) -> Dict[str, Any]:
+        """Estimate quality metrics from a row sample.
+        
+        Args:
+            df: Full DataFrame (only its length is used)
+            sample: Row sample of df
+            
+        Returns:
+            Quality metrics dictionary with point estimates, 95% confidence
+            bounds ('null_pct_ci', 'duplicate_pct_ci') and sample size
+        """
+        total_rows, sample_rows = len(df), len(sample)
+        n_columns = len(df.columns)
+        fraction = sample_rows / total_rows
+        
+        sample_cells = sample_rows * n_columns
+        null_cells = int(sample.isna().sum().sum())
+        null_pct = null_cells / sample_cells * 100 if sample_cells else 0.0
+        null_lo, null_hi = wilson_interval(null_cells, sample_cells, total_rows * n_columns)
+        
+        sample_dups = int(sample.duplicated().sum())
+        dup_frac = estimate_duplicate_fraction(sample_dups, sample_rows, fraction)
+        dup_lo, dup_hi = wilson_interval(sample_dups, sample_rows, total_rows)
+        
+        issues = self._detect_issues(null_pct, dup_frac * 100)
         
         return {
             "valid": len(issues) == 0,
-            "null_count": null_count,
+            "null_count": int(round(null_cells / fraction)),
             "null_pct": round(null_pct, 2),
-            "duplicates": dup_count,
-            "duplicate_pct": round(dup_pct, 2),
-            "issues": issues
+            "duplicates": int(round(dup_frac * total_rows)),
+            "duplicate_pct": round(dup_frac * 100, 2),
+            "issues": issues,
+            "null_pct_ci": [round(null_lo * 100, 2), round(null_hi * 100, 2)],
+            "duplicate_pct_ci": [
+                round(min(1.0, dup_lo / fraction) * 100, 2),
+                round(min(1.0, dup_hi / fraction) * 100, 2),
+            ],
+            "confidence_level": CONFIDENCE_LEVEL,
+            "sample_rows": sample_rows,
+            "sample_fraction": round(fraction, 6),
         }
     
+    def _quality_score_bounds(self, quality_info: Dict[str, Any]) -> List[float]:
+        """Quality score at the pessimistic and optimistic ends of the CIs."""
+        null_lo, null_hi = quality_info['null_pct_ci']
+        dup_lo, dup_hi = quality_info['duplicate_pct_ci']
+        low = self._calculate_quality_from_metrics({
+            'null_pct': null_hi, 'duplicate_pct': dup_hi, 'issues': self._detect_issues(null_hi, dup_hi)
+        })
+        high = self._calculate_quality_from_metrics({
+            'null_pct': null_lo, 'duplicate_pct': dup_lo, 'issues': self._detect_issues(null_lo, dup_lo)
+        })
+        return [low, high]
+    
+    def _check_accumulated_quality(self, accumulator: StreamingQualityAccumulator) -> Dict[str, Any]:
+        """Quality metrics from a streaming accumulator (no rescan)."""
+        metrics = accumulator.metrics()
+        if accumulator.rows == 0:
+            return self._check_data_quality(None)
+        
+        issues = self._detect_issues(metrics['null_pct'], metrics['duplicate_pct'])
+        return {
+            "valid": len(issues) == 0,
+            "null_count": metrics['null_count'],
+            "null_pct": metrics['null_pct'],
+            "duplicates": metrics['duplicates'] or 0,
+            "duplicate_pct": metrics['duplicate_pct'],
+            "issues": issues,
+            "chunks": metrics['chunks'],
+        }
+    
+    def _extract_accumulated_metadata(
+        self,
+        accumulator: StreamingQualityAccumulator,
+        df: pd.DataFrame,
+        file_path: Any,
+        file_format: str
+    ) -> Dict[str, Any]:
+        """Metadata from accumulator counts; per-column unique counts are skipped."""
+        metadata = self._extract_metadata(df.iloc[:0], file_path, file_format)
+        metrics = accumulator.metrics()
+        rows = accumulator.rows
+        
+        columns_info = {}
+        for col in accumulator.columns:
+            null_count = int(metrics['column_null_counts'].get(col, 0))
+            columns_info[col] = {
+                "dtype": metrics['column_dtypes'].get(col, 'object'),
+                "non_null_count": rows - null_count,
+                "null_count": null_count,
+                "null_percentage": round(null_count / rows * 100, 2) if rows else 0.0,
+            }
+        
+        metadata.update({
+            "rows": rows,
+            "columns": len(accumulator.columns),
+            "column_names": list(accumulator.columns),
+            "memory_usage_mb": round(df.memory_usage(deep=False).sum() / (1024 * 1024), 2),
+            "columns_info": columns_info,
+        })
+        return metadata
+    
     def _calculate_quality_from_metrics(self, quality_info: Dict[str, Any]) -> float:
         """Calculate quality score from quality metrics - IMPROVED FORMULA.
         
@@ -8,6 +8,6 @@ This agent monitors all errors across the system and provides:
 - Learning from successful fixes
 """
 
-from agents.error_intelligence.main import ErrorIntelligence
+from agents.error_intelligence.main import ErrorIntelligence, get_error_intelligence
 
-__all__ = ['ErrorIntelligence']
+__all__ = ['ErrorIntelligence', 'get_error_intelligence']
@@ -2,61 +2,146 @@
 
 Coordinates all error intelligence workers to track, analyze, and learn from
 errors across all agents and workers in the system.
+
+Tracking only updates the in-memory patterns; the PatternStore writes them
+to disk in batches from a background thread (see workers.pattern_store).
+
+ErrorIntelligence is a process-wide service: every ErrorIntelligence() call
+returns the same instance, so the many workers that create one share a
+single tracker, pattern store and set of learned fixes. The analysis
+workers are only loaded when first used.
+
+The tracker starts from the stored patterns (the pattern file plus the
+replayed append log), because every flush writes the tracker's snapshot
+over the pattern file.
 """
 
-import json
-import os
+import threading
 from datetime import datetime
 from typing import Dict, Any, Optional, List
 
 from core.logger import get_logger
 from core.error_recovery import retry_on_error
 from core.exceptions import AgentError
+from agents.agent_config import AgentConfig
 from agents.error_intelligence.workers.error_tracker import ErrorTracker
 from agents.error_intelligence.workers.pattern_analyzer import PatternAnalyzer
 from agents.error_intelligence.workers.worker_health import WorkerHealth
 from agents.error_intelligence.workers.fix_recommender import FixRecommender
 from agents.error_intelligence.workers.learning_engine import LearningEngine
+from agents.error_intelligence.workers.pattern_store import PatternStore, get_pattern_store
 
 logger = get_logger(__name__)
 
 
 class ErrorIntelligence:
-    """Error Intelligence Agent - Tracks successes and learns from system errors."""
+    """Error Intelligence Agent - Tracks successes and learns from system errors.
+    
+    Implemented as a singleton (like ErrorTracker): constructing it is
+    cheap, and all workers share one instance.
+    """
+    
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls):
+        """Singleton pattern - always return same instance."""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    instance = super(ErrorIntelligence, cls).__new__(cls)
+                    instance._initialized = False
+                    cls._instance = instance
+        return cls._instance
 
     def __init__(self):
-        """Initialize error intelligence agent with all workers."""
-        self.error_tracker = ErrorTracker()
-        self.pattern_analyzer = PatternAnalyzer()
-        self.worker_health = WorkerHealth()
-        self.fix_recommender = FixRecommender()
-        self.learning_engine = LearningEngine()
-        
-        self.error_patterns_file = '.error_patterns.json'
-        self.error_patterns = self._load_error_patterns()
+        """Initialize error intelligence agent (only on first creation)."""
+        if self._initialized:
+            return
+        with self._instance_lock:
+            if self._initialized:
+                return
+            self.error_tracker = ErrorTracker()
+            self.error_patterns_file = AgentConfig.ERROR_INTEL_PATTERNS_FILE
+            self.pattern_store: PatternStore = get_pattern_store(
+                self.error_patterns_file,
+                self.error_tracker.snapshot,
+                flush_every=AgentConfig.ERROR_INTEL_FLUSH_EVERY,
+                flush_interval=AgentConfig.ERROR_INTEL_FLUSH_INTERVAL_SECONDS,
+                log_format=AgentConfig.ERROR_INTEL_LOG_FORMAT
+            )
+            self._error_patterns: Optional[Dict[str, Any]] = None
+            self._seed_tracker()
+            self._workers: Dict[str, Any] = {}
+            self._workers_lock = threading.Lock()
+            self._initialized = True
         
         logger.info("ErrorIntelligence agent initialized")
 
+    @property
+    def error_patterns(self) -> Dict[str, Any]:
+        """Tracked patterns, including those stored by earlier runs."""
+        if self._error_patterns is None:
+            self._error_patterns = self._load_error_patterns()
+        return self._error_patterns
+
+    @error_patterns.setter
+    def error_patterns(self, patterns: Dict[str, Any]) -> None:
+        self._error_patterns = patterns
+
+    @property
+    def pattern_analyzer(self) -> PatternAnalyzer:
+        return self._worker('pattern_analyzer', PatternAnalyzer)
+
+    @property
+    def worker_health(self) -> WorkerHealth:
+        return self._worker('worker_health', WorkerHealth)
+
+    @property
+    def fix_recommender(self) -> FixRecommender:
+        return self._worker('fix_recommender', FixRecommender)
+
+    @property
+    def learning_engine(self) -> LearningEngine:
+        return self._worker('learning_engine', LearningEngine)
+
+    def _worker(self, name: str, factory: Any) -> Any:
+        """Analysis worker, created on first use."""
+        worker = self._workers.get(name)
+        if worker is None:
+            with self._workers_lock:
+                worker = self._workers.get(name)
+                if worker is None:
+                    worker = self._workers[name] = factory()
+        return worker
+
+    def _seed_tracker(self) -> None:
+        """Merge stored patterns into the tracker before anything is flushed.
+        
+        Nothing is written until the first tracked event, so seeding here
+        keeps a flush from replacing earlier processes' patterns (or, in
+        append mode, compacting away their logged events).
+        """
+        with self.error_tracker.lock:
+            self.error_tracker.seed(self._load_error_patterns(), str(self.pattern_store.path.resolve()))
+            self._error_patterns = self.error_tracker.get_patterns()
+
     def _load_error_patterns(self) -> Dict[str, Any]:
         """Load error patterns from file or create empty structure."""
-        if os.path.exists(self.error_patterns_file):
-            try:
-                with open(self.error_patterns_file, 'r') as f:
-                    return json.load(f)
-            except Exception as e:
-                logger.warning(f"Failed to load error patterns: {e}")
-                return {}
-        return {}
-
-    def _save_error_patterns(self) -> None:
-        """Save error patterns to file."""
-        try:
-            with open(self.error_patterns_file, 'w') as f:
-                json.dump(self.error_patterns, f, indent=2)
-        except Exception as e:
-            logger.error(f"Failed to save error patterns: {e}")
+        return self.pattern_store.load()
+
+    def _save_error_patterns(self, event: Optional[Dict[str, Any]] = None) -> None:
+        """Queue error patterns for the next batched write."""
+        self.pattern_store.record(event)
+
+    def flush(self) -> bool:
+        """Write pending error patterns to disk now.
+        
+        Returns:
+            True if anything was written
+        """
+        return self.pattern_store.flush()
 
-    @retry_on_error(max_attempts=2, backoff=1)
     def track_success(
         self,
         agent_name: str,
@@ -66,6 +151,9 @@ class ErrorIntelligence:
     ) -> None:
         """Track a successful operation.
         
+        Called on nearly every worker operation, so it only updates memory
+        (no retries: ErrorTracker never raises); the write happens later.
+        
         Args:
             agent_name: Name of agent that succeeded
             worker_name: Name of worker that succeeded
@@ -73,7 +161,7 @@ class ErrorIntelligence:
             context: Additional context about the success
         """
         # Track the success
-        self.error_tracker.track_success(
+        event = self.error_tracker.track_success(
             agent_name=agent_name,
             worker_name=worker_name,
             operation=operation,
@@ -82,11 +170,8 @@ class ErrorIntelligence:
         
         # Update error patterns
         self.error_patterns = self.error_tracker.get_patterns()
-        self._save_error_patterns()
-        
-        logger.info(f"Success tracked: {agent_name}.{worker_name} - {operation}")
+        self._save_error_patterns(event)
 
-    @retry_on_error(max_attempts=2, backoff=1)
     def track_error(
         self,
         agent_name: str,
@@ -107,7 +192,7 @@ class ErrorIntelligence:
             context: Additional context about the error
         """
         # Track the error
-        self.error_tracker.track_error(
+        event = self.error_tracker.track_error(
             agent_name=agent_name,
             worker_name=worker_name,
             error_type=error_type,
@@ -118,7 +203,7 @@ class ErrorIntelligence:
         
         # Update error patterns
         self.error_patterns = self.error_tracker.get_patterns()
-        self._save_error_patterns()
+        self._save_error_patterns(event)
         
         logger.info(f"Error tracked: {agent_name}.{worker_name} - {error_type}")
 
@@ -246,3 +331,8 @@ class ErrorIntelligence:
                 print(f"  ✓ {fix['fix_applied']}")
         
         print("\n" + "="*70 + "\n")
+
+
+def get_error_intelligence() -> ErrorIntelligence:
+    """The process-wide ErrorIntelligence service (created on first call)."""
+    return ErrorIntelligence()
@@ -6,4 +6,5 @@ Each worker handles a specific aspect of error intelligence:
 - worker_health: Calculates health scores
 - fix_recommender: Suggests fixes
 - learning_engine: Learns from successful fixes
+- pattern_store: Persists error patterns in batches
 """
@@ -1,5 +1,7 @@
 """ErrorTracker Worker - Captures and stores errors from agents/workers."""
 
+import json
+import threading
 from typing import Dict, Any, Optional
 from datetime import datetime
 from core.logger import get_logger
@@ -29,6 +31,8 @@ class ErrorTracker:
             return
         
         self.errors = {}
+        self.lock = threading.RLock()
+        self.seeded_from = set()  # Pattern files already merged in (see seed)
         self.error_intelligence = None  # Lazy load to avoid circular dependency
         self._initialized = True
         logger.info("ErrorTracker worker initialized")
@@ -43,13 +47,48 @@ class ErrorTracker:
                 pass
         return self.error_intelligence
 
+    @staticmethod
+    def apply_event(errors: Dict[str, Any], event: Dict[str, Any]) -> None:
+        """Add one tracked event to a patterns dict.
+        
+        Args:
+            errors: Patterns by agent (updated in place)
+            event: {'kind': 'success' | 'error', 'agent', 'worker',
+                and for errors 'record'}
+        """
+        agent_name = event['agent']
+        worker_name = event['worker']
+        if agent_name not in errors:
+            errors[agent_name] = {
+                'total_runs': 0,
+                'successes': 0,
+                'failures': 0,
+                'workers': {},
+            }
+        
+        if worker_name not in errors[agent_name]['workers']:
+            errors[agent_name]['workers'][worker_name] = {
+                'successes': 0,
+                'failures': 0,
+                'errors': [],
+            }
+        
+        errors[agent_name]['total_runs'] += 1
+        if event['kind'] == 'success':
+            errors[agent_name]['successes'] += 1
+            errors[agent_name]['workers'][worker_name]['successes'] += 1
+        else:
+            errors[agent_name]['failures'] += 1
+            errors[agent_name]['workers'][worker_name]['failures'] += 1
+            errors[agent_name]['workers'][worker_name]['errors'].append(event['record'])
+
     def track_success(
         self,
         agent_name: str,
         worker_name: str,
         operation: str,
         context: Optional[Dict[str, Any]] = None,
-    ) -> None:
+    ) -> Optional[Dict[str, Any]]:
         """Track a successful run.
         
         Args:
@@ -57,33 +96,21 @@ class ErrorTracker:
             worker_name: Name of worker
             operation: Operation that succeeded
             context: Additional context
+            
+        Returns:
+            The tracked event (None if tracking failed)
         """
         try:
-            if agent_name not in self.errors:
-                self.errors[agent_name] = {
-                    'total_runs': 0,
-                    'successes': 0,
-                    'failures': 0,
-                    'workers': {},
-                }
-            
-            if worker_name not in self.errors[agent_name]['workers']:
-                self.errors[agent_name]['workers'][worker_name] = {
-                    'successes': 0,
-                    'failures': 0,
-                    'errors': [],
-                }
-            
-            # Increment success counters
-            self.errors[agent_name]['total_runs'] += 1
-            self.errors[agent_name]['successes'] += 1
-            self.errors[agent_name]['workers'][worker_name]['successes'] += 1
-            
-            logger.debug(f"Tracked success: {agent_name}.{worker_name} - {operation}")
+            event = {'kind': 'success', 'agent': agent_name, 'worker': worker_name, 'operation': operation}
+            with self.lock:
+                self.apply_event(self.errors, event)
+            # Not logged: successes are tracked on every worker call
+            return event
         
         except Exception as e:
             logger.error(f"ErrorTracker.track_success failed: {e}")
             # Don't raise - we don't want tracking to break the system
+            return None
 
     def track_error(
         self,
@@ -93,7 +120,7 @@ class ErrorTracker:
         error_message: str,
         data_type: Optional[str] = None,
         context: Optional[Dict[str, Any]] = None,
-    ) -> None:
+    ) -> Optional[Dict[str, Any]]:
         """Track an error.
         
         Args:
@@ -103,28 +130,11 @@ class ErrorTracker:
             error_message: Error message
             data_type: Data type that caused error
             context: Additional context
+            
+        Returns:
+            The tracked event (None if tracking failed)
         """
         try:
-            if agent_name not in self.errors:
-                self.errors[agent_name] = {
-                    'total_runs': 0,
-                    'successes': 0,
-                    'failures': 0,
-                    'workers': {},
-                }
-            
-            if worker_name not in self.errors[agent_name]['workers']:
-                self.errors[agent_name]['workers'][worker_name] = {
-                    'successes': 0,
-                    'failures': 0,
-                    'errors': [],
-                }
-            
-            # Increment failure counters
-            self.errors[agent_name]['total_runs'] += 1
-            self.errors[agent_name]['failures'] += 1
-            self.errors[agent_name]['workers'][worker_name]['failures'] += 1
-            
             # Store error details
             error_record = {
                 'timestamp': datetime.now().isoformat(),
@@ -133,14 +143,17 @@ class ErrorTracker:
                 'data_type': data_type,
                 'context': context or {},
             }
-            
-            self.errors[agent_name]['workers'][worker_name]['errors'].append(error_record)
+            event = {'kind': 'error', 'agent': agent_name, 'worker': worker_name, 'record': error_record}
+            with self.lock:
+                self.apply_event(self.errors, event)
             
             logger.debug(f"Tracked error: {agent_name}.{worker_name} - {error_type}")
+            return event
         
         except Exception as e:
             logger.error(f"ErrorTracker.track_error failed: {e}")
             # Don't raise - we don't want tracking to break the system
+            return None
 
     def record_run(self, agent_name: str) -> None:
         """Record a run attempt for an agent.
@@ -149,19 +162,60 @@ class ErrorTracker:
             agent_name: Name of agent that ran
         """
         try:
-            if agent_name not in self.errors:
-                self.errors[agent_name] = {
-                    'total_runs': 0,
-                    'successes': 0,
-                    'failures': 0,
-                    'workers': {},
-                }
-            
-            self.errors[agent_name]['total_runs'] += 1
+            with self.lock:
+                if agent_name not in self.errors:
+                    self.errors[agent_name] = {
+                        'total_runs': 0,
+                        'successes': 0,
+                        'failures': 0,
+                        'workers': {},
+                    }
+                
+                self.errors[agent_name]['total_runs'] += 1
         
         except Exception as e:
             logger.error(f"ErrorTracker.record_run failed: {e}")
 
+    def seed(self, stored: Dict[str, Any], source: str) -> bool:
+        """Start from patterns persisted by earlier runs.
+        
+        Events this process tracked before seeding are added on top of
+        the stored counts. Each source is merged in only once.
+        
+        Args:
+            stored: Patterns loaded from disk (taken over, not copied)
+            source: Pattern file the patterns came from
+            
+        Returns:
+            True if the patterns were merged in
+        """
+        with self.lock:
+            if source in self.seeded_from:
+                return False
+            for agent_name, agent in self.errors.items():
+                base = stored.setdefault(agent_name, {'total_runs': 0, 'successes': 0, 'failures': 0, 'workers': {}})
+                for key in ('total_runs', 'successes', 'failures'):
+                    base[key] = base.get(key, 0) + agent.get(key, 0)
+                for worker_name, worker in agent.get('workers', {}).items():
+                    into = base.setdefault('workers', {}).setdefault(
+                        worker_name, {'successes': 0, 'failures': 0, 'errors': []}
+                    )
+                    into['successes'] = into.get('successes', 0) + worker.get('successes', 0)
+                    into['failures'] = into.get('failures', 0) + worker.get('failures', 0)
+                    into.setdefault('errors', []).extend(worker.get('errors', []))
+            self.errors = stored
+            self.seeded_from.add(source)
+            return True
+
+    def snapshot(self) -> Dict[str, Any]:
+        """JSON-ready copy of the patterns, safe to write while tracking goes on.
+        
+        Returns:
+            Deep copy of the error patterns (non-JSON context values as strings)
+        """
+        with self.lock:
+            return json.loads(json.dumps(self.errors, default=str))
+
     def get_patterns(self) -> Dict[str, Any]:
         """Get current error patterns.
         
@@ -206,7 +260,8 @@ class ErrorTracker:
     def clear(self) -> None:
         """Clear all tracked errors."""
         try:
-            self.errors = {}
+            with self.lock:
+                self.errors = {}
             logger.info("Error tracker cleared")
         except Exception as e:
             logger.error(f"ErrorTracker.clear failed: {e}")
@@ -0,0 +1,242 @@
+"""PatternStore Worker - Batched, background persistence of error patterns.
+
+Every worker operation tracks a success or an error. Rewriting the whole
+pattern file on each call made tracking cost a full JSON dump and file
+write; the store instead:
+
+- counts tracked events in memory (a lock and a counter per call)
+- flushes from a background thread once `flush_every` events are pending
+  or `flush_interval` seconds have passed, and at interpreter exit
+- writes atomically: a temporary file in the same directory is renamed
+  over the pattern file, so readers never see a half-written file
+- optionally ('append' format) appends each event as a JSON line to a
+  log next to the pattern file, and folds the log into the pattern file
+  when it grows large or at exit. Loading replays the log, so events
+  since the last snapshot survive a crash
+
+One store exists per pattern file (see get_pattern_store), shared by all
+ErrorIntelligence instances of the process.
+
+Usage:
+    store = get_pattern_store('.error_patterns.json', tracker.snapshot)
+    store.record(event)   # after every tracked event
+    store.flush()         # force a write (tests, shutdown)
+"""
+
+import atexit
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# ===== CONSTANTS =====
+LOG_FORMATS = ('snapshot', 'append')
+# Log lines after which the append log is folded into the pattern file
+COMPACT_AFTER_LINES = 10000
+
+
+def write_json_atomic(path: Path, data: Any) -> None:
+    """Write JSON to a temporary file and rename it over path."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{path.name}.", suffix='.tmp', dir=str(path.parent))
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f, indent=2, default=str)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class PatternStore:
+    """Accumulates tracked events and persists error patterns in batches.
+
+    Example:
+        >>> store = PatternStore('.error_patterns.json', tracker.snapshot, flush_every=100)
+        >>> store.record({'kind': 'success', 'agent': 'loader', 'worker': 'csv'})
+        >>> store.pending
+        1
+    """
+
+    def __init__(
+        self,
+        path: str,
+        snapshot: Callable[[], Dict[str, Any]],
+        flush_every: int = 100,
+        flush_interval: float = 5.0,
+        log_format: str = 'snapshot'
+    ) -> None:
+        """Create a store.
+
+        Args:
+            path: Pattern file (JSON)
+            snapshot: Returns a JSON-ready copy of the current patterns
+            flush_every: Pending events that trigger a flush (1 = every event)
+            flush_interval: Seconds between background flushes
+            log_format: 'snapshot' rewrites the pattern file on flush;
+                'append' appends events to a JSON-lines log
+        """
+        if log_format not in LOG_FORMATS:
+            raise ValueError(f"log_format must be one of {LOG_FORMATS}")
+        self.path = Path(path)
+        self.log_path = self.path.with_suffix('.jsonl')
+        self.snapshot = snapshot
+        self.flush_every = max(1, int(flush_every))
+        self.flush_interval = flush_interval
+        self.log_format = log_format
+        self.pending = 0
+        self.flushes = 0
+        self.log_lines = 0
+        self._events: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+    def load(self) -> Dict[str, Any]:
+        """Patterns from the pattern file, with the append log replayed on top.
+
+        Returns:
+            Stored patterns ({} if there are none or the file is unreadable)
+        """
+        patterns: Dict[str, Any] = {}
+        self.log_lines = 0
+        if self.path.exists():
+            try:
+                with open(self.path, 'r') as f:
+                    patterns = json.load(f)
+            except Exception as e:
+                logger.warning(f"Failed to load error patterns: {e}")
+                patterns = {}
+        if self.log_format == 'append' and self.log_path.exists():
+            from .error_tracker import ErrorTracker
+            try:
+                with open(self.log_path, 'r') as f:
+                    for line in f:
+                        if line.strip():
+                            ErrorTracker.apply_event(patterns, json.loads(line))
+                            self.log_lines += 1
+            except Exception as e:
+                logger.warning(f"Failed to replay error pattern log: {e}")
+        return patterns
+
+    def record(self, event: Optional[Dict[str, Any]] = None) -> None:
+        """Note a tracked event; a flush is scheduled once enough are pending."""
+        with self._lock:
+            self.pending += 1
+            if event is not None and self.log_format == 'append':
+                self._events.append(event)
+            due = self.pending >= self.flush_every
+        if self._thread is None:
+            self._start()
+        if due:
+            self._wake.set()
+
+    def flush(self) -> bool:
+        """Persist pending events now.
+
+        Returns:
+            True if anything was written
+        """
+        with self._flush_lock:
+            with self._lock:
+                if self.pending == 0:
+                    return False
+                events, self._events = self._events, []
+                self.pending = 0
+            try:
+                if self.log_format == 'append' and self.log_lines + len(events) < COMPACT_AFTER_LINES:
+                    self._append(events)
+                else:
+                    self._compact()
+                self.flushes += 1
+                return True
+            except Exception as e:
+                logger.error(f"Failed to save error patterns: {e}")
+                return False
+
+    def close(self) -> None:
+        """Flush and stop the background thread (append logs are compacted)."""
+        self._closed = True
+        self._wake.set()
+        self.flush()
+        if self.log_format == 'append' and self.log_lines:
+            with self._flush_lock:
+                try:
+                    self._compact()
+                except Exception as e:
+                    logger.error(f"Failed to compact error pattern log: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Pending events and write counters."""
+        return {
+            'path': str(self.path),
+            'log_format': self.log_format,
+            'pending': self.pending,
+            'flushes': self.flushes,
+            'log_lines': self.log_lines
+        }
+
+    def _append(self, events: List[Dict[str, Any]]) -> None:
+        """Append events to the JSON-lines log (caller holds the flush lock)."""
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.log_path, 'a') as f:
+            f.write(''.join(json.dumps(event, default=str) + '\n' for event in events))
+        self.log_lines += len(events)
+
+    def _compact(self) -> None:
+        """Rewrite the pattern file and drop the log (caller holds the flush lock)."""
+        write_json_atomic(self.path, self.snapshot())
+        if self.log_format == 'append' and self.log_path.exists():
+            self.log_path.unlink()
+        self.log_lines = 0
+
+    def _start(self) -> None:
+        """Start the background flush thread on first use."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name='error-patterns-flush', daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            if not self._closed:
+                self.flush()
+
+
+_stores: Dict[str, PatternStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_pattern_store(path: str, snapshot: Callable[[], Dict[str, Any]], **options: Any) -> PatternStore:
+    """Process-wide store for a pattern file, created (and closed at exit) on first use.
+
+    Args:
+        path: Pattern file
+        snapshot: Returns a JSON-ready copy of the current patterns
+        **options: PatternStore options, used when the store is created
+
+    Returns:
+        The store for path
+    """
+    key = os.path.abspath(path)
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = PatternStore(path, snapshot, **options)
+            _stores[key] = store
+            atexit.register(store.close)
+        return store
@@ -4,7 +4,7 @@ Coordinates 12 workers for systematic data exploration.
 Implements retry logic, error intelligence, and health reporting.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Union
 from datetime import datetime
 import pandas as pd
 
@@ -28,6 +28,7 @@ from .workers import (
 from core.structured_logger import get_structured_logger
 from core.error_recovery import retry_on_error
 from core.exceptions import AgentError
+from core.shared_dataset import SharedDataset, frame_for_agent
 
 structured_logger = get_structured_logger(__name__)
 
@@ -129,11 +130,11 @@ class Explorer:
         })
     
     @retry_on_error(max_attempts=2, backoff=1)
-    def set_data(self, df: pd.DataFrame) -> None:
+    def set_data(self, df: Union[pd.DataFrame, SharedDataset]) -> None:
         """Set data to explore.
         
         Args:
-            df: DataFrame to analyze
+            df: DataFrame to analyze, or SharedDataset (kept as a view)
             
         Raises:
             AgentError: If DataFrame is None
@@ -141,6 +142,7 @@ class Explorer:
         if df is None:
             raise AgentError("Cannot set None as data")
         
+        df = frame_for_agent(df, copy=False)
         self.data = df
         self.analysis_cache = {}  # Clear cache when data changes
         
@@ -8,6 +8,8 @@ Refactored architecture:
   - DataManager: Handle caching and data flow
   - AgentRegistry: Manage agent registration
   - NarrativeIntegrator: Bridge to narrative generator
+  - SessionManager: Per-client workspaces
+  - ProcessBackend: Process pool for CPU-bound tasks
 
 Integrated with Week 1 foundation systems:
 - Configuration management
@@ -22,6 +24,9 @@ from .workers.workflow_executor import WorkflowExecutor
 from .workers.data_manager import DataManager
 from .workers.agent_registry import AgentRegistry
 from .workers.narrative_integrator import NarrativeIntegrator
+from .workers.workflow_dag import WorkflowDAG
+from .workers.session_manager import SessionManager
+from .workers.process_backend import ProcessBackend
 
 __all__ = [
     "Orchestrator",
@@ -29,5 +34,8 @@ __all__ = [
     "WorkflowExecutor",
     "DataManager",
     "AgentRegistry",
-    "NarrativeIntegrator"
+    "NarrativeIntegrator",
+    "WorkflowDAG",
+    "SessionManager",
+    "ProcessBackend"
 ]
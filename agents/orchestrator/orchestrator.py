@@ -3,22 +3,32 @@
 Upgraded with quality tracking and error handling.
 """
 
-from typing import Any, Dict, List, Optional
+import itertools
+from typing import Any, Callable, Dict, List, Optional
 from datetime import datetime, timezone
 from enum import Enum
 
 from core.logger import get_logger
 from core.structured_logger import get_structured_logger
-from core.exceptions import OrchestratorError, DataValidationError
+from core.exceptions import OrchestratorError, DataValidationError, TaskCancelledError, TaskTimeoutError
 from core.error_recovery import retry_on_error
 from core.validators import validate_output
+from core.shared_dataset import SharedDataset
 
+from agents.agent_config import AgentConfig
 from agents.error_intelligence.main import ErrorIntelligence
 from agents.orchestrator.workers.agent_registry import AgentRegistry
 from agents.orchestrator.workers.data_manager import DataManager
 from agents.orchestrator.workers.task_router import TaskRouter
 from agents.orchestrator.workers.workflow_executor import WorkflowExecutor
 from agents.orchestrator.workers.narrative_integrator import NarrativeIntegrator
+from agents.orchestrator.workers.workflow_dag import WorkflowDAG
+from agents.orchestrator.workers.session_manager import SessionManager, DatasetPool
+from agents.orchestrator.workers.process_backend import ProcessBackend
+from agents.orchestrator.workers.event_bus import (
+    EventBus, EventCallback, stage_event, summarize_result,
+    WORKFLOW_STARTED, STAGE_STARTED, STAGE_COMPLETED, STAGE_FAILED, STAGE_SKIPPED, WORKFLOW_FINISHED
+)
 
 
 class TaskStatus(Enum):
@@ -27,6 +37,8 @@ class TaskStatus(Enum):
     EXECUTING = "executing"
     COMPLETED = "completed"
     FAILED = "failed"
+    CANCELLED = "cancelled"
+    TIMED_OUT = "timed_out"
 
 
 class WorkflowStatus(Enum):
@@ -36,6 +48,8 @@ class WorkflowStatus(Enum):
     COMPLETED = "completed"
     FAILED = "failed"
     PARTIALLY_COMPLETED = "partially_completed"
+    CANCELLED = "cancelled"
+    TIMED_OUT = "timed_out"
 
 
 class QualityScore:
@@ -88,14 +102,29 @@ class Orchestrator:
         self.quality_tracker = QualityScore()
         self.agent_registry = AgentRegistry()
         self.data_manager = DataManager()
-        self.task_router = TaskRouter(self.agent_registry, self.data_manager)
+        self.dataset_pool = DatasetPool()
+        self.process_backend = ProcessBackend() if AgentConfig.ORCHESTRATOR_PROCESS_WORKERS > 0 else None
+        self.task_router = TaskRouter(
+            self.agent_registry,
+            self.data_manager,
+            dataset_pool=self.dataset_pool,
+            process_backend=self.process_backend
+        )
+        self.sessions = SessionManager(
+            self.agent_registry,
+            result_cache=self.task_router.result_cache,
+            dataset_pool=self.dataset_pool,
+            process_backend=self.process_backend
+        )
         self.workflow_executor = WorkflowExecutor(self.task_router)
         self.narrative_integrator = NarrativeIntegrator()
+        self.events = EventBus()
         
         # State
         self.current_task: Optional[Dict[str, Any]] = None
         self.current_workflow: Optional[Dict[str, Any]] = None
         self.execution_history: List[Dict[str, Any]] = []
+        self._task_sequence = itertools.count(1)
         
         self.logger.info(f"Orchestrator initialized (v{self.version})")
 
@@ -160,40 +189,77 @@ class Orchestrator:
     # ========== DATA MANAGEMENT ==========
 
     @retry_on_error(max_attempts=2, backoff=1)
-    def cache_data(self, key: str, data: Any) -> Dict[str, Any]:
+    def cache_data(self, key: str, data: Any, session_id: Optional[str] = None) -> Dict[str, Any]:
         """Cache data."""
-        self.data_manager.set(key, data)
+        data_manager = self._data_manager(session_id)
+        data_manager.set(key, data)
         return {
             'success': True,
             'key': key,
             'cached_at': datetime.now(timezone.utc).isoformat(),
-            'cache_size': self.data_manager.get_count()
+            'cache_size': data_manager.get_count()
         }
 
     @retry_on_error(max_attempts=2, backoff=1)
-    def get_cached_data(self, key: str) -> Optional[Any]:
-        """Get cached data."""
-        return self.data_manager.get(key)
+    def get_cached_data(self, key: str, session_id: Optional[str] = None) -> Optional[Any]:
+        """Get cached data (shared datasets are returned as zero-copy views)."""
+        data = self._data_manager(session_id).get(key)
+        if isinstance(data, SharedDataset):
+            return data.view()
+        return data
 
     @retry_on_error(max_attempts=2, backoff=1)
-    def list_cached_data(self) -> Dict[str, Any]:
+    def list_cached_data(self, session_id: Optional[str] = None) -> Dict[str, Any]:
         """List cache."""
+        data_manager = self._data_manager(session_id)
         return {
-            'keys': self.data_manager.list_keys(),
-            'count': self.data_manager.get_count(),
+            'keys': data_manager.list_keys(),
+            'count': data_manager.get_count(),
             'timestamp': datetime.now(timezone.utc).isoformat()
         }
 
     @retry_on_error(max_attempts=2, backoff=1)
     def clear_cache(self) -> Dict[str, Any]:
-        """Clear cache."""
+        """Clear cache (including memoized task results)."""
         self.data_manager.clear()
+        self.task_router.result_cache.clear()
         self.logger.info("Cache cleared")
         return {
             'success': True,
             'cleared_at': datetime.now(timezone.utc).isoformat()
         }
 
+    # ========== SESSIONS ==========
+
+    def create_session(self) -> Dict[str, Any]:
+        """Open a workspace with its own cache; pass its id as session_id."""
+        return self.sessions.create().to_dict()
+
+    def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Session summary, or None if it is not open."""
+        session = self.sessions.get(session_id)
+        return session.to_dict() if session is not None else None
+
+    def close_session(self, session_id: str) -> Dict[str, Any]:
+        """Close a session and free its cache."""
+        return {
+            'success': self.sessions.close(session_id),
+            'session_id': session_id,
+            'closed_at': datetime.now(timezone.utc).isoformat()
+        }
+
+    def _data_manager(self, session_id: Optional[str]) -> DataManager:
+        """Cache of a session (None = the default workspace)."""
+        if session_id is None:
+            return self.data_manager
+        return self.sessions.get_or_create(session_id).data_manager
+
+    def _task_router(self, session_id: Optional[str]) -> TaskRouter:
+        """TaskRouter of a session (None = the default workspace)."""
+        if session_id is None:
+            return self.task_router
+        return self.sessions.get_or_create(session_id).task_router
+
     # ========== TASK EXECUTION ==========
 
     @retry_on_error(max_attempts=3, backoff=2)
@@ -201,11 +267,18 @@ class Orchestrator:
     def execute_task(
         self,
         task_type: str,
-        parameters: Optional[Dict[str, Any]] = None
+        parameters: Optional[Dict[str, Any]] = None,
+        session_id: Optional[str] = None,
+        timeout: Optional[float] = None
     ) -> Dict[str, Any]:
-        """Execute a single task."""
+        """Execute a single task (in a session's workspace if session_id is set).
+        
+        timeout overrides AgentConfig.TASK_TIMEOUT_SECONDS for this task. A
+        task that is cancelled or runs out of time raises TaskCancelledError
+        or TaskTimeoutError carrying its partial results; neither is retried.
+        """
         task_start = datetime.now(timezone.utc)
-        task_id = f"task_{task_start.timestamp()}"
+        task_id = f"task_{task_start.timestamp()}_{next(self._task_sequence)}"
         task = {
             'id': task_id,
             'type': task_type,
@@ -213,13 +286,17 @@ class Orchestrator:
             'status': TaskStatus.CREATED.value,
             'created_at': task_start.isoformat()
         }
+        if session_id is not None:
+            task['session_id'] = session_id
+        if timeout is not None:
+            task['timeout'] = timeout
         
         self.current_task = task
         self.logger.info(f"Task created: {task_id} (type: {task_type})")
         
         try:
             task['status'] = TaskStatus.EXECUTING.value
-            result = self.task_router.route(task)
+            result = self._task_router(session_id).route(task)
             
             task['status'] = TaskStatus.COMPLETED.value
             task['result'] = result
@@ -235,6 +312,15 @@ class Orchestrator:
             
             self.logger.info(f"Task completed: {task_id}")
         
+        except TaskCancelledError as e:
+            timed_out = isinstance(e, TaskTimeoutError)
+            task['status'] = (TaskStatus.TIMED_OUT if timed_out else TaskStatus.CANCELLED).value
+            task['error'] = str(e)
+            task['partial_result'] = e.partial_result
+            self.quality_tracker.add_failure()
+            self.logger.warning(f"Task {task['status']}: {task_id} - {e}")
+            raise
+        
         except Exception as e:
             task['status'] = TaskStatus.FAILED.value
             task['error'] = str(e)
@@ -249,7 +335,7 @@ class Orchestrator:
             )
             
             self.logger.error(f"Task failed: {task_id} - {e}")
-            raise OrchestratorError(f"Task execution failed: {str(e)}")
+            raise OrchestratorError(f"Task execution failed: {str(e)}") from e
         
         finally:
             task_end = datetime.now(timezone.utc)
@@ -264,9 +350,31 @@ class Orchestrator:
     @validate_output('dict')
     def execute_workflow(
         self,
-        workflow_tasks: List[Dict[str, Any]]
+        workflow_tasks: List[Dict[str, Any]],
+        max_workers: Optional[int] = None,
+        on_task_done: Optional[Callable[[Dict[str, Any]], None]] = None,
+        should_stop: Optional[Callable[[], bool]] = None,
+        session_id: Optional[str] = None,
+        on_event: Optional[EventCallback] = None,
+        timeout: Optional[float] = None
     ) -> Dict[str, Any]:
-        """Execute a workflow."""
+        """Execute a workflow; stages run as soon as their dependencies finish.
+        
+        Args:
+            workflow_tasks: Task configs
+            max_workers: Concurrent tasks (default AgentConfig.WORKFLOW_MAX_WORKERS)
+            on_task_done: Called with a progress dict (index, type, status,
+                duration_ms, result, error) as each task finishes
+            should_stop: Polled while running; True cancels tasks not yet
+                started and tells running ones to stop
+            session_id: Session workspace to run in (None = default workspace)
+            on_event: Called with each stage event of this workflow, like
+                the subscribers of self.events (see workers.event_bus)
+            timeout: Seconds the whole workflow may take (default
+                AgentConfig.WORKFLOW_TIMEOUT_SECONDS; 0 = no deadline). Each
+                task also has its own deadline: its 'timeout' key, else
+                AgentConfig.TASK_TIMEOUT_SECONDS
+        """
         workflow_start = datetime.now(timezone.utc)
         workflow_id = f"workflow_{workflow_start.timestamp()}"
         
@@ -279,6 +387,8 @@ class Orchestrator:
             'failed_tasks': 0,
             'results': {}
         }
+        if session_id is not None:
+            workflow['session_id'] = session_id
         
         self.current_workflow = workflow
         self.logger.info(f"Workflow started: {workflow_id} ({len(workflow_tasks)} tasks)")
@@ -286,21 +396,72 @@ class Orchestrator:
         try:
             workflow['status'] = WorkflowStatus.RUNNING.value
             
+            # Independent stages run concurrently, one task per agent at a time
+            dag = WorkflowDAG(
+                workflow_tasks,
+                lock_key=lambda task: self.task_router.TASK_TO_AGENT.get(task.get('type'), task.get('type'))
+            )
+            total = len(workflow_tasks)
+            finished = 0
+            
+            def emit(event, **fields):
+                progress = 100.0 * finished / total if total else 100.0
+                self.events.publish(stage_event(event, workflow_id, progress, **fields), extra=on_event)
+            
+            def started(node):
+                emit(STAGE_STARTED, index=node.index, type=node.task_type)
+            
+            def done(node, record):
+                nonlocal finished
+                finished += 1
+                if on_task_done is not None:
+                    on_task_done({
+                        'index': node.index,
+                        'type': node.task_type,
+                        'status': record.status,
+                        'duration_ms': round(record.duration_ms, 2),
+                        'result': record.result,
+                        'error': record.error
+                    })
+                stage_result = record.result.get('result') if isinstance(record.result, dict) else record.result
+                emit(
+                    {'completed': STAGE_COMPLETED, 'skipped': STAGE_SKIPPED}.get(record.status, STAGE_FAILED),
+                    index=node.index,
+                    type=node.task_type,
+                    status=record.status,
+                    duration_ms=round(record.duration_ms, 2),
+                    summary=summarize_result(stage_result) if record.status == 'completed' else None,
+                    error=record.error
+                )
+            
+            emit(WORKFLOW_STARTED, total_tasks=total, session_id=session_id)
+            records = dag.run(
+                lambda task: self.execute_task(
+                    task.get('type'), task.get('parameters', {}), session_id=session_id, timeout=task.get('timeout')
+                ),
+                max_workers=max_workers or AgentConfig.WORKFLOW_MAX_WORKERS,
+                on_done=done,
+                should_stop=should_stop,
+                on_start=started,
+                timeout=AgentConfig.WORKFLOW_TIMEOUT_SECONDS if timeout is None else timeout
+            )
+            
             for idx, task_config in enumerate(workflow_tasks):
-                task_type = task_config.get('type')
-                params = task_config.get('parameters', {})
-                
-                self.logger.info(f"Task {idx+1}/{len(workflow_tasks)}: {task_type}")
-                
-                try:
-                    task_result = self.execute_task(task_type, params)
-                    workflow['results'][task_result['id']] = task_result
+                record = records[idx]
+                if record.status == 'completed':
+                    workflow['results'][record.result['id']] = record.result
                     workflow['completed_tasks'] += 1
-                except Exception as e:
-                    self.logger.warning(f"Task {idx+1} failed: {task_type}")
+                else:
+                    self.logger.warning(f"Task {idx+1} {record.status}: {task_config.get('type')}")
                     workflow['failed_tasks'] += 1
+            workflow['timing'] = dag.timing()
             
-            if workflow['failed_tasks'] == 0:
+            if dag.cancelled:
+                workflow['status'] = WorkflowStatus.CANCELLED.value
+            elif dag.timed_out:
+                workflow['status'] = WorkflowStatus.TIMED_OUT.value
+                self.quality_tracker.add_failure()
+            elif workflow['failed_tasks'] == 0:
                 workflow['status'] = WorkflowStatus.COMPLETED.value
                 self.quality_tracker.add_success()
             elif workflow['completed_tasks'] > 0:
@@ -310,6 +471,13 @@ class Orchestrator:
                 workflow['status'] = WorkflowStatus.FAILED.value
                 self.quality_tracker.add_failure()
             
+            emit(
+                WORKFLOW_FINISHED,
+                status=workflow['status'],
+                completed_tasks=workflow['completed_tasks'],
+                failed_tasks=workflow['failed_tasks'],
+                wall_ms=workflow['timing']['wall_ms']
+            )
             self.logger.info(f"Workflow completed: {workflow_id}")
             return workflow
         
@@ -347,14 +515,15 @@ class Orchestrator:
     @validate_output('dict')
     def execute_workflow_with_narrative(
         self,
-        workflow_tasks: List[Dict[str, Any]]
+        workflow_tasks: List[Dict[str, Any]],
+        on_event: Optional[EventCallback] = None
     ) -> Dict[str, Any]:
-        """Execute workflow and generate narrative."""
+        """Execute workflow and generate narrative (stage events go to on_event)."""
         pipeline_start = datetime.now(timezone.utc)
         
         try:
             self.logger.info("Full pipeline started")
-            workflow_result = self.execute_workflow(workflow_tasks)
+            workflow_result = self.execute_workflow(workflow_tasks, on_event=on_event)
             
             agent_results = {}
             for task_id, task_result in workflow_result.get('results', {}).items():
@@ -418,8 +587,12 @@ class Orchestrator:
             },
             'cache': {
                 'items': self.data_manager.get_count(),
-                'keys': self.data_manager.list_keys()
+                'keys': self.data_manager.list_keys(),
+                'memory': self.data_manager.get_stats()
             },
+            'result_cache': self.task_router.result_cache.stats(),
+            'sessions': self.sessions.stats(),
+            'process_backend': self.process_backend.stats() if self.process_backend else {'enabled': False},
             'health': self.quality_tracker.get_score() * 100
         }
 
@@ -448,8 +621,10 @@ class Orchestrator:
 
     @retry_on_error(max_attempts=2, backoff=1)
     def reset(self) -> Dict[str, Any]:
-        """Reset orchestrator."""
+        """Reset orchestrator (closes all sessions)."""
         self.data_manager.clear()
+        self.sessions.close_all()
+        self.task_router.result_cache.clear()
         self.execution_history.clear()
         self.current_task = None
         self.current_workflow = None
@@ -464,6 +639,8 @@ class Orchestrator:
         """Shutdown orchestrator."""
         final_health = self.quality_tracker.get_score() * 100
         self.reset()
+        if self.process_backend is not None:
+            self.process_backend.shutdown()
         self.logger.info(f"Orchestrator shutdown (health: {final_health:.1f})")
         return {
             'success': True,
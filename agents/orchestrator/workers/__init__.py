@@ -2,10 +2,13 @@
 
 Workers:
 - TaskRouter: Route tasks to appropriate agents based on task type
-- WorkflowExecutor: Execute multi-task workflows in sequence
+- WorkflowExecutor: Execute multi-task workflows as dependency DAGs
 - DataManager: Manage data caching and inter-agent data flow
 - AgentRegistry: Register and track agent instances
 - NarrativeIntegrator: Bridge orchestrator to narrative generator
+- WorkflowDAG: Dependency-driven parallel task scheduling
+- SessionManager: Per-client workspaces with a shared dataset tier
+- ProcessBackend: Run CPU-bound tasks in warm agent processes
 """
 
 from .task_router import TaskRouter
@@ -13,11 +16,17 @@ from .workflow_executor import WorkflowExecutor
 from .data_manager import DataManager
 from .agent_registry import AgentRegistry
 from .narrative_integrator import NarrativeIntegrator
+from .workflow_dag import WorkflowDAG
+from .session_manager import SessionManager
+from .process_backend import ProcessBackend
 
 __all__ = [
     "TaskRouter",
     "WorkflowExecutor",
     "DataManager",
     "AgentRegistry",
-    "NarrativeIntegrator"
+    "NarrativeIntegrator",
+    "WorkflowDAG",
+    "SessionManager",
+    "ProcessBackend"
 ]
@@ -5,30 +5,91 @@ Responsibilities:
 - Retrieve cached data by key
 - Validate data types
 - Provide data access priority (provided > cached > loaded)
+- Keep the cache within a memory budget
+
+Memory budget:
+- Every entry's size is measured when it is set (deep memory_usage for
+  DataFrames, a recursive estimate for results)
+- When the total exceeds the budget, least-recently-used entries spill to
+  local disk: DataFrames as Parquet, shared datasets as memory-mapped
+  Arrow IPC, other results pickled
+- get() reloads a spilled entry transparently
 """
 
+import hashlib
+import itertools
+import os
+import pickle
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
 from typing import Any, Dict, List, Optional
 import pandas as pd
 from core.logger import get_logger
 from core.structured_logger import get_structured_logger
 from core.exceptions import DataLoadError
+from core.shared_dataset import SharedDataset
+from agents.agent_config import AgentConfig
 from agents.error_intelligence.main import ErrorIntelligence
+from .result_cache import estimate_size
+
+
+@dataclass
+class SpillRecord:
+    """Where an evicted cache entry was written."""
+    path: Path
+    file_format: str  # 'parquet', 'arrow' or 'pickle'
+    type_name: str
+    size_bytes: int
+    label: Optional[str] = None  # SharedDataset name
+
+
+def measure(data: Any) -> int:
+    """In-memory size of a cache entry in bytes."""
+    if isinstance(data, SharedDataset):
+        return int(data.view().memory_usage(index=True, deep=True).sum())
+    return estimate_size(data)
 
 
 class DataManager:
     """Manages data caching and flow between agents.
     
-    Implements a caching layer to share data between agents
-    and provides priority-based data access patterns.
+    Implements a memory-budgeted LRU caching layer to share data between
+    agents and provides priority-based data access patterns.
     """
 
-    def __init__(self) -> None:
-        """Initialize the DataManager."""
+    def __init__(self, max_mb: Optional[float] = None, spill_dir: Optional[str] = None) -> None:
+        """Initialize the DataManager.
+        
+        Args:
+            max_mb: Memory budget for cached entries (default
+                AgentConfig.ORCHESTRATOR_CACHE_MAX_MB; 0 = unlimited)
+            spill_dir: Directory for spilled entries (default
+                AgentConfig.ORCHESTRATOR_SPILL_DIR, else a temp directory)
+        """
         self.name = "DataManager"
         self.logger = get_logger("DataManager")
         self.structured_logger = get_structured_logger("DataManager")
         self.error_intelligence = ErrorIntelligence()
-        self.cache: Dict[str, Any] = {}
+        budget = AgentConfig.ORCHESTRATOR_CACHE_MAX_MB if max_mb is None else max_mb
+        self.max_bytes = int(budget * 1024 * 1024)
+        self._spill_dir_setting = spill_dir or AgentConfig.ORCHESTRATOR_SPILL_DIR
+        self._spill_dir: Optional[Path] = None
+        self._spill_ids = itertools.count(1)
+        self._lock = threading.RLock()
+        self.cache: 'OrderedDict[str, Any]' = OrderedDict()  # In-memory entries, LRU first
+        self.spilled: Dict[str, SpillRecord] = {}
+        self._sizes: Dict[str, int] = {}
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.spills = 0
+        self.reloads = 0
+        self.dropped = 0
         self.logger.info("DataManager initialized")
 
     def set(self, key: str, data: Any) -> None:
@@ -39,12 +100,16 @@ class DataManager:
             data: Data to cache
         """
         try:
-            self.cache[key] = data
+            with self._lock:
+                self._discard(key)
+                self._store(key, data)
+                self._enforce_budget(protect=key)
             self.logger.info(f"Data cached: {key}")
             self.structured_logger.info("Data cached", {
                 'cache_key': key,
                 'data_type': type(data).__name__,
-                'total_cached': len(self.cache)
+                'total_cached': self.get_count(),
+                'size_bytes': self._sizes.get(key, 0)
             })
             
             # Track success
@@ -66,7 +131,7 @@ class DataManager:
             raise DataLoadError(f"Failed to cache data with key '{key}': {e}")
 
     def get(self, key: str) -> Optional[Any]:
-        """Retrieve cached data by key.
+        """Retrieve cached data by key (reloading it if it was spilled).
         
         Args:
             key: Cache key
@@ -74,7 +139,16 @@ class DataManager:
         Returns:
             Cached data or None if not found
         """
-        return self.cache.get(key)
+        with self._lock:
+            if key in self.cache:
+                self.cache.move_to_end(key)
+                self.hits += 1
+                return self.cache[key]
+            if key in self.spilled:
+                self.hits += 1
+                return self._reload(key)
+            self.misses += 1
+            return None
 
     def get_or_default(self, key: str, default: Any = None) -> Any:
         """Retrieve cached data with default fallback.
@@ -86,7 +160,7 @@ class DataManager:
         Returns:
             Cached data or default
         """
-        return self.cache.get(key, default)
+        return self.get(key) if self.exists(key) else default
 
     def get_dataframe(self, key: str) -> Optional[pd.DataFrame]:
         """Retrieve cached DataFrame.
@@ -95,7 +169,7 @@ class DataManager:
             key: Cache key
         
         Returns:
-            DataFrame or None
+            DataFrame (a zero-copy view for a SharedDataset) or None
         
         Raises:
             DataLoadError: If cached data is not a DataFrame
@@ -104,6 +178,9 @@ class DataManager:
         if data is None:
             return None
         
+        if isinstance(data, SharedDataset):
+            return data.view()
+        
         if not isinstance(data, pd.DataFrame):
             raise DataLoadError(f"Cached data at '{key}' is not a DataFrame")
         
@@ -116,9 +193,10 @@ class DataManager:
             key: Cache key
         
         Returns:
-            True if cached, False otherwise
+            True if cached (in memory or spilled), False otherwise
         """
-        return key in self.cache
+        with self._lock:
+            return key in self.cache or key in self.spilled
 
     def delete(self, key: str) -> bool:
         """Delete cached data.
@@ -129,15 +207,20 @@ class DataManager:
         Returns:
             True if deleted, False if not found
         """
-        if key in self.cache:
-            del self.cache[key]
+        with self._lock:
+            found = self._discard(key)
+        if found:
             self.logger.info(f"Cache deleted: {key}")
-            return True
-        return False
+        return found
 
     def clear(self) -> None:
-        """Clear all cached data."""
-        self.cache.clear()
+        """Clear all cached data (including spilled files)."""
+        with self._lock:
+            for key in list(self.cache) + list(self.spilled):
+                self._discard(key)
+            if self._spill_dir is not None and not self._spill_dir_setting:
+                shutil.rmtree(self._spill_dir, ignore_errors=True)
+                self._spill_dir = None
         self.logger.info("Cache cleared")
 
     def list_keys(self) -> List[str]:
@@ -146,7 +229,8 @@ class DataManager:
         Returns:
             List of cache keys
         """
-        return list(self.cache.keys())
+        with self._lock:
+            return list(self.cache.keys()) + list(self.spilled.keys())
 
     def get_count(self) -> int:
         """Get number of cached items.
@@ -154,7 +238,8 @@ class DataManager:
         Returns:
             Number of items in cache
         """
-        return len(self.cache)
+        with self._lock:
+            return len(self.cache) + len(self.spilled)
 
     def get_summary(self) -> Dict[str, Any]:
         """Get cache summary.
@@ -162,14 +247,158 @@ class DataManager:
         Returns:
             Summary dict with cache stats
         """
-        return {
-            'total_items': len(self.cache),
-            'keys': list(self.cache.keys()),
-            'data_types': {
-                key: type(data).__name__ 
-                for key, data in self.cache.items()
+        with self._lock:
+            data_types = {key: type(data).__name__ for key, data in self.cache.items()}
+            data_types.update({key: record.type_name for key, record in self.spilled.items()})
+            return {
+                'total_items': self.get_count(),
+                'keys': self.list_keys(),
+                'data_types': data_types,
+                'shared_datasets': {
+                    key: {'name': data.name, 'shape': list(data.shape), 'views': data.views_created}
+                    for key, data in self.cache.items()
+                    if isinstance(data, SharedDataset)
+                },
+                'spilled': sorted(self.spilled)
+            }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Memory accounting and eviction counters.
+        
+        Returns:
+            Dict with bytes in memory, budget, hits/misses, evictions,
+            spills, reloads and dropped entries
+        """
+        with self._lock:
+            return {
+                'memory_bytes': self.total_bytes,
+                'max_bytes': self.max_bytes,
+                'in_memory': len(self.cache),
+                'spilled': len(self.spilled),
+                'spilled_bytes': sum(record.size_bytes for record in self.spilled.values()),
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'spills': self.spills,
+                'reloads': self.reloads,
+                'dropped': self.dropped,
+                'spill_dir': str(self._spill_dir) if self._spill_dir else None
             }
-        }
+
+    # ========== MEMORY BUDGET ==========
+
+    def _store(self, key: str, data: Any) -> None:
+        """Add an entry as most recently used (caller holds the lock)."""
+        size = measure(data)
+        self.cache[key] = data
+        self.cache.move_to_end(key)
+        self._sizes[key] = size
+        self.total_bytes += size
+
+    def _discard(self, key: str) -> bool:
+        """Remove an entry from memory and disk (caller holds the lock)."""
+        found = False
+        if key in self.cache:
+            data = self.cache.pop(key)
+            if isinstance(data, SharedDataset) and data.is_memory_mapped:
+                self._remove_file(data.path)
+            self.total_bytes -= self._sizes.pop(key, 0)
+            found = True
+        record = self.spilled.pop(key, None)
+        if record is not None:
+            self._remove_file(record.path)
+            found = True
+        return found
+
+    def _enforce_budget(self, protect: Optional[str] = None) -> None:
+        """Spill least-recently-used entries until within budget.
+        
+        The entry just set or reloaded (protect) always stays in memory.
+        """
+        if self.max_bytes <= 0:
+            return
+        while self.total_bytes > self.max_bytes:
+            victim = next((key for key in self.cache if key != protect), None)
+            if victim is None:
+                break
+            self._spill(victim)
+
+    def _spill(self, key: str) -> None:
+        """Move one entry from memory to disk (dropped if it cannot be written)."""
+        data = self.cache.pop(key)
+        size = self._sizes.pop(key, 0)
+        self.total_bytes -= size
+        self.evictions += 1
+        try:
+            self.spilled[key] = self._write(key, data, size)
+            self.spills += 1
+            self.logger.info(f"Cache entry spilled to disk: {key} ({size / 1024 / 1024:.1f}MB)")
+        except Exception as e:
+            self.dropped += 1
+            self.logger.warning(f"Cache entry '{key}' could not be spilled and was dropped: {e}")
+
+    def _write(self, key: str, data: Any, size: int) -> SpillRecord:
+        """Write an evicted entry in the best format for its type."""
+        stem = f"{next(self._spill_ids):06d}_{hashlib.sha1(key.encode('utf-8')).hexdigest()[:12]}"
+        directory = self._spill_directory()
+        type_name = type(data).__name__
+        if isinstance(data, SharedDataset):
+            if data.is_memory_mapped:
+                # Already backed by a file; nothing to write
+                return SpillRecord(Path(data.path), 'arrow', type_name, size, data.name)
+            path = data.to_ipc(directory / f"{stem}.arrow")
+            return SpillRecord(path, 'arrow', type_name, size, data.name)
+        if isinstance(data, pd.DataFrame):
+            path = directory / f"{stem}.parquet"
+            try:
+                data.to_parquet(path)
+                return SpillRecord(path, 'parquet', type_name, size)
+            except Exception as e:
+                # Mixed-type object columns, non-string column names, no pyarrow
+                self._remove_file(path)
+                self.logger.info(f"Parquet spill of '{key}' failed ({e}), pickling instead")
+        path = directory / f"{stem}.pkl"
+        with open(path, 'wb') as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        return SpillRecord(path, 'pickle', type_name, size)
+
+    def _reload(self, key: str) -> Any:
+        """Bring a spilled entry back into memory (caller holds the lock)."""
+        record = self.spilled.pop(key)
+        if record.file_format == 'arrow':
+            # Memory-mapped: the file stays until the entry is discarded
+            data = SharedDataset.open_ipc(record.path, name=record.label or key)
+        elif record.file_format == 'parquet':
+            data = pd.read_parquet(record.path)
+            self._remove_file(record.path)
+        else:
+            with open(record.path, 'rb') as f:
+                data = pickle.load(f)
+            self._remove_file(record.path)
+        self.reloads += 1
+        self._store(key, data)
+        self._enforce_budget(protect=key)
+        self.logger.info(f"Cache entry reloaded from disk: {key}")
+        return data
+
+    def _spill_directory(self) -> Path:
+        """Spill directory, created on first use."""
+        if self._spill_dir is None:
+            if self._spill_dir_setting:
+                self._spill_dir = Path(self._spill_dir_setting)
+                self._spill_dir.mkdir(parents=True, exist_ok=True)
+            else:
+                self._spill_dir = Path(tempfile.mkdtemp(prefix='goat_cache_spill_'))
+        return self._spill_dir
+
+    def _remove_file(self, path: Path) -> None:
+        """Delete a spill file; memory-mapped files still in use are kept."""
+        if self._spill_dir is None or Path(path).parent != self._spill_dir:
+            return
+        try:
+            os.remove(path)
+        except OSError:
+            pass
 
     def get_data_for_task(
         self, 
@@ -235,7 +464,7 @@ class DataManager:
                     result = loader_agent.load(params['file_path'])
                     if result.get('status') == 'success':
                         data = result['data']
-                        self.set('loaded_data', data)
+                        self.set('loaded_data', SharedDataset(data, name=str(params['file_path'])))
                         self.logger.info(f"Loaded and cached data from: {params['file_path']}")
                         self.error_intelligence.track_success(
                             agent_name="orchestrator",
@@ -0,0 +1,110 @@
+"""EventBus Worker - Stage events published while a workflow runs.
+
+Workflows return only once every stage is done. Stage events let clients
+render results as they arrive (exploration while prediction still runs):
+
+- workflow_started: task count
+- stage_started: task index and type
+- stage_completed / stage_failed / stage_skipped: duration, error and a
+  small summary of the result. Events are kept in job progress and sent
+  to every stream subscriber, so full results (DataFrames) are not
+  included; fetch them from the workflow result (GET /api/jobs/{id})
+- workflow_finished: final status and counts
+
+Every event carries the workflow id, a timestamp and 'progress', the
+percentage of stages finished so far. Subscribers are plain callables;
+one that raises is logged and never stops the workflow.
+
+Usage:
+    bus = EventBus()
+    token = bus.subscribe(lambda event: print(event['event'], event['progress']))
+    bus.publish(stage_event('stage_started', workflow_id, progress=0.0, index=0, type='load_data'))
+    bus.unsubscribe(token)
+"""
+
+import itertools
+import threading
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional
+
+import pandas as pd
+
+from core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# ===== CONSTANTS =====
+WORKFLOW_STARTED = 'workflow_started'
+STAGE_STARTED = 'stage_started'
+STAGE_COMPLETED = 'stage_completed'
+STAGE_FAILED = 'stage_failed'
+STAGE_SKIPPED = 'stage_skipped'
+WORKFLOW_FINISHED = 'workflow_finished'
+# Top-level keys listed in a result summary
+SUMMARY_MAX_KEYS = 20
+
+EventCallback = Callable[[Dict[str, Any]], None]
+
+
+def stage_event(event: str, workflow_id: str, progress: float, **fields: Any) -> Dict[str, Any]:
+    """Build an event dict."""
+    return {
+        'event': event,
+        'workflow_id': workflow_id,
+        'progress': round(progress, 1),
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        **fields
+    }
+
+
+def summarize_result(result: Any) -> Dict[str, Any]:
+    """Small, JSON-friendly description of a stage result."""
+    if isinstance(result, dict):
+        summary: Dict[str, Any] = {'keys': [str(key) for key in list(result)[:SUMMARY_MAX_KEYS]]}
+        for key in ('status', 'success', 'quality_score'):
+            if key in result and isinstance(result[key], (str, bool, int, float)):
+                summary[key] = result[key]
+        return summary
+    if isinstance(result, pd.DataFrame):
+        return {'type': 'DataFrame', 'shape': list(result.shape)}
+    if isinstance(result, (list, tuple)):
+        return {'type': type(result).__name__, 'length': len(result)}
+    return {'type': type(result).__name__}
+
+
+class EventBus:
+    """Thread-safe fan-out of events to subscribers."""
+
+    def __init__(self) -> None:
+        self._subscribers: Dict[int, EventCallback] = {}
+        self._tokens = itertools.count(1)
+        self._lock = threading.Lock()
+        self.published = 0
+
+    def subscribe(self, callback: EventCallback) -> int:
+        """Register a callback; returns a token for unsubscribe()."""
+        with self._lock:
+            token = next(self._tokens)
+            self._subscribers[token] = callback
+            return token
+
+    def unsubscribe(self, token: int) -> bool:
+        """Remove a callback; True if it was registered."""
+        with self._lock:
+            return self._subscribers.pop(token, None) is not None
+
+    def publish(self, event: Dict[str, Any], extra: Optional[EventCallback] = None) -> None:
+        """Send an event to every subscriber (and to extra, if given)."""
+        with self._lock:
+            callbacks = list(self._subscribers.values())
+            self.published += 1
+        if extra is not None:
+            callbacks.append(extra)
+        for callback in callbacks:
+            try:
+                callback(event)
+            except Exception as e:
+                logger.warning(f"Event subscriber failed on {event.get('event')}: {e}")
+
+    def __len__(self) -> int:
+        return len(self._subscribers)
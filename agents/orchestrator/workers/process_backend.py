@@ -0,0 +1,275 @@
+"""ProcessBackend Worker - Runs CPU-bound tasks in a pool of agent processes.
+
+Explore, aggregate, detect_anomalies and predict are pandas/scikit-learn
+work that holds the GIL, so in the API process concurrent workflows take
+turns. The backend runs them in worker processes instead:
+- Warm agents: each worker process builds an agent once per agent class
+  and reuses it for every later task of that class
+- Shared-memory datasets: a SharedDataset is written once as an Arrow IPC
+  file in shared memory (/dev/shm when available) and workers memory-map
+  it, so rows are never pickled; only parameters and results are
+- Workers keep their mapped datasets open for later tasks on the same data
+- Any task the backend cannot take (agent class with constructor
+  arguments, broken pool) falls back to running in-process
+- A task whose token is cancelled or expires is stopped by killing the
+  pool's workers (a process cannot reach a checkpoint() in the parent);
+  other tasks that were running in the pool fall back to in-process
+
+Usage:
+    backend = ProcessBackend(max_workers=4)
+    result = backend.run('aggregate', params, agent, shared_dataset)
+"""
+
+import importlib
+import multiprocessing
+import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from core.cancellation import current_token
+from core.logger import get_logger
+from core.shared_dataset import SharedDataset
+from agents.agent_config import AgentConfig
+
+logger = get_logger(__name__)
+
+# ===== CONSTANTS =====
+# Tasks worth the cost of a process hop
+CPU_BOUND_TASKS = ['explore', 'aggregate', 'detect_anomalies', 'predict']
+# Datasets kept exported to shared memory / mapped in each worker
+MAX_SHARED_DATASETS = 8
+# How often a waiting caller checks its cancellation token
+CANCEL_POLL_SECONDS = 0.05
+SHARED_MEMORY_DIR = Path('/dev/shm')
+
+
+class BackendUnavailable(RuntimeError):
+    """The task cannot run in the process pool."""
+
+
+def agent_path(agent: Any) -> str:
+    """Importable 'module:qualname' of an agent's class."""
+    cls = type(agent)
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+class ProcessBackend:
+    """Pool of worker processes running CPU-bound agent tasks.
+
+    Example:
+        >>> backend = ProcessBackend(max_workers=4)
+        >>> if backend.accepts('aggregate', agent):
+        ...     result = backend.run('aggregate', params, agent, shared)
+        >>> backend.shutdown()
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, start_method: Optional[str] = None) -> None:
+        """Initialize the backend (processes start on first use).
+
+        Args:
+            max_workers: Worker processes (default
+                AgentConfig.ORCHESTRATOR_PROCESS_WORKERS; 0 disables)
+            start_method: multiprocessing start method (default
+                AgentConfig.ORCHESTRATOR_PROCESS_START_METHOD)
+        """
+        self.name = "ProcessBackend"
+        self.max_workers = AgentConfig.ORCHESTRATOR_PROCESS_WORKERS if max_workers is None else max_workers
+        self.start_method = start_method or AgentConfig.ORCHESTRATOR_PROCESS_START_METHOD
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._exported: 'OrderedDict[str, Path]' = OrderedDict()  # fingerprint -> IPC file
+        self._export_dir: Optional[Path] = None
+        self._rejected: Dict[str, str] = {}  # agent path -> reason
+        self.tasks_run = 0
+        self.fallbacks = 0
+        self.exports = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_workers > 0
+
+    def accepts(self, task_type: str, agent: Any) -> bool:
+        """Whether a task of this type and agent runs in the pool."""
+        return (
+            self.enabled
+            and task_type in CPU_BOUND_TASKS
+            and agent_path(agent) not in self._rejected
+        )
+
+    def run(self, task_type: str, params: Dict[str, Any], agent: Any, dataset: SharedDataset) -> Any:
+        """Run a task in a worker process.
+
+        Args:
+            task_type: CPU-bound task type
+            params: Task parameters
+            agent: Parent-process agent (only its class is used)
+            dataset: Loaded dataset
+
+        Returns:
+            The task result
+
+        Raises:
+            BackendUnavailable: If the pool cannot run this task; the
+                caller runs it in-process instead
+            TaskCancelledError: If the current token is cancelled or
+                expires first; the pool is recycled to stop the worker
+        """
+        token = current_token()
+        path = self._export(dataset)
+        pool = self._get_pool()
+        future = pool.submit(_run_task, agent_path(agent), task_type, params, str(path), dataset.name)
+        try:
+            while True:
+                try:
+                    result = future.result(timeout=CANCEL_POLL_SECONDS if token is not None else None)
+                    break
+                except TimeoutError:
+                    if token.cancelled:
+                        future.cancel()
+                        self._reset_pool(pool, kill=True)
+                        logger.warning(f"{task_type} stopped in worker process: {token.reason}")
+                        raise token.error(f"Task '{task_type}'")
+        except BrokenProcessPool as e:
+            self._reset_pool(pool)
+            self.fallbacks += 1
+            raise BackendUnavailable(f"Process pool broke: {e}")
+        except _AgentUnavailable as e:
+            self._rejected[agent_path(agent)] = str(e)
+            self.fallbacks += 1
+            logger.warning(f"{agent_path(agent)} runs in-process from now on: {e}")
+            raise BackendUnavailable(str(e))
+        self.tasks_run += 1
+        return result
+
+    def shutdown(self) -> None:
+        """Stop the workers and delete exported datasets."""
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True, cancel_futures=True)
+                self._pool = None
+            if self._export_dir is not None:
+                shutil.rmtree(self._export_dir, ignore_errors=True)
+                self._export_dir = None
+            self._exported.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool size and counters."""
+        return {
+            'enabled': self.enabled,
+            'max_workers': self.max_workers,
+            'running': self._pool is not None,
+            'tasks_run': self.tasks_run,
+            'fallbacks': self.fallbacks,
+            'shared_datasets': len(self._exported),
+            'exports': self.exports,
+            'in_process_agents': dict(self._rejected)
+        }
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                context = multiprocessing.get_context(self.start_method)
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=context)
+                logger.info(f"Process pool started ({self.max_workers} workers, {self.start_method})")
+            return self._pool
+
+    def _reset_pool(self, pool: ProcessPoolExecutor, kill: bool = False) -> None:
+        """Drop pool (unless already replaced); kill=True also stops its running workers."""
+        with self._lock:
+            if self._pool is not pool:
+                return
+            processes = list((pool._processes or {}).values()) if kill else []
+            pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.kill()
+
+    def _export(self, dataset: SharedDataset) -> Path:
+        """IPC file workers can map for a dataset, written once per content."""
+        if dataset.is_memory_mapped:
+            return dataset.path
+        fingerprint = dataset.fingerprint()
+        with self._lock:
+            path = self._exported.get(fingerprint)
+            if path is not None:
+                self._exported.move_to_end(fingerprint)
+                return path
+            if self._export_dir is None:
+                base = SHARED_MEMORY_DIR if SHARED_MEMORY_DIR.is_dir() else None
+                self._export_dir = Path(tempfile.mkdtemp(prefix='goat_shared_', dir=base))
+            path = dataset.to_ipc(self._export_dir / f"{fingerprint[:24]}.arrow")
+            self._exported[fingerprint] = path
+            self.exports += 1
+            while len(self._exported) > MAX_SHARED_DATASETS:
+                # Workers that mapped it keep their mapping after the unlink
+                _, old = self._exported.popitem(last=False)
+                try:
+                    os.remove(old)
+                except OSError:
+                    pass
+            return path
+
+
+# ========== WORKER PROCESS SIDE ==========
+
+class _AgentUnavailable(RuntimeError):
+    """The agent class cannot be built in a worker process."""
+
+
+_worker_router = None
+_worker_agents: Dict[str, Any] = {}
+_worker_datasets: 'OrderedDict[str, SharedDataset]' = OrderedDict()
+
+
+def _run_task(path: str, task_type: str, params: Dict[str, Any], dataset_path: str, dataset_name: str) -> Any:
+    """Entry point in the worker: route one task with a warm agent."""
+    global _worker_router
+    if _worker_router is None:
+        from .agent_registry import AgentRegistry
+        from .data_manager import DataManager
+        from .result_cache import ResultCache
+        from .task_router import TaskRouter
+        _worker_router = TaskRouter(AgentRegistry(), DataManager(max_mb=0), result_cache=ResultCache(max_entries=0))
+
+    agent = _worker_agent(path)
+    _worker_router.data_manager.set('loaded_data', _worker_dataset(dataset_path, dataset_name))
+    return getattr(_worker_router, f"_route_{task_type}")(agent, params)
+
+
+def _worker_agent(path: str) -> Any:
+    """Agent instance of a class, built once per worker process."""
+    agent = _worker_agents.get(path)
+    if agent is None:
+        module_name, _, qualname = path.partition(':')
+        try:
+            target: Any = importlib.import_module(module_name)
+            for part in qualname.split('.'):
+                target = getattr(target, part)
+            agent = target()
+        except Exception as e:
+            raise _AgentUnavailable(f"Cannot build {path} in a worker process: {e}")
+        _worker_agents[path] = agent
+    return agent
+
+
+def _worker_dataset(dataset_path: str, name: str) -> SharedDataset:
+    """Memory-mapped dataset, kept open for later tasks on the same data."""
+    dataset = _worker_datasets.get(dataset_path)
+    if dataset is None:
+        dataset = SharedDataset.open_ipc(dataset_path, name=name)
+        _worker_datasets[dataset_path] = dataset
+        while len(_worker_datasets) > MAX_SHARED_DATASETS:
+            _worker_datasets.popitem(last=False)
+    else:
+        _worker_datasets.move_to_end(dataset_path)
+    return dataset
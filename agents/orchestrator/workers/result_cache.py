@@ -0,0 +1,187 @@
+"""ResultCache Worker - Memoizes task results per dataset and parameters.
+
+Dashboards repeat the same requests against the same loaded data. A task
+result is fully determined by:
+- The dataset fingerprint (content hash of the SharedDataset)
+- The task type
+- The canonicalized parameters (sorted keys, None values dropped)
+- The agent class and version (a new agent release never serves old results)
+
+Entries are evicted least-recently-used, after a TTL, and when the
+estimated size of all results exceeds the memory budget. Cached results
+are returned by reference: treat them as read-only.
+"""
+
+import hashlib
+import json
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# ===== CONSTANTS =====
+# Nesting depth walked when estimating result sizes
+SIZE_ESTIMATE_DEPTH = 6
+
+
+def canonical_params(params: Optional[Dict[str, Any]]) -> str:
+    """Stable text form of task parameters (order and None values ignored)."""
+    relevant = {key: value for key, value in (params or {}).items() if value is not None}
+    return json.dumps(relevant, sort_keys=True, default=str)
+
+
+def agent_version(agent: Any) -> str:
+    """Identity of the code that produced a result."""
+    cls = type(agent)
+    return f"{cls.__module__}.{cls.__qualname__}:{getattr(agent, 'version', '')}"
+
+
+def estimate_size(obj: Any, depth: int = SIZE_ESTIMATE_DEPTH) -> int:
+    """Approximate memory footprint of a task result in bytes."""
+    if isinstance(obj, pd.DataFrame):
+        return int(obj.memory_usage(index=True, deep=True).sum())
+    if isinstance(obj, (pd.Series, pd.Index)):
+        return int(obj.memory_usage(deep=True))
+    if isinstance(obj, np.ndarray):
+        return int(obj.nbytes)
+    size = sys.getsizeof(obj)
+    if depth <= 0:
+        return size
+    if isinstance(obj, dict):
+        size += sum(estimate_size(k, depth - 1) + estimate_size(v, depth - 1) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(estimate_size(item, depth - 1) for item in obj)
+    return size
+
+
+@dataclass
+class CacheEntry:
+    """One memoized result."""
+    result: Any
+    size_bytes: int
+    created_at: float
+    hits: int = 0
+
+
+class ResultCache:
+    """Thread-safe LRU + TTL cache of task results under a memory budget.
+
+    Example:
+        >>> cache = ResultCache(max_entries=256, ttl_seconds=600, max_mb=256)
+        >>> key = cache.make_key(shared.fingerprint(), 'explore', params, agent)
+        >>> result = cache.get(key)
+        >>> if result is None:
+        ...     result = agent.get_summary_report()
+        ...     cache.put(key, result)
+    """
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = 600, max_mb: float = 256) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum results kept (0 disables the cache)
+            ttl_seconds: Age after which a result is recomputed (0 = no expiry)
+            max_mb: Budget for the estimated size of all results
+        """
+        self.name = "ResultCache"
+        self.max_entries = max(0, int(max_entries))
+        self.ttl_seconds = float(ttl_seconds)
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self._entries: 'OrderedDict[str, CacheEntry]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expired = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.max_bytes > 0
+
+    @staticmethod
+    def make_key(fingerprint: str, task_type: str, params: Optional[Dict[str, Any]], agent: Any) -> str:
+        """Memoization key of a task run."""
+        raw = '\x1f'.join([fingerprint, task_type, canonical_params(params), agent_version(agent)])
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Cached result, or None on a miss or an expired entry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if self.ttl_seconds > 0 and time.monotonic() - entry.created_at > self.ttl_seconds:
+                self._remove(key)
+                self.expired += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            entry.hits += 1
+            self.hits += 1
+            return entry.result
+
+    def put(self, key: str, result: Any) -> bool:
+        """Store a result, evicting least-recently-used entries as needed.
+
+        Returns:
+            True if stored (False when disabled or larger than the budget)
+        """
+        if not self.enabled:
+            return False
+        size = estimate_size(result)
+        if size > self.max_bytes:
+            logger.info(f"Result of {size / 1024 / 1024:.1f}MB exceeds the result cache budget, not cached")
+            return False
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = CacheEntry(result=result, size_bytes=size, created_at=time.monotonic())
+            self.total_bytes += size
+            while len(self._entries) > self.max_entries or self.total_bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+        return True
+
+    def clear(self) -> None:
+        """Drop every entry (statistics are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+
+    def _remove(self, key: str) -> None:
+        """Remove one entry (caller holds the lock)."""
+        entry = self._entries.pop(key)
+        self.total_bytes -= entry.size_bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit rate, size and eviction counters."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'enabled': self.enabled,
+                'entries': len(self._entries),
+                'size_mb': round(self.total_bytes / 1024 / 1024, 3),
+                'max_entries': self.max_entries,
+                'max_mb': round(self.max_bytes / 1024 / 1024, 3),
+                'ttl_seconds': self.ttl_seconds,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+                'evictions': self.evictions,
+                'expired': self.expired,
+            }
@@ -0,0 +1,277 @@
+"""SessionManager Worker - Per-client workspaces on one orchestrator.
+
+The API serves many clients from one Orchestrator. Without sessions every
+client reads and writes the same DataManager keys ('loaded_data',
+'explore', ...), so concurrent users overwrite each other's data.
+
+- Session: its own DataManager (cached datasets and stage results, with
+  its own memory quota and spill directory) and its own TaskRouter
+- DatasetPool: shared read-only tier. A loaded dataset is interned by
+  content fingerprint, so sessions loading the same file hold one
+  SharedDataset. The pool keeps weak references: a dataset is freed once
+  no session caches it any more
+- Memoized task results (ResultCache) are shared across sessions; they are
+  keyed by dataset fingerprint, so one session never sees another
+  session's data
+- Idle sessions expire after a TTL; the number of sessions is bounded
+
+Agents are shared: sessions only separate data, not agent instances.
+
+Usage:
+    sessions = SessionManager(agent_registry, result_cache=router.result_cache)
+    session = sessions.get_or_create('3f2a...')
+    session.task_router.route({'type': 'load_data', 'parameters': {...}})
+"""
+
+import re
+import threading
+import time
+import uuid
+import weakref
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from core.logger import get_logger
+from core.exceptions import OrchestratorError
+from core.shared_dataset import SharedDataset
+from agents.agent_config import AgentConfig
+from .data_manager import DataManager
+from .result_cache import ResultCache
+from .task_router import TaskRouter
+
+logger = get_logger(__name__)
+
+# ===== CONSTANTS =====
+# Session ids become spill directory names
+SESSION_ID_PATTERN = re.compile(r'^[A-Za-z0-9_-]{1,64}$')
+
+
+class SessionLimitError(OrchestratorError):
+    """No room for another session."""
+
+
+class DatasetPool:
+    """Deduplicates identical shared datasets across sessions.
+
+    Example:
+        >>> pool = DatasetPool()
+        >>> a = pool.intern(SharedDataset(df, name='sales.csv'))
+        >>> b = pool.intern(SharedDataset(df.copy(), name='sales.csv'))
+        >>> a is b
+        True
+    """
+
+    def __init__(self) -> None:
+        self._datasets: 'weakref.WeakValueDictionary[str, SharedDataset]' = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+
+    def intern(self, dataset: SharedDataset) -> SharedDataset:
+        """Return the pooled dataset with the same content, adding it if new.
+
+        Args:
+            dataset: Freshly loaded dataset
+
+        Returns:
+            The existing pooled instance, or dataset itself
+        """
+        fingerprint = dataset.fingerprint()
+        with self._lock:
+            pooled = self._datasets.get(fingerprint)
+            if pooled is not None:
+                self.hits += 1
+                self.bytes_saved += dataset.nbytes()
+                logger.info(f"Dataset '{dataset.name}' already loaded, sharing pooled copy")
+                return pooled
+            self._datasets[fingerprint] = dataset
+            self.misses += 1
+            return dataset
+
+    def stats(self) -> Dict[str, Any]:
+        """Pooled datasets and deduplication counters."""
+        with self._lock:
+            datasets = list(self._datasets.values())
+            return {
+                'datasets': len(datasets),
+                'bytes': sum(dataset.nbytes() for dataset in datasets),
+                'hits': self.hits,
+                'misses': self.misses,
+                'bytes_saved': self.bytes_saved
+            }
+
+
+@dataclass
+class Session:
+    """One client's workspace."""
+    id: str
+    data_manager: DataManager
+    task_router: TaskRouter
+    created_at: float = field(default_factory=time.time)
+    last_used: float = field(default_factory=time.time)
+
+    def touch(self) -> None:
+        self.last_used = time.time()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Session summary for status and API responses."""
+        return {
+            'session_id': self.id,
+            'created_at': self.created_at,
+            'idle_seconds': round(time.time() - self.last_used, 3),
+            'keys': self.data_manager.list_keys(),
+            'memory': self.data_manager.get_stats()
+        }
+
+
+class SessionManager:
+    """Creates, looks up and expires session workspaces."""
+
+    def __init__(
+        self,
+        agent_registry: Any,
+        result_cache: Optional[ResultCache] = None,
+        dataset_pool: Optional[DatasetPool] = None,
+        process_backend: Optional[Any] = None,
+        max_sessions: Optional[int] = None,
+        idle_ttl_seconds: Optional[float] = None,
+        session_max_mb: Optional[float] = None
+    ) -> None:
+        """Initialize the SessionManager.
+
+        Args:
+            agent_registry: AgentRegistry shared by all sessions
+            result_cache: Memoized results shared by all sessions
+            dataset_pool: Shared read-only dataset tier
+            process_backend: ProcessBackend shared by all sessions
+            max_sessions: Open sessions allowed (default
+                AgentConfig.SESSION_MAX_COUNT; 0 = unlimited)
+            idle_ttl_seconds: Idle time before a session expires (default
+                AgentConfig.SESSION_IDLE_TTL_SECONDS; 0 = never)
+            session_max_mb: Memory quota of each session's cache (default
+                AgentConfig.SESSION_CACHE_MAX_MB; 0 = unlimited)
+        """
+        self.name = "SessionManager"
+        self.agent_registry = agent_registry
+        self.result_cache = result_cache
+        self.dataset_pool = dataset_pool if dataset_pool is not None else DatasetPool()
+        self.process_backend = process_backend
+        self.max_sessions = AgentConfig.SESSION_MAX_COUNT if max_sessions is None else max_sessions
+        self.idle_ttl_seconds = AgentConfig.SESSION_IDLE_TTL_SECONDS if idle_ttl_seconds is None else idle_ttl_seconds
+        self.session_max_mb = AgentConfig.SESSION_CACHE_MAX_MB if session_max_mb is None else session_max_mb
+        self._sessions: Dict[str, Session] = {}
+        self._lock = threading.Lock()
+        self.expired = 0
+        logger.info("SessionManager initialized")
+
+    def create(self) -> Session:
+        """Open a session with a new random id."""
+        return self.get_or_create(uuid.uuid4().hex)
+
+    def get_or_create(self, session_id: str) -> Session:
+        """Session for an id, opening it on first use.
+
+        Args:
+            session_id: Client-chosen id (letters, digits, '-' and '_')
+
+        Returns:
+            The session
+
+        Raises:
+            OrchestratorError: If the id is malformed
+            SessionLimitError: If max_sessions are open and none is idle
+        """
+        if not SESSION_ID_PATTERN.match(session_id or ''):
+            raise OrchestratorError(f"Invalid session id: {session_id!r}")
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is None:
+                self._expire_idle()
+                if self.max_sessions > 0 and len(self._sessions) >= self.max_sessions:
+                    raise SessionLimitError(f"Session limit reached ({self.max_sessions} open)")
+                session = self._open(session_id)
+                self._sessions[session_id] = session
+            session.touch()
+            return session
+
+    def get(self, session_id: str) -> Optional[Session]:
+        """Existing session or None."""
+        with self._lock:
+            session = self._sessions.get(session_id)
+        if session is not None:
+            session.touch()
+        return session
+
+    def close(self, session_id: str) -> bool:
+        """Close a session and free its cache.
+
+        Returns:
+            True if the session existed
+        """
+        with self._lock:
+            session = self._sessions.pop(session_id, None)
+        if session is None:
+            return False
+        session.data_manager.clear()
+        logger.info(f"Session closed: {session_id}")
+        return True
+
+    def close_all(self) -> None:
+        """Close every session."""
+        for session_id in self.list_ids():
+            self.close(session_id)
+
+    def expire_idle(self) -> int:
+        """Close sessions idle for longer than the TTL.
+
+        Returns:
+            Number of sessions closed
+        """
+        with self._lock:
+            return self._expire_idle()
+
+    def list_ids(self) -> List[str]:
+        with self._lock:
+            return list(self._sessions)
+
+    def stats(self) -> Dict[str, Any]:
+        """Open sessions, their memory use and the shared tier."""
+        with self._lock:
+            sessions = list(self._sessions.values())
+        return {
+            'open': len(sessions),
+            'max_sessions': self.max_sessions,
+            'expired': self.expired,
+            'memory_bytes': sum(session.data_manager.total_bytes for session in sessions),
+            'shared_datasets': self.dataset_pool.stats()
+        }
+
+    def _open(self, session_id: str) -> Session:
+        """Build a session's DataManager and TaskRouter (caller holds the lock)."""
+        spill_dir = None
+        if AgentConfig.ORCHESTRATOR_SPILL_DIR:
+            spill_dir = str(Path(AgentConfig.ORCHESTRATOR_SPILL_DIR) / 'sessions' / session_id)
+        data_manager = DataManager(max_mb=self.session_max_mb, spill_dir=spill_dir)
+        task_router = TaskRouter(
+            self.agent_registry,
+            data_manager,
+            result_cache=self.result_cache,
+            dataset_pool=self.dataset_pool,
+            process_backend=self.process_backend
+        )
+        logger.info(f"Session opened: {session_id}")
+        return Session(session_id, data_manager, task_router)
+
+    def _expire_idle(self) -> int:
+        """Close idle sessions (caller holds the lock)."""
+        if self.idle_ttl_seconds <= 0:
+            return 0
+        cutoff = time.time() - self.idle_ttl_seconds
+        stale = [sid for sid, session in self._sessions.items() if session.last_used < cutoff]
+        for session_id in stale:
+            self._sessions.pop(session_id).data_manager.clear()
+            self.expired += 1
+            logger.info(f"Session expired: {session_id}")
+        return len(stale)
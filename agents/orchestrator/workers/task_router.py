@@ -6,20 +6,53 @@ Responsibilities:
 - Ensure data flows in correct sequence
 - Handle task-specific parameters
 - Execute agent methods based on task configuration
+- Enforce per-task deadlines with cooperative cancellation
 """
 
-from typing import Any, Dict, List, Optional
+import contextvars
+import threading
+import weakref
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from core.logger import get_logger
 from core.structured_logger import get_structured_logger
-from core.exceptions import OrchestratorError
+from core.exceptions import InvalidTaskError, OrchestratorError, TaskCancelledError
+from core.cancellation import CancellationToken, checkpoint, current_token, use_token
 from core.error_recovery import retry_on_error
+from core.shared_dataset import SharedDataset
+from agents.agent_config import AgentConfig
+from .result_cache import ResultCache
+from .process_backend import BackendUnavailable
+from .workflow_dag import validate_dependency_order, stage_dependencies
 from agents.error_intelligence.main import ErrorIntelligence
 
+# ===== CONSTANTS =====
+# How often a waiting route() checks its task's cancellation token
+CANCEL_POLL_SECONDS = 0.05
+
+# One lock per agent instance, shared by every router (and so every session)
+_agent_locks: 'weakref.WeakKeyDictionary[Any, threading.RLock]' = weakref.WeakKeyDictionary()
+_agent_locks_guard = threading.Lock()
+
+
+def agent_lock(agent: Any) -> threading.RLock:
+    """Lock serializing in-process tasks on a (stateful) agent instance.
+    
+    Routes load data into the agent with set_data() and then call it, so
+    two sessions sharing the agent must not interleave those steps.
+    """
+    with _agent_locks_guard:
+        lock = _agent_locks.get(agent)
+        if lock is None:
+            lock = threading.RLock()
+            _agent_locks[agent] = lock
+        return lock
+
 
 class TaskRouter:
     """Routes tasks to appropriate agents based on task type.
     
-    CORRECT PIPELINE ORDER (MUST FOLLOW):
+    Canonical pipeline order (stages only need to follow the stages they
+    depend on, see workflow_dag):
     1. load_data
     2. explore
     3. aggregate  
@@ -31,7 +64,7 @@ class TaskRouter:
     9. report
     """
     
-    # CORRECT PIPELINE ORDER - DO NOT CHANGE
+    # Canonical pipeline order - DO NOT CHANGE
     PIPELINE_ORDER = [
         'load_data',
         'explore',
@@ -56,13 +89,37 @@ class TaskRouter:
         'visualize': 'visualizer',
         'report': 'reporter'
     }
+    
+    # Tasks whose result only depends on loaded_data and their parameters
+    MEMOIZABLE_TASKS = [
+        'explore',
+        'aggregate',
+        'detect_anomalies',
+        'predict',
+        'recommend',
+        'visualize',
+        'report'
+    ]
 
-    def __init__(self, agent_registry: Any, data_manager: Any) -> None:
+    def __init__(
+        self,
+        agent_registry: Any,
+        data_manager: Any,
+        result_cache: Optional[ResultCache] = None,
+        dataset_pool: Optional[Any] = None,
+        process_backend: Optional[Any] = None
+    ) -> None:
         """Initialize the TaskRouter.
         
         Args:
             agent_registry: AgentRegistry instance
             data_manager: DataManager instance
+            result_cache: Memoized task results (default sized from
+                AgentConfig.ORCHESTRATOR_RESULT_CACHE_*)
+            dataset_pool: DatasetPool deduplicating loaded datasets across
+                sessions (None keeps every load separate)
+            process_backend: ProcessBackend for CPU-bound tasks (None runs
+                everything in-process)
         """
         self.name = "TaskRouter"
         self.logger = get_logger("TaskRouter")
@@ -70,12 +127,22 @@ class TaskRouter:
         self.error_intelligence = ErrorIntelligence()
         self.agent_registry = agent_registry
         self.data_manager = data_manager
+        self.result_cache = result_cache if result_cache is not None else ResultCache(
+            max_entries=AgentConfig.ORCHESTRATOR_RESULT_CACHE_ENTRIES,
+            ttl_seconds=AgentConfig.ORCHESTRATOR_RESULT_CACHE_TTL_SECONDS,
+            max_mb=AgentConfig.ORCHESTRATOR_RESULT_CACHE_MAX_MB
+        )
+        self.dataset_pool = dataset_pool
+        self.process_backend = process_backend
         self.logger.info("TaskRouter initialized with pipeline order:")
         for idx, task in enumerate(self.PIPELINE_ORDER, 1):
             self.logger.info(f"  {idx}. {task}")
 
     def validate_pipeline_order(self, tasks: List[Dict[str, Any]]) -> bool:
-        """Validate that tasks follow correct pipeline order.
+        """Validate that no task is listed before a stage it depends on.
+        
+        Independent stages (e.g. aggregate and explore) may appear in any
+        order; see workflow_dag.STAGE_REQUIRES / STAGE_AFTER.
         
         Args:
             tasks: List of tasks
@@ -91,24 +158,13 @@ class TaskRouter:
         # Check all types are valid
         for task_type in task_types:
             if task_type not in self.TASK_TO_AGENT:
-                raise OrchestratorError(
+                raise InvalidTaskError(
                     f"Invalid task type: {task_type}. "
                     f"Valid types: {list(self.TASK_TO_AGENT.keys())}"
                 )
         
-        # Check order
-        try:
-            indices = [self.PIPELINE_ORDER.index(t) for t in task_types]
-        except ValueError as e:
-            raise OrchestratorError(f"Invalid task in pipeline: {e}")
-        
-        # Verify tasks are in ascending order
-        if indices != sorted(indices):
-            raise OrchestratorError(
-                f"\n\nERROR: Tasks out of order!\n"
-                f"Expected order: {self.PIPELINE_ORDER}\n"
-                f"Got: {task_types}\n\n"
-            )
+        # Check order: each task must come after the stages it depends on
+        validate_dependency_order(tasks)
         
         return True
 
@@ -127,10 +183,10 @@ class TaskRouter:
         task_type = task.get('type')
         
         if not task_type:
-            raise OrchestratorError("Task must have 'type' field")
+            raise InvalidTaskError("Task must have 'type' field")
         
         if task_type not in self.TASK_TO_AGENT:
-            raise OrchestratorError(
+            raise InvalidTaskError(
                 f"Unknown task type: '{task_type}'. "
                 f"Valid types: {list(self.TASK_TO_AGENT.keys())}"
             )
@@ -141,6 +197,12 @@ class TaskRouter:
     def route(self, task: Dict[str, Any]) -> Any:
         """Route a task to the appropriate agent.
         
+        The task runs under a CancellationToken whose deadline is the task's
+        'timeout' (seconds, default AgentConfig.TASK_TIMEOUT_SECONDS) and
+        never later than the enclosing workflow's. Once it is cancelled or
+        expires, route() stops waiting straight away; the agent stops at
+        its next checkpoint().
+        
         Args:
             task: Task dict with type and parameters
         
@@ -148,6 +210,8 @@ class TaskRouter:
             Task result from agent
         
         Raises:
+            TaskTimeoutError: If the deadline passed (with partial results)
+            TaskCancelledError: If the task was cancelled
             OrchestratorError: If routing fails
         """
         task_type = task.get('type')
@@ -168,31 +232,22 @@ class TaskRouter:
             agent = self.agent_registry.get(agent_name)
             
             if not agent:
-                raise OrchestratorError(
+                raise InvalidTaskError(
                     f"Agent not registered: {agent_name} (for task: {task_type})"
                 )
             
-            # Route based on task type
-            if task_type == 'load_data':
-                result = self._route_load_data(agent, params)
-            elif task_type == 'explore':
-                result = self._route_explore(agent, params)
-            elif task_type == 'aggregate':
-                result = self._route_aggregate(agent, params)
-            elif task_type == 'detect_anomalies':
-                result = self._route_detect_anomalies(agent, params)
-            elif task_type == 'predict':
-                result = self._route_predict(agent, params)
-            elif task_type == 'recommend':
-                result = self._route_recommend(agent, params)
-            elif task_type == 'narrative':
-                result = self._route_narrative(agent, params)
-            elif task_type == 'visualize':
-                result = self._route_visualize(agent, params)
-            elif task_type == 'report':
-                result = self._route_report(agent, params)
-            else:
-                raise OrchestratorError(f"Unknown task type: {task_type}")
+            # Same task, parameters and agent on the same data: reuse the result
+            memo_key = self._memo_key(task, agent)
+            if memo_key is not None:
+                cached = self.result_cache.get(memo_key)
+                if cached is not None:
+                    self.data_manager.set(task_type, cached)
+                    self.logger.info(f"Task served from result cache: {task_type}")
+                    return cached
+            
+            token = CancellationToken(timeout=self._task_timeout(task), parent=current_token())
+            token.check(task_type)
+            result = self._run_with_deadline(task_type, token, lambda: self._execute(task_type, agent, params))
             
             # Track success
             self.error_intelligence.track_success(
@@ -204,10 +259,23 @@ class TaskRouter:
             
             # Cache result
             self.data_manager.set(task_type, result)
+            if memo_key is not None and self._is_cacheable(result):
+                self.result_cache.put(memo_key, result)
             
             self.logger.info(f"Task completed and cached: {task_type}")
             return result
         
+        except TaskCancelledError as e:
+            self.logger.warning(f"Task stopped: {e}")
+            self.error_intelligence.track_error(
+                agent_name="orchestrator",
+                worker_name="TaskRouter",
+                error_type=type(e).__name__,
+                error_message=str(e),
+                context={"task_type": task_type}
+            )
+            raise
+        
         except Exception as e:
             self.logger.error(f"Task routing failed: {e}")
             self.error_intelligence.track_error(
@@ -217,23 +285,153 @@ class TaskRouter:
                 error_message=str(e),
                 context={"task_type": task_type}
             )
-            raise OrchestratorError(f"Failed to route task '{task_type}': {e}")
+            raise OrchestratorError(f"Failed to route task '{task_type}': {e}") from e
+
+    def _execute(self, task_type: str, agent: Any, params: Dict[str, Any]) -> Any:
+        """Run a task, CPU-bound stages in the process pool when one is configured.
+        
+        In-process tasks hold the agent's lock from set_data() until the
+        agent returns, since agents are shared across sessions. A task that
+        timed out keeps the lock until its abandoned thread returns, so the
+        agent is never handed to another task while still in use.
+        """
+        offloaded, result = self._run_in_backend(task_type, agent, params)
+        if not offloaded:
+            with agent_lock(agent):
+                checkpoint()  # The task may have expired while waiting for the agent
+                result = self._dispatch(task_type, agent, params)
+        return result
+
+    @staticmethod
+    def _task_timeout(task: Dict[str, Any]) -> Optional[float]:
+        """Stage deadline in seconds (None = no deadline of its own)."""
+        timeout = task.get('timeout')
+        if timeout is None:
+            timeout = AgentConfig.TASK_TIMEOUT_SECONDS
+        return float(timeout) if timeout and float(timeout) > 0 else None
+
+    def _run_with_deadline(self, task_type: str, token: CancellationToken, func: Callable[[], Any]) -> Any:
+        """Run func with token as the current token, giving up when it is cancelled.
+        
+        Without a deadline or a parent token nothing can cancel the task,
+        so it runs on the calling thread. Otherwise it runs on its own
+        daemon thread; a cancelled task is abandoned there (it stops at its
+        next checkpoint) and the caller gets its thread back immediately.
+        The thread inherits the caller's context, so retry layers inside
+        the agent share the caller's retry budget.
+        """
+        if token.deadline is None and token.parent is None:
+            with use_token(token):
+                return func()
+        
+        outcome: Dict[str, Any] = {}
+        finished = threading.Event()
+        
+        def target() -> None:
+            try:
+                with use_token(token):
+                    outcome['result'] = func()
+            except BaseException as e:
+                outcome['error'] = e
+            finally:
+                finished.set()
+        
+        context = contextvars.copy_context()
+        threading.Thread(target=context.run, args=(target,), name=f"task-{task_type}", daemon=True).start()
+        while not finished.wait(CANCEL_POLL_SECONDS):
+            if token.cancelled:
+                error = token.error(f"Task '{task_type}'")
+                token.cancel(str(error))  # Reaches the agent's next checkpoint()
+                raise error
+        if 'error' in outcome:
+            raise outcome['error']
+        return outcome['result']
+
+    def _dispatch(self, task_type: str, agent: Any, params: Dict[str, Any]) -> Any:
+        """Run a task in this process, based on its type."""
+        if task_type == 'load_data':
+            return self._route_load_data(agent, params)
+        elif task_type == 'explore':
+            return self._route_explore(agent, params)
+        elif task_type == 'aggregate':
+            return self._route_aggregate(agent, params)
+        elif task_type == 'detect_anomalies':
+            return self._route_detect_anomalies(agent, params)
+        elif task_type == 'predict':
+            return self._route_predict(agent, params)
+        elif task_type == 'recommend':
+            return self._route_recommend(agent, params)
+        elif task_type == 'narrative':
+            return self._route_narrative(agent, params)
+        elif task_type == 'visualize':
+            return self._route_visualize(agent, params)
+        elif task_type == 'report':
+            return self._route_report(agent, params)
+        else:
+            raise InvalidTaskError(f"Unknown task type: {task_type}")
+
+    def _run_in_backend(self, task_type: str, agent: Any, params: Dict[str, Any]) -> Tuple[bool, Any]:
+        """Run a CPU-bound task in the process pool if possible.
+        
+        Returns:
+            (True, result) if it ran there, (False, None) if the caller
+            should run it in-process
+        """
+        backend = self.process_backend
+        if backend is None or not backend.accepts(task_type, agent):
+            return False, None
+        data = self.data_manager.get('loaded_data')
+        if not isinstance(data, SharedDataset):
+            return False, None
+        try:
+            return True, backend.run(task_type, params, agent, data)
+        except BackendUnavailable as e:
+            self.logger.warning(f"Running {task_type} in-process: {e}")
+            return False, None
+
+    def _memo_key(self, task: Dict[str, Any], agent: Any) -> Optional[str]:
+        """Result cache key of a task, or None if it must run.
+        
+        Only tasks reading the shared loaded dataset are memoized; a task
+        may opt out with 'use_cache': False.
+        """
+        if not self.result_cache.enabled or task.get('use_cache', True) is False:
+            return None
+        if task.get('type') not in self.MEMOIZABLE_TASKS:
+            return None
+        data = self.data_manager.get('loaded_data')
+        if not isinstance(data, SharedDataset):
+            return None
+        return self.result_cache.make_key(
+            data.fingerprint(), task['type'], task.get('parameters', {}), agent
+        )
+
+    @staticmethod
+    def _is_cacheable(result: Any) -> bool:
+        """Error results are never memoized."""
+        if isinstance(result, dict):
+            return result.get('status') != 'error' and result.get('success', True) is not False
+        return result is not None
 
     def _route_load_data(self, agent: Any, params: Dict[str, Any]) -> Any:
         """Route load_data task to DataLoaderAgent."""
         file_path = params.get('file_path')
         if not file_path:
-            raise OrchestratorError("Missing 'file_path' parameter for load_data")
+            raise InvalidTaskError("Missing 'file_path' parameter for load_data")
         result = agent.load(file_path)
         if result.get('status') == 'success':
-            self.data_manager.set('loaded_data', result['data'])
+            # Loaded once; every later stage gets a zero-copy view
+            shared = SharedDataset(result['data'], name=str(file_path))
+            if self.dataset_pool is not None:
+                shared = self.dataset_pool.intern(shared)
+            self.data_manager.set('loaded_data', shared)
         return result
 
     def _route_explore(self, agent: Any, params: Dict[str, Any]) -> Any:
         """Route explore task to ExplorerAgent."""
         data = self.data_manager.get('loaded_data')
         if data is None:
-            raise OrchestratorError(
+            raise InvalidTaskError(
                 "No loaded data for explore. Run 'load_data' first."
             )
         agent.set_data(data)
@@ -243,13 +441,13 @@ class TaskRouter:
         """Route aggregate task to AggregatorAgent."""
         data = self.data_manager.get('loaded_data')
         if data is None:
-            raise OrchestratorError(
+            raise InvalidTaskError(
                 "No loaded data for aggregate. Run 'load_data' first."
             )
         agent.set_data(data)
         group_by = params.get('group_by')
         if not group_by:
-            raise OrchestratorError("Missing 'group_by' parameter for aggregate")
+            raise InvalidTaskError("Missing 'group_by' parameter for aggregate")
         return agent.groupby_single(
             group_by,
             params.get('agg_col'),
@@ -260,7 +458,7 @@ class TaskRouter:
         """Route detect_anomalies task to AnomalyDetectorAgent."""
         data = self.data_manager.get('loaded_data')
         if data is None:
-            raise OrchestratorError(
+            raise InvalidTaskError(
                 "No loaded data for detect_anomalies. Run 'load_data' first."
             )
         agent.set_data(data)
@@ -273,13 +471,13 @@ class TaskRouter:
         elif method == 'isolation_forest':
             return agent.isolation_forest_detection(params.get('columns', []))
         else:
-            raise OrchestratorError(f"Unknown anomaly method: {method}")
+            raise InvalidTaskError(f"Unknown anomaly method: {method}")
 
     def _route_predict(self, agent: Any, params: Dict[str, Any]) -> Any:
         """Route predict task to PredictorAgent."""
         data = self.data_manager.get('loaded_data')
         if data is None:
-            raise OrchestratorError(
+            raise InvalidTaskError(
                 "No loaded data for predict. Run 'load_data' first."
             )
         agent.set_data(data)
@@ -293,13 +491,13 @@ class TaskRouter:
                 params.get('periods', 10)
             )
         else:
-            raise OrchestratorError(f"Unknown prediction type: {pred_type}")
+            raise InvalidTaskError(f"Unknown prediction type: {pred_type}")
 
     def _route_recommend(self, agent: Any, params: Dict[str, Any]) -> Any:
         """Route recommend task to RecommenderAgent."""
         data = self.data_manager.get('loaded_data')
         if data is None:
-            raise OrchestratorError(
+            raise InvalidTaskError(
                 "No loaded data for recommend. Run 'load_data' first."
             )
         agent.set_data(data)
@@ -322,7 +520,7 @@ class TaskRouter:
         """Route visualize task to VisualizerAgent."""
         data = self.data_manager.get('loaded_data')
         if data is None:
-            raise OrchestratorError(
+            raise InvalidTaskError(
                 "No loaded data for visualize. Run 'load_data' first."
             )
         agent.set_data(data)
@@ -336,13 +534,13 @@ class TaskRouter:
         elif chart_type == 'heatmap':
             return agent.heatmap()
         else:
-            raise OrchestratorError(f"Unknown chart type: {chart_type}")
+            raise InvalidTaskError(f"Unknown chart type: {chart_type}")
 
     def _route_report(self, agent: Any, params: Dict[str, Any]) -> Any:
         """Route report task to ReporterAgent."""
         data = self.data_manager.get('loaded_data')
         if data is None:
-            raise OrchestratorError(
+            raise InvalidTaskError(
                 "No loaded data for report. Run 'load_data' first."
             )
         agent.set_data(data)
@@ -354,7 +552,7 @@ class TaskRouter:
         elif report_type == 'comprehensive':
             return agent.generate_comprehensive_report()
         else:
-            raise OrchestratorError(f"Unknown report type: {report_type}")
+            raise InvalidTaskError(f"Unknown report type: {report_type}")
 
     def get_pipeline_info(self) -> Dict[str, Any]:
         """Get pipeline information.
@@ -365,5 +563,6 @@ class TaskRouter:
         return {
             'order': self.PIPELINE_ORDER,
             'task_to_agent': self.TASK_TO_AGENT,
-            'total_stages': len(self.PIPELINE_ORDER)
+            'total_stages': len(self.PIPELINE_ORDER),
+            'dependencies': {task: stage_dependencies(task) for task in self.PIPELINE_ORDER}
         }
@@ -0,0 +1,391 @@
+"""Workflow DAG - Dependency-driven parallel execution of workflow tasks.
+
+Every analysis stage only reads the loaded dataset, so the pipeline is a
+DAG rather than a chain:
+
+    load_data -> explore | aggregate | detect_anomalies | predict
+                 | recommend | visualize | report
+    explore, aggregate, detect_anomalies, predict, recommend -> narrative
+
+Two kinds of edges:
+- requires: the task needs the dependency's output and is skipped if the
+  dependency failed
+- after: ordering only; narrative summarizes whatever analysis results
+  were cached and still runs if some of them failed
+
+Ready tasks run concurrently on a thread pool. Agents are stateful and hold
+their DataFrame, so they are shared in-process instead of being pickled
+to a process pool; tasks routed to the same agent are never run at the
+same time. Each task records its start offset and duration, and the run
+reports the critical path so end-to-end latency can be compared with the
+sum of stage times.
+
+A run may have a deadline. Every task runs under the run's cancellation
+token, so cancelling or timing out the run also stops running tasks at
+their next checkpoint; the run stops waiting for them straight away.
+An abandoned task keeps its agent's TaskRouter lock until its thread
+returns, so a later stage on the same agent waits for it even though the
+run has already released the stage's lock_key.
+"""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from core.cancellation import CancellationToken, use_token
+from core.exceptions import OrchestratorError, TaskCancelledError, TaskTimeoutError
+from core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# ===== CONSTANTS =====
+ANALYSIS_STAGES = ['explore', 'aggregate', 'detect_anomalies', 'predict', 'recommend']
+
+# Stages whose output a task needs
+STAGE_REQUIRES: Dict[str, List[str]] = {
+    'load_data': [],
+    'explore': ['load_data'],
+    'aggregate': ['load_data'],
+    'detect_anomalies': ['load_data'],
+    'predict': ['load_data'],
+    'recommend': ['load_data'],
+    'narrative': [],
+    'visualize': ['load_data'],
+    'report': ['load_data'],
+}
+
+# Stages a task must wait for without needing them to succeed
+STAGE_AFTER: Dict[str, List[str]] = {
+    'narrative': ['load_data'] + ANALYSIS_STAGES,
+}
+
+# Task states
+STATUS_PENDING = 'pending'
+STATUS_COMPLETED = 'completed'
+STATUS_FAILED = 'failed'
+STATUS_SKIPPED = 'skipped'
+STATUS_CANCELLED = 'cancelled'
+STATUS_TIMED_OUT = 'timed_out'
+FINISHED_STATES = (STATUS_COMPLETED, STATUS_FAILED, STATUS_SKIPPED, STATUS_CANCELLED, STATUS_TIMED_OUT)
+# A task requiring a dependency in one of these states is skipped
+BROKEN_STATES = (STATUS_FAILED, STATUS_SKIPPED, STATUS_CANCELLED, STATUS_TIMED_OUT)
+
+# How often should_stop() and the deadline are polled while tasks are running
+STOP_POLL_SECONDS = 0.1
+
+
+def stage_dependencies(task_type: str) -> List[str]:
+    """All stages a task type waits for (required and ordering-only)."""
+    return STAGE_REQUIRES.get(task_type, []) + STAGE_AFTER.get(task_type, [])
+
+
+@dataclass
+class DagNode:
+    """One workflow task and the earlier tasks it waits for."""
+    index: int
+    task: Dict[str, Any]
+    requires: List[int] = field(default_factory=list)
+    after: List[int] = field(default_factory=list)
+
+    @property
+    def task_type(self) -> str:
+        return self.task.get('type')
+
+    @property
+    def critical(self) -> bool:
+        return bool(self.task.get('critical', False))
+
+    @property
+    def depends_on(self) -> List[int]:
+        return sorted(set(self.requires + self.after))
+
+
+@dataclass
+class StageRecord:
+    """Outcome and timing of one task."""
+    index: int
+    task_type: str
+    status: str = STATUS_PENDING
+    result: Any = None
+    error: Optional[str] = None
+    started_ms: Optional[float] = None  # Offset from the start of the run
+    duration_ms: float = 0.0
+
+    def timing(self) -> Dict[str, Any]:
+        return {
+            'status': self.status,
+            'started_ms': round(self.started_ms, 2) if self.started_ms is not None else None,
+            'duration_ms': round(self.duration_ms, 2),
+        }
+
+
+def build_dag(tasks: List[Dict[str, Any]]) -> List[DagNode]:
+    """Resolve each task's dependencies to earlier tasks in the list.
+
+    A task depends on every earlier task of a stage it requires or must
+    follow, and on the previous task of its own type (so repeated stages
+    keep their order and the last one wins in the cache). A task may
+    name extra required stages in 'depends_on'.
+
+    Args:
+        tasks: Workflow task configs in submission order
+
+    Returns:
+        One DagNode per task, in the same order
+    """
+    nodes = []
+    for index, task in enumerate(tasks):
+        task_type = task.get('type')
+        requires = set(STAGE_REQUIRES.get(task_type, [])) | set(task.get('depends_on', []))
+        after = set(STAGE_AFTER.get(task_type, []))
+        node = DagNode(index=index, task=task)
+        for earlier in nodes:
+            if earlier.task_type in requires:
+                node.requires.append(earlier.index)
+            elif earlier.task_type in after or earlier.task_type == task_type:
+                node.after.append(earlier.index)
+        nodes.append(node)
+    return nodes
+
+
+def critical_path(nodes: List[DagNode], records: Dict[int, StageRecord]) -> Dict[str, Any]:
+    """Longest chain of dependent task durations.
+
+    Args:
+        nodes: DAG nodes (dependencies always point to earlier nodes)
+        records: Timing of every node
+
+    Returns:
+        {'indices': [...], 'task_types': [...], 'duration_ms': float}
+    """
+    finish: Dict[int, float] = {}
+    previous: Dict[int, Optional[int]] = {}
+    for node in nodes:
+        best = max(node.depends_on, key=lambda idx: finish[idx], default=None)
+        finish[node.index] = records[node.index].duration_ms + (finish[best] if best is not None else 0.0)
+        previous[node.index] = best
+
+    if not finish:
+        return {'indices': [], 'task_types': [], 'duration_ms': 0.0}
+    tail = max(finish, key=finish.get)
+    chain = []
+    while tail is not None:
+        chain.append(tail)
+        tail = previous[tail]
+    chain.reverse()
+    return {
+        'indices': chain,
+        'task_types': [nodes[idx].task_type for idx in chain],
+        'duration_ms': round(finish[chain[-1]], 2),
+    }
+
+
+class WorkflowDAG:
+    """Runs workflow tasks as soon as their dependencies have finished.
+
+    Example:
+        >>> dag = WorkflowDAG(tasks, lock_key=lambda task: TASK_TO_AGENT[task['type']])
+        >>> records = dag.run(router.route, max_workers=4)
+        >>> dag.timing()['critical_path']['task_types']
+        ['load_data', 'predict', 'narrative']
+    """
+
+    def __init__(
+        self,
+        tasks: List[Dict[str, Any]],
+        lock_key: Optional[Callable[[Dict[str, Any]], Any]] = None
+    ) -> None:
+        """Build the DAG.
+
+        Args:
+            tasks: Workflow task configs in submission order
+            lock_key: Maps a task to the resource it holds exclusively
+                (default: its type); tasks with equal keys never overlap
+        """
+        self.nodes = build_dag(tasks)
+        self.lock_key = lock_key or (lambda task: task.get('type'))
+        self.records: Dict[int, StageRecord] = {
+            node.index: StageRecord(index=node.index, task_type=node.task_type) for node in self.nodes
+        }
+        self.wall_ms = 0.0
+        self.max_workers = 1
+        self.aborted: Optional[str] = None
+        self.cancelled = False
+        self.timed_out = False
+        self.token: Optional[CancellationToken] = None
+        self._on_done: Optional[Callable[[DagNode, StageRecord], None]] = None
+
+    def run(
+        self,
+        run_task: Callable[[Dict[str, Any]], Any],
+        max_workers: int = 4,
+        on_done: Optional[Callable[[DagNode, StageRecord], None]] = None,
+        should_stop: Optional[Callable[[], bool]] = None,
+        on_start: Optional[Callable[[DagNode], None]] = None,
+        timeout: Optional[float] = None
+    ) -> Dict[int, StageRecord]:
+        """Execute every task.
+
+        Args:
+            run_task: Called with the task config; its return value is the
+                task result and an exception marks the task failed
+            max_workers: Thread pool size (1 runs tasks one at a time in order)
+            on_done: Called with each task's node and record once it has
+                completed, failed or been skipped (partial results)
+            should_stop: Polled while tasks run; returning True cancels every
+                task that has not started yet and the token of running ones
+            on_start: Called with a task's node on its worker thread just
+                before the task runs
+            timeout: Seconds the whole run may take (None or <= 0 = no
+                deadline); tasks still pending then are cancelled and
+                running ones are told to stop
+
+        Returns:
+            {task index: StageRecord}; a failed critical task cancels every
+            task that has not started yet
+        """
+        self.max_workers = max(1, int(max_workers))
+        self.token = CancellationToken(timeout=timeout)
+        poll = STOP_POLL_SECONDS if should_stop is not None or self.token.deadline is not None else None
+        self._on_done = on_done
+        pending = {node.index for node in self.nodes}
+        running: Dict[Any, DagNode] = {}
+        busy = set()
+        run_start = time.perf_counter()
+
+        def timed(node: DagNode) -> Any:
+            record = self.records[node.index]
+            started = time.perf_counter()
+            record.started_ms = (started - run_start) * 1000
+            if on_start is not None:
+                try:
+                    on_start(node)
+                except Exception as e:
+                    logger.warning(f"Workflow start callback failed: {e}")
+            try:
+                with use_token(self.token):
+                    return run_task(node.task)
+            finally:
+                record.duration_ms = (time.perf_counter() - started) * 1000
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='workflow') as pool:
+            while pending or running:
+                if self.aborted is None and should_stop is not None and should_stop():
+                    self.aborted = 'Workflow cancelled'
+                    self.cancelled = True
+                    self.token.cancel(self.aborted)
+                if self.aborted is None and self.token.timed_out:
+                    self.aborted = f"Workflow timed out after {timeout}s"
+                    self.timed_out = True
+                if self.aborted is None:
+                    for node in self._ready(pending, busy):
+                        pending.discard(node.index)
+                        busy.add(self.lock_key(node.task))
+                        running[pool.submit(timed, node)] = node
+                if not running:
+                    break
+
+                done, _ = wait(
+                    list(running),
+                    timeout=poll,
+                    return_when=FIRST_COMPLETED
+                )
+                for future in done:
+                    node = running.pop(future)
+                    busy.discard(self.lock_key(node.task))
+                    record = self.records[node.index]
+                    error = future.exception()
+                    if error is None:
+                        record.status = STATUS_COMPLETED
+                        record.result = future.result()
+                    elif isinstance(error, TaskCancelledError):
+                        record.status = STATUS_TIMED_OUT if isinstance(error, TaskTimeoutError) else STATUS_CANCELLED
+                        record.result = error.partial_result
+                        record.error = str(error)
+                        logger.warning(f"Workflow task {node.index + 1} ({node.task_type}) stopped: {error}")
+                        if node.critical and self.aborted is None:
+                            self.aborted = f"Critical task stopped: {error}"
+                    else:
+                        record.status = STATUS_FAILED
+                        record.error = str(error)
+                        logger.error(f"Workflow task {node.index + 1} ({node.task_type}) failed: {error}")
+                        if node.critical and self.aborted is None:
+                            self.aborted = f"Critical task failed: {error}"
+                    self._notify(node)
+
+        for index in pending:
+            record = self.records[index]
+            record.status = STATUS_CANCELLED
+            record.error = self.aborted
+        self.wall_ms = (time.perf_counter() - run_start) * 1000
+        return self.records
+
+    def _notify(self, node: DagNode) -> None:
+        """Report a finished task; callback errors never stop the run."""
+        if self._on_done is None:
+            return
+        try:
+            self._on_done(node, self.records[node.index])
+        except Exception as e:
+            logger.warning(f"Workflow progress callback failed: {e}")
+
+    def _ready(self, pending: set, busy: set) -> List[DagNode]:
+        """Pending tasks whose dependencies are done, skipping broken branches."""
+        ready = []
+        progress = True
+        while progress:
+            progress = False
+            for index in sorted(pending):
+                node = self.nodes[index]
+                failed = [idx for idx in node.requires if self.records[idx].status in BROKEN_STATES]
+                if failed:
+                    record = self.records[index]
+                    record.status = STATUS_SKIPPED
+                    record.error = f"Dependency failed: {self.nodes[failed[0]].task_type}"
+                    self._notify(node)
+                    pending.discard(index)
+                    progress = True
+        claimed = set(busy)
+        for index in sorted(pending):
+            node = self.nodes[index]
+            if any(self.records[idx].status not in FINISHED_STATES for idx in node.depends_on):
+                continue
+            key = self.lock_key(node.task)
+            if key in claimed:
+                continue
+            claimed.add(key)
+            ready.append(node)
+        return ready
+
+    def timing(self) -> Dict[str, Any]:
+        """Wall time, per-stage times and the critical path of the last run."""
+        stage_sum = sum(record.duration_ms for record in self.records.values())
+        path = critical_path(self.nodes, self.records)
+        return {
+            'max_workers': self.max_workers,
+            'wall_ms': round(self.wall_ms, 2),
+            'stage_sum_ms': round(stage_sum, 2),
+            'critical_path': path,
+            'speedup': round(stage_sum / self.wall_ms, 2) if self.wall_ms else 1.0,
+            'stages': {index: record.timing() for index, record in self.records.items()},
+        }
+
+
+def validate_dependency_order(tasks: List[Dict[str, Any]]) -> bool:
+    """Check that no task is listed before a stage it depends on.
+
+    Raises:
+        OrchestratorError: If a dependency only appears later in the list
+    """
+    task_types = [task.get('type') for task in tasks]
+    for index, task_type in enumerate(task_types):
+        dependencies = set(stage_dependencies(task_type)) | set(tasks[index].get('depends_on', []))
+        late = [later for later in task_types[index + 1:] if later in dependencies]
+        if late:
+            raise OrchestratorError(
+                f"\n\nERROR: Tasks out of order!\n"
+                f"'{task_type}' must come after {sorted(set(late))}\n"
+                f"Got: {task_types}\n\n"
+            )
+    return True
@@ -1,27 +1,30 @@
 """WorkflowExecutor Worker - Executes multi-task workflows.
 
 Responsibilities:
-- Execute sequences of tasks
+- Execute workflows as a dependency DAG (independent stages in parallel)
 - Handle task dependencies
+- Record per-stage timing and the critical path
 - Manage workflow state
 - Track task progress
-- Handle workflow-level errors
+- Handle workflow-level errors and deadlines
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 from datetime import datetime, timezone
 from core.logger import get_logger
 from core.structured_logger import get_structured_logger
-from core.exceptions import OrchestratorError
+from core.exceptions import OrchestratorError, TaskCancelledError, TaskTimeoutError
 from core.error_recovery import retry_on_error
 from agents.error_intelligence.main import ErrorIntelligence
+from agents.agent_config import AgentConfig
+from .workflow_dag import WorkflowDAG
 
 
 class WorkflowExecutor:
-    """Executes workflows (sequences of tasks).
+    """Executes workflows (DAGs of tasks).
     
-    Manages task execution order, tracks progress, handles
-    dependencies, and aggregates results.
+    Runs each task once its dependencies are done, tracks progress
+    and timing, and aggregates results.
     """
 
     def __init__(self, task_router: Any) -> None:
@@ -39,19 +42,36 @@ class WorkflowExecutor:
         self.logger.info("WorkflowExecutor initialized")
 
     @retry_on_error(max_attempts=2, backoff=1)
-    def execute(self, workflow_tasks: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Execute a workflow (sequence of tasks).
+    def execute(
+        self,
+        workflow_tasks: List[Dict[str, Any]],
+        max_workers: Optional[int] = None,
+        timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Execute a workflow as a dependency DAG.
+        
+        Tasks start as soon as the stages they depend on have finished, so
+        independent stages (explore, aggregate, detect_anomalies, ...) run
+        concurrently. Tasks whose required stage failed are skipped.
         
         Args:
-            workflow_tasks: List of task configs to execute in sequence
+            workflow_tasks: List of task configs (listed in dependency order)
+            max_workers: Concurrent tasks (default AgentConfig.WORKFLOW_MAX_WORKERS;
+                1 runs them one after another)
+            timeout: Seconds the workflow may take (default
+                AgentConfig.WORKFLOW_TIMEOUT_SECONDS; 0 = no deadline). Tasks
+                also honour their own 'timeout' key
         
         Returns:
-            Workflow result with all task results
+            Workflow result with all task results and per-stage timing
         
         Raises:
-            OrchestratorError: If workflow execution fails
+            TaskTimeoutError: If the workflow ran out of time (the partial
+                workflow is its partial_result; not retried)
+            OrchestratorError: If a critical task fails
         """
         workflow_id = self._generate_workflow_id()
+        workers = max_workers or AgentConfig.WORKFLOW_MAX_WORKERS
         
         workflow = {
             'workflow_id': workflow_id,
@@ -60,56 +80,66 @@ class WorkflowExecutor:
             'tasks': [],
             'started_at': datetime.now(timezone.utc).isoformat(),
             'completed_at': None,
-            'error': None
+            'error': None,
+            'timing': None
         }
         
         self.logger.info(f"Workflow started: {workflow_id}")
         self.structured_logger.info("Workflow execution started", {
             'workflow_id': workflow_id,
-            'total_tasks': len(workflow_tasks)
+            'total_tasks': len(workflow_tasks),
+            'max_workers': workers
         })
         
         try:
-            for i, task_config in enumerate(workflow_tasks, 1):
-                self.logger.info(f"Executing task {i}/{len(workflow_tasks)}: {task_config['type']}")
-                
-                # Create task
-                task = self._create_task(task_config, i, len(workflow_tasks))
-                
-                # Execute task
-                try:
-                    task_result = self.task_router.route(task)
-                    task['result'] = task_result
-                    task['status'] = 'completed'
-                except Exception as e:
-                    task['status'] = 'failed'
-                    task['error'] = str(e)
-                    self.logger.error(f"Task failed: {e}")
-                    
-                    # Check if task is critical (fail-fast)
-                    if task_config.get('critical', False):
-                        workflow['status'] = 'failed'
-                        workflow['error'] = f"Critical task failed: {e}"
-                        raise OrchestratorError(f"Critical task failed: {e}")
-                
-                task['completed_at'] = datetime.now(timezone.utc).isoformat()
+            tasks = [
+                self._create_task(task_config, i, len(workflow_tasks))
+                for i, task_config in enumerate(workflow_tasks, 1)
+            ]
+            dag = WorkflowDAG(tasks, lock_key=self._agent_for)
+            for node in dag.nodes:
+                tasks[node.index]['depends_on'] = [tasks[idx]['id'] for idx in node.depends_on]
+            
+            records = dag.run(
+                self._run_task,
+                max_workers=workers,
+                timeout=AgentConfig.WORKFLOW_TIMEOUT_SECONDS if timeout is None else timeout
+            )
+            
+            for task, node in zip(tasks, dag.nodes):
+                record = records[node.index]
+                task['status'] = record.status
+                task['result'] = record.result
+                task['error'] = record.error
+                task['started_ms'] = record.timing()['started_ms']
+                task['duration_ms'] = record.timing()['duration_ms']
                 workflow['tasks'].append(task)
-                
-                self.structured_logger.info("Task completed", {
-                    'task_number': i,
-                    'task_type': task_config['type'],
-                    'status': task['status']
-                })
+            workflow['timing'] = dag.timing()
+            
+            if dag.timed_out:
+                workflow['status'] = 'timed_out'
+                workflow['error'] = dag.aborted
+                raise TaskTimeoutError(dag.aborted, partial_result=workflow)
+            if dag.aborted:
+                workflow['status'] = 'failed'
+                workflow['error'] = dag.aborted
+                raise OrchestratorError(dag.aborted)
             
             # Workflow completed successfully
             workflow['status'] = 'completed'
             workflow['completed_at'] = datetime.now(timezone.utc).isoformat()
             
-            self.logger.info(f"Workflow completed: {workflow_id}")
+            self.logger.info(
+                f"Workflow completed: {workflow_id} in {workflow['timing']['wall_ms']:.0f}ms "
+                f"(stages {workflow['timing']['stage_sum_ms']:.0f}ms, "
+                f"critical path {workflow['timing']['critical_path']['duration_ms']:.0f}ms)"
+            )
             self.structured_logger.info("Workflow execution completed", {
                 'workflow_id': workflow_id,
                 'total_tasks': len(workflow_tasks),
-                'successful_tasks': len([t for t in workflow['tasks'] if t['status'] == 'completed'])
+                'successful_tasks': len([t for t in workflow['tasks'] if t['status'] == 'completed']),
+                'wall_ms': workflow['timing']['wall_ms'],
+                'critical_path_ms': workflow['timing']['critical_path']['duration_ms']
             })
             
             # Track success
@@ -124,7 +154,8 @@ class WorkflowExecutor:
             return workflow
         
         except Exception as e:
-            workflow['status'] = 'failed'
+            if not isinstance(e, TaskCancelledError):
+                workflow['status'] = 'failed'
             workflow['completed_at'] = datetime.now(timezone.utc).isoformat()
             workflow['error'] = str(e)
             
@@ -140,8 +171,20 @@ class WorkflowExecutor:
                 context={"workflow_id": workflow_id}
             )
             
+            if isinstance(e, TaskCancelledError):
+                raise
             raise OrchestratorError(f"Workflow execution failed: {e}")
 
+    def _run_task(self, task: Dict[str, Any]) -> Any:
+        """Route one task (called from a workflow thread)."""
+        self.logger.info(f"Executing task {task['id']}: {task['type']}")
+        task['status'] = 'executing'
+        return self.task_router.route(task)
+
+    def _agent_for(self, task: Dict[str, Any]) -> str:
+        """Agent a task runs on; one task per agent at a time."""
+        return self.task_router.TASK_TO_AGENT.get(task['type'], task['type'])
+
     def _create_task(self, task_config: Dict[str, Any], task_number: int, total_tasks: int) -> Dict[str, Any]:
         """Create a task from config.
         
@@ -161,6 +204,8 @@ class WorkflowExecutor:
             'parameters': task_config.get('parameters', {}),
             'cache_as': task_config.get('cache_as'),
             'critical': task_config.get('critical', False),
+            'timeout': task_config.get('timeout'),
+            'depends_on': task_config.get('depends_on', []),
             'status': 'created',
             'created_at': datetime.now(timezone.utc).isoformat(),
             'completed_at': None,
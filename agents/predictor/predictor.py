@@ -6,7 +6,7 @@ Integrated with Week 1 Systems:
 - Error recovery and handling
 """
 
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Union
 import pandas as pd
 import numpy as np
 
@@ -14,6 +14,7 @@ from core.logger import get_logger
 from core.error_recovery import retry_on_error
 from core.structured_logger import get_structured_logger
 from core.exceptions import AgentError
+from core.shared_dataset import SharedDataset, frame_for_agent
 from .workers import (
     LinearRegression,
     DecisionTree,
@@ -95,13 +96,14 @@ class Predictor:
     # ===== DATA MANAGEMENT =====
     
     @retry_on_error(max_attempts=2, backoff=1)
-    def set_data(self, df: pd.DataFrame) -> None:
+    def set_data(self, df: Union[pd.DataFrame, SharedDataset]) -> None:
         """Store DataFrame for all workers to use.
         
         Args:
-            df: Input DataFrame
+            df: Input DataFrame (copied), or SharedDataset (kept as a view)
         """
-        self.data = df.copy()
+        df = frame_for_agent(df)
+        self.data = df
         self.prediction_results = {}
         self.logger.info(f"Data set: {df.shape}")
         self.structured_logger.info("Data set for prediction", {
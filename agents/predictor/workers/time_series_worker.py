@@ -2,6 +2,7 @@
 
 from .base_worker import BaseWorker, WorkerResult, ErrorType
 from core.logger import get_logger
+from core.cancellation import checkpoint
 from agents.error_intelligence.main import ErrorIntelligence
 import pandas as pd
 import numpy as np
@@ -188,7 +189,10 @@ class TimeSeriesWorker(BaseWorker):
             seasonal=None,
             initialization_method='estimated'
         )
+        # The fit itself cannot be interrupted; stop before and after it
+        checkpoint()
         fitted_model = model.fit(optimized=True)
+        checkpoint()
         
         # Generate forecast
         forecast = fitted_model.forecast(steps=forecast_periods)
@@ -233,7 +237,10 @@ class TimeSeriesWorker(BaseWorker):
         
         # Fit ARIMA(1,1,1) as default
         model = ARIMA(ts_data, order=(1, 1, 1))
+        # The fit itself cannot be interrupted; stop before and after it
+        checkpoint()
         fitted_model = model.fit()
+        checkpoint()
         
         # Generate forecast
         forecast = fitted_model.forecast(steps=forecast_periods)
@@ -17,7 +17,7 @@ Wired to use Workers Pattern:
 - ActionPlanGenerator worker
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 import pandas as pd
 from datetime import datetime, timezone
 
@@ -28,6 +28,7 @@ from core.structured_logger import get_structured_logger
 from core.validators import validate_input, validate_output
 from core.logger import get_logger
 from core.exceptions import AgentError
+from core.shared_dataset import SharedDataset, frame_for_agent
 
 # Worker imports
 from agents.recommender.workers import (
@@ -85,15 +86,17 @@ class Recommender:
             extra={'version': '2.0-week1-integrated', 'workers': 5}
         )
     
-    @validate_input({'df': 'dataframe'})
-    def set_data(self, df: pd.DataFrame) -> None:
+    @validate_input({'df': 'dataset'})
+    def set_data(self, df: Union[pd.DataFrame, SharedDataset]) -> None:
         """Set data for analysis with validation.
         
         Args:
-            df: DataFrame to analyze (validated)
+            df: DataFrame to analyze (validated, copied), or SharedDataset
+                (kept as a view)
         """
         with logger.operation('set_data', {'rows': len(df), 'columns': len(df.columns)}):
-            self.data = df.copy()
+            df = frame_for_agent(df)
+            self.data = df
             logger.info(
                 'Data set for recommendation',
                 extra={'rows': df.shape[0], 'columns': df.shape[1]}
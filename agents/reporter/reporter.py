@@ -26,7 +26,7 @@ Integrated with Week 1 Systems:
 - Error recovery and handling
 """
 
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 import pandas as pd
 from datetime import datetime
 import hashlib
@@ -35,6 +35,7 @@ from core.logger import get_logger
 from core.error_recovery import retry_on_error
 from core.structured_logger import get_structured_logger
 from core.exceptions import AgentError
+from core.shared_dataset import SharedDataset, frame_for_agent
 
 # Worker imports
 from agents.reporter.workers import (
@@ -157,13 +158,14 @@ class Reporter:
         return hashlib.md5(data_str.encode()).hexdigest()
     
     @retry_on_error(max_attempts=2, backoff=1)
-    def set_data(self, df: pd.DataFrame) -> None:
+    def set_data(self, df: Union[pd.DataFrame, SharedDataset]) -> None:
         """Set data for report generation with hash tracking.
         
         Args:
-            df: DataFrame to report on
+            df: DataFrame to report on (copied), or SharedDataset (kept as a view)
         """
-        self.data = df.copy()
+        df = frame_for_agent(df)
+        self.data = df
         self.data_hash = self._compute_data_hash(df)
         self.reports = {}
         self.cache.clear()  # Clear cache on new data
@@ -19,7 +19,7 @@ Integrated with:
 - Automatic Retry with Exponential Backoff
 """
 
-from typing import Any, Dict, Optional, List
+from typing import Any, Dict, Optional, List, Union
 from datetime import datetime, timezone
 import pandas as pd
 import logging
@@ -29,6 +29,7 @@ from core.logger import get_logger
 from core.error_recovery import retry_on_error
 from core.structured_logger import get_structured_logger
 from core.exceptions import AgentError
+from core.shared_dataset import SharedDataset, frame_for_agent
 from agents.error_intelligence.main import ErrorIntelligence
 from .workers import (
     LineChartWorker,
@@ -139,23 +140,24 @@ class Visualizer:
     # === SECTION 1: DATA MANAGEMENT ===
 
     @retry_on_error(max_attempts=2, backoff=1)
-    def set_data(self, df: pd.DataFrame) -> None:
+    def set_data(self, df: Union[pd.DataFrame, SharedDataset]) -> None:
         """Set data to visualize.
         
         Args:
-            df: DataFrame to visualize
+            df: DataFrame to visualize (copied), or SharedDataset (kept as a view)
             
         Raises:
             TypeError: If df is not a DataFrame
             ValueError: If df is empty
         """
+        df = frame_for_agent(df)
         if not isinstance(df, pd.DataFrame):
             raise TypeError(f"Expected DataFrame, got {type(df).__name__}")
         
         if df.empty:
             raise ValueError("Cannot set empty DataFrame")
         
-        self.data = df.copy()
+        self.data = df
         self.charts = {}
         
         # Capture metadata
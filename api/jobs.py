@@ -0,0 +1,318 @@
+"""Job queue for long-running API work.
+
+Workflows can take minutes, so the API does not run them on the event
+loop. A request submits a job and gets its id back straight away, and a
+bounded thread pool runs it:
+- Queue limit: submissions beyond max_queued waiting jobs are rejected
+  (QueueFullError, HTTP 429)
+- Progress: a job function reports partial results through its JobContext;
+  every change bumps the job's version so clients can long-poll for it
+- Cancellation: a queued job never starts; a running job sees
+  context.cancelled and stops at its next checkpoint
+- History: finished jobs are kept (up to max_finished) for later polling.
+  Stored results and progress are compacted: DataFrames are replaced by
+  a shape summary, so history never keeps loaded datasets alive. The
+  job's future still resolves to the full result for a waiting caller
+
+Usage:
+    jobs = JobManager(max_workers=1, max_queued=16)
+    job = jobs.submit('workflow', lambda ctx: orchestrator.execute_workflow(
+        tasks, on_task_done=ctx.report, should_stop=lambda: ctx.cancelled
+    ))
+    jobs.wait(job.id, since_version=0, timeout=30)
+"""
+
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+import pandas as pd
+
+from core.logger import get_logger
+from core.shared_dataset import SharedDataset
+
+logger = get_logger(__name__)
+
+# ===== CONSTANTS =====
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+FINISHED_JOB_STATES = (JOB_COMPLETED, JOB_FAILED, JOB_CANCELLED)
+# Column names listed in a compacted DataFrame
+COMPACT_MAX_COLUMNS = 50
+
+
+def compact_result(value: Any) -> Any:
+    """Copy of a result with DataFrames (and Series) replaced by small summaries."""
+    if isinstance(value, dict):
+        return {key: compact_result(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [compact_result(item) for item in value]
+    if isinstance(value, tuple):
+        return tuple(compact_result(item) for item in value)
+    if isinstance(value, SharedDataset):
+        value = value.view()
+    if isinstance(value, pd.DataFrame):
+        return {
+            'type': 'DataFrame',
+            'shape': list(value.shape),
+            'columns': [str(col) for col in value.columns[:COMPACT_MAX_COLUMNS]],
+        }
+    if isinstance(value, pd.Series):
+        return {'type': 'Series', 'name': str(value.name), 'length': len(value)}
+    return value
+
+
+class QueueFullError(RuntimeError):
+    """The job queue is at its limit."""
+
+
+class JobNotFoundError(KeyError):
+    """No job with that id."""
+
+
+@dataclass
+class Job:
+    """State of one submitted job."""
+    id: str
+    kind: str
+    status: str = JOB_QUEUED
+    created_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    result: Any = None
+    error: Optional[str] = None
+    progress: List[Dict[str, Any]] = field(default_factory=list)
+    version: int = 0
+    cancel_requested: bool = False
+    future: Optional[Future] = field(default=None, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_JOB_STATES
+
+    def to_dict(self, include_result: bool = True) -> Dict[str, Any]:
+        """Job summary for API responses."""
+        data = {
+            'job_id': self.id,
+            'kind': self.kind,
+            'status': self.status,
+            'created_at': self.created_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+            'version': self.version,
+            'cancel_requested': self.cancel_requested,
+            'progress': list(self.progress),
+            'error': self.error,
+        }
+        if include_result:
+            data['result'] = self.result
+        return data
+
+
+class JobContext:
+    """Handle passed to a running job function."""
+
+    def __init__(self, manager: 'JobManager', job: Job) -> None:
+        self._manager = manager
+        self.job_id = job.id
+        self._job = job
+
+    @property
+    def cancelled(self) -> bool:
+        """True once cancellation was requested; stop at the next checkpoint."""
+        return self._job.cancel_requested
+
+    def report(self, partial: Dict[str, Any]) -> None:
+        """Publish a partial result (e.g. one finished workflow task)."""
+        partial = compact_result(partial)
+        self._manager._update(self._job, lambda job: job.progress.append(partial))
+
+
+class JobManager:
+    """Bounded pool of background jobs with status, progress and cancellation."""
+
+    def __init__(self, max_workers: int = 1, max_queued: int = 16, max_finished: int = 100) -> None:
+        """Initialize the manager.
+
+        Args:
+            max_workers: Jobs running at the same time
+            max_queued: Jobs allowed to wait for a worker
+            max_finished: Finished jobs kept for polling (oldest dropped first)
+        """
+        self.max_workers = max(1, int(max_workers))
+        self.max_queued = max(0, int(max_queued))
+        self.max_finished = max(1, int(max_finished))
+        self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='api-job')
+        self._jobs: 'OrderedDict[str, Job]' = OrderedDict()
+        self._ids = itertools.count(1)
+        self._changed = threading.Condition()
+        logger.info(f"JobManager initialized ({self.max_workers} workers, queue limit {self.max_queued})")
+
+    # ========== SUBMISSION ==========
+
+    def submit(self, kind: str, func: Callable[[JobContext], Any]) -> Job:
+        """Queue a job.
+
+        Args:
+            kind: Job type label (e.g. 'workflow')
+            func: Called on a worker thread with a JobContext; its return
+                value becomes the job result
+
+        Returns:
+            The queued Job
+
+        Raises:
+            QueueFullError: If max_queued jobs are already waiting
+        """
+        with self._changed:
+            if self.queue_depth() >= self.max_queued:
+                raise QueueFullError(f"Job queue is full ({self.max_queued} jobs waiting)")
+            job = Job(id=f"job_{next(self._ids):06d}", kind=kind)
+            self._jobs[job.id] = job
+            job.future = self._pool.submit(self._run, job, func)
+        logger.info(f"Job queued: {job.id} ({kind})")
+        return job
+
+    def _run(self, job: Job, func: Callable[[JobContext], Any]) -> Any:
+        """Worker-thread body of a job; returns the full (uncompacted) result."""
+        with self._changed:
+            if job.cancel_requested:
+                return None
+            job.status = JOB_RUNNING
+            job.started_at = datetime.now(timezone.utc).isoformat()
+            job.version += 1
+            self._changed.notify_all()
+
+        try:
+            result = func(JobContext(self, job))
+        except Exception as e:
+            logger.error(f"Job failed: {job.id} - {e}")
+            self._finish(job, JOB_FAILED, error=str(e))
+            return None
+        status = JOB_CANCELLED if job.cancel_requested else JOB_COMPLETED
+        self._finish(job, status, result=result)
+        return result
+
+    def _finish(self, job: Job, status: str, result: Any = None, error: Optional[str] = None) -> None:
+        result = compact_result(result)
+
+        def apply(job: Job) -> None:
+            job.status = status
+            job.result = result
+            job.error = error
+            job.finished_at = datetime.now(timezone.utc).isoformat()
+        self._update(job, apply)
+        logger.info(f"Job {status}: {job.id}")
+        self._prune()
+
+    def _update(self, job: Job, change: Callable[[Job], None]) -> None:
+        """Apply a change to a job and wake up waiting pollers."""
+        with self._changed:
+            change(job)
+            job.version += 1
+            self._changed.notify_all()
+
+    def _prune(self) -> None:
+        """Drop the oldest finished jobs beyond max_finished."""
+        with self._changed:
+            finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+            for job_id in finished[:max(0, len(finished) - self.max_finished)]:
+                del self._jobs[job_id]
+
+    # ========== QUERIES ==========
+
+    def get(self, job_id: str) -> Job:
+        """Look up a job.
+
+        Raises:
+            JobNotFoundError: If the id is unknown (or was pruned)
+        """
+        with self._changed:
+            job = self._jobs.get(job_id)
+        if job is None:
+            raise JobNotFoundError(job_id)
+        return job
+
+    def list(self) -> List[Job]:
+        """All known jobs, oldest first."""
+        with self._changed:
+            return list(self._jobs.values())
+
+    def queue_depth(self) -> int:
+        """Jobs waiting for a worker."""
+        with self._changed:
+            return sum(1 for job in self._jobs.values() if job.status == JOB_QUEUED and not job.cancel_requested)
+
+    def wait(self, job_id: str, since_version: int = -1, timeout: Optional[float] = None) -> Job:
+        """Block until the job changes past since_version, finishes or times out.
+
+        Args:
+            job_id: Job id
+            since_version: Version the caller already has
+            timeout: Seconds to wait at most (None = until it changes)
+
+        Returns:
+            The job (check job.version to see whether anything changed)
+        """
+        job = self.get(job_id)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._changed:
+            while job.version <= since_version and not job.finished:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    break
+                self._changed.wait(remaining)
+        return job
+
+    # ========== CONTROL ==========
+
+    def cancel(self, job_id: str) -> Job:
+        """Request cancellation.
+
+        A queued job is cancelled immediately; a running job is marked and
+        finishes as cancelled once its function returns.
+
+        Returns:
+            The job
+        """
+        job = self.get(job_id)
+        with self._changed:
+            if job.finished:
+                return job
+            job.cancel_requested = True
+            job.version += 1
+            queued = job.status == JOB_QUEUED
+            self._changed.notify_all()
+        if queued:
+            job.future.cancel()
+            self._finish(job, JOB_CANCELLED)
+        logger.info(f"Job cancellation requested: {job_id}")
+        return job
+
+    def stats(self) -> Dict[str, Any]:
+        """Job counts by status and queue limits."""
+        with self._changed:
+            counts: Dict[str, int] = {}
+            for job in self._jobs.values():
+                counts[job.status] = counts.get(job.status, 0) + 1
+        return {
+            'max_workers': self.max_workers,
+            'max_queued': self.max_queued,
+            'queue_depth': self.queue_depth(),
+            'jobs': counts,
+        }
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Cancel queued jobs and stop the pool."""
+        for job in self.list():
+            if job.status == JOB_QUEUED:
+                self.cancel(job.id)
+        self._pool.shutdown(wait=wait, cancel_futures=True)
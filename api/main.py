@@ -11,6 +11,10 @@ Usage:
     
 API will be available at: http://localhost:8000
 API docs: http://localhost:8000/docs
+
+Sessions:
+    Send an X-Session-ID header (or get one from POST /api/sessions) to work
+    in a private workspace; without it requests share the default workspace.
 """
 
 import sys
@@ -22,8 +26,10 @@ import json
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from fastapi import FastAPI, UploadFile, File, HTTPException, BackgroundTasks
-from fastapi.responses import FileResponse, JSONResponse
+import asyncio
+
+from fastapi import FastAPI, UploadFile, File, HTTPException, BackgroundTasks, Header, WebSocket, WebSocketDisconnect
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import Optional, List, Dict, Any
@@ -33,6 +39,7 @@ import numpy as np
 from datetime import datetime
 
 from agents.orchestrator import Orchestrator
+from agents.orchestrator.workers.session_manager import SessionLimitError
 from agents.data_loader import DataLoader
 from agents.explorer import Explorer
 from agents.aggregator import Aggregator
@@ -41,10 +48,16 @@ from agents.predictor import Predictor
 from agents.anomaly_detector import AnomalyDetector
 from agents.recommender import Recommender
 from agents.reporter import Reporter
+from agents.agent_config import AgentConfig
 from core.logger import get_logger
+from core.exceptions import OrchestratorError
+from api.jobs import JobManager, JobContext, QueueFullError, JobNotFoundError, JOB_CANCELLED
 
 logger = get_logger(__name__)
 
+# Seconds between keep-alive comments on an idle event stream
+EVENT_STREAM_KEEPALIVE_SECONDS = 15.0
+
 # Initialize FastAPI app
 app = FastAPI(
     title="GOAT Data Analyst API",
@@ -79,6 +92,12 @@ agents = [
 for agent_name, agent_instance in agents:
     orchestrator.register_agent(agent_name, agent_instance)
 
+# Long-running work runs here, off the event loop
+job_manager = JobManager(
+    max_workers=AgentConfig.API_JOB_WORKERS,
+    max_queued=AgentConfig.API_JOB_QUEUE_LIMIT,
+)
+
 logger.info("FastAPI server initialized with all agents")
 
 
@@ -357,7 +376,7 @@ async def list_agents():
 # ============================================================================
 
 @app.post("/api/load")
-async def load_data(request: LoadDataRequest):
+async def load_data(request: LoadDataRequest, x_session_id: Optional[str] = Header(None)):
     """Load data from file.
     
     Loads data using DataLoader agent and returns metadata.
@@ -366,8 +385,10 @@ async def load_data(request: LoadDataRequest):
     try:
         logger.info(f"Loading data from: {request.file_path}")
         
-        task = orchestrator.create_task("load_data", {"file_path": request.file_path})
-        task_result = orchestrator.execute_task(task["id"])
+        _check_session(x_session_id)
+        task_result = orchestrator.execute_task(
+            "load_data", {"file_path": request.file_path}, session_id=x_session_id
+        )
         result = task_result.get("result", {})
         
         # Extract metadata from result
@@ -385,10 +406,13 @@ async def load_data(request: LoadDataRequest):
             "rows": metadata.get("rows", 0),
             "columns": metadata.get("columns", 0),
             "columns_list": metadata.get("column_names", []),
+            "session_id": x_session_id,
         }
         
         return safe_json_response(response_data)
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error loading data: {str(e)}", exc_info=True)
         raise HTTPException(status_code=400, detail=str(e))
@@ -399,7 +423,7 @@ async def load_data(request: LoadDataRequest):
 # ============================================================================
 
 @app.post("/api/explore")
-async def explore_data(request: ExploreDataRequest):
+async def explore_data(request: ExploreDataRequest, x_session_id: Optional[str] = Header(None)):
     """Explore data using Explorer agent with worker-based analysis.
     
     Returns comprehensive report with worker results and quality validation.
@@ -407,7 +431,8 @@ async def explore_data(request: ExploreDataRequest):
     try:
         logger.info(f"Exploring data from key: {request.data_key}")
         
-        data = orchestrator.get_cached_data(request.data_key)
+        _check_session(x_session_id)
+        data = orchestrator.get_cached_data(request.data_key, session_id=x_session_id)
         if data is None:
             raise HTTPException(status_code=404, detail="Data not found")
         
@@ -425,6 +450,8 @@ async def explore_data(request: ExploreDataRequest):
         
         return safe_json_response(report)
     
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error exploring data: {str(e)}", exc_info=True)
         raise HTTPException(status_code=400, detail=str(e))
@@ -619,31 +646,233 @@ async def generate_report(request: ReportRequest):
 # WORKFLOW ENDPOINTS
 # ============================================================================
 
-@app.post("/api/workflow")
-async def execute_workflow(request: WorkflowRequest):
-    """Execute a complete workflow."""
+def _workflow_job(tasks: List[Dict[str, Any]], session_id: Optional[str] = None):
+    """Job function running a workflow with progress and cancellation."""
+    def run(context: JobContext):
+        return orchestrator.execute_workflow(
+            tasks,
+            on_event=context.report,
+            should_stop=lambda: context.cancelled,
+            session_id=session_id,
+        )
+    return run
+
+
+def _check_session(session_id: Optional[str]) -> None:
+    """Open the session up front, mapping a bad id to 400 and a full table to 429."""
+    if session_id is None:
+        return
     try:
-        logger.info(f"Executing workflow with {len(request.tasks)} tasks")
-        
-        workflow_result = orchestrator.execute_workflow(request.tasks)
-        
-        workflow_result = convert_to_json_serializable(workflow_result)
-        
-        logger.info(f"Workflow execution complete")
-        
-        return safe_json_response(workflow_result)
-    except Exception as e:
-        logger.error(f"Error executing workflow: {str(e)}", exc_info=True)
+        orchestrator.sessions.get_or_create(session_id)
+    except SessionLimitError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    except OrchestratorError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
+def _submit_job(kind: str, func):
+    """Submit to the job queue, mapping a full queue to HTTP 429."""
+    try:
+        return job_manager.submit(kind, func)
+    except QueueFullError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+
+
+def _get_job(job_id: str):
+    try:
+        return job_manager.get(job_id)
+    except JobNotFoundError:
+        raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found")
+
+
+@app.post("/api/workflow")
+async def execute_workflow(request: WorkflowRequest, x_session_id: Optional[str] = Header(None)):
+    """Execute a complete workflow and wait for the result.
+    
+    Runs on the job pool (not the event loop), so other requests are
+    served meanwhile. Use POST /api/jobs to get a job id back instead.
+    """
+    logger.info(f"Executing workflow with {len(request.tasks)} tasks")
+    _check_session(x_session_id)
+    job = _submit_job("workflow", _workflow_job(request.tasks, x_session_id))
+    try:
+        # asyncio.wait does not raise if the job itself was cancelled
+        await asyncio.wait([asyncio.wrap_future(job.future)])
+    except asyncio.CancelledError:
+        job_manager.cancel(job.id)
+        raise
+    
+    if job.result is None and job.status == JOB_CANCELLED:
+        raise HTTPException(status_code=409, detail=f"Workflow job '{job.id}' was cancelled")
+    if job.error is not None:
+        logger.error(f"Error executing workflow: {job.error}")
+        raise HTTPException(status_code=400, detail=job.error)
+    
+    logger.info(f"Workflow execution complete")
+    # job.result is compacted for the job history; this caller gets it in full
+    return safe_json_response(convert_to_json_serializable(job.future.result()))
+
+
+# ============================================================================
+# JOB ENDPOINTS
+# ============================================================================
+
+@app.post("/api/jobs", status_code=202)
+async def submit_job(request: WorkflowRequest, x_session_id: Optional[str] = Header(None)):
+    """Submit a workflow job; returns its id immediately."""
+    _check_session(x_session_id)
+    job = _submit_job("workflow", _workflow_job(request.tasks, x_session_id))
+    return {
+        "job_id": job.id,
+        "status": job.status,
+        "queue_depth": job_manager.queue_depth(),
+        "status_url": f"/api/jobs/{job.id}",
+    }
+
+
+@app.get("/api/jobs")
+async def list_jobs():
+    """List jobs (without results) and queue statistics."""
+    return safe_json_response({
+        "jobs": [convert_to_json_serializable(job.to_dict(include_result=False)) for job in job_manager.list()],
+        "stats": job_manager.stats(),
+    })
+
+
+@app.get("/api/jobs/{job_id}")
+async def get_job(job_id: str, wait: float = 0.0, since: int = -1):
+    """Job status, partial results and (once finished) the result.
+    
+    With wait > 0 the request long-polls: it returns as soon as the job's
+    version exceeds `since` (or it finishes), or after `wait` seconds.
+    """
+    job = _get_job(job_id)
+    if wait > 0:
+        await asyncio.to_thread(job_manager.wait, job_id, since, min(wait, 60.0))
+    return safe_json_response(convert_to_json_serializable(job.to_dict()))
+
+
+async def _job_events(job_id: str, start: int = 0):
+    """Yield (index, event) for a job's stage events from `start` on.
+    
+    Ends with (None, {'event': 'end', ...}) once the job has finished;
+    yields (None, None) when nothing happened for a keep-alive interval.
+    """
+    sent = max(0, start)
+    version = -1
+    while True:
+        job = await asyncio.to_thread(job_manager.wait, job_id, version, EVENT_STREAM_KEEPALIVE_SECONDS)
+        if job.version == version and not job.finished:
+            yield None, None
+            continue
+        version = job.version
+        events = list(job.progress)
+        for index in range(sent, len(events)):
+            yield index, events[index]
+        sent = max(sent, len(events))
+        if job.finished:
+            yield None, {"event": "end", "job_id": job.id, "status": job.status, "error": job.error}
+            return
+
+
+def _encode_event(event: Dict[str, Any]) -> str:
+    return json.dumps(convert_to_json_serializable(event), cls=NaNHandlingEncoder, allow_nan=False)
+
+
+@app.get("/api/jobs/{job_id}/events")
+async def stream_job_events(job_id: str, since: int = 0, last_event_id: Optional[str] = Header(None)):
+    """Stage events of a job as Server-Sent Events.
+    
+    Each event's id is its index in the job's progress list; a client
+    reconnecting with Last-Event-ID (or ?since=) resumes after it.
+    """
+    _get_job(job_id)
+    start = int(last_event_id) + 1 if last_event_id and last_event_id.isdigit() else since
+    
+    async def stream():
+        async for index, event in _job_events(job_id, start):
+            if event is None:
+                yield ": keep-alive\n\n"
+                continue
+            event_id = f"id: {index}\n" if index is not None else ""
+            yield f"{event_id}event: {event.get('event', 'progress')}\ndata: {_encode_event(event)}\n\n"
+    
+    return StreamingResponse(stream(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+
+@app.websocket("/ws/jobs/{job_id}")
+async def job_events_websocket(websocket: WebSocket, job_id: str, since: int = 0):
+    """Stage events of a job over a WebSocket, one JSON message each."""
+    await websocket.accept()
+    try:
+        job_manager.get(job_id)
+    except JobNotFoundError:
+        await websocket.close(code=4404, reason=f"Job '{job_id}' not found")
+        return
+    try:
+        async for index, event in _job_events(job_id, since):
+            if event is not None:
+                await websocket.send_text(_encode_event({**event, "event_index": index}))
+        await websocket.close()
+    except WebSocketDisconnect:
+        logger.info(f"Event stream client disconnected: {job_id}")
+
+
+@app.delete("/api/jobs/{job_id}")
+async def cancel_job(job_id: str):
+    """Cancel a job; running workflows stop before their next task."""
+    job = _get_job(job_id)
+    if job.finished:
+        raise HTTPException(status_code=409, detail=f"Job '{job_id}' already {job.status}")
+    job = job_manager.cancel(job_id)
+    return {"job_id": job.id, "status": job.status, "cancel_requested": job.cancel_requested}
+
+
+# ============================================================================
+# SESSION ENDPOINTS
+# ============================================================================
+
+@app.post("/api/sessions", status_code=201)
+async def create_session():
+    """Open a private workspace; send its id as the X-Session-ID header."""
+    try:
+        return safe_json_response(orchestrator.create_session())
+    except SessionLimitError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+
+
+@app.get("/api/sessions")
+async def session_stats():
+    """Open sessions, their memory use and shared-dataset deduplication."""
+    return safe_json_response(orchestrator.sessions.stats())
+
+
+@app.get("/api/sessions/{session_id}")
+async def get_session(session_id: str):
+    """Session keys and cache statistics."""
+    session = orchestrator.get_session(session_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail=f"Session '{session_id}' not found")
+    return safe_json_response(session)
+
+
+@app.delete("/api/sessions/{session_id}")
+async def close_session(session_id: str):
+    """Close a session and free its cached data."""
+    result = orchestrator.close_session(session_id)
+    if not result["success"]:
+        raise HTTPException(status_code=404, detail=f"Session '{session_id}' not found")
+    return result
+
+
 @app.get("/api/cache/{key}")
-async def get_cached_data(key: str):
+async def get_cached_data(key: str, x_session_id: Optional[str] = Header(None)):
     """Get cached data."""
     try:
         logger.info(f"Retrieving cached data: {key}")
         
-        data = orchestrator.get_cached_data(key)
+        _check_session(x_session_id)
+        data = orchestrator.get_cached_data(key, session_id=x_session_id)
         if data is None:
             raise HTTPException(status_code=404, detail=f"Key '{key}' not found")
         
@@ -665,6 +894,8 @@ async def get_cached_data(key: str):
         logger.info(f"Cached data retrieved successfully")
         
         return safe_json_response({"status": "success", "key": key, "data": str(data)})
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error retrieving cached data: {str(e)}", exc_info=True)
         raise HTTPException(status_code=400, detail=str(e))
@@ -0,0 +1,151 @@
+"""Cancellation tokens - Deadlines and cooperative cancellation.
+
+Python threads cannot be killed, so a runaway stage (an OCSVM fit, an
+ARIMA search) is stopped cooperatively:
+- The orchestrator gives every task a CancellationToken with a deadline;
+  tokens form a tree (workflow -> task), and cancelling or timing out a
+  parent cancels its children
+- The caller stops waiting as soon as the token is cancelled or expires,
+  so its thread-pool slot is free again immediately
+- The token is the current token of the thread running the agent; agents
+  and their workers call checkpoint() between expensive steps, which
+  raises once the task was cancelled and records partial results
+
+Usage:
+    from core.cancellation import CancellationToken, use_token, checkpoint
+
+    token = CancellationToken(timeout=300)
+    with use_token(token):
+        agent.run()                   # inside: checkpoint(lof=lof_result)
+"""
+
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+from core.exceptions import TaskCancelledError, TaskTimeoutError
+
+_current_token: contextvars.ContextVar = contextvars.ContextVar('cancellation_token', default=None)
+
+
+class CancellationToken:
+    """Cancellation flag with an optional deadline and a parent.
+
+    Example:
+        >>> workflow = CancellationToken(timeout=600)
+        >>> task = CancellationToken(timeout=300, parent=workflow)
+        >>> workflow.cancel('Workflow cancelled')
+        >>> task.cancelled
+        True
+    """
+
+    def __init__(self, timeout: Optional[float] = None, parent: Optional['CancellationToken'] = None) -> None:
+        """Create a token.
+
+        Args:
+            timeout: Seconds until the token expires (None or <= 0 = no deadline)
+            parent: Token whose cancellation and deadline also apply
+        """
+        self.parent = parent
+        self.deadline: Optional[float] = time.monotonic() + timeout if timeout and timeout > 0 else None
+        if parent is not None and parent.deadline is not None:
+            self.deadline = parent.deadline if self.deadline is None else min(self.deadline, parent.deadline)
+        self.partial: Dict[str, Any] = {}
+        self._reason: Optional[str] = None
+        self._event = threading.Event()
+
+    @property
+    def timed_out(self) -> bool:
+        """True once the deadline (own or inherited) has passed."""
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    @property
+    def cancelled(self) -> bool:
+        """True once cancelled, timed out, or the parent was cancelled."""
+        return (
+            self._event.is_set()
+            or self.timed_out
+            or (self.parent is not None and self.parent.cancelled)
+        )
+
+    @property
+    def reason(self) -> Optional[str]:
+        if self._reason is not None:
+            return self._reason
+        if self.parent is not None and self.parent.cancelled:
+            return self.parent.reason
+        if self.timed_out:
+            return "Deadline exceeded"
+        return None
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left before the deadline (None = no deadline)."""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    def cancel(self, reason: str = "Cancelled") -> None:
+        """Cancel the token (and every token below it)."""
+        if self._reason is None:
+            self._reason = reason
+        self._event.set()
+
+    def wait(self, seconds: float) -> bool:
+        """Sleep up to seconds, waking early on cancellation; True if cancelled."""
+        end = time.monotonic() + seconds
+        while not self.cancelled:
+            left = end - time.monotonic()
+            if left <= 0:
+                return False
+            self._event.wait(min(left, 0.05))
+        return True
+
+    def report(self, **partial: Any) -> None:
+        """Record partial results, returned if the task is stopped."""
+        self.partial.update(partial)
+
+    def error(self, context: str = "") -> TaskCancelledError:
+        """Exception describing why the token was cancelled."""
+        prefix = f"{context}: " if context else ""
+        partial = dict(self.partial) or None
+        if self.timed_out and not self._event.is_set():
+            return TaskTimeoutError(f"{prefix}{self.reason}", partial_result=partial)
+        return TaskCancelledError(f"{prefix}{self.reason}", partial_result=partial)
+
+    def check(self, context: str = "") -> None:
+        """Raise TaskCancelledError (or TaskTimeoutError) if cancelled."""
+        if self.cancelled:
+            raise self.error(context)
+
+
+def current_token() -> Optional[CancellationToken]:
+    """Token of the task running in this thread, if any."""
+    return _current_token.get()
+
+
+@contextmanager
+def use_token(token: Optional[CancellationToken]) -> Iterator[Optional[CancellationToken]]:
+    """Make token the current token for the duration of the block."""
+    reset = _current_token.set(token)
+    try:
+        yield token
+    finally:
+        _current_token.reset(reset)
+
+
+def checkpoint(**partial: Any) -> None:
+    """Record partial results and stop if the current task was cancelled.
+
+    A no-op outside orchestrated tasks.
+
+    Raises:
+        TaskCancelledError: If the current token is cancelled or expired
+    """
+    token = current_token()
+    if token is None:
+        return
+    if partial:
+        token.report(**partial)
+    token.check()
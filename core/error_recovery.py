@@ -6,6 +6,24 @@ Provides robust error handling with:
 - Graceful degradation
 - Detailed error context
 - Recovery strategies
+- Cancelled and timed-out tasks (TaskCancelledError) are never retried
+
+Retries are classified and budgeted:
+- Only transient errors are retried. Deterministic ones (missing files,
+  bad types, validation/config errors, see NON_RETRYABLE_ERRORS) fail on
+  the first attempt; an exception may set `retryable = True/False` to
+  override
+- Nested retry layers (execute_task -> route -> agent method -> loader)
+  share one RetryBudget: the outermost layer's retries are the total for
+  the whole call, so attempts no longer multiply (3x2x3...). An inner
+  layer that gives up raises RecoveryError, which outer layers pass on
+  without retrying again
+- A retry never sleeps past the deadline: the `deadline` argument or the
+  current task's cancellation token (see core.cancellation), and backoff
+  waits end early when the task is cancelled
+- Coroutine functions get the same logic with `await asyncio.sleep`, so
+  retries never block the event loop (retry_on_error detects them;
+  ErrorRecoveryStrategy.retry_async for lambdas)
 
 Usage:
     from core.error_recovery import ErrorRecoveryStrategy, retry_on_error
@@ -21,23 +39,135 @@ Usage:
         max_attempts=3,
         fallback=None
     )
+    
+    # Async (does not block the event loop):
+    @retry_on_error(max_attempts=3, backoff=2, deadline=10)
+    async def fetch(url):
+        ...
 """
 
+import asyncio
+import contextvars
+import inspect
+import threading
 import time
 import functools
-from typing import Callable, Any, Optional, TypeVar
+from contextlib import contextmanager
+from typing import Awaitable, Callable, Any, Iterator, Optional, TypeVar
 from core.logger import get_logger
+from core.cancellation import current_token
+from core.exceptions import ConfigError, DataValidationError, TaskCancelledError
 
 logger = get_logger(__name__)
 
 T = TypeVar('T')
 
+# ===== CONSTANTS =====
+# Errors that fail the same way every time, so retrying only adds latency
+NON_RETRYABLE_ERRORS = (
+    TaskCancelledError,
+    ConfigError,
+    DataValidationError,
+    FileNotFoundError,
+    IsADirectoryError,
+    NotADirectoryError,
+    PermissionError,
+    TypeError,
+    AttributeError,
+    NotImplementedError,
+    ImportError,
+    MemoryError,
+)
+# Longest single backoff wait in seconds
+MAX_BACKOFF_SECONDS = 30.0
+
 
 class RecoveryError(Exception):
     """Exception raised when all recovery attempts fail."""
     pass
 
 
+def is_retryable(error: BaseException) -> bool:
+    """Whether retrying could help with this error.
+    
+    An explicit `retryable` attribute on the exception wins; otherwise
+    NON_RETRYABLE_ERRORS and RecoveryError (an inner layer already gave
+    up) are not retried. Wrapped errors are classified by the first
+    exception in their __cause__/__context__ chain that decides.
+    """
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        retryable = getattr(error, 'retryable', None)
+        if retryable is not None:
+            return bool(retryable)
+        if isinstance(error, NON_RETRYABLE_ERRORS + (RecoveryError,)):
+            return False
+        # Wrappers (raise OrchestratorError(...) from e) keep the cause's class
+        error = error.__cause__ or (None if error.__suppress_context__ else error.__context__)
+    return True
+
+
+class RetryBudget:
+    """Retries and deadline shared by nested retry layers of one call."""
+    
+    def __init__(self, retries: int, deadline: Optional[float] = None) -> None:
+        """Create a budget.
+        
+        Args:
+            retries: Retries allowed in total, across all layers
+            deadline: time.monotonic() after which nothing is retried
+        """
+        self.retries = max(0, retries)
+        self.deadline = deadline
+        self.used = 0
+        self._lock = threading.Lock()
+    
+    def remaining(self) -> Optional[float]:
+        """Seconds before the deadline (None = no deadline)."""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+    
+    def take(self, wait_time: float) -> bool:
+        """Claim one retry after waiting wait_time; False if none is left or the wait would pass the deadline."""
+        remaining = self.remaining()
+        if remaining is not None and wait_time >= remaining:
+            return False
+        with self._lock:
+            if self.used >= self.retries:
+                return False
+            self.used += 1
+            return True
+
+
+_retry_budget: contextvars.ContextVar = contextvars.ContextVar('retry_budget', default=None)
+
+
+def current_budget() -> Optional[RetryBudget]:
+    """Budget of the outermost retry layer running in this context, if any."""
+    return _retry_budget.get()
+
+
+@contextmanager
+def _budget_scope(max_attempts: int, deadline: Optional[float]) -> Iterator[RetryBudget]:
+    """Join the enclosing budget, or open one for an outermost retry layer."""
+    budget = _retry_budget.get()
+    if budget is not None:
+        yield budget
+        return
+    absolute = time.monotonic() + deadline if deadline and deadline > 0 else None
+    token = current_token()
+    if token is not None and token.deadline is not None:
+        absolute = token.deadline if absolute is None else min(absolute, token.deadline)
+    budget = RetryBudget(max_attempts - 1, absolute)
+    reset = _retry_budget.set(budget)
+    try:
+        yield budget
+    finally:
+        _retry_budget.reset(reset)
+
+
 class ErrorRecoveryStrategy:
     """Provides retry logic, timeouts, and graceful degradation."""
     
@@ -50,6 +180,7 @@ class ErrorRecoveryStrategy:
         fallback: Optional[T] = None,
         on_error: Optional[Callable] = None,
         context: Optional[str] = None,
+        deadline: Optional[float] = None,
     ) -> T:
         """Retry a function with exponential backoff.
         
@@ -61,53 +192,139 @@ class ErrorRecoveryStrategy:
             fallback: Value to return if all retries fail
             on_error: Callback function for errors
             context: Context string for logging
+            deadline: Seconds all attempts may take (the current task's
+                deadline also applies)
             
         Returns:
             Function result or fallback value
             
         Raises:
             RecoveryError: If all retries fail and no fallback provided
+            TaskCancelledError: If the current task was cancelled
         """
-        last_exception = None
-        context_str = f" ({context})" if context else ""
+        with _budget_scope(max_attempts, deadline) as budget:
+            for attempt in range(max_attempts):
+                try:
+                    if timeout:
+                        return ErrorRecoveryStrategy._execute_with_timeout(func, timeout)
+                    else:
+                        return func()
+                
+                except TaskCancelledError:
+                    # Retrying cannot help once the task was cancelled or its deadline passed
+                    raise
+                
+                except Exception as e:
+                    wait_time = ErrorRecoveryStrategy._next_wait(e, attempt, max_attempts, backoff, budget)
+                    if wait_time is None:
+                        return ErrorRecoveryStrategy._give_up(e, attempt, fallback, on_error, context)
+                    ErrorRecoveryStrategy._log_retry(e, attempt, max_attempts, wait_time, context)
+                    ErrorRecoveryStrategy._wait(wait_time)
+    
+    @staticmethod
+    async def retry_async(
+        func: Callable[[], Awaitable[T]],
+        max_attempts: int = 3,
+        backoff: int = 2,
+        fallback: Optional[T] = None,
+        on_error: Optional[Callable] = None,
+        context: Optional[str] = None,
+        deadline: Optional[float] = None,
+    ) -> T:
+        """Async retry(): awaits func() and backs off without blocking the event loop.
         
-        for attempt in range(max_attempts):
-            try:
-                if timeout:
-                    return ErrorRecoveryStrategy._execute_with_timeout(func, timeout)
-                else:
-                    return func()
+        Args:
+            func: Zero-argument function returning an awaitable
+            max_attempts, backoff, fallback, on_error, context, deadline: As in retry()
+            
+        Returns:
+            Awaited result or fallback value
             
-            except Exception as e:
-                last_exception = e
+        Raises:
+            RecoveryError: If all retries fail and no fallback provided
+        """
+        with _budget_scope(max_attempts, deadline) as budget:
+            for attempt in range(max_attempts):
+                try:
+                    return await func()
                 
-                if attempt == max_attempts - 1:
-                    # Last attempt failed
-                    if on_error:
-                        try:
-                            on_error(e, attempt, context)
-                        except Exception as callback_error:
-                            logger.warning(f"Error in on_error callback: {callback_error}")
-                    
-                    if fallback is not None:
-                        logger.warning(
-                            f"All {max_attempts} retry attempts failed{context_str}. "
-                            f"Using fallback value. Last error: {e}"
-                        )
-                        return fallback
-                    
-                    error_msg = f"Recovery failed after {max_attempts} attempts{context_str}: {e}"
-                    logger.error(error_msg)
-                    raise RecoveryError(error_msg) from e
+                except TaskCancelledError:
+                    raise
                 
-                # Calculate backoff
-                wait_time = backoff ** attempt
-                logger.warning(
-                    f"Attempt {attempt + 1}/{max_attempts} failed{context_str}. "
-                    f"Error: {type(e).__name__}: {e}. "
-                    f"Retrying in {wait_time}s..."
-                )
-                time.sleep(wait_time)
+                except Exception as e:
+                    wait_time = ErrorRecoveryStrategy._next_wait(e, attempt, max_attempts, backoff, budget)
+                    if wait_time is None:
+                        return ErrorRecoveryStrategy._give_up(e, attempt, fallback, on_error, context)
+                    ErrorRecoveryStrategy._log_retry(e, attempt, max_attempts, wait_time, context)
+                    await asyncio.sleep(wait_time)
+    
+    @staticmethod
+    def _next_wait(
+        error: Exception,
+        attempt: int,
+        max_attempts: int,
+        backoff: float,
+        budget: RetryBudget
+    ) -> Optional[float]:
+        """Backoff before the next attempt, or None to give up now."""
+        if attempt >= max_attempts - 1 or not is_retryable(error):
+            return None
+        wait_time = min(float(backoff ** attempt), MAX_BACKOFF_SECONDS)
+        token = current_token()
+        if token is not None and token.deadline is not None and wait_time >= token.remaining():
+            return None  # The task would time out while backing off
+        return wait_time if budget.take(wait_time) else None
+    
+    @staticmethod
+    def _give_up(
+        error: Exception,
+        attempt: int,
+        fallback: Optional[T],
+        on_error: Optional[Callable],
+        context: Optional[str]
+    ) -> T:
+        """Return the fallback or raise RecoveryError after the last attempt."""
+        context_str = f" ({context})" if context else ""
+        attempts = attempt + 1
+        if on_error:
+            try:
+                on_error(error, attempt, context)
+            except Exception as callback_error:
+                logger.warning(f"Error in on_error callback: {callback_error}")
+        
+        if fallback is not None:
+            logger.warning(
+                f"All {attempts} retry attempts failed{context_str}. "
+                f"Using fallback value. Last error: {error}"
+            )
+            return fallback
+        
+        if isinstance(error, RecoveryError):
+            # An inner layer already gave up and logged it
+            raise error
+        reason = "" if is_retryable(error) else " (not retryable)"
+        error_msg = f"Recovery failed after {attempts} attempts{context_str}{reason}: {error}"
+        logger.error(error_msg)
+        raise RecoveryError(error_msg) from error
+    
+    @staticmethod
+    def _log_retry(error: Exception, attempt: int, max_attempts: int, wait_time: float, context: Optional[str]) -> None:
+        context_str = f" ({context})" if context else ""
+        logger.warning(
+            f"Attempt {attempt + 1}/{max_attempts} failed{context_str}. "
+            f"Error: {type(error).__name__}: {error}. "
+            f"Retrying in {wait_time:g}s..."
+        )
+    
+    @staticmethod
+    def _wait(wait_time: float) -> None:
+        """Back off; ends early (raising) if the current task is cancelled."""
+        token = current_token()
+        if token is None:
+            time.sleep(wait_time)
+            return
+        if token.wait(wait_time):
+            token.check("Retry backoff")
     
     @staticmethod
     def _execute_with_timeout(
@@ -174,14 +391,16 @@ def retry_on_error(
     backoff: int = 2,
     timeout: Optional[int] = None,
     fallback: Optional[Any] = None,
+    deadline: Optional[float] = None,
 ):
-    """Decorator for retry logic.
+    """Decorator for retry logic (sync or async functions).
     
     Args:
         max_attempts: Number of attempts
         backoff: Backoff multiplier
-        timeout: Timeout per attempt
+        timeout: Timeout per attempt (sync functions only)
         fallback: Fallback value
+        deadline: Seconds all attempts may take
         
     Returns:
         Decorated function
@@ -192,6 +411,19 @@ def retry_on_error(
             return pd.read_csv(path)
     """
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs) -> T:
+                return await ErrorRecoveryStrategy.retry_async(
+                    lambda: func(*args, **kwargs),
+                    max_attempts=max_attempts,
+                    backoff=backoff,
+                    fallback=fallback,
+                    context=func.__name__,
+                    deadline=deadline,
+                )
+            return async_wrapper
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> T:
             return ErrorRecoveryStrategy.retry(
@@ -201,6 +433,7 @@ def retry_on_error(
                 timeout=timeout,
                 fallback=fallback,
                 context=func.__name__,
+                deadline=deadline,
             )
         return wrapper
     return decorator
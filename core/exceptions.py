@@ -59,3 +59,21 @@ class AnomalyDetectionError(GOATException):
 class ReportGenerationError(GOATException):
     """Raised when report generation fails."""
     pass
+
+
+class InvalidTaskError(OrchestratorError):
+    """Raised when a task cannot run as configured (bad type, missing parameters or data)."""
+    retryable = False
+
+
+class TaskCancelledError(OrchestratorError):
+    """Raised when a task is cancelled before it finishes."""
+
+    def __init__(self, message: str, partial_result=None):
+        super().__init__(message)
+        self.partial_result = partial_result
+
+
+class TaskTimeoutError(TaskCancelledError):
+    """Raised when a task or workflow exceeds its deadline."""
+    pass
@@ -0,0 +1,222 @@
+"""Shared Dataset - Read-only DataFrame handle passed between agents.
+
+A workflow loads its dataset once and every agent works on a view of it
+instead of its own ``df.copy()``:
+- view() returns a shallow DataFrame sharing the column buffers, O(columns)
+- Numeric buffers are marked read-only for the dataset and its views, so an
+  in-place write (``view.loc[i, c] = x``) can never change the data seen by
+  every other agent: it raises, or under copy-on-write (pandas 3) only
+  changes a private copy of that view's column
+- Replacing or adding a column on a view (``view['c'] = ...``) only changes
+  that view: copy-on-write at column granularity
+- to_ipc()/open_ipc() store the dataset as an Arrow IPC file and memory-map
+  it back, so numeric columns live in shared, OS-evictable page cache
+- fingerprint() hashes the content once, for keying memoized results
+
+Usage:
+    from core.shared_dataset import SharedDataset, frame_for_agent
+
+    shared = SharedDataset(loader_result['data'], name='sales.csv')
+    agent.set_data(shared)          # agent keeps shared.view()
+"""
+
+import hashlib
+import threading
+from pathlib import Path
+from typing import Any, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class SharedDataset:
+    """Read-only dataset shared by reference between agents.
+
+    Wrapping takes ownership of the frame's buffers (they are shared, not
+    copied), so the original DataFrame should be treated as handed over.
+    The wrapper freezes its own views of the numeric buffers; the caller's
+    frame is left writable. Object (string) and extension-array columns
+    are shared the same way but are not frozen.
+
+    Example:
+        >>> shared = SharedDataset(df, name='sales')
+        >>> view = shared.view()
+        >>> view['margin'] = view['revenue'] - view['cost']  # only this view
+        >>> view.loc[0, 'revenue'] = 0  # raises, or copies the column (pandas 3)
+    """
+
+    def __init__(self, df: pd.DataFrame, name: str = 'dataset') -> None:
+        """Wrap a DataFrame.
+
+        Args:
+            df: Dataset to share
+            name: Label for logs and status (e.g. source file name)
+
+        Raises:
+            TypeError: If df is not a DataFrame
+        """
+        if not isinstance(df, pd.DataFrame):
+            raise TypeError(f"Expected DataFrame, got {type(df).__name__}")
+
+        self.name = name
+        self.path: Optional[Path] = None  # Arrow IPC file when memory-mapped
+        self._frame = df.copy(deep=False)
+        self._lock = threading.Lock()
+        self._fingerprint: Optional[str] = None
+        self.views_created = 0
+        _freeze(self._frame)
+
+        logger.info(f"Shared dataset '{name}': {df.shape[0]} rows, {df.shape[1]} columns")
+
+    @property
+    def shape(self):
+        """(rows, columns) of the dataset."""
+        return self._frame.shape
+
+    @property
+    def columns(self) -> pd.Index:
+        """Column labels."""
+        return self._frame.columns
+
+    @property
+    def is_memory_mapped(self) -> bool:
+        """True when the buffers come from a memory-mapped Arrow file."""
+        return self.path is not None
+
+    def __len__(self) -> int:
+        return len(self._frame)
+
+    def __repr__(self) -> str:
+        backing = f"mmap:{self.path}" if self.path else "memory"
+        return f"SharedDataset(name={self.name!r}, shape={self.shape}, backing={backing})"
+
+    def view(self) -> pd.DataFrame:
+        """Get a zero-copy DataFrame view.
+
+        Returns:
+            Shallow DataFrame over the shared, read-only buffers
+        """
+        with self._lock:
+            self.views_created += 1
+        return self._frame.copy(deep=False)
+
+    def fingerprint(self) -> str:
+        """Content hash of the dataset (computed once; the data is immutable).
+
+        Covers column names, dtypes, index and values, so reloading an
+        unchanged file gives the same fingerprint.
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        with self._lock:
+            if self._fingerprint is None:
+                digest = hashlib.sha256()
+                digest.update(repr([(str(col), str(dtype)) for col, dtype in self._frame.dtypes.items()]).encode())
+                digest.update(pd.util.hash_pandas_object(self._frame, index=True).values.tobytes())
+                self._fingerprint = digest.hexdigest()
+            return self._fingerprint
+
+    def nbytes(self) -> int:
+        """Shallow memory footprint of the shared buffers in bytes."""
+        return int(self._frame.memory_usage(index=True, deep=False).sum())
+
+    def to_ipc(self, path: Union[str, Path]) -> Path:
+        """Write the dataset to an uncompressed Arrow IPC file.
+
+        Args:
+            path: Destination file
+
+        Returns:
+            Path written
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        import pyarrow as pa
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        table = pa.Table.from_pandas(self._frame, preserve_index=True)
+        with pa.OSFile(str(path), 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        return path
+
+    @classmethod
+    def open_ipc(cls, path: Union[str, Path], name: Optional[str] = None) -> 'SharedDataset':
+        """Memory-map an Arrow IPC file as a shared dataset.
+
+        Numeric columns without nulls are used straight from the mapped
+        pages; other columns are converted once.
+
+        Args:
+            path: Arrow IPC file written by to_ipc()
+            name: Label (defaults to the file stem)
+
+        Returns:
+            SharedDataset backed by the mapped file
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        import pyarrow as pa
+
+        path = Path(path)
+        source = pa.memory_map(str(path), 'r')
+        table = pa.ipc.open_file(source).read_all()
+        shared = cls(table.to_pandas(split_blocks=True), name=name or path.stem)
+        shared.path = path
+        return shared
+
+    def memory_map(self, path: Union[str, Path]) -> 'SharedDataset':
+        """Move the dataset into a memory-mapped Arrow file.
+
+        Args:
+            path: Arrow IPC file to write
+
+        Returns:
+            New SharedDataset backed by the file (this one can be dropped)
+        """
+        return self.open_ipc(self.to_ipc(path), name=self.name)
+
+
+def frame_for_agent(data: Any, copy: bool = True) -> Any:
+    """DataFrame an agent may keep from set_data() input.
+
+    Args:
+        data: SharedDataset, DataFrame or anything else
+        copy: Copy plain DataFrames (agents that may mutate their data)
+
+    Returns:
+        A view of a SharedDataset, a copy (or the frame itself when
+        copy=False) of a DataFrame; other input is returned unchanged so
+        the agent's own type checks still apply
+    """
+    if isinstance(data, SharedDataset):
+        return data.view()
+    if copy and isinstance(data, pd.DataFrame):
+        return data.copy()
+    return data
+
+
+def _freeze(df: pd.DataFrame) -> None:
+    """Mark the frame's non-object numpy buffers read-only.
+
+    Each block gets a fresh read-only view of its buffer, so only this
+    frame (and views taken from it) are frozen; a frame it was shallow
+    copied from keeps its own writable array objects.
+
+    Object columns stay writable: several pandas Cython routines
+    (memory_usage, factorize) reject read-only object buffers.
+    """
+    for block in df._mgr.blocks:
+        values = block.values
+        if isinstance(values, np.ndarray) and values.dtype != object:
+            frozen = values.view()
+            frozen.flags.writeable = False
+            block.values = frozen
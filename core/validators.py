@@ -27,6 +27,7 @@ import numpy as np
 from typing import Any, Dict, List, Callable, Optional, Union, Type
 from functools import wraps
 from core.logger import get_logger
+from core.shared_dataset import SharedDataset
 
 logger = get_logger(__name__)
 
@@ -44,6 +45,11 @@ class DataValidator:
         """Check if object is a pandas DataFrame."""
         return isinstance(obj, pd.DataFrame)
     
+    @staticmethod
+    def is_dataset(obj: Any) -> bool:
+        """Check if object is a DataFrame or a SharedDataset."""
+        return isinstance(obj, (pd.DataFrame, SharedDataset))
+    
     @staticmethod
     def is_series(obj: Any) -> bool:
         """Check if object is a pandas Series."""
@@ -130,6 +136,7 @@ class DataValidator:
         """
         validators = {
             'dataframe': cls.is_dataframe,
+            'dataset': cls.is_dataset,
             'series': cls.is_series,
             'list': cls.is_list,
             'dict': cls.is_dict,
@@ -0,0 +1,155 @@
+"""Tests for task deadlines and cooperative cancellation."""
+
+import time
+
+import pandas as pd
+import pytest
+
+from core.cancellation import CancellationToken, checkpoint, current_token, use_token
+from core.exceptions import TaskCancelledError, TaskTimeoutError
+from agents.orchestrator import AgentRegistry, DataManager, TaskRouter
+from agents.orchestrator.workers.result_cache import ResultCache
+from agents.orchestrator.workers.workflow_dag import WorkflowDAG, STATUS_CANCELLED, STATUS_SKIPPED, STATUS_TIMED_OUT
+
+
+class SlowDetector:
+    """Stand-in detector that reports partial results between slow steps."""
+
+    name = "anomaly_detector"
+
+    def __init__(self, step_seconds=0.1, steps=20):
+        self.step_seconds = step_seconds
+        self.steps = steps
+        self.calls = 0
+        self.stopped_at = None
+
+    def set_data(self, data):
+        self.data = data
+
+    def isolation_forest_detection(self, columns):
+        self.calls += 1
+        for step in range(self.steps):
+            try:
+                checkpoint(steps_done=step)
+            except TaskCancelledError:
+                self.stopped_at = step
+                raise
+            time.sleep(self.step_seconds)
+        return {"status": "success", "steps_done": self.steps}
+
+
+def make_router(agent):
+    registry = AgentRegistry()
+    registry.register("anomaly_detector", agent)
+    manager = DataManager(max_mb=0)
+    manager.set("loaded_data", pd.DataFrame({"x": range(10)}))
+    return TaskRouter(registry, manager, result_cache=ResultCache(max_entries=0))
+
+
+class TestCancellationToken:
+    """Deadlines, parents and partial results."""
+
+    def test_deadline_and_parent(self):
+        parent = CancellationToken()
+        child = CancellationToken(timeout=60, parent=parent)
+        assert not child.cancelled and child.remaining() > 59
+
+        parent.cancel("Stopped by user")
+        assert child.cancelled and child.reason == "Stopped by user"
+        assert type(child.error()) is TaskCancelledError
+
+        expired = CancellationToken(timeout=0.01)
+        expired.report(rows=5)
+        time.sleep(0.02)
+        error = expired.error("stage")
+        assert isinstance(error, TaskTimeoutError) and error.partial_result == {"rows": 5}
+
+    def test_checkpoint_outside_tasks_is_noop(self):
+        assert current_token() is None
+        checkpoint(anything=1)
+
+        token = CancellationToken()
+        with use_token(token):
+            checkpoint(done=1)
+            token.cancel()
+            with pytest.raises(TaskCancelledError):
+                checkpoint()
+        assert token.partial == {"done": 1}
+
+
+def test_route_times_out_promptly_with_partial_result():
+    agent = SlowDetector()
+    router = make_router(agent)
+
+    started = time.perf_counter()
+    with pytest.raises(TaskTimeoutError) as info:
+        router.route({"type": "detect_anomalies", "parameters": {"method": "isolation_forest"}, "timeout": 0.25})
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 1.0
+    assert info.value.partial_result["steps_done"] >= 1
+    assert agent.calls == 1  # timeouts are never retried
+    time.sleep(0.2)
+    assert agent.stopped_at is not None  # the abandoned thread stopped too
+
+
+def test_workflow_deadline_cancels_running_and_pending_tasks():
+    agent = SlowDetector()
+    router = make_router(agent)
+    tasks = [
+        {"type": "detect_anomalies", "parameters": {"method": "isolation_forest"}, "timeout": 0},
+        {"type": "narrative"},
+        {"type": "report", "depends_on": ["detect_anomalies"]},
+    ]
+    dag = WorkflowDAG(tasks)
+
+    started = time.perf_counter()
+    records = dag.run(router.route, max_workers=2, timeout=0.3)
+
+    assert time.perf_counter() - started < 1.0
+    assert dag.timed_out and not dag.cancelled
+    assert records[0].status == STATUS_TIMED_OUT
+    assert records[0].result["steps_done"] >= 1
+    assert records[1].status == STATUS_CANCELLED
+    assert records[2].status in (STATUS_SKIPPED, STATUS_CANCELLED)
+
+
+class UninterruptibleDetector(SlowDetector):
+    """Stand-in detector whose whole run is one fit without checkpoints."""
+
+    def __init__(self, fit_seconds=0.4):
+        super().__init__()
+        self.fit_seconds = fit_seconds
+        self.active = 0
+        self.max_active = 0
+
+    def isolation_forest_detection(self, columns):
+        self.calls += 1
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        time.sleep(self.fit_seconds)
+        self.active -= 1
+        return {"status": "success"}
+
+
+def test_abandoned_task_keeps_agent_reserved():
+    agent = UninterruptibleDetector()
+    router = make_router(agent)
+    task = {"type": "detect_anomalies", "parameters": {"method": "isolation_forest"}, "use_cache": False}
+
+    with pytest.raises(TaskTimeoutError):
+        router.route({**task, "timeout": 0.1})
+    assert agent.active == 1  # still fitting on the abandoned thread
+
+    started = time.perf_counter()
+    assert router.route({**task, "timeout": 0})["status"] == "success"
+    assert time.perf_counter() - started >= 0.2  # waited for the abandoned fit
+    assert agent.calls == 2 and agent.max_active == 1
+
+    # A task whose deadline passes while it waits for the agent never starts
+    with pytest.raises(TaskTimeoutError):
+        router.route({**task, "timeout": 0.1})
+    with pytest.raises(TaskTimeoutError):
+        router.route({**task, "timeout": 0.1})
+    time.sleep(0.5)
+    assert agent.calls == 3
@@ -0,0 +1,141 @@
+"""Tests for chunked CSV streaming and incremental quality metrics."""
+
+import pandas as pd
+import numpy as np
+import pytest
+
+from agents.data_loader import DataLoader
+from agents.data_loader.workers import CSVStreaming, StreamingQualityAccumulator
+
+
+@pytest.fixture
+def csv_with_issues(tmp_path):
+    """CSV with nulls and duplicates spread across chunk boundaries."""
+    df = pd.DataFrame({
+        "id": [1, 2, 3, 4, 1, 2, 7, 8, 9, 10],
+        "value": [10.0, np.nan, 30.0, 40.0, 10.0, np.nan, 70.0, np.nan, 90.0, 100.0],
+        "label": ["a", "b", "c", "d", "a", "b", "g", "h", None, "j"],
+    })
+    path = tmp_path / "issues.csv"
+    df.to_csv(path, index=False)
+    return path, df
+
+
+class TestStreamingQualityAccumulator:
+    """Incremental metrics must match whole-frame metrics."""
+
+    def test_metrics_match_full_frame(self, csv_with_issues):
+        path, df = csv_with_issues
+        acc = StreamingQualityAccumulator()
+        for chunk in pd.read_csv(path, chunksize=3):
+            acc.update(chunk)
+
+        full = pd.read_csv(path)
+        metrics = acc.metrics()
+        assert metrics["rows"] == len(full)
+        assert metrics["null_count"] == int(full.isna().sum().sum())
+        assert metrics["duplicates"] == int(full.duplicated().sum())
+        assert metrics["chunks"] == 4
+
+    def test_duplicates_across_many_chunks(self):
+        rng = np.random.default_rng(0)
+        full = pd.DataFrame({"a": rng.integers(0, 50, 2000), "b": rng.integers(0, 20, 2000)})
+        acc = StreamingQualityAccumulator()
+        for start in range(0, len(full), 37):
+            acc.update(full.iloc[start:start + 37])
+        assert acc.metrics()["duplicates"] == int(full.duplicated().sum())
+        # Hash runs stay few and disjoint instead of one array re-sorted per chunk
+        assert len(acc._hash_runs) <= 12
+        assert sum(len(run) for run in acc._hash_runs) == len(full) - int(full.duplicated().sum())
+
+    def test_dtype_promotion_across_chunks(self):
+        acc = StreamingQualityAccumulator()
+        acc.update(pd.DataFrame({"x": [1, 2]}))
+        acc.update(pd.DataFrame({"x": [1.5, np.nan]}))
+        assert acc.metrics()["column_dtypes"]["x"] == "float64"
+
+    def test_empty_accumulator(self):
+        metrics = StreamingQualityAccumulator().metrics()
+        assert metrics["valid"] is False
+        assert metrics["rows"] == 0
+
+
+class TestCSVStreaming:
+    """Tests for CSVStreaming chunked reading."""
+
+    def test_iter_chunks_bounded_by_chunksize(self, csv_with_issues):
+        path, df = csv_with_issues
+        worker = CSVStreaming()
+        sizes = [len(c) for c in worker.iter_chunks(str(path), chunksize=4)]
+        assert sizes == [4, 4, 2]
+
+    def test_iter_chunks_rejects_bad_chunksize(self, csv_with_issues):
+        path, _ = csv_with_issues
+        worker = CSVStreaming()
+        with pytest.raises(ValueError, match="chunksize"):
+            list(worker.iter_chunks(str(path), chunksize=0))
+
+    def test_execute_collects_and_reports_metrics(self, csv_with_issues):
+        path, df = csv_with_issues
+        result = CSVStreaming().safe_execute(file_path=str(path), chunksize=3)
+        assert result.success
+        assert len(result.data) == len(df)
+        assert result.metadata["chunks"] == 4
+        assert result.metadata["duplicates"] == 2
+
+    def test_execute_metrics_only(self, csv_with_issues):
+        path, df = csv_with_issues
+        result = CSVStreaming().safe_execute(file_path=str(path), chunksize=3, collect=False)
+        assert result.success
+        assert result.data is None
+        assert result.rows_processed == len(df)
+        assert result.metadata["collected"] is False
+
+    def test_execute_without_duplicate_tracking(self, csv_with_issues):
+        path, _ = csv_with_issues
+        result = CSVStreaming().safe_execute(file_path=str(path), chunksize=3, track_duplicates=False)
+        assert result.success
+        assert result.metadata["duplicates"] is None
+
+
+def test_dataloader_stream(csv_with_issues):
+    """DataLoader.stream yields chunks without storing loaded_data."""
+    path, df = csv_with_issues
+    loader = DataLoader()
+    acc = StreamingQualityAccumulator()
+    total = sum(len(c) for c in loader.stream(str(path), chunksize=5, accumulator=acc))
+    assert total == len(df)
+    assert acc.metrics()["rows"] == len(df)
+    assert loader.loaded_data is None
+
+    acc = StreamingQualityAccumulator()
+    list(loader.stream(str(path), chunksize=5, accumulator=acc, track_duplicates=False))
+    assert acc.metrics()["duplicates"] is None
+    assert acc.metrics()["rows"] == len(df)
+
+
+def test_chunked_tier_applies_dtype_optimization(tmp_path):
+    """optimize_dtypes gives the chunked tier the same dtypes as the in-memory tier."""
+    n = 3000
+    df = pd.DataFrame({
+        "id": np.arange(n),
+        "small": np.arange(n) % 100,
+        "region": np.array(["north", "south", "east", "west"])[np.arange(n) % 4],
+        "when": pd.date_range("2024-01-01", periods=n, freq="h").astype(str),
+    })
+    # A category that only appears after the first chunk
+    df.loc[n - 1, "region"] = "central"
+    path = tmp_path / "wide.csv"
+    df.to_csv(path, index=False)
+
+    in_memory = DataLoader().load(str(path), optimize_dtypes=True, load_tier="in_memory")
+    chunked = DataLoader().load(str(path), optimize_dtypes=True, load_tier="chunked")
+    assert chunked["status"] in ("success", "warning")
+    assert chunked["data"].dtypes.astype(str).to_dict() == in_memory["data"].dtypes.astype(str).to_dict()
+    assert chunked["metadata"]["dtypes_optimized"] is True
+
+    result = CSVStreaming().safe_execute(file_path=str(path), chunksize=100, optimize_dtypes=True, sample_rows=500)
+    assert isinstance(result.data["region"].dtype, pd.CategoricalDtype)
+    assert set(result.data["region"].cat.categories) == {"north", "south", "east", "west", "central"}
+    assert result.data["small"].tolist() == df["small"].tolist()
+    assert "memory_saved_mb" in result.metadata
@@ -0,0 +1,88 @@
+"""Tests for the memory-budgeted DataManager cache."""
+
+import pandas as pd
+import pytest
+
+from core.shared_dataset import SharedDataset
+from agents.orchestrator import DataManager
+from agents.orchestrator.workers.data_manager import measure
+
+
+def frame(n, seed=0):
+    return pd.DataFrame({"a": range(seed, seed + n), "b": [float(i) for i in range(n)]})
+
+
+@pytest.fixture
+def manager(tmp_path):
+    # Room for roughly two 10k-row frames
+    one = measure(frame(10_000))
+    mb = (one * 2.5) / 1024 / 1024
+    return DataManager(max_mb=mb, spill_dir=str(tmp_path / "spill"))
+
+
+class TestMemoryBudget:
+    """Accounting, LRU eviction and transparent reload."""
+
+    def test_sizes_are_accounted(self, manager):
+        manager.set("a", frame(10_000))
+        assert manager.get_stats()["memory_bytes"] == measure(frame(10_000))
+
+        manager.delete("a")
+        assert manager.get_stats()["memory_bytes"] == 0
+
+    def test_lru_entry_spills_and_reloads(self, manager):
+        manager.set("a", frame(10_000, 0))
+        manager.set("b", frame(10_000, 1))
+        manager.get("a")  # b is now least recently used
+        manager.set("c", frame(10_000, 2))
+
+        stats = manager.get_stats()
+        assert stats["spilled"] == 1 and stats["evictions"] == 1
+        assert "b" not in manager.cache and manager.exists("b")
+        assert manager.get_count() == 3
+
+        reloaded = manager.get("b")
+        pd.testing.assert_frame_equal(reloaded, frame(10_000, 1))
+        assert manager.get_stats()["reloads"] == 1
+        assert manager.get_stats()["memory_bytes"] <= manager.max_bytes
+
+    def test_non_dataframe_results_spill_via_pickle(self, manager):
+        manager.set("result", {"rows": list(range(50_000))})
+        manager.set("a", frame(10_000))
+        manager.set("b", frame(10_000))
+
+        assert "result" in manager.spilled
+        assert manager.spilled["result"].file_format == "pickle"
+        assert manager.get("result") == {"rows": list(range(50_000))}
+
+    def test_shared_dataset_spills_to_arrow(self, manager):
+        manager.set("loaded_data", SharedDataset(frame(10_000), name="sales"))
+        manager.set("a", frame(10_000))
+        manager.set("b", frame(10_000))
+
+        assert manager.spilled["loaded_data"].file_format == "arrow"
+        dataset = manager.get("loaded_data")
+        assert isinstance(dataset, SharedDataset) and dataset.name == "sales"
+        pd.testing.assert_frame_equal(dataset.view(), frame(10_000))
+
+    def test_zero_budget_is_unlimited(self, tmp_path):
+        manager = DataManager(max_mb=0, spill_dir=str(tmp_path))
+        for i in range(5):
+            manager.set(str(i), frame(10_000, i))
+        assert manager.get_stats()["spilled"] == 0
+
+    def test_clear_removes_spill_files(self, manager, tmp_path):
+        for key in "abc":
+            manager.set(key, frame(10_000))
+        assert any((tmp_path / "spill").iterdir())
+
+        manager.clear()
+        assert manager.get_count() == 0
+        assert not any((tmp_path / "spill").iterdir())
+
+    def test_hits_and_misses(self, manager):
+        manager.set("a", frame(10))
+        manager.get("a")
+        manager.get("missing")
+        stats = manager.get_stats()
+        assert stats["hits"] == 1 and stats["misses"] == 1
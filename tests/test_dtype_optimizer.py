@@ -0,0 +1,87 @@
+"""Tests for load-time dtype inference and downcasting."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from agents.data_loader import DataLoader
+from agents.data_loader.workers import CSVLoaderWorker, DtypeOptimizer
+
+
+@pytest.fixture
+def catalog_csv(tmp_path):
+    """Product-catalog style CSV: ids, low-cardinality strings, sparse ints."""
+    n = 2000
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        "product_id": [f"{i:032x}" for i in range(n)],
+        "category": rng.choice(["toys", "books", "garden", "tools"], n),
+        "photos_qty": rng.integers(1, 10, n).astype(float),
+        "weight_g": rng.integers(0, 40_000, n),
+        "price": rng.random(n) * 100,
+        "created_at": pd.date_range("2024-01-01", periods=n, freq="h").astype(str),
+    })
+    df.loc[::7, "photos_qty"] = np.nan
+    path = tmp_path / "catalog.csv"
+    df.to_csv(path, index=False)
+    return path
+
+
+class TestDtypeOptimizer:
+    """Unit tests for DtypeOptimizer."""
+
+    def test_infers_category_and_datetime(self, catalog_csv):
+        sample = pd.read_csv(catalog_csv, nrows=500)
+        hints = DtypeOptimizer.infer_read_options(sample)
+        assert hints["dtype"] == {"category": "category"}
+        assert hints["parse_dates"] == ["created_at"]
+
+    def test_high_cardinality_strings_stay_object(self):
+        sample = pd.DataFrame({"id": [f"id-{i}" for i in range(100)]})
+        assert DtypeOptimizer.infer_read_options(sample)["dtype"] == {}
+
+    def test_downcast_is_lossless(self):
+        df = pd.DataFrame({
+            "small": [1, 2, 3],
+            "negative": [-1, 0, 100],
+            "sparse_int": [1.0, np.nan, 3.0],
+            "half": [0.5, 1.25, np.nan],
+            "precise": [0.1, 0.2, 0.3],
+        })
+        out, changes = DtypeOptimizer.downcast(df)
+        assert out["small"].dtype == np.uint8
+        assert out["negative"].dtype == np.int8
+        assert str(out["sparse_int"].dtype) == "Int8"
+        assert out["half"].dtype == np.float32
+        # 0.1 is not representable in float32, so it must stay float64
+        assert out["precise"].dtype == np.float64
+        assert "precise" not in changes
+        pd.testing.assert_frame_equal(out.astype("float64"), df.astype("float64"))
+
+
+class TestOptimizedLoad:
+    """CSVLoaderWorker / DataLoader optimize_dtypes mode."""
+
+    def test_worker_reports_memory_saving(self, catalog_csv):
+        result = CSVLoaderWorker().safe_execute(file_path=str(catalog_csv), optimize_dtypes=True)
+        assert result.success
+        meta = result.metadata
+        assert meta["dtypes_optimized"] is True
+        assert meta["memory_usage_mb"] < meta["memory_usage_unoptimized_mb"]
+        assert meta["memory_saved_pct"] > 0
+        text_dtype = pd.read_csv(catalog_csv, nrows=1)["category"].dtype
+        assert meta["dtype_changes"]["category"] == f"{text_dtype}->category"
+        assert str(result.data["photos_qty"].dtype) == "Int8"
+        assert pd.api.types.is_datetime64_any_dtype(result.data["created_at"])
+
+    def test_default_load_unchanged(self, catalog_csv):
+        result = CSVLoaderWorker().safe_execute(file_path=str(catalog_csv))
+        assert result.data["category"].dtype == pd.read_csv(catalog_csv)["category"].dtype
+        assert not isinstance(result.data["category"].dtype, pd.CategoricalDtype)
+        assert "dtypes_optimized" not in result.metadata
+
+    def test_dataloader_forwards_option(self, catalog_csv):
+        result = DataLoader().load(str(catalog_csv), optimize_dtypes=True)
+        assert result["status"] in ("success", "warning")
+        assert "memory_saved_mb" in result["metadata"]
+        assert result["data"]["weight_g"].dtype == np.uint16
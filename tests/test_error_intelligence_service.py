@@ -0,0 +1,34 @@
+"""Tests for the process-wide ErrorIntelligence service."""
+
+import threading
+
+from agents.error_intelligence import ErrorIntelligence, get_error_intelligence
+from agents.error_intelligence.workers.learning_engine import LearningEngine
+
+
+def test_every_worker_shares_one_instance():
+    first = ErrorIntelligence()
+    assert ErrorIntelligence() is first
+    assert get_error_intelligence() is first
+    assert isinstance(first.learning_engine, LearningEngine)
+    assert first.learning_engine is ErrorIntelligence().learning_engine
+
+
+def test_concurrent_tracking_from_many_threads():
+    service = get_error_intelligence()
+
+    def work():
+        ei = ErrorIntelligence()
+        for _ in range(250):
+            ei.track_success("ServiceTest", "Worker", "op")
+        ei.track_error("ServiceTest", "Worker", "ValueError", "bad input")
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = service.error_tracker.get_agent_stats("ServiceTest")
+    assert stats["successes"] == 2000 and stats["failures"] == 8
+    assert len(service.error_patterns["ServiceTest"]["workers"]["Worker"]["errors"]) == 8
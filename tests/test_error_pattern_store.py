@@ -0,0 +1,127 @@
+"""Tests for batched persistence of error patterns."""
+
+import json
+import threading
+
+from agents.agent_config import AgentConfig
+from agents.error_intelligence.main import ErrorIntelligence
+from agents.error_intelligence.workers import pattern_store
+from agents.error_intelligence.workers.error_tracker import ErrorTracker
+from agents.error_intelligence.workers.pattern_store import PatternStore
+
+
+def success(agent="loader", worker="csv"):
+    return {"kind": "success", "agent": agent, "worker": worker, "operation": "load"}
+
+
+def failure(agent="loader", worker="csv"):
+    return {"kind": "error", "agent": agent, "worker": worker, "record": {"error_type": "ValueError"}}
+
+
+class Patterns:
+    """Minimal tracker: applies events and snapshots them."""
+
+    def __init__(self):
+        self.errors = {}
+        self.lock = threading.Lock()
+
+    def track(self, store, event):
+        with self.lock:
+            ErrorTracker.apply_event(self.errors, event)
+        store.record(event)
+
+    def snapshot(self):
+        with self.lock:
+            return json.loads(json.dumps(self.errors))
+
+
+def test_writes_in_batches(tmp_path):
+    path = tmp_path / "patterns.json"
+    patterns = Patterns()
+    store = PatternStore(str(path), patterns.snapshot, flush_every=1000, flush_interval=60)
+
+    for _ in range(10):
+        patterns.track(store, success())
+    assert not path.exists() and store.pending == 10
+
+    assert store.flush()
+    assert not store.flush()  # nothing pending
+    saved = json.loads(path.read_text())
+    assert saved["loader"]["successes"] == 10
+    assert list(tmp_path.iterdir()) == [path]  # no temporary files left
+    store.close()
+
+
+def test_background_flush_after_enough_events(tmp_path):
+    path = tmp_path / "patterns.json"
+    patterns = Patterns()
+    store = PatternStore(str(path), patterns.snapshot, flush_every=5, flush_interval=60)
+
+    threads = [
+        threading.Thread(target=lambda: [patterns.track(store, success()) for _ in range(50)])
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    store.close()
+
+    assert store.flushes >= 1
+    assert json.loads(path.read_text())["loader"]["total_runs"] == 200
+
+
+def test_append_log_is_replayed_and_compacted(tmp_path):
+    path = tmp_path / "patterns.json"
+    patterns = Patterns()
+    store = PatternStore(str(path), patterns.snapshot, flush_every=1000, log_format="append")
+    patterns.track(store, success())
+    patterns.track(store, failure())
+    store.flush()
+
+    assert not path.exists()
+    assert len(store.log_path.read_text().splitlines()) == 2
+    replayed = PatternStore(str(path), dict, log_format="append").load()
+    assert replayed["loader"]["workers"]["csv"] == {
+        "successes": 1, "failures": 1, "errors": [{"error_type": "ValueError"}]
+    }
+
+    store.close()
+    assert not store.log_path.exists()
+    assert json.loads(path.read_text())["loader"]["failures"] == 1
+
+
+def restart(monkeypatch):
+    """A fresh ErrorIntelligence, tracker and store, as in a new process."""
+    monkeypatch.setattr(ErrorIntelligence, "_instance", None)
+    monkeypatch.setattr(ErrorTracker, "_instance", None)
+    monkeypatch.setattr(pattern_store, "_stores", {})
+    return ErrorIntelligence()
+
+
+def test_restart_keeps_earlier_patterns(tmp_path, monkeypatch):
+    path = tmp_path / "patterns.json"
+    monkeypatch.setattr(AgentConfig, "ERROR_INTEL_PATTERNS_FILE", str(path))
+    monkeypatch.setattr(AgentConfig, "ERROR_INTEL_LOG_FORMAT", "append")
+    monkeypatch.setattr(AgentConfig, "ERROR_INTEL_FLUSH_EVERY", 1000)
+
+    first = restart(monkeypatch)
+    for _ in range(3):
+        first.track_error("loader", "csv", "ValueError", "bad row")
+    first.flush()  # the process then dies without close()
+    assert len(first.pattern_store.log_path.read_text().splitlines()) == 3
+
+    second = restart(monkeypatch)
+    assert second is not first
+    assert second.error_patterns["loader"]["failures"] == 3
+    second.track_error("loader", "csv", "ValueError", "bad row")
+    second.pattern_store.close()
+
+    assert not second.pattern_store.log_path.exists()
+    saved = json.loads(path.read_text())
+    assert saved["loader"]["failures"] == 4
+    assert len(saved["loader"]["workers"]["csv"]["errors"]) == 4
+
+    third = restart(monkeypatch)
+    assert third.error_patterns["loader"]["failures"] == 4
+    third.pattern_store.close()
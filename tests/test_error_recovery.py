@@ -1,12 +1,20 @@
 """Tests for error recovery framework - Week 1 Hardening."""
 
+import asyncio
+import time
+from unittest.mock import Mock
+
 import pytest
+from core.cancellation import CancellationToken, use_token
 from core.error_recovery import (
     ErrorRecoveryStrategy,
     retry_on_error,
     with_fallback,
     RecoveryError,
+    current_budget,
+    is_retryable,
 )
+from core.exceptions import TaskCancelledError
 
 
 class TestErrorRecoveryStrategy:
@@ -195,3 +203,143 @@ class TestWithFallbackDecorator:
         
         assert func_with_args(2, 3) == 5
         assert func_with_args(0, 3) == "fallback"
+
+
+class TestRetryBudget:
+    """Test suite for retry classification, shared budgets and deadlines."""
+    
+    def test_non_retryable_error_fails_immediately(self):
+        """Test deterministic errors are not retried."""
+        calls = [0]
+        
+        @retry_on_error(max_attempts=3, backoff=0)
+        def missing_file():
+            calls[0] += 1
+            raise FileNotFoundError("data.csv")
+        
+        with pytest.raises(RecoveryError, match="not retryable"):
+            missing_file()
+        assert calls[0] == 1
+    
+    def test_retryable_attribute_overrides_classification(self):
+        """Test an exception can mark itself retryable."""
+        class Flaky(TypeError):
+            retryable = True
+        
+        assert is_retryable(Flaky()) and not is_retryable(TypeError())
+        assert not is_retryable(RecoveryError("inner layer gave up"))
+    
+    def test_nested_layers_share_one_budget(self):
+        """Test nested retries do not multiply attempts."""
+        calls = [0]
+        
+        @retry_on_error(max_attempts=3, backoff=0.01)
+        def inner():
+            calls[0] += 1
+            raise ConnectionError("flaky")
+        
+        @retry_on_error(max_attempts=3, backoff=0.01)
+        def outer():
+            return inner()
+        
+        with pytest.raises(RecoveryError):
+            outer()
+        assert calls[0] == 3  # not 3 x 3
+        assert current_budget() is None
+    
+    def test_retry_stops_at_deadline(self):
+        """Test no backoff wait runs past the deadline."""
+        calls = [0]
+        
+        def flaky():
+            calls[0] += 1
+            raise ConnectionError("flaky")
+        
+        started = time.perf_counter()
+        with pytest.raises(RecoveryError):
+            ErrorRecoveryStrategy.retry(flaky, max_attempts=5, backoff=2, deadline=1.5)
+        assert time.perf_counter() - started < 1.5
+        assert calls[0] == 2  # waits of 1s fit, the next 2s wait does not
+    
+    def test_cancelled_task_interrupts_backoff(self):
+        """Test backoff ends as soon as the current task is cancelled."""
+        token = CancellationToken()
+        
+        def flaky():
+            token.cancel("Stopped")
+            raise ConnectionError("flaky")
+        
+        started = time.perf_counter()
+        with use_token(token):
+            with pytest.raises(TaskCancelledError):
+                ErrorRecoveryStrategy.retry(flaky, max_attempts=3, backoff=10)
+        assert time.perf_counter() - started < 1.0
+    
+    def test_async_retry_does_not_block_event_loop(self):
+        """Test coroutine functions are retried with asyncio.sleep."""
+        calls = [0]
+        ticks = [0]
+        
+        @retry_on_error(max_attempts=2, backoff=0.2)
+        async def flaky():
+            calls[0] += 1
+            if calls[0] < 2:
+                raise ConnectionError("flaky")
+            return ticks[0]
+        
+        async def ticker():
+            for _ in range(5):
+                await asyncio.sleep(0.02)
+                ticks[0] += 1
+        
+        async def main():
+            return await asyncio.gather(flaky(), ticker())
+        
+        ticks_during_backoff, _ = asyncio.run(main())
+        assert calls[0] == 2
+        assert ticks_during_backoff >= 3  # the loop kept running while flaky() backed off
+
+
+class TestRetryThroughOrchestrator:
+    """Test classification survives the orchestrator's wrapping layers."""
+    
+    def _orchestrator(self, agent):
+        from agents.orchestrator import Orchestrator
+        orchestrator = Orchestrator()
+        orchestrator.register_agent(agent.name, agent)
+        return orchestrator
+    
+    def test_deterministic_agent_error_runs_once(self):
+        """Test execute_task -> route -> agent calls a TypeError-raising agent once."""
+        import pandas as pd
+        
+        class BrokenRecommender:
+            name = "recommender"
+            calls = 0
+            
+            def set_data(self, data):
+                self.data = data
+            
+            def generate_action_plan(self):
+                BrokenRecommender.calls += 1
+                raise TypeError("unsupported operand")
+        
+        orchestrator = self._orchestrator(BrokenRecommender())
+        orchestrator.cache_data("loaded_data", pd.DataFrame({"x": [1, 2]}))
+        
+        started = time.perf_counter()
+        with pytest.raises(RecoveryError):
+            orchestrator.execute_task("recommend")
+        assert BrokenRecommender.calls == 1
+        assert time.perf_counter() - started < 0.5
+    
+    def test_missing_parameter_is_not_retried(self):
+        """Test a load_data without file_path fails without backoff."""
+        loader = Mock()
+        loader.name = "data_loader"
+        orchestrator = self._orchestrator(loader)
+        
+        started = time.perf_counter()
+        with pytest.raises(RecoveryError, match="not retryable"):
+            orchestrator.execute_task("load_data")
+        assert time.perf_counter() - started < 0.5
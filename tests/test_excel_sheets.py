@@ -0,0 +1,97 @@
+"""Tests for multi-sheet Excel loading."""
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("openpyxl")
+
+from agents.data_loader import DataLoader
+from agents.data_loader.workers import JSONExcelLoaderWorker
+from agents.data_loader.workers import json_excel_loader
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    path = tmp_path / "report.xlsx"
+    with pd.ExcelWriter(path, engine="openpyxl") as writer:
+        pd.DataFrame({"id": range(50), "amount": [float(i) for i in range(50)]}).to_excel(
+            writer, sheet_name="sales", index=False
+        )
+        pd.DataFrame({"id": range(10), "amount": [None] * 5 + [1.0] * 5}).to_excel(
+            writer, sheet_name="returns", index=False
+        )
+        pd.DataFrame().to_excel(writer, sheet_name="notes", index=False)
+    return path
+
+
+class TestJSONExcelLoaderSheets:
+    """JSONExcelLoaderWorker.load_sheets behaviour."""
+
+    def test_all_sheets_in_workbook_order(self, workbook):
+        results = JSONExcelLoaderWorker().load_sheets(str(workbook))
+
+        assert list(results) == ["sales", "returns", "notes"]
+        assert results["sales"].success and len(results["sales"].data) == 50
+        assert results["returns"].quality_score > 0
+        assert not results["notes"].success  # empty sheet fails alone
+
+    def test_threaded_path_matches_sequential(self, workbook, monkeypatch):
+        sequential = JSONExcelLoaderWorker().load_sheets(str(workbook), sheet_names=["sales", "returns"])
+        monkeypatch.setattr(json_excel_loader, "PARALLEL_ENGINES", [json_excel_loader.excel_engine("xlsx")])
+        threaded = JSONExcelLoaderWorker().load_sheets(str(workbook), sheet_names=["sales", "returns"])
+
+        for sheet in ("sales", "returns"):
+            pd.testing.assert_frame_equal(sequential[sheet].data, threaded[sheet].data)
+
+    def test_unknown_sheet_rejected(self, workbook):
+        with pytest.raises(ValueError, match="Sheets not found"):
+            JSONExcelLoaderWorker().load_sheets(str(workbook), sheet_names=["missing"])
+
+    def test_engine_falls_back_without_calamine(self, monkeypatch):
+        monkeypatch.setitem(__import__("sys").modules, "python_calamine", None)
+        assert json_excel_loader.excel_engine("xlsx") == "openpyxl"
+        assert json_excel_loader.excel_engine("xls") == "xlrd"
+
+
+class TestDataLoaderSheets:
+    """DataLoader.load_sheets merges, validates and caches per sheet."""
+
+    def test_per_sheet_quality(self, workbook):
+        result = DataLoader().load_sheets(str(workbook), sheet_names=["sales", "returns"])
+
+        assert result["status"] in ("success", "warning")
+        assert set(result["data"]) == {"sales", "returns"}
+        assert result["sheet_quality"]["sales"] > result["sheet_quality"]["returns"]
+        assert result["sheet_quality"]["returns"] < result["quality_score"] < result["sheet_quality"]["sales"]
+
+    def test_pushdown_applies_to_every_sheet(self, workbook):
+        result = DataLoader().load_sheets(
+            str(workbook), sheet_names=["sales", 1], columns=["amount"], filters=[("id", "<", 3)]
+        )
+        assert list(result["data"]) == ["sales", 1]
+        for df in result["data"].values():
+            assert list(df.columns) == ["amount"]
+            assert len(df) == 3
+
+    def test_partial_failure_is_a_warning(self, workbook):
+        result = DataLoader().load_sheets(str(workbook))
+        assert result["status"] == "warning"
+        assert "notes" not in result["data"]
+        assert any(error.startswith("notes:") for error in result["errors"])
+
+    def test_repeat_load_served_from_cache(self, tmp_path, monkeypatch):
+        workbook = tmp_path / "clean.xlsx"
+        with pd.ExcelWriter(workbook, engine="openpyxl") as writer:
+            for sheet in ("sales", "returns"):
+                pd.DataFrame({"id": range(20), "region": ["n", "s"] * 10}).to_excel(writer, sheet_name=sheet, index=False)
+        loader = DataLoader(cache_dir=str(tmp_path / "cache"))
+        first = loader.load_sheets(str(workbook))
+        assert first["metadata"]["cache"]["sales"] == "miss"
+
+        def fail(*args, **kwargs):
+            raise AssertionError("workbook parsed again")
+        monkeypatch.setattr(loader.json_excel_loader, "load_sheets", fail)
+
+        second = loader.load_sheets(str(workbook))
+        assert second["metadata"]["cache"] == {"sales": "hit", "returns": "hit"}
+        pd.testing.assert_frame_equal(second["data"]["sales"], first["data"]["sales"], check_dtype=False)
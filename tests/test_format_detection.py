@@ -0,0 +1,95 @@
+"""Tests for content-sniffing format detection."""
+
+import json
+import sqlite3
+
+import pandas as pd
+import pytest
+
+from agents.data_loader import DataLoader
+from agents.data_loader.workers import CSVLoaderWorker, FormatDetection
+
+
+def detect(path):
+    result = FormatDetection().safe_execute(file_path=str(path))
+    assert result.success, result.errors
+    return result.data
+
+
+class TestSniffing:
+    """Format from file header bytes."""
+
+    def test_binary_signatures(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        df = pd.DataFrame({"a": [1, 2, 3]})
+
+        parquet = tmp_path / "export_parquet"
+        df.to_parquet(parquet)
+        xlsx = tmp_path / "export_xlsx"
+        df.to_excel(xlsx, index=False, engine="openpyxl")
+        db = tmp_path / "export_db"
+        with sqlite3.connect(db) as conn:
+            df.to_sql("t", conn)
+
+        assert detect(parquet)["detected_format"] == "parquet"
+        assert detect(xlsx)["detected_format"] == "xlsx"
+        assert detect(db)["detected_format"] == "sqlite"
+        assert detect(db)["detection_method"] == "content"
+
+    def test_json_vs_jsonl(self, tmp_path):
+        jsonl = tmp_path / "events"
+        jsonl.write_text("\n".join(json.dumps({"id": i}) for i in range(3)))
+        array = tmp_path / "events_array"
+        array.write_text(json.dumps([{"id": 1}, {"id": 2}], indent=2))
+
+        assert detect(jsonl)["detected_format"] == "jsonl"
+        assert detect(array)["detected_format"] == "json"
+
+    def test_csv_dialect_and_encoding(self, tmp_path):
+        path = tmp_path / "prices.txt"
+        path.write_bytes("name;price\n'Café, Paris';3,50\nBäckerei;2,10\n".encode("latin-1"))
+
+        data = detect(path)
+
+        assert data["detected_format"] == "csv"
+        assert data["csv_options"]["delimiter"] == ";"
+        assert data["csv_options"]["encoding"] in ("cp1252", "latin-1")
+
+    def test_only_header_is_read(self, tmp_path):
+        path = tmp_path / "big.csv"
+        path.write_text("a,b\n" + "1,2\n" * 100_000)
+        assert detect(path)["bytes_read"] == 8192
+
+    def test_mismatched_extension_warns(self, tmp_path):
+        path = tmp_path / "really_parquet.csv"
+        pd.DataFrame({"a": [1]}).to_parquet(path)
+        result = FormatDetection().safe_execute(file_path=str(path))
+        assert result.data["detected_format"] == "parquet"
+        assert any("does not match" in w for w in result.warnings)
+
+
+class TestDataLoaderSniffing:
+    """Sniffed format and dialect drive DataLoader.load."""
+
+    def test_extensionless_semicolon_latin1_csv(self, tmp_path):
+        path = tmp_path / "export_2025"
+        path.write_bytes("city;amount\nMünchen;10\nZürich;20\n".encode("latin-1"))
+
+        result = DataLoader().load(str(path))
+
+        assert result["status"] in ("success", "warning"), result["errors"]
+        df = result["data"]
+        assert list(df.columns) == ["city", "amount"]
+        assert df["city"].tolist() == ["München", "Zürich"]
+
+    def test_caller_options_win(self, tmp_path):
+        path = tmp_path / "data.csv"
+        path.write_text("a|b\n1|2\n3|4\n")
+        assert list(DataLoader().load(str(path), delimiter=",")["data"].columns) == ["a|b"]
+
+    def test_worker_still_rejects_unconfirmed_extension(self, tmp_path):
+        path = tmp_path / "notes.txt"
+        path.write_text("a,b\n1,2\n")
+        with pytest.raises(ValueError, match="File must be CSV"):
+            CSVLoaderWorker().validate_input({"file_path": str(path)})
+        assert CSVLoaderWorker().validate_input({"file_path": str(path), "detected_format": "csv"})
@@ -0,0 +1,130 @@
+"""Tests for incremental append loading of growing CSV/JSONL files."""
+
+import json
+
+import pandas as pd
+import pytest
+
+from agents.data_loader import DataLoader
+
+
+@pytest.fixture
+def growing_csv(tmp_path):
+    path = tmp_path / "events.csv"
+    pd.DataFrame({
+        "id": range(500),
+        "region": ["north", "south"] * 250,
+        "amount": [float(i) for i in range(500)],
+    }).to_csv(path, index=False)
+    return path
+
+
+def append(path, text):
+    with open(path, "a") as f:
+        f.write(text)
+
+
+class TestIncrementalCSV:
+    """Appended CSV lines are parsed on their own."""
+
+    def test_only_appended_complete_lines_are_parsed(self, growing_csv):
+        loader = DataLoader()
+        first = loader.load(str(growing_csv), incremental=True)
+        assert first["metadata"]["append"]["mode"] == "full"
+        offset = first["metadata"]["append"]["offset"]
+
+        append(growing_csv, "500,east,1.5\n501,west,2.5\n502,ea")
+        result = loader.load(str(growing_csv), incremental=True)
+
+        meta = result["metadata"]["append"]
+        assert meta["mode"] == "append"
+        assert meta["appended_rows"] == 2
+        assert meta["offset"] == offset + len("500,east,1.5\n501,west,2.5\n")
+        assert len(result["data"]) == 502
+        assert result["data"]["amount"].dtype == "float64"
+        assert result["data"]["region"].iloc[-1] == "west"
+
+        # The unfinished line is picked up once it is completed
+        assert loader.load(str(growing_csv), incremental=True)["metadata"]["append"]["mode"] == "unchanged"
+        append(growing_csv, "st,3.5\n")
+        result = loader.load(str(growing_csv), incremental=True)
+        assert result["data"]["region"].iloc[-1] == "east"
+        assert loader.append_tracker.stats()["appends"] == 2
+
+    def test_quality_metrics_updated_from_new_rows(self, growing_csv):
+        loader = DataLoader()
+        loader.load(str(growing_csv), incremental=True)
+        append(growing_csv, "0,north,0.0\n1,south,1.0\n503,,\n")
+
+        result = loader.load(str(growing_csv), incremental=True)
+        assert result["metadata"]["rows"] == 503
+        assert result["metadata"]["duplicates"] == 2
+        assert result["metadata"]["columns_info"]["region"]["null_count"] == 1
+
+    def test_pushdown_applies_to_appended_rows(self, growing_csv):
+        loader = DataLoader()
+        kwargs = {"columns": ["id", "amount"], "filters": [("id", ">=", 498)], "incremental": True}
+        assert len(loader.load(str(growing_csv), **kwargs)["data"]) == 2
+        append(growing_csv, "600,east,1.0\n7,west,2.0\n")
+
+        result = loader.load(str(growing_csv), **kwargs)
+        assert result["metadata"]["append"]["mode"] == "append"
+        assert list(result["data"].columns) == ["id", "amount"]
+        assert result["data"]["id"].tolist() == [498, 499, 600]
+
+    def test_categories_extended(self, growing_csv):
+        loader = DataLoader()
+        loader.load(str(growing_csv), incremental=True, optimize_dtypes=True)
+        append(growing_csv, "500,east,1.5\n")
+
+        result = loader.load(str(growing_csv), incremental=True, optimize_dtypes=True)
+        region = result["data"]["region"]
+        assert isinstance(region.dtype, pd.CategoricalDtype)
+        assert set(region.cat.categories) == {"north", "south", "east"}
+
+    def test_text_column_keeps_numeric_looking_values(self, tmp_path):
+        path = tmp_path / "customers.csv"
+        pd.DataFrame({"id": range(200), "zip": [f"A{i:03d}" for i in range(200)]}).to_csv(path, index=False)
+        loader = DataLoader()
+        loader.load(str(path), incremental=True)
+        append(path, "200,01234\n")
+
+        result = loader.load(str(path), incremental=True)
+        assert result["metadata"]["append"]["mode"] == "append"
+        assert result["data"]["zip"].iloc[-1] == "01234"
+        assert result["data"]["zip"].tolist() == DataLoader().load(str(path))["data"]["zip"].tolist()
+
+    @pytest.mark.parametrize("rewrite, reason", [
+        (lambda p: p.write_text("id,region,amount\n1,north,1.0\n"), "truncated"),
+        (lambda p: p.write_text(p.read_text().replace("north", "NORTH") + "9,x,1.0\n"), "rewritten"),
+        (lambda p: append(p, "1,north,not-a-number\n"), "dtypes"),
+    ])
+    def test_full_reload_when_not_an_append(self, growing_csv, rewrite, reason):
+        loader = DataLoader()
+        loader.load(str(growing_csv), incremental=True)
+        rewrite(growing_csv)
+
+        meta = loader.load(str(growing_csv), incremental=True)["metadata"]["append"]
+        assert meta["mode"] == "full"
+        assert reason in meta["reason"]
+
+
+class TestIncrementalJSONL:
+    """Appended JSON lines are flattened and aligned to the cached schema."""
+
+    def test_append_and_new_key_reload(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        path.write_text("".join(json.dumps({"id": i, "user": {"name": f"u{i}"}}) + "\n" for i in range(100)))
+        loader = DataLoader()
+        loader.load(str(path), incremental=True)
+
+        append(path, json.dumps({"id": 100, "user": {"name": "u100"}}) + "\nnot json\n")
+        result = loader.load(str(path), incremental=True)
+        assert result["metadata"]["append"]["appended_rows"] == 1
+        assert result["data"]["user.name"].iloc[-1] == "u100"
+        assert any("malformed" in w for w in result["warnings"])
+
+        append(path, json.dumps({"id": 101, "user": {"name": "u101"}, "tag": "x"}) + "\n")
+        result = loader.load(str(path), incremental=True)
+        assert result["metadata"]["append"]["mode"] == "full"
+        assert "tag" in result["data"].columns
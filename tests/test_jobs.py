@@ -0,0 +1,141 @@
+"""Tests for the API job queue."""
+
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from api.jobs import JobManager, QueueFullError, JobNotFoundError
+
+
+@pytest.fixture
+def manager():
+    jobs = JobManager(max_workers=1, max_queued=2)
+    yield jobs
+    jobs.shutdown(wait=True)
+
+
+def blocking(gate):
+    def run(context):
+        gate.wait(5)
+        return "done"
+    return run
+
+
+class TestJobManager:
+    """Queueing, progress and cancellation."""
+
+    def test_result_and_progress(self, manager):
+        def run(context):
+            for step in range(3):
+                context.report({"step": step})
+            return {"total": 3}
+
+        job = manager.submit("demo", run)
+        assert manager.wait(job.id, since_version=0, timeout=5).version > 0
+        job.future.result(timeout=5)
+
+        assert job.status == "completed"
+        assert job.result == {"total": 3}
+        assert [p["step"] for p in job.progress] == [0, 1, 2]
+        assert job.to_dict()["version"] >= 5
+
+    def test_history_keeps_no_dataframes(self, manager):
+        frame = pd.DataFrame({"x": range(1000), "y": 1.0})
+
+        def run(context):
+            context.report({"type": "load_data", "result": {"data": frame}})
+            return {"results": {"task_1": {"result": {"status": "success", "data": frame}}}}
+
+        job = manager.submit("demo", run)
+        full = job.future.result(timeout=5)
+
+        assert full["results"]["task_1"]["result"]["data"] is frame  # waiting callers get it all
+        stored = job.result["results"]["task_1"]["result"]
+        assert stored == {"status": "success", "data": {"type": "DataFrame", "shape": [1000, 2], "columns": ["x", "y"]}}
+        assert job.progress[0]["result"]["data"]["type"] == "DataFrame"
+
+    def test_queue_limit(self, manager):
+        gate = threading.Event()
+        manager.submit("slow", blocking(gate))
+        time.sleep(0.05)  # first job is running, not queued
+        manager.submit("slow", blocking(gate))
+        manager.submit("slow", blocking(gate))
+
+        with pytest.raises(QueueFullError):
+            manager.submit("slow", blocking(gate))
+        assert manager.stats()["queue_depth"] == 2
+        gate.set()
+
+    def test_cancel_queued_and_running(self, manager):
+        gate = threading.Event()
+        seen = []
+
+        def cooperative(context):
+            while not context.cancelled:
+                time.sleep(0.01)
+            seen.append("stopped")
+            return "partial"
+
+        running = manager.submit("loop", cooperative)
+        queued = manager.submit("slow", blocking(gate))
+        time.sleep(0.05)
+
+        assert manager.cancel(queued.id).status == "cancelled"
+        manager.cancel(running.id)
+        running.future.result(timeout=5)
+
+        assert running.status == "cancelled" and running.result == "partial"
+        assert seen == ["stopped"]
+        assert queued.started_at is None
+
+    def test_failure_and_unknown_job(self, manager):
+        def broken(context):
+            raise ValueError("bad input")
+
+        job = manager.submit("broken", broken)
+        job.future.result(timeout=5)
+        assert job.status == "failed" and job.error == "bad input"
+        with pytest.raises(JobNotFoundError):
+            manager.get("job_999999")
+
+    def test_wait_times_out_without_change(self, manager):
+        gate = threading.Event()
+        job = manager.submit("slow", blocking(gate))
+        time.sleep(0.05)
+        started = time.monotonic()
+        assert manager.wait(job.id, since_version=job.version, timeout=0.2).status == "running"
+        assert time.monotonic() - started >= 0.2
+        gate.set()
+
+
+def test_workflow_endpoints(monkeypatch):
+    TestClient = pytest.importorskip("fastapi.testclient").TestClient
+    import api.main as api_main
+
+    gate = threading.Event()
+
+    def fake_workflow(tasks, on_event=None, should_stop=None, session_id=None):
+        on_event({"event": "stage_completed", "index": 0, "type": tasks[0]["type"], "status": "completed"})
+        gate.wait(5)
+        return {"status": "completed", "total_tasks": len(tasks)}
+
+    monkeypatch.setattr(api_main.orchestrator, "execute_workflow", fake_workflow)
+    client = TestClient(api_main.app)
+
+    submitted = client.post("/api/jobs", json={"tasks": [{"type": "load_data"}]})
+    assert submitted.status_code == 202
+    job_id = submitted.json()["job_id"]
+
+    polled = client.get(f"/api/jobs/{job_id}", params={"wait": 2, "since": 1}).json()
+    assert polled["status"] == "running"
+    assert polled["progress"][0]["type"] == "load_data"
+
+    gate.set()
+    api_main.job_manager.get(job_id).future.result(timeout=5)
+    assert client.get(f"/api/jobs/{job_id}").json()["result"]["total_tasks"] == 1
+    assert client.delete(f"/api/jobs/{job_id}").status_code == 409
+    assert client.get("/api/jobs/job_999999").status_code == 404
+
+    assert client.post("/api/workflow", json={"tasks": [{"type": "load_data"}]}).json()["status"] == "completed"
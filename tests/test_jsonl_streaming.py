@@ -0,0 +1,103 @@
+"""Tests for batched JSONL streaming."""
+
+import json
+
+import pytest
+
+from agents.data_loader import DataLoader
+from agents.data_loader.workers import JSONLStreaming, StreamingQualityAccumulator
+
+
+@pytest.fixture
+def events_jsonl(tmp_path):
+    """250 nested events with two malformed lines and a blank line."""
+    path = tmp_path / "events.jsonl"
+    lines = []
+    for i in range(250):
+        event = {"id": i, "user": {"name": f"u{i % 10}", "geo": {"country": "LV"}}, "tags": ["a"]}
+        if i % 50 == 0:
+            event["extra"] = True
+        lines.append(json.dumps(event))
+    lines.insert(100, '{"id": 999, "user": ')
+    lines.insert(200, "not json at all")
+    lines.insert(10, "")
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+class TestJSONLStreaming:
+    """JSONLStreaming worker behaviour."""
+
+    def test_chunks_flattened_and_bounded(self, events_jsonl):
+        stats = {}
+        chunks = list(JSONLStreaming().iter_chunks(str(events_jsonl), chunksize=100, stats=stats))
+
+        assert [len(c) for c in chunks] == [100, 100, 50]
+        assert "user.geo.country" in chunks[0].columns
+        assert stats == {"lines": 252, "malformed_lines": 2}
+
+    def test_malformed_lines_reported(self, events_jsonl):
+        result = JSONLStreaming().safe_execute(file_path=str(events_jsonl), chunksize=64)
+
+        assert result.success
+        assert result.metadata["rows"] == 250
+        assert result.metadata["malformed_lines"] == 2
+        assert result.rows_failed == 2
+        assert any("malformed" in w for w in result.warnings)
+
+    def test_schema_pins_columns(self, events_jsonl):
+        schema = {"id": "int64", "user.name": "category", "extra": "boolean"}
+        chunks = list(JSONLStreaming().iter_chunks(str(events_jsonl), chunksize=100, schema=schema))
+
+        for chunk in chunks:
+            assert list(chunk.columns) == list(schema)
+            assert str(chunk["user.name"].dtype) == "category"
+        assert chunks[0]["extra"].sum() == 2
+
+    def test_max_level(self, events_jsonl):
+        chunk = next(JSONLStreaming().iter_chunks(str(events_jsonl), max_level=1))
+        assert "user.geo" in chunk.columns
+        assert "user.geo.country" not in chunk.columns
+
+    def test_accumulator_handles_list_cells(self, events_jsonl):
+        acc = StreamingQualityAccumulator()
+        for _ in JSONLStreaming().iter_chunks(str(events_jsonl), chunksize=100, accumulator=acc):
+            pass
+        assert acc.rows == 250
+        assert acc.duplicates == 0
+
+
+class TestDataLoaderJSONL:
+    """DataLoader routes JSONL through the streaming worker."""
+
+    def test_load_with_pushdown(self, events_jsonl):
+        result = DataLoader().load(
+            str(events_jsonl), chunksize=40, columns=["id", "user.name"], filters=[("id", "<", 20)]
+        )
+
+        assert result["status"] in ("success", "warning"), result["errors"]
+        assert list(result["data"].columns) == ["id", "user.name"]
+        assert len(result["data"]) == 20
+        assert result["metadata"]["chunks"] == 1
+
+    @pytest.mark.parametrize("chunksize", [3, 100])
+    def test_late_optional_key_does_not_depend_on_chunksize(self, tmp_path, chunksize):
+        path = tmp_path / "late.jsonl"
+        lines = [{"id": i, "user": {"country": "LV"}} if i >= 5 else {"id": i} for i in range(10)]
+        path.write_text("\n".join(json.dumps(line) for line in lines) + "\n")
+
+        result = DataLoader().load(str(path), chunksize=chunksize, columns=["id", "user.country"])
+        assert result["status"] in ("success", "warning"), result["errors"]
+        assert result["data"].shape == (10, 2)
+        assert result["data"]["user.country"].notna().sum() == 5
+
+        filtered = DataLoader().load(str(path), chunksize=chunksize, filters=[("user.country", "==", "LV")])
+        assert filtered["status"] in ("success", "warning"), filtered["errors"]
+        assert filtered["data"]["id"].tolist() == [5, 6, 7, 8, 9]
+
+        with pytest.raises(KeyError, match="Columns not found"):
+            list(JSONLStreaming().iter_chunks(str(path), chunksize=chunksize, columns=["id", "user.city"]))
+
+    def test_stream_dispatches_on_format(self, events_jsonl):
+        chunks = list(DataLoader().stream(str(events_jsonl), chunksize=100))
+        assert sum(len(c) for c in chunks) == 250
@@ -0,0 +1,99 @@
+"""Tests for the Parquet load cache."""
+
+import os
+import time
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from agents.data_loader import DataLoader
+from agents.data_loader.workers import LoadCache
+
+
+@pytest.fixture
+def sample_csv(tmp_path):
+    path = tmp_path / "sales.csv"
+    pd.DataFrame({
+        "region": ["north", "south", "east", "west"] * 25,
+        "amount": range(100),
+    }).to_csv(path, index=False)
+    return path
+
+
+class TestLoadCache:
+    """Unit tests for LoadCache."""
+
+    def test_key_changes_with_kwargs_and_mtime(self, sample_csv):
+        key1 = LoadCache.make_key(str(sample_csv), {"format": "csv"})
+        key2 = LoadCache.make_key(str(sample_csv), {"format": "csv", "columns": ["amount"]})
+        assert key1 != key2
+
+        stat = sample_csv.stat()
+        os.utime(sample_csv, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert LoadCache.make_key(str(sample_csv), {"format": "csv"}) != key1
+
+    def test_put_get_roundtrip(self, tmp_path, sample_csv):
+        cache = LoadCache(str(tmp_path / "cache"))
+        df = pd.read_csv(sample_csv)
+        key = cache.make_key(str(sample_csv))
+
+        assert cache.get(key) is None
+        assert cache.put(key, df, {"quality_score": 0.9})
+
+        cached_df, meta = cache.get(key)
+        pd.testing.assert_frame_equal(cached_df, df)
+        assert meta["quality_score"] == 0.9
+        assert cache.hits == 1 and cache.misses == 1
+
+    def test_lru_eviction_respects_budget(self, tmp_path):
+        cache = LoadCache(str(tmp_path / "cache"), max_size_mb=0.02)
+        frames = {f"k{i}": pd.DataFrame({"x": range(i * 1000, i * 1000 + 1000)}) for i in range(3)}
+        for key, df in frames.items():
+            cache.put(key, df)
+            time.sleep(0.01)
+
+        stats = cache.get_stats()
+        assert stats["size_mb"] <= stats["max_size_mb"]
+        assert stats["evictions"] >= 1
+        # Oldest entry goes first
+        assert cache.get("k0") is None
+        assert cache.get("k2") is not None
+
+    def test_rejects_non_positive_budget(self, tmp_path):
+        with pytest.raises(ValueError):
+            LoadCache(str(tmp_path), max_size_mb=0)
+
+
+class TestDataLoaderCache:
+    """DataLoader integration with the load cache."""
+
+    def test_second_load_is_cache_hit(self, tmp_path, sample_csv):
+        loader = DataLoader(cache_dir=str(tmp_path / "cache"))
+
+        first = loader.load(str(sample_csv))
+        second = loader.load(str(sample_csv))
+
+        assert first["status"] == second["status"]
+        pd.testing.assert_frame_equal(first["data"], second["data"])
+        assert second["quality_score"] == first["quality_score"]
+        assert second["metadata"]["cache_hit"] is True
+
+        history = loader.get_load_history()
+        assert [h["cache"] for h in history] == ["miss", "hit"]
+        assert history[-1]["cache_hits"] == 1
+        assert history[-1]["cache_misses"] == 1
+
+    def test_use_cache_false_bypasses(self, tmp_path, sample_csv):
+        loader = DataLoader(cache_dir=str(tmp_path / "cache"))
+        loader.load(str(sample_csv))
+        loader.load(str(sample_csv), use_cache=False)
+        assert loader.get_load_history()[-1]["cache"] == "disabled"
+        assert loader.get_cache_stats()["hits"] == 0
+
+    def test_cache_disabled_by_default(self, sample_csv):
+        loader = DataLoader()
+        loader.load(str(sample_csv))
+        assert loader.get_cache_stats() == {"enabled": False}
+        assert loader.get_load_history()[-1]["cache"] == "disabled"
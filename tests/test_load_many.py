@@ -0,0 +1,76 @@
+"""Tests for multi-file (partitioned) loading."""
+
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from agents.data_loader import DataLoader
+
+
+@pytest.fixture
+def partitions(tmp_path):
+    """Three monthly CSV exports; the last one gained a column."""
+    for month in (1, 2, 3):
+        df = pd.DataFrame({
+            "order_id": range(month * 100, month * 100 + 50),
+            "amount": [float(month)] * 50,
+        })
+        if month == 3:
+            df["channel"] = "web"
+        df.to_csv(tmp_path / f"sales_2025-0{month}.csv", index=False)
+    return tmp_path
+
+
+class TestLoadMany:
+    """DataLoader.load_many behaviour."""
+
+    def test_glob_concatenates_in_order(self, partitions):
+        result = DataLoader().load_many(str(partitions / "sales_2025-*.csv"), parallelism=3)
+
+        assert result["status"] in ("success", "warning"), result["errors"]
+        df = result["data"]
+        assert len(df) == 150
+        assert df["order_id"].iloc[0] == 100 and df["order_id"].iloc[-1] == 349
+        assert result["metadata"]["file_count"] == 3
+
+    def test_schema_union_reported(self, partitions):
+        result = DataLoader().load_many(str(partitions / "*.csv"))
+
+        df = result["data"]
+        assert list(df.columns) == ["order_id", "amount", "channel"]
+        assert df["channel"].isna().sum() == 100
+        missing = result["metadata"]["missing_columns"]
+        assert missing == {"channel": ["sales_2025-01.csv", "sales_2025-02.csv"]}
+        assert any("channel" in w for w in result["warnings"])
+
+    def test_source_column(self, partitions):
+        paths = sorted(str(p) for p in partitions.glob("*.csv"))
+        result = DataLoader().load_many(paths, source_column="source_file")
+
+        source = result["data"]["source_file"]
+        assert source.dtype == "category"
+        assert source.value_counts()["sales_2025-02.csv"] == 50
+
+    def test_validator_runs_once(self, partitions):
+        loader = DataLoader()
+        with patch.object(loader.validator, "safe_execute", wraps=loader.validator.safe_execute) as spy:
+            loader.load_many(str(partitions / "*.csv"))
+        assert spy.call_count == 1
+        assert len(spy.call_args.kwargs["df"]) == 150
+
+    def test_pushdown_applies_per_file(self, partitions):
+        result = DataLoader().load_many(
+            str(partitions / "*.csv"), columns=["order_id"], filters=[("amount", ">", 1)]
+        )
+        assert list(result["data"].columns) == ["order_id"]
+        assert len(result["data"]) == 100
+
+    def test_no_match_and_bad_partition(self, partitions):
+        loader = DataLoader()
+        assert loader.load_many(str(partitions / "*.parquet"))["status"] == "error"
+
+        (partitions / "sales_2025-04.csv").write_text("")
+        result = loader.load_many(str(partitions / "*.csv"))
+        assert result["status"] == "error"
+        assert any("sales_2025-04.csv" in e for e in result["errors"])
@@ -0,0 +1,112 @@
+"""Tests for column projection and row-filter pushdown."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from agents.data_loader import DataLoader
+from agents.data_loader.workers import CSVStreaming, ParquetLoaderWorker
+from agents.data_loader.workers.pushdown import apply_filters, normalize_filters, read_columns
+
+
+@pytest.fixture
+def sales_df():
+    n = 1000
+    return pd.DataFrame({
+        "order_id": np.arange(n),
+        "region": np.array(["north", "south", "east", "west"])[np.arange(n) % 4],
+        "amount": np.arange(n) * 1.5,
+        "note": ["x"] * n,
+    })
+
+
+class TestPushdownHelpers:
+    """Unit tests for filter helpers."""
+
+    def test_normalize_rejects_bad_filters(self):
+        with pytest.raises(ValueError):
+            normalize_filters([("amount", "~", 1)])
+        with pytest.raises(ValueError):
+            normalize_filters([("region", "in", "north")])
+        assert normalize_filters(("amount", ">", 1)) == [("amount", ">", 1)]
+
+    def test_read_columns_adds_filter_columns(self):
+        filters = normalize_filters([("amount", ">", 1)])
+        assert read_columns(["region"], filters) == ["region", "amount"]
+        assert read_columns(None, filters) is None
+
+    def test_apply_filters_ands_predicates(self, sales_df):
+        filters = normalize_filters([("amount", ">=", 300), ("region", "in", ["north", "east"])])
+        out = apply_filters(sales_df, filters)
+        assert (out["amount"] >= 300).all()
+        assert set(out["region"]) == {"north", "east"}
+        assert len(out) == 400
+
+
+@pytest.mark.parametrize("fmt", ["csv", "json", "jsonl", "xlsx", "parquet"])
+def test_dataloader_pushdown_all_formats(tmp_path, sales_df, fmt):
+    if fmt == "parquet":
+        pytest.importorskip("pyarrow")
+    path = tmp_path / f"sales.{fmt}"
+    if fmt == "csv":
+        sales_df.to_csv(path, index=False)
+    elif fmt == "json":
+        sales_df.to_json(path, orient="records")
+    elif fmt == "jsonl":
+        sales_df.to_json(path, orient="records", lines=True)
+    elif fmt == "xlsx":
+        pytest.importorskip("openpyxl")
+        sales_df.head(200).to_excel(path, index=False)
+    else:
+        sales_df.to_parquet(path, index=False)
+
+    result = DataLoader().load(
+        str(path),
+        columns=["order_id", "amount"],
+        filters=[("region", "==", "south"), ("order_id", "<", 100)],
+    )
+
+    assert result["status"] in ("success", "warning"), result["errors"]
+    df = result["data"]
+    assert list(df.columns) == ["order_id", "amount"]
+    assert df["order_id"].tolist() == list(range(1, 100, 4))
+
+
+def test_parquet_skips_row_groups(tmp_path, sales_df):
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "sales.parquet"
+    sales_df.to_parquet(path, index=False, row_group_size=100)
+
+    result = ParquetLoaderWorker().safe_execute(
+        file_path=str(path),
+        columns=["amount"],
+        filters=[("order_id", ">=", 950)],
+    )
+
+    assert result.success
+    assert len(result.data) == 50
+    assert list(result.data.columns) == ["amount"]
+    assert result.metadata["file_columns"] == 4
+    assert result.metadata["row_groups_total"] == 10
+    assert result.metadata["row_groups_read"] == 1
+
+
+def test_streaming_filters_per_chunk(tmp_path, sales_df):
+    path = tmp_path / "sales.csv"
+    sales_df.to_csv(path, index=False)
+
+    chunks = list(CSVStreaming().iter_chunks(
+        str(path), chunksize=100, columns=["order_id"], filters=[("region", "==", "west")]
+    ))
+
+    assert len(chunks) == 10
+    assert all(list(c.columns) == ["order_id"] for c in chunks)
+    assert sum(len(c) for c in chunks) == 250
+
+
+def test_invalid_filter_returns_error(tmp_path, sales_df):
+    path = tmp_path / "sales.csv"
+    sales_df.to_csv(path, index=False)
+    result = DataLoader().load(str(path), filters=[("amount", "like", 1)])
+    assert result["status"] == "error"
+    assert "Unsupported filter operator" in result["message"]
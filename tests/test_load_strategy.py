@@ -0,0 +1,101 @@
+"""Tests for size-tiered loading."""
+
+import pandas as pd
+import pytest
+
+from agents.data_loader import DataLoader
+from agents.data_loader.workers import CSVLoaderWorker
+from agents.data_loader.workers import load_strategy
+from agents.data_loader.workers.load_strategy import available_memory_mb, choose_tier
+
+
+@pytest.fixture
+def sales_csv(tmp_path):
+    path = tmp_path / "sales.csv"
+    pd.DataFrame({
+        "order_id": range(5000),
+        "region": ["north", "south"] * 2500,
+    }).to_csv(path, index=False)
+    return path
+
+
+class TestChooseTier:
+    """Unit tests for choose_tier."""
+
+    def test_small_file_in_memory(self):
+        plan = choose_tier(10, "csv", available_mb=8000)
+        assert plan.tier == "in_memory"
+        assert plan.sample_fraction == 1.0
+
+    def test_large_file_that_fits_is_chunked(self):
+        assert choose_tier(800, "csv", available_mb=64_000).tier == "chunked"
+
+    def test_file_exceeding_budget_is_sampled(self):
+        plan = choose_tier(1000, "csv", memory_fraction=0.5, available_mb=600)
+        assert plan.tier == "sampled"
+        # 300MB budget / (1000MB * 3x expansion)
+        assert plan.sample_fraction == pytest.approx(0.1)
+        assert plan.to_dict()["load_tier"] == "sampled"
+
+    def test_non_incremental_formats(self):
+        assert choose_tier(300, "json", available_mb=64_000).tier == "in_memory"
+        with pytest.raises(ValueError, match="too large"):
+            choose_tier(5000, "xlsx", available_mb=1000)
+        with pytest.raises(ValueError, match="not supported"):
+            choose_tier(1, "json", requested_tier="chunked")
+
+    def test_available_memory_detected(self):
+        assert available_memory_mb() > 0
+
+
+class TestTieredLoading:
+    """DataLoader picks and records a tier."""
+
+    def test_no_size_rejection(self, tmp_path):
+        big = tmp_path / "big.csv"
+        with open(big, "wb") as f:
+            f.truncate(101 * 1024 * 1024)
+        assert CSVLoaderWorker().validate_input({"file_path": str(big)})
+        assert DataLoader()._validate_file(big, "csv")["valid"]
+
+    def test_default_tier_recorded(self, sales_csv):
+        result = DataLoader().load(str(sales_csv))
+        assert result["metadata"]["load_tier"] == "in_memory"
+
+    def test_above_threshold_is_chunked(self, sales_csv, monkeypatch):
+        loader = DataLoader()
+        monkeypatch.setattr(loader, "MAX_FILE_SIZE_MB", 0.01)
+        result = loader.load(str(sales_csv))
+        assert result["metadata"]["load_tier"] == "chunked"
+        assert len(result["data"]) == 5000
+
+    def test_sampled_keeps_full_row_count(self, sales_csv, monkeypatch):
+        size_mb = sales_csv.stat().st_size / (1024 * 1024)
+        # Budget fits roughly a quarter of the parsed file
+        monkeypatch.setattr(load_strategy, "available_memory_mb", lambda: size_mb * 3 * 0.5)
+        loader = DataLoader()
+        monkeypatch.setattr(loader, "MAX_FILE_SIZE_MB", 0.01)
+
+        result = loader.load(str(sales_csv))
+
+        meta = result["metadata"]
+        assert meta["load_tier"] == "sampled"
+        assert meta["is_sample"] is True
+        assert meta["rows"] == 5000
+        assert 1000 < len(result["data"]) < 1500
+        assert any("row sample" in w for w in result["warnings"])
+
+    def test_parquet_sampled(self, tmp_path, monkeypatch):
+        pytest.importorskip("pyarrow")
+        path = tmp_path / "sales.parquet"
+        pd.DataFrame({"x": range(10_000)}).to_parquet(path, row_group_size=1000)
+        size_mb = path.stat().st_size / (1024 * 1024)
+        # 5x Parquet expansion, half of RAM usable -> quarter of the rows
+        monkeypatch.setattr(load_strategy, "available_memory_mb", lambda: size_mb * 5 * 0.25 / 0.5)
+
+        result = DataLoader().load(str(path), load_tier="sampled", columns=["x"], filters=[("x", "<", 5000)])
+
+        assert result["metadata"]["load_tier"] == "sampled"
+        assert result["data"]["x"].max() < 5000
+        assert 1000 < len(result["data"]) < 1500
+        assert result["metadata"]["sample_fraction"] == pytest.approx(0.25)
@@ -0,0 +1,118 @@
+"""Tests for running CPU-bound tasks in the process pool."""
+
+import multiprocessing
+import os
+import time
+
+import pandas as pd
+import pytest
+
+from core.exceptions import TaskTimeoutError
+from core.shared_dataset import SharedDataset
+from agents.orchestrator import AgentRegistry, DataManager, TaskRouter
+from agents.orchestrator.workers.process_backend import ProcessBackend
+from agents.orchestrator.workers.result_cache import ResultCache
+
+
+class PidAggregator:
+    """Stand-in aggregator reporting which process ran it."""
+
+    name = "aggregator"
+
+    def __init__(self):
+        self.runs = 0
+
+    def set_data(self, data):
+        self.data = data.view()
+
+    def groupby_single(self, group_by, agg_col, agg_func):
+        self.runs += 1
+        totals = self.data.groupby(group_by)[agg_col].agg(agg_func)
+        return {"status": "success", "pid": os.getpid(), "runs": self.runs, "totals": totals.to_dict()}
+
+
+class ConfiguredAggregator(PidAggregator):
+    """Needs constructor arguments, so it cannot be rebuilt in a worker."""
+
+    def __init__(self, config):
+        super().__init__()
+
+
+class SlowAggregator(PidAggregator):
+    """Runs far past any test deadline."""
+
+    def groupby_single(self, group_by, agg_col, agg_func):
+        time.sleep(60)
+        return super().groupby_single(group_by, agg_col, agg_func)
+
+
+@pytest.fixture(scope="module")
+def backend():
+    pool = ProcessBackend(max_workers=1)
+    yield pool
+    pool.shutdown()
+
+
+def make_router(agent, backend):
+    registry = AgentRegistry()
+    registry.register("aggregator", agent)
+    manager = DataManager(max_mb=0)
+    frame = pd.DataFrame({"g": ["a", "b", "a", "b"], "v": [1, 2, 3, 4]})
+    manager.set("loaded_data", SharedDataset(frame, name="groups"))
+    return TaskRouter(registry, manager, result_cache=ResultCache(max_entries=0), process_backend=backend)
+
+
+PARAMS = {"group_by": "g", "agg_col": "v", "agg_func": "sum"}
+
+
+def test_cpu_bound_task_runs_in_worker_process(backend):
+    router = make_router(PidAggregator(), backend)
+
+    first = router.route({"type": "aggregate", "parameters": PARAMS})
+    second = router.route({"type": "aggregate", "parameters": PARAMS})
+
+    assert first["totals"] == {"a": 4, "b": 6}
+    assert first["pid"] != os.getpid()
+    assert second["runs"] == 2  # warm agent reused in the worker
+    assert backend.stats()["exports"] == 1
+    assert router.data_manager.get("aggregate") == second
+
+
+def test_agent_that_cannot_be_rebuilt_runs_in_process(backend):
+    router = make_router(ConfiguredAggregator(config={}), backend)
+
+    result = router.route({"type": "aggregate", "parameters": PARAMS})
+
+    assert result["pid"] == os.getpid()
+    assert "ConfiguredAggregator" in next(iter(backend.stats()["in_process_agents"]))
+    router.route({"type": "aggregate", "parameters": PARAMS})
+    assert backend.stats()["fallbacks"] == 1
+
+
+def test_disabled_backend_accepts_nothing():
+    assert not ProcessBackend(max_workers=0).accepts("aggregate", PidAggregator())
+    assert not ProcessBackend(max_workers=1).accepts("load_data", PidAggregator())
+
+
+def test_timed_out_task_stops_its_worker_process():
+    backend = ProcessBackend(max_workers=1)
+    children = set(multiprocessing.active_children())
+    try:
+        router = make_router(SlowAggregator(), backend)
+        started = time.monotonic()
+        with pytest.raises(TaskTimeoutError):
+            router.route({"type": "aggregate", "parameters": PARAMS, "timeout": 1})
+        assert time.monotonic() - started < 10
+
+        # The waiting thread notices the deadline and kills the worker
+        deadline = time.monotonic() + 10
+        while set(multiprocessing.active_children()) - children and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert not set(multiprocessing.active_children()) - children
+        assert backend._pool is None
+
+        result = make_router(PidAggregator(), backend).route({"type": "aggregate", "parameters": PARAMS})
+        assert result["totals"] == {"a": 4, "b": 6}
+        assert result["pid"] != os.getpid()
+    finally:
+        backend.shutdown()
@@ -0,0 +1,101 @@
+"""Tests for memoized task results in the orchestrator."""
+
+import time
+
+import pandas as pd
+import pytest
+
+from core.shared_dataset import SharedDataset
+from agents.orchestrator import AgentRegistry, DataManager, TaskRouter
+from agents.orchestrator.workers.result_cache import ResultCache, canonical_params
+
+
+class CountingRecommender:
+    """Stand-in agent that counts how often it really runs."""
+
+    name = "recommender"
+    version = "1.0"
+
+    def __init__(self):
+        self.runs = 0
+
+    def set_data(self, data):
+        self.data = data
+
+    def generate_action_plan(self):
+        self.runs += 1
+        return {"status": "success", "rows": len(self.data.view())}
+
+
+@pytest.fixture
+def router():
+    registry = AgentRegistry()
+    registry.register("recommender", CountingRecommender())
+    manager = DataManager()
+    manager.set("loaded_data", SharedDataset(pd.DataFrame({"x": range(100)}), name="x"))
+    return TaskRouter(registry, manager, result_cache=ResultCache(max_entries=8, ttl_seconds=0, max_mb=1))
+
+
+class TestResultCache:
+    """LRU, TTL and budget eviction."""
+
+    def test_lru_eviction(self):
+        cache = ResultCache(max_entries=2, ttl_seconds=0)
+        cache.put("a", {"v": 1})
+        cache.put("b", {"v": 2})
+        cache.get("a")
+        cache.put("c", {"v": 3})
+
+        assert cache.get("b") is None
+        assert cache.get("a") == {"v": 1}
+        assert cache.stats()["evictions"] == 1
+
+    def test_ttl_and_memory_budget(self):
+        cache = ResultCache(max_entries=10, ttl_seconds=0.05, max_mb=0.1)
+        cache.put("small", {"v": 1})
+        time.sleep(0.06)
+        assert cache.get("small") is None
+        assert cache.stats()["expired"] == 1
+
+        big = pd.DataFrame({"x": range(20000)})  # ~160KB
+        assert cache.put("big", big) is False
+        assert len(cache) == 0
+
+    def test_params_canonicalized(self):
+        assert canonical_params({"b": 1, "a": None, "c": "x"}) == canonical_params({"c": "x", "b": 1})
+
+
+class TestTaskRouterMemoization:
+    """TaskRouter.route reuses results for the same data and parameters."""
+
+    def test_repeat_served_from_cache(self, router):
+        agent = router.agent_registry.get("recommender")
+        first = router.route({"type": "recommend", "parameters": {"limit": 5}})
+        second = router.route({"type": "recommend", "parameters": {"limit": 5, "unused": None}})
+
+        assert second is first
+        assert agent.runs == 1
+        assert router.data_manager.get("recommend") is first
+        assert router.result_cache.stats()["hits"] == 1
+
+    def test_new_data_params_or_version_rerun(self, router):
+        agent = router.agent_registry.get("recommender")
+        router.route({"type": "recommend"})
+        router.route({"type": "recommend", "parameters": {"limit": 1}})
+        router.route({"type": "recommend", "use_cache": False})
+        agent.version = "1.1"
+        router.route({"type": "recommend"})
+        assert agent.runs == 4
+
+        router.data_manager.set("loaded_data", SharedDataset(pd.DataFrame({"x": range(50)})))
+        assert router.route({"type": "recommend"})["rows"] == 50
+        # Identical content reloaded: same fingerprint, cache hit
+        router.data_manager.set("loaded_data", SharedDataset(pd.DataFrame({"x": range(50)})))
+        router.route({"type": "recommend"})
+        assert agent.runs == 5
+
+    def test_errors_not_memoized(self, router):
+        agent = router.agent_registry.get("recommender")
+        agent.generate_action_plan = lambda: {"status": "error", "message": "boom"}
+        router.route({"type": "recommend"})
+        assert len(router.result_cache) == 0
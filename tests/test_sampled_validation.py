@@ -0,0 +1,108 @@
+"""Tests for sampled and incremental validation modes."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from agents.data_loader import DataLoader
+from agents.data_loader.workers import StreamingQualityAccumulator, ValidatorWorker
+from agents.data_loader.workers.quality_calculator import QualityScoreCalculator
+from agents.data_loader.workers.quality_sampling import stratified_sample, wilson_interval
+
+
+@pytest.fixture
+def orders():
+    """200k rows, 30% nulls in one of four columns (7.5% of cells), ~5% duplicated rows."""
+    n = 200_000
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame({
+        "order_id": np.arange(n),
+        "customer": rng.integers(0, 5000, n),
+        "amount": rng.random(n) * 100,
+        "coupon": np.where(rng.random(n) < 0.3, None, "SAVE10"),
+    })
+    dup_rows = df.sample(frac=0.05, random_state=2)
+    return pd.concat([df, dup_rows], ignore_index=True)
+
+
+class TestSamplingHelpers:
+    """Unit tests for quality_sampling."""
+
+    def test_stratified_sample_covers_all_blocks(self):
+        df = pd.DataFrame({"x": np.arange(100_000)})
+        sample = stratified_sample(df, sample_rows=1000, strata=10)
+        assert 990 <= len(sample) <= 1010
+        assert sample.index.is_monotonic_increasing
+        blocks = np.bincount(sample["x"].to_numpy() // 10_000, minlength=10)
+        assert (blocks == 100).all()
+
+    def test_small_frame_returned_as_is(self):
+        df = pd.DataFrame({"x": range(10)})
+        assert stratified_sample(df, sample_rows=100) is df
+
+    def test_wilson_interval(self):
+        low, high = wilson_interval(10, 100)
+        assert low < 0.1 < high
+        # Whole population sampled -> no uncertainty
+        assert wilson_interval(10, 100, population=100) == (0.1, 0.1)
+
+
+class TestValidationModes:
+    """ValidatorWorker full / sampled / incremental."""
+
+    def test_sampled_close_to_full(self, orders):
+        worker = ValidatorWorker()
+        full = worker.safe_execute(df=orders, validation_mode="full")
+        sampled = worker.safe_execute(df=orders, validation_mode="sampled", sample_rows=20_000)
+
+        meta = sampled.metadata
+        assert meta["validation_mode"] == "sampled"
+        assert meta["quality_score_is_estimate"] is True
+        assert meta["sample_rows"] < len(orders)
+        assert meta["rows"] == len(orders)
+
+        lo, hi = meta["null_pct_ci"]
+        assert lo <= full.metadata["null_pct"] <= hi
+        assert meta["duplicate_pct"] == pytest.approx(full.metadata["duplicate_pct"], abs=1.5)
+        score_lo, score_hi = meta["quality_score_ci"]
+        assert score_lo <= sampled.quality_score <= score_hi
+        assert abs(sampled.quality_score - full.quality_score) <= 0.02
+
+    def test_incremental_uses_accumulator(self, orders):
+        acc = StreamingQualityAccumulator()
+        for start in range(0, len(orders), 50_000):
+            acc.update(orders.iloc[start:start + 50_000])
+
+        worker = ValidatorWorker()
+        full = worker.safe_execute(df=orders)
+        inc = worker.safe_execute(df=orders, validation_mode="incremental", accumulator=acc)
+
+        assert inc.metadata["duplicates"] == full.metadata["duplicates"]
+        assert inc.metadata["null_count"] == full.metadata["null_count"]
+        assert inc.quality_score == full.quality_score
+
+    def test_bad_mode_fails(self, orders):
+        worker = ValidatorWorker()
+        assert not worker.safe_execute(df=orders, validation_mode="fast").success
+        assert not worker.safe_execute(df=orders, validation_mode="incremental").success
+
+    def test_calculator_sampling(self, orders):
+        score, metrics = QualityScoreCalculator.calculate(orders, sample_rows=20_000)
+        full_score, _ = QualityScoreCalculator.calculate(orders)
+        assert metrics["quality_score_is_estimate"] is True
+        assert metrics["total_rows"] == len(orders)
+        assert score == pytest.approx(full_score, abs=0.05)
+
+
+def test_dataloader_validation_modes(tmp_path, orders):
+    path = tmp_path / "orders.csv"
+    orders.head(20_000).to_csv(path, index=False)
+    loader = DataLoader()
+
+    sampled = loader.load(str(path), validation_mode="sampled", validation_sample_rows=5000)
+    assert sampled["metadata"]["quality_score_is_estimate"] is True
+
+    inc = loader.load(str(path), validation_mode="incremental")
+    full = loader.load(str(path))
+    assert inc["metadata"]["validation_mode"] == "incremental"
+    assert inc["quality_score"] == full["quality_score"]
@@ -0,0 +1,125 @@
+"""Tests for the schema registry and per-dataset load profiles."""
+
+import json
+
+import pandas as pd
+import pytest
+
+from agents.data_loader import DataLoader
+from agents.data_loader.workers import SchemaRegistry, ValidatorWorker
+
+
+@pytest.fixture
+def sales_csv(tmp_path):
+    path = tmp_path / "sales_2025-01.csv"
+    pd.DataFrame({
+        "order_id": range(200),
+        "zip": ["01234", "00501"] * 100,
+        "amount": [float(i % 50) for i in range(200)],
+        "ordered_at": pd.date_range("2025-01-01", periods=200, freq="h").astype(str),
+    }).to_csv(path, index=False, sep=";")
+    return path
+
+
+@pytest.fixture
+def registry_path(tmp_path):
+    return str(tmp_path / "schemas.json")
+
+
+class TestSchemaRegistry:
+    """Registry persistence and matching."""
+
+    def test_profiles_persist_and_match_patterns(self, tmp_path, registry_path):
+        df = pd.DataFrame({"a": [1, 2], "b": ["x", None]})
+        SchemaRegistry(registry_path).register("sales", df, "csv", {"delimiter": ";"}, pattern="sales_*.csv")
+
+        registry = SchemaRegistry(registry_path)
+        profile = registry.match(tmp_path / "sales_2025-02.csv")
+        assert profile.name == "sales"
+        assert profile.dtypes == {"a": "int64", "b": str(df.dtypes["b"])}
+        assert profile.column_stats["b"]["null_pct"] == 50.0
+        assert profile.column_stats["a"] == {"null_pct": 0.0, "min": 1.0, "max": 2.0}
+        assert registry.match(tmp_path / "returns.csv") is None
+        assert json.loads(open(registry_path).read())["version"] == 1
+
+
+class TestDataLoaderProfiles:
+    """DataLoader learns, reuses and enforces profiles."""
+
+    def test_first_load_learns_second_reuses(self, sales_csv, registry_path, monkeypatch):
+        first = DataLoader(schema_registry=registry_path).load(str(sales_csv), optimize_dtypes=True)
+        assert first["status"] in ("success", "warning"), first["errors"]
+
+        loader = DataLoader(schema_registry=registry_path)
+        monkeypatch.setattr(loader, "_resolve_format", lambda path: pytest.fail("format was sniffed"))
+        second = loader.load(str(sales_csv))
+
+        assert second["status"] in ("success", "warning"), second["errors"]
+        pd.testing.assert_series_equal(second["data"].dtypes, first["data"].dtypes)
+        assert str(second["data"]["ordered_at"].dtype).startswith("datetime64")
+        assert second["metadata"]["baseline_profile"] == str(sales_csv.resolve())
+        assert second["metadata"]["schema_drift"] == []
+        assert "unique_values" not in second["metadata"]["columns_info"]["amount"]
+
+    def test_header_drift_fails_before_parsing(self, sales_csv, tmp_path, registry_path):
+        loader = DataLoader(schema_registry=registry_path)
+        loader.load(str(sales_csv), dataset="sales", schema_pattern="sales_*.csv")
+
+        drifted = tmp_path / "sales_2025-02.csv"
+        pd.read_csv(sales_csv, sep=";").rename(columns={"amount": "total"}).to_csv(drifted, index=False, sep=";")
+        loader.csv_loader.safe_execute = lambda **kwargs: pytest.fail("drifted file was parsed")
+
+        result = loader.load(str(drifted))
+        assert result["status"] == "error"
+        assert "Missing columns: ['amount']" in result["message"]
+
+    def test_null_in_integer_column_is_drift_not_a_parse_error(self, sales_csv, tmp_path, registry_path):
+        loader = DataLoader(schema_registry=registry_path)
+        loader.load(str(sales_csv), dataset="sales", schema_pattern="sales_*.csv")
+
+        with_null = tmp_path / "sales_2025-02.csv"
+        frame = pd.read_csv(sales_csv, sep=";", dtype={"zip": str})
+        frame.loc[3, "order_id"] = None
+        frame.to_csv(with_null, index=False, sep=";")
+        assert DataLoader().load(str(with_null))["status"] in ("success", "warning")
+
+        result = loader.load(str(with_null))
+        assert result["status"] == "error"
+        assert "Schema drift" in result["message"] and "Profile dtypes do not fit" in result["message"]
+
+        warned = loader.load(str(with_null), schema_drift="warn")
+        assert warned["status"] in ("success", "warning"), warned["errors"]
+        assert warned["data"]["order_id"].isna().sum() == 1
+        assert any("order_id" in issue for issue in warned["metadata"]["schema_drift"])
+
+    def test_update_mode_relearns(self, sales_csv, registry_path):
+        loader = DataLoader(schema_registry=registry_path)
+        loader.load(str(sales_csv), dataset="sales")
+        pd.read_csv(sales_csv, sep=";").assign(channel="web").to_csv(sales_csv, index=False, sep=";")
+
+        assert loader.load(str(sales_csv), dataset="sales", schema_drift="warn")["status"] != "error"
+        assert "channel" not in loader.schema_registry.get("sales").dtypes
+        loader.load(str(sales_csv), dataset="sales", schema_drift="update")
+        assert "channel" in loader.schema_registry.get("sales").dtypes
+
+    def test_projection_does_not_relearn(self, sales_csv, registry_path):
+        loader = DataLoader(schema_registry=registry_path)
+        result = loader.load(str(sales_csv), columns=["amount"])
+        assert result["status"] in ("success", "warning")
+        assert len(loader.schema_registry) == 0
+
+
+class TestValidatorBaseline:
+    """Cheap drift checks against a profile."""
+
+    def test_stats_drift_reported(self, registry_path):
+        baseline = pd.DataFrame({"amount": [float(i) for i in range(100)], "note": ["x"] * 100})
+        profile = SchemaRegistry(registry_path).register("orders", baseline, "csv")
+
+        current = pd.DataFrame({"amount": [1000.0] * 50 + [None] * 50, "note": ["x"] * 100})
+        result = ValidatorWorker().safe_execute(df=current, baseline=profile)
+
+        assert result.metadata["schema_drift"] == []
+        drift = " ".join(result.metadata["stats_drift"])
+        assert "null rate rose" in drift and "far outside" in drift
+        assert any("Drift from profile 'orders'" in w for w in result.warnings)
@@ -0,0 +1,154 @@
+"""Tests for session-isolated orchestrator workspaces."""
+
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from core.exceptions import OrchestratorError
+from core.shared_dataset import SharedDataset
+from agents.orchestrator import AgentRegistry, Orchestrator, SessionManager
+from agents.orchestrator.workers.session_manager import DatasetPool, SessionLimitError
+
+
+class FakeLoader:
+    """Stand-in loader returning a fresh copy of a file's frame."""
+
+    name = "data_loader"
+
+    def __init__(self, files):
+        self.files = files
+
+    def load(self, file_path):
+        return {"status": "success", "data": self.files[file_path].copy()}
+
+
+class StatefulExplorer:
+    """Stand-in explorer that keeps set_data() state between calls, like the real agents."""
+
+    name = "explorer"
+
+    def set_data(self, data):
+        self.data = data
+
+    def get_summary_report(self):
+        time.sleep(0.05)  # Another session's set_data() would land here
+        return {"status": "success", "columns": list(self.data.columns)}
+
+
+@pytest.fixture
+def files():
+    return {
+        "sales.csv": pd.DataFrame({"x": range(1000)}),
+        "costs.csv": pd.DataFrame({"y": range(500)}),
+    }
+
+
+@pytest.fixture
+def orchestrator(files):
+    orch = Orchestrator()
+    orch.register_agent("data_loader", FakeLoader(files))
+    yield orch
+    orch.sessions.close_all()
+
+
+class TestDatasetPool:
+    """Content-based deduplication."""
+
+    def test_identical_content_is_shared(self):
+        pool = DatasetPool()
+        a = pool.intern(SharedDataset(pd.DataFrame({"x": range(10)}), name="a"))
+        b = pool.intern(SharedDataset(pd.DataFrame({"x": range(10)}), name="b"))
+        c = pool.intern(SharedDataset(pd.DataFrame({"x": range(11)}), name="c"))
+
+        assert a is b and a is not c
+        stats = pool.stats()
+        assert stats["datasets"] == 2 and stats["hits"] == 1 and stats["bytes_saved"] > 0
+
+    def test_unreferenced_datasets_are_released(self):
+        pool = DatasetPool()
+        pool.intern(SharedDataset(pd.DataFrame({"x": range(10)})))
+        assert pool.stats()["datasets"] == 0
+
+
+class TestSessionManager:
+    """Limits, expiry and id validation."""
+
+    def test_limit_and_idle_expiry(self):
+        sessions = SessionManager(AgentRegistry(), max_sessions=2, idle_ttl_seconds=0.05, session_max_mb=0)
+        sessions.get_or_create("a")
+        sessions.get_or_create("b")
+        with pytest.raises(SessionLimitError):
+            sessions.get_or_create("c")
+
+        time.sleep(0.1)
+        sessions.get_or_create("c")
+        assert sessions.list_ids() == ["c"]
+        assert sessions.stats()["expired"] == 2
+
+    def test_invalid_id(self):
+        sessions = SessionManager(AgentRegistry())
+        with pytest.raises(OrchestratorError):
+            sessions.get_or_create("../etc")
+
+
+class TestOrchestratorSessions:
+    """Workspaces are isolated but share identical datasets."""
+
+    def test_sessions_do_not_overwrite_each_other(self, orchestrator):
+        orchestrator.execute_task("load_data", {"file_path": "sales.csv"}, session_id="alice")
+        orchestrator.execute_task("load_data", {"file_path": "costs.csv"}, session_id="bob")
+
+        assert list(orchestrator.get_cached_data("loaded_data", session_id="alice").columns) == ["x"]
+        assert list(orchestrator.get_cached_data("loaded_data", session_id="bob").columns) == ["y"]
+        assert orchestrator.get_cached_data("loaded_data") is None
+
+    def test_same_file_is_held_once(self, orchestrator):
+        for user in ("alice", "bob", "carol"):
+            orchestrator.execute_task("load_data", {"file_path": "sales.csv"}, session_id=user)
+
+        datasets = [orchestrator.sessions.get(user).data_manager.get("loaded_data") for user in ("alice", "bob", "carol")]
+        assert datasets[0] is datasets[1] is datasets[2]
+        assert orchestrator.get_detailed_status()["sessions"]["shared_datasets"]["hits"] == 2
+
+    def test_sessions_take_turns_on_a_shared_agent(self, orchestrator):
+        orchestrator.register_agent("explorer", StatefulExplorer())
+        orchestrator.execute_task("load_data", {"file_path": "sales.csv"}, session_id="alice")
+        orchestrator.execute_task("load_data", {"file_path": "costs.csv"}, session_id="bob")
+
+        results = {}
+
+        def explore(user):
+            for _ in range(3):
+                task = {"type": "explore", "use_cache": False}
+                results.setdefault(user, []).append(orchestrator.sessions.get(user).task_router.route(task))
+
+        threads = [threading.Thread(target=explore, args=(user,)) for user in ("alice", "bob")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert all(r["columns"] == ["x"] for r in results["alice"])
+        assert all(r["columns"] == ["y"] for r in results["bob"])
+
+    def test_close_session_frees_cache(self, orchestrator):
+        orchestrator.execute_task("load_data", {"file_path": "sales.csv"}, session_id="alice")
+        assert orchestrator.close_session("alice")["success"]
+        assert orchestrator.get_session("alice") is None
+        assert orchestrator.close_session("alice")["success"] is False
+
+
+def test_session_endpoints():
+    TestClient = pytest.importorskip("fastapi.testclient").TestClient
+    import api.main as api_main
+
+    client = TestClient(api_main.app)
+    session_id = client.post("/api/sessions").json()["session_id"]
+
+    assert client.get(f"/api/sessions/{session_id}").json()["keys"] == []
+    assert client.get("/api/cache/loaded_data", headers={"X-Session-ID": session_id}).status_code == 404
+    assert client.get("/api/cache/loaded_data", headers={"X-Session-ID": "../bad"}).status_code == 400
+    assert client.delete(f"/api/sessions/{session_id}").status_code == 200
+    assert client.get(f"/api/sessions/{session_id}").status_code == 404
@@ -0,0 +1,99 @@
+"""Tests for the shared read-only dataset handoff between agents."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from agents.aggregator import Aggregator
+from agents.data_loader import DataLoader
+from agents.explorer import Explorer
+from agents.orchestrator import AgentRegistry, DataManager, TaskRouter
+from agents.predictor import Predictor
+from core.shared_dataset import SharedDataset, frame_for_agent
+
+
+@pytest.fixture
+def sales():
+    return pd.DataFrame({
+        "region": ["north", "south", "east", "west"] * 250,
+        "revenue": np.arange(1000, dtype=float),
+        "units": np.arange(1000),
+    })
+
+
+class TestSharedDataset:
+    """View and copy-on-write semantics."""
+
+    def test_views_share_buffers(self, sales):
+        shared = SharedDataset(sales, name="sales")
+        a, b = shared.view(), shared.view()
+
+        assert np.shares_memory(a["revenue"].to_numpy(), b["revenue"].to_numpy())
+        assert shared.views_created == 2
+        assert shared.nbytes() > 0
+
+    def test_in_place_write_never_reaches_other_views(self, sales):
+        shared = SharedDataset(sales)
+        view, other = shared.view(), shared.view()
+        try:
+            view.loc[0, "revenue"] = -1.0  # pandas 3 copies the column (copy-on-write)
+        except ValueError as e:
+            assert "read-only" in str(e)  # earlier pandas hit the frozen buffer
+
+        assert other.loc[0, "revenue"] == 0.0
+        assert shared.view().loc[0, "revenue"] == 0.0
+        assert not other["revenue"].to_numpy().flags.writeable
+
+    def test_caller_frame_stays_writable(self, sales):
+        SharedDataset(sales)
+        assert all(values.flags.writeable for values in sales._mgr.arrays if isinstance(values, np.ndarray))
+        sales.loc[0, "units"] = 7
+        assert sales.loc[0, "units"] == 7
+
+    def test_column_assignment_is_private_to_view(self, sales):
+        shared = SharedDataset(sales)
+        view = shared.view()
+        view["revenue"] = view["revenue"] * 2
+        view["margin"] = 1.0
+
+        other = shared.view()
+        assert other["revenue"].iloc[10] == 10.0
+        assert "margin" not in other.columns
+
+    def test_frame_for_agent(self, sales):
+        shared = SharedDataset(sales)
+        assert np.shares_memory(frame_for_agent(shared)["units"].to_numpy(), sales["units"].to_numpy())
+        assert not np.shares_memory(frame_for_agent(sales.copy())["units"].to_numpy(), sales["units"].to_numpy())
+        assert frame_for_agent("not a frame") == "not a frame"
+
+    def test_memory_mapped_round_trip(self, sales, tmp_path):
+        pytest.importorskip("pyarrow")
+        mapped = SharedDataset(sales, name="sales").memory_map(tmp_path / "sales.arrow")
+
+        assert mapped.is_memory_mapped
+        view = mapped.view()
+        pd.testing.assert_frame_equal(view, sales, check_dtype=False)
+        assert not view["revenue"].to_numpy().flags.writeable
+
+
+class TestAgentHandoff:
+    """Agents keep views instead of copies."""
+
+    def test_agents_share_loaded_data(self, sales, tmp_path):
+        path = tmp_path / "sales.csv"
+        sales.to_csv(path, index=False)
+
+        registry = AgentRegistry()
+        registry.register("data_loader", DataLoader())
+        data_manager = DataManager()
+        TaskRouter(registry, data_manager).route(
+            {"type": "load_data", "parameters": {"file_path": str(path)}}
+        )
+
+        shared = data_manager.get("loaded_data")
+        assert isinstance(shared, SharedDataset)
+        base = shared.view()["revenue"].to_numpy()
+        for agent in (Explorer(), Aggregator(), Predictor()):
+            agent.set_data(shared)
+            assert np.shares_memory(agent.data["revenue"].to_numpy(), base)
+        assert isinstance(data_manager.get_dataframe("loaded_data"), pd.DataFrame)
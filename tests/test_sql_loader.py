@@ -0,0 +1,105 @@
+"""Tests for chunked SQL loading with query pushdown."""
+
+import sqlite3
+
+import pandas as pd
+import pytest
+
+from agents.data_loader import DataLoader
+from agents.data_loader.workers import SQLLoaderWorker
+from agents.data_loader.workers.sql_loader import build_query
+
+
+@pytest.fixture
+def orders_db(tmp_path):
+    path = tmp_path / "orders.db"
+    with sqlite3.connect(path) as conn:
+        pd.DataFrame({
+            "id": range(1000),
+            "region": ["north", "south", "east", "west"] * 250,
+            "amount": [float(i % 100) for i in range(1000)],
+        }).to_sql("orders", conn, index=False)
+        pd.DataFrame({"x": [1, 2]}).to_sql("odd name", conn, index=False)
+    return path
+
+
+class TestBuildQuery:
+    """SQL generation."""
+
+    def test_projection_and_bound_filters(self):
+        sql, params = build_query(
+            "orders", columns=["id", "amount"],
+            filters=[("amount", ">", 50), ("region", "in", ["north", "east"]), ("note", "==", None)]
+        )
+        assert sql == (
+            'SELECT "id", "amount" FROM "orders" WHERE "amount" > :_p0 '
+            'AND "region" IN (:_p1, :_p2) AND "note" IS NULL'
+        )
+        assert params == {"_p0": 50, "_p1": "north", "_p2": "east"}
+
+    def test_identifiers_are_quoted(self):
+        sql, _ = build_query('t"; DROP TABLE orders; --', columns=['a"b'])
+        assert sql == 'SELECT "a""b" FROM "t""; DROP TABLE orders; --"'
+
+    def test_positional_query_params(self):
+        sql, params = build_query(
+            query="SELECT * FROM orders WHERE region = ?", params=["north"], filters=[("id", "<", 5)]
+        )
+        assert sql.endswith('AS _q WHERE "id" < ?')
+        assert params == ["north", 5]
+
+
+class TestSQLLoaderWorker:
+    """SQLLoaderWorker behaviour."""
+
+    def test_chunked_read_reuses_connections(self, orders_db):
+        worker = SQLLoaderWorker()
+        for _ in range(3):
+            result = worker.safe_execute(source=str(orders_db), table_name="orders", chunksize=300)
+            assert result.success, result.errors
+        assert result.metadata["chunks"] == 4
+        assert len(result.data) == 1000
+        assert result.metadata["pool"]["created"] == 1
+        assert result.metadata["pool"]["reused"] == 2
+
+    def test_pushdown_and_params(self, orders_db):
+        result = SQLLoaderWorker().safe_execute(
+            source=str(orders_db),
+            query="SELECT * FROM orders WHERE region = :region",
+            params={"region": "north"},
+            columns=["id", "amount"],
+            filters=[("amount", ">=", 90)],
+        )
+        df = result.data
+        assert list(df.columns) == ["id", "amount"]
+        assert len(df) == 20
+        assert (df["amount"] >= 90).all()
+
+    def test_connection_is_read_only(self, orders_db):
+        result = SQLLoaderWorker().safe_execute(source=str(orders_db), query="DELETE FROM orders")
+        assert not result.success
+        with sqlite3.connect(orders_db) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM orders").fetchone()[0] == 1000
+
+
+class TestDataLoaderSQL:
+    """DataLoader routes SQLite files and URLs through SQLLoaderWorker."""
+
+    def test_load_file_with_table_and_pushdown(self, orders_db):
+        result = DataLoader().load(
+            str(orders_db), table_name="orders", columns=["id"], filters=[("region", "==", "west")]
+        )
+        assert result["status"] in ("success", "warning"), result["errors"]
+        assert len(result["data"]) == 250
+        assert result["metadata"]["query"] == 'SELECT "id" FROM "orders" WHERE "region" = :_p0'
+
+    def test_load_url(self, orders_db):
+        pytest.importorskip("sqlalchemy")
+        loader = DataLoader()
+        result = loader.load(f"sqlite:///{orders_db}", table_name="odd name")
+        assert result["status"] in ("success", "warning"), result["errors"]
+        assert result["data"]["x"].tolist() == [1, 2]
+
+        result = loader.load_sql(f"sqlite:///{orders_db}", table_name="orders", filters=[("id", "<", 10)])
+        assert len(result["data"]) == 10
+        assert loader.sql_loader.pool.stats()["engines"] == 1
@@ -0,0 +1,111 @@
+"""Tests for workflow stage events and their API streams."""
+
+import json
+
+import pandas as pd
+import pytest
+
+from agents.orchestrator import Orchestrator
+from agents.orchestrator.workers.event_bus import EventBus, summarize_result
+
+
+class FakeLoader:
+    name = "data_loader"
+
+    def load(self, file_path):
+        return {"status": "success", "data": pd.DataFrame({"x": range(10)})}
+
+
+class FakeExplorer:
+    name = "explorer"
+
+    def set_data(self, data):
+        self.data = data
+
+    def get_summary_report(self):
+        return {"status": "success", "rows": len(self.data.view())}
+
+
+class TestEventBus:
+    """Fan-out and summaries."""
+
+    def test_subscribers_and_failing_callback(self):
+        bus = EventBus()
+        seen = []
+        bus.subscribe(lambda event: 1 / 0)
+        token = bus.subscribe(seen.append)
+        bus.publish({"event": "a"}, extra=seen.append)
+        assert seen == [{"event": "a"}, {"event": "a"}]
+
+        assert bus.unsubscribe(token)
+        bus.publish({"event": "b"})
+        assert len(seen) == 2
+
+    def test_summaries(self):
+        assert summarize_result({"status": "success", "rows": 3}) == {"keys": ["status", "rows"], "status": "success"}
+        assert summarize_result(pd.DataFrame({"a": [1, 2]})) == {"type": "DataFrame", "shape": [2, 1]}
+
+
+def test_workflow_publishes_stage_events():
+    orchestrator = Orchestrator()
+    orchestrator.register_agent("data_loader", FakeLoader())
+    orchestrator.register_agent("explorer", FakeExplorer())
+    bus_events, own_events = [], []
+    orchestrator.events.subscribe(bus_events.append)
+
+    orchestrator.execute_workflow(
+        [{"type": "load_data", "parameters": {"file_path": "x.csv"}},
+         {"type": "explore"}],
+        on_event=own_events.append
+    )
+
+    kinds = [event["event"] for event in own_events]
+    assert kinds[0] == "workflow_started" and kinds[-1] == "workflow_finished"
+    assert kinds.count("stage_started") == 2
+    explored = next(e for e in own_events if e["event"] == "stage_completed" and e["type"] == "explore")
+    assert explored["summary"]["status"] == "success"
+    loaded = next(e for e in own_events if e["event"] == "stage_completed" and e["type"] == "load_data")
+    assert "result" not in loaded
+    assert not any(isinstance(value, pd.DataFrame) for event in own_events for value in event.values())
+    assert own_events[-1]["progress"] == 100.0
+    assert bus_events == own_events
+
+
+@pytest.fixture
+def client(monkeypatch):
+    TestClient = pytest.importorskip("fastapi.testclient").TestClient
+    import api.main as api_main
+
+    def fake_workflow(tasks, on_event=None, should_stop=None, session_id=None):
+        on_event({"event": "stage_completed", "index": 0, "type": "load_data", "progress": 50.0})
+        on_event({"event": "stage_completed", "index": 1, "type": "explore", "progress": 100.0})
+        return {"status": "completed"}
+
+    monkeypatch.setattr(api_main.orchestrator, "execute_workflow", fake_workflow)
+    return TestClient(api_main.app)
+
+
+def test_server_sent_events(client):
+    job_id = client.post("/api/jobs", json={"tasks": [{"type": "load_data"}]}).json()["job_id"]
+
+    with client.stream("GET", f"/api/jobs/{job_id}/events") as response:
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = [json.loads(line[6:]) for line in response.iter_lines() if line.startswith("data: ")]
+
+    assert [event["event"] for event in events] == ["stage_completed", "stage_completed", "end"]
+    assert events[-1]["status"] == "completed"
+
+    with client.stream("GET", f"/api/jobs/{job_id}/events", headers={"Last-Event-ID": "0"}) as response:
+        resumed = [json.loads(line[6:]) for line in response.iter_lines() if line.startswith("data: ")]
+    assert [event.get("type") for event in resumed] == ["explore", None]
+
+
+def test_websocket_events(client):
+    job_id = client.post("/api/jobs", json={"tasks": [{"type": "load_data"}]}).json()["job_id"]
+
+    with client.websocket_connect(f"/ws/jobs/{job_id}") as websocket:
+        first = websocket.receive_json()
+        second = websocket.receive_json()
+        end = websocket.receive_json()
+
+    assert (first["event_index"], second["type"], end["event"]) == (0, "explore", "end")
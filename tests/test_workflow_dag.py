@@ -0,0 +1,146 @@
+"""Tests for DAG-based parallel workflow execution."""
+
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from core.error_recovery import RecoveryError
+from core.exceptions import OrchestratorError
+from agents.orchestrator import Orchestrator, TaskRouter, WorkflowExecutor
+from agents.orchestrator.workers.workflow_dag import WorkflowDAG, build_dag
+
+ANALYSIS = ["explore", "aggregate", "detect_anomalies", "predict", "recommend"]
+
+
+class SleepyRouter:
+    """Routes tasks by sleeping; records which tasks overlap."""
+
+    TASK_TO_AGENT = TaskRouter.TASK_TO_AGENT
+
+    def __init__(self, durations, fail=()):
+        self.durations = durations
+        self.fail = set(fail)
+        self.active = set()
+        self.max_active = 0
+        self.finished = []
+        self._lock = threading.Lock()
+
+    def route(self, task):
+        with self._lock:
+            self.active.add(task["type"])
+            self.max_active = max(self.max_active, len(self.active))
+        time.sleep(self.durations.get(task["type"], 0.01))
+        with self._lock:
+            self.active.discard(task["type"])
+            self.finished.append(task["type"])
+        if task["type"] in self.fail:
+            raise OrchestratorError(f"{task['type']} broke")
+        return {"status": "success", "task": task["type"]}
+
+
+def pipeline():
+    return [{"type": "load_data"}] + [{"type": t} for t in ANALYSIS] + [{"type": "narrative"}]
+
+
+class TestWorkflowDAG:
+    """Dependency resolution and scheduling."""
+
+    def test_analysis_stages_only_depend_on_load(self):
+        nodes = build_dag(pipeline())
+        assert all(node.depends_on == [0] for node in nodes[1:6])
+        assert nodes[6].depends_on == [0, 1, 2, 3, 4, 5]
+        assert nodes[6].requires == []
+
+    def test_latency_follows_critical_path(self):
+        durations = {"load_data": 0.05, "predict": 0.2, "narrative": 0.05}
+        durations.update({t: 0.1 for t in ANALYSIS if t != "predict"})
+        router = SleepyRouter(durations)
+        dag = WorkflowDAG(pipeline())
+        dag.run(router.route, max_workers=5)
+
+        timing = dag.timing()
+        assert router.max_active == 5
+        assert timing["critical_path"]["task_types"] == ["load_data", "predict", "narrative"]
+        assert timing["stage_sum_ms"] > 600
+        assert timing["wall_ms"] < timing["critical_path"]["duration_ms"] + 150
+        assert router.finished[0] == "load_data" and router.finished[-1] == "narrative"
+
+    def test_same_agent_never_overlaps(self):
+        tasks = [{"type": "load_data"}] + [{"type": "aggregate"}] * 3
+        router = SleepyRouter({})
+        WorkflowDAG(tasks).run(router.route, max_workers=4)
+        assert router.max_active == 1
+
+    def test_failed_requirement_skips_dependents_but_not_narrative(self):
+        router = SleepyRouter({}, fail={"load_data"})
+        records = WorkflowDAG(pipeline()).run(router.route, max_workers=4)
+
+        assert records[0].status == "failed"
+        assert {records[i].status for i in range(1, 6)} == {"skipped"}
+        assert records[6].status == "completed"
+
+
+class TestWorkflowExecutor:
+    """WorkflowExecutor runs workflows through the DAG."""
+
+    def test_results_in_submission_order_with_timing(self):
+        executor = WorkflowExecutor(SleepyRouter({}))
+        workflow = executor.execute(pipeline(), max_workers=3)
+
+        assert workflow["status"] == "completed"
+        assert [t["type"] for t in workflow["tasks"]] == [t["type"] for t in pipeline()]
+        assert workflow["tasks"][1]["depends_on"] == [workflow["tasks"][0]["id"]]
+        assert all(t["duration_ms"] > 0 for t in workflow["tasks"])
+        assert workflow["timing"]["max_workers"] == 3
+
+    def test_critical_failure_cancels_pending_tasks(self):
+        executor = WorkflowExecutor(SleepyRouter({}, fail={"load_data"}))
+        tasks = pipeline()
+        tasks[0]["critical"] = True
+
+        with pytest.raises(RecoveryError, match="Critical task failed"):
+            executor.execute(tasks)
+        assert {t["status"] for t in executor.workflow_history[-1]["tasks"][1:]} == {"cancelled"}
+
+
+class TestPipelineOrder:
+    """Only true dependencies constrain the task order."""
+
+    def test_independent_stages_in_any_order(self):
+        router = TaskRouter(Mock(), Mock())
+        tasks = [{"type": t} for t in ["load_data", "predict", "explore", "aggregate", "narrative", "report"]]
+        assert router.validate_pipeline_order(tasks)
+
+    def test_dependency_listed_late_rejected(self):
+        router = TaskRouter(Mock(), Mock())
+        with pytest.raises(OrchestratorError, match="out of order"):
+            router.validate_pipeline_order([{"type": "narrative"}, {"type": "explore"}])
+        with pytest.raises(OrchestratorError, match="out of order"):
+            router.validate_pipeline_order([{"type": "explore"}, {"type": "load_data"}])
+
+
+def test_orchestrator_workflow_records_timing():
+    orch = Orchestrator()
+    orch.task_router = SleepyRouter({})
+    workflow = orch.execute_workflow(pipeline(), max_workers=4)
+
+    assert workflow["status"] == "completed"
+    assert workflow["completed_tasks"] == 7
+    assert len(workflow["results"]) == 7
+    assert workflow["timing"]["critical_path"]["task_types"][0] == "load_data"
+
+
+def test_should_stop_cancels_unstarted_tasks_and_reports_progress():
+    router = SleepyRouter({"load_data": 0.2})
+    progress = []
+    dag = WorkflowDAG(pipeline())
+    started = time.monotonic()
+    records = dag.run(router.route, on_done=lambda node, record: progress.append(record.status),
+                      should_stop=lambda: time.monotonic() - started > 0.05)
+
+    assert dag.cancelled
+    assert records[0].status == "completed"
+    assert {records[i].status for i in range(1, 7)} == {"cancelled"}
+    assert progress == ["completed"]